@@ -15,9 +15,21 @@ from app.database import Base  # noqa: E402
 
 # Importar todos los modelos para que Alembic los detecte
 from app.models import (  # noqa: E402, F401
+    ArchivedRecord,
+    DailyEventStats,
+    DailySignups,
     Event,
+    EventDeletion,
     EventRegistration,
+    EventRegistrationBucket,
+    IdempotencyKey,
+    Job,
+    OutboxMessage,
+    PurgeCheckpoint,
+    RateLimitBucket,
+    SchedulerCheckpoint,
     Session,
+    SessionRegistration,
     User,
 )
 
@@ -0,0 +1,117 @@
+"""Baseline: tablas users, events, sessions y event_registrations
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0001_baseline"
+down_revision = None
+# "main" permite actualizar la rama principal sin aplicar la rama opcional "partitioning"
+branch_labels = ("main",)
+depends_on = None
+
+
+def upgrade() -> None:
+    # Búsquedas sin acentos en crud.event.get_events
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("full_name", sa.String(), nullable=True),
+        sa.Column(
+            "role",
+            sa.Enum("ADMIN", "ORGANIZER", "ATTENDEE", name="userrole"),
+            nullable=False,
+        ),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "events",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("location", sa.String(), nullable=True),
+        sa.Column("start_date", sa.DateTime(), nullable=False),
+        sa.Column("end_date", sa.DateTime(), nullable=False),
+        sa.Column("capacity", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("SCHEDULED", "CANCELLED", name="eventstatusdb"),
+            nullable=False,
+        ),
+        sa.Column("creator_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["creator_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_events_id", "events", ["id"])
+    op.create_index("ix_events_name", "events", ["name"])
+
+    op.create_table(
+        "sessions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("speaker_name", sa.String(), nullable=True),
+        sa.Column("speaker_bio", sa.Text(), nullable=True),
+        sa.Column("start_time", sa.DateTime(), nullable=False),
+        sa.Column("end_time", sa.DateTime(), nullable=False),
+        sa.Column("location", sa.String(), nullable=True),
+        sa.Column("capacity", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_sessions_id", "sessions", ["id"])
+
+    op.create_table(
+        "event_registrations",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("registered_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_event_registrations_id", "event_registrations", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_registrations_id", table_name="event_registrations")
+    op.drop_table("event_registrations")
+    op.drop_index("ix_sessions_id", table_name="sessions")
+    op.drop_table("sessions")
+    op.drop_index("ix_events_name", table_name="events")
+    op.drop_index("ix_events_id", table_name="events")
+    op.drop_table("events")
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_index("ix_users_id", table_name="users")
+    op.drop_table("users")
+    sa.Enum(name="eventstatusdb").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="userrole").drop(op.get_bind(), checkfirst=True)
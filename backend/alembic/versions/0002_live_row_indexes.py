@@ -0,0 +1,41 @@
+"""Índices parciales de filas vivas (is_deleted = false)
+
+Se crean con CREATE INDEX CONCURRENTLY para no bloquear escrituras en
+tablas grandes ya pobladas. CONCURRENTLY no puede ejecutarse dentro de una
+transacción, por eso se usa autocommit_block().
+
+Revision ID: 0002_live_row_indexes
+Revises: 0001_baseline
+Create Date: 2026-10-18 10:05:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0002_live_row_indexes"
+down_revision = "0001_baseline"
+branch_labels = None
+depends_on = None
+
+LIVE_ROW_INDEXES = [
+    ("ix_event_registrations_event_id_live", "event_registrations", "event_id"),
+    ("ix_event_registrations_user_id_live", "event_registrations", "user_id"),
+    ("ix_sessions_event_id_start_time_live", "sessions", "event_id, start_time"),
+    ("ix_events_creator_id_created_at_live", "events", "creator_id, created_at"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in LIVE_ROW_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} ({columns}) WHERE is_deleted = false"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _table, _columns in LIVE_ROW_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,59 @@
+"""Opcional: particionar event_registrations (hash por event_id o rango mensual)
+
+Rama opcional "partitioning", no se aplica con `alembic upgrade main@head`.
+
+    alembic -x strategy=hash -x partitions=16 upgrade partitioning@head
+    alembic -x strategy=range -x months_ahead=3 upgrade partitioning@head
+
+Revision ID: 0003_partition_registrations
+Revises:
+Create Date: 2026-10-18 10:10:00.000000
+
+"""
+
+from datetime import date
+
+import sqlalchemy as sa
+
+from alembic import context, op
+from app.core import partitioning
+
+# revision identifiers, used by Alembic.
+revision = "0003_partition_registrations"
+down_revision = None
+branch_labels = ("partitioning",)
+depends_on = "0002_live_row_indexes"
+
+
+def upgrade() -> None:
+    x_args = context.get_x_argument(as_dictionary=True)
+    strategy = x_args.get("strategy", "hash")
+    today = date.today()
+    first_registration = None
+    indexes = None  # Offline: índices conocidos
+    if not context.is_offline_mode():
+        first_registration = (
+            op.get_bind()
+            .execute(sa.text("SELECT min(registered_at) FROM event_registrations"))
+            .scalar()
+        )
+        indexes = partitioning.list_index_definitions(op.get_bind())
+
+    for statement in partitioning.conversion_sql(
+        strategy,
+        first_month=first_registration.date() if first_registration else today,
+        today=today,
+        modulus=int(x_args.get("partitions", 16)),
+        months_ahead=int(x_args.get("months_ahead", 3)),
+        indexes=indexes,
+    ):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    indexes = detached = None
+    if not context.is_offline_mode():
+        indexes = partitioning.list_index_definitions(op.get_bind())
+        detached = partitioning.list_detached_partitions(op.get_bind())
+    for statement in partitioning.revert_sql(indexes=indexes, detached=detached):
+        op.execute(statement)
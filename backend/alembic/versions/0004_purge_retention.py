@@ -0,0 +1,67 @@
+"""Purgado por retención: checkpoints, archivo e índices de filas eliminadas
+
+Revision ID: 0004_purge_retention
+Revises: 0002_live_row_indexes
+Create Date: 2026-10-18 10:15:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import context, op
+from app.core import partitioning
+
+# revision identifiers, used by Alembic.
+revision = "0004_purge_retention"
+down_revision = "0002_live_row_indexes"
+branch_labels = None
+depends_on = None
+
+PURGE_INDEXES = [
+    ("ix_event_registrations_purge", "event_registrations"),
+    ("ix_sessions_purge", "sessions"),
+    ("ix_events_purge", "events"),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "purge_checkpoints",
+        sa.Column("table_name", sa.String(), nullable=False),
+        sa.Column("last_id", sa.Integer(), nullable=False),
+        sa.Column("purged_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("table_name"),
+    )
+    op.create_table(
+        "archived_records",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("table_name", sa.String(), nullable=False),
+        sa.Column("record_id", sa.Integer(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.Column("archived_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_archived_records_id", "archived_records", ["id"])
+
+    # Una tabla particionada no admite CREATE INDEX CONCURRENTLY sobre el padre
+    partitioned = (
+        not context.is_offline_mode() and partitioning.get_strategy(op.get_bind()) is not None
+    )
+    with op.get_context().autocommit_block():
+        for name, table in PURGE_INDEXES:
+            concurrently = "" if partitioned and table == partitioning.TABLE else "CONCURRENTLY "
+            op.execute(
+                f"CREATE INDEX {concurrently}IF NOT EXISTS {name} "
+                f"ON {table} (id) WHERE is_deleted = true"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _table in PURGE_INDEXES:
+            op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.drop_index("ix_archived_records_id", table_name="archived_records")
+    op.drop_table("archived_records")
+    op.drop_table("purge_checkpoints")
@@ -0,0 +1,33 @@
+"""Columna version para concurrencia optimista en eventos y sesiones
+
+Revision ID: 0005_row_versions
+Revises: 0004_purge_retention
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0005_row_versions"
+down_revision = "0004_purge_retention"
+branch_labels = None
+depends_on = None
+
+VERSIONED_TABLES = ["events", "sessions"]
+
+
+def upgrade() -> None:
+    # ADD COLUMN con DEFAULT constante no reescribe la tabla en PostgreSQL >= 11
+    for table in VERSIONED_TABLES:
+        op.add_column(
+            table,
+            sa.Column("version", sa.Integer(), server_default=sa.text("1"), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    for table in VERSIONED_TABLES:
+        op.drop_column(table, "version")
@@ -0,0 +1,76 @@
+"""Restricciones de exclusión: sin solapes de sala ni de ponente por evento
+
+Usa btree_gist para combinar igualdad (event_id, sala/ponente normalizados) con el
+solapamiento de tsrange(start_time, end_time, '[)') en un mismo índice GiST.
+Solo se aplica a sesiones vivas con sala/ponente informados.
+
+Si ya existen sesiones en conflicto la migración se detiene y las lista; se pueden
+revisar con GET /api/v1/sessions/event/{event_id}/conflicts.
+
+Revision ID: 0006_session_agenda_exclusion
+Revises: 0005_row_versions
+Create Date: 2026-10-18 12:30:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision = "0006_session_agenda_exclusion"
+down_revision = "0005_row_versions"
+branch_labels = None
+depends_on = None
+
+# nombre de la restricción -> columna normalizada
+EXCLUSIONS = {
+    "ex_sessions_location_overlap": "location",
+    "ex_sessions_speaker_overlap": "speaker_name",
+}
+
+
+def _find_existing_conflicts(column: str) -> list:
+    """Pares de sesiones vivas que ya violarían la restricción"""
+    return (
+        op.get_bind()
+        .execute(
+            sa.text(
+                f"SELECT a.event_id, a.id, b.id, a.{column} FROM sessions a "
+                f"JOIN sessions b ON a.event_id = b.event_id AND a.id < b.id "
+                f"AND lower(btrim(a.{column})) = lower(btrim(b.{column})) "
+                f"AND tsrange(a.start_time, a.end_time, '[)') && tsrange(b.start_time, b.end_time, '[)') "
+                f"WHERE a.is_deleted = false AND b.is_deleted = false "
+                f"AND btrim(a.{column}) <> '' LIMIT 20"
+            )
+        )
+        .fetchall()
+    )
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    for name, column in EXCLUSIONS.items():
+        if not context.is_offline_mode():
+            conflicts = _find_existing_conflicts(column)
+            if conflicts:
+                pairs = ", ".join(
+                    f"evento {event_id}: sesiones {a}/{b} ({value})"
+                    for event_id, a, b, value in conflicts
+                )
+                raise RuntimeError(
+                    f"No se puede crear {name}: hay sesiones solapadas por {column}. "
+                    f"Corrígelas antes de migrar: {pairs}"
+                )
+        op.execute(
+            f"ALTER TABLE sessions ADD CONSTRAINT {name} EXCLUDE USING gist ("
+            f"event_id WITH =, lower(btrim({column})) WITH =, "
+            f"tsrange(start_time, end_time, '[)') WITH &&"
+            f") WHERE (is_deleted = false AND {column} IS NOT NULL AND btrim({column}) <> '')"
+        )
+
+
+def downgrade() -> None:
+    for name in EXCLUSIONS:
+        op.execute(f"ALTER TABLE sessions DROP CONSTRAINT IF EXISTS {name}")
@@ -0,0 +1,58 @@
+"""Contador registered_count e índices de los filtros del listado de eventos
+
+registered_count permite filtrar por disponibilidad (registered_count < capacity) sin
+contar registros por fila. Se rellena a partir de los registros vivos existentes.
+
+Revision ID: 0007_event_list_filters
+Revises: 0006_session_agenda_exclusion
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0007_event_list_filters"
+down_revision = "0006_session_agenda_exclusion"
+branch_labels = None
+depends_on = None
+
+EVENT_LIST_INDEXES = [
+    ("ix_events_start_date_live", "start_date", "is_deleted = false"),
+    ("ix_events_created_at_live", "created_at", "is_deleted = false"),
+    (
+        "ix_events_start_date_available",
+        "start_date",
+        "is_deleted = false AND registered_count < capacity",
+    ),
+    ("ix_events_location_lower_live", "lower(location)", "is_deleted = false"),
+]
+
+
+def upgrade() -> None:
+    op.add_column(
+        "events",
+        sa.Column("registered_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+    )
+    op.execute(
+        "UPDATE events SET registered_count = ("
+        "SELECT count(*) FROM event_registrations r "
+        "WHERE r.event_id = events.id AND r.is_deleted = false"
+        ") WHERE is_deleted = false"
+    )
+
+    with op.get_context().autocommit_block():
+        for name, columns, where in EVENT_LIST_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON events ({columns}) WHERE {where}"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _columns, _where in EVENT_LIST_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    op.drop_column("events", "registered_count")
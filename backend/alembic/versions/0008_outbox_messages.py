@@ -0,0 +1,51 @@
+"""Outbox transaccional de notificaciones (emails y webhooks)
+
+Revision ID: 0008_outbox_messages
+Revises: 0007_event_list_filters
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0008_outbox_messages"
+down_revision = "0007_event_list_filters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbox_messages",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("topic", sa.String(), nullable=False),
+        sa.Column("channel", sa.String(length=7), nullable=False),
+        sa.Column("recipient", sa.String(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(length=7), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_outbox_messages_id", "outbox_messages", ["id"])
+    # Tabla nueva (vacía): no hace falta CONCURRENTLY
+    op.create_index(
+        "ix_outbox_messages_pending",
+        "outbox_messages",
+        ["next_attempt_at"],
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outbox_messages_pending", table_name="outbox_messages")
+    op.drop_index("ix_outbox_messages_id", table_name="outbox_messages")
+    op.drop_table("outbox_messages")
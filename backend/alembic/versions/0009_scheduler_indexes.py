@@ -0,0 +1,39 @@
+"""Índices de los instantes que carga el planificador de temporizadores
+
+Al arrancar (y en cada recarga de la ventana) el planificador consulta los eventos
+programados que empiezan o terminan, y las sesiones que empiezan, en las próximas
+horas. start_date ya tiene índice parcial (0007); se añaden end_date y start_time.
+
+Revision ID: 0009_scheduler_indexes
+Revises: 0008_outbox_messages
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0009_scheduler_indexes"
+down_revision = "0008_outbox_messages"
+branch_labels = None
+depends_on = None
+
+SCHEDULER_INDEXES = [
+    ("ix_events_end_date_live", "events", "end_date"),
+    ("ix_sessions_start_time_live", "sessions", "start_time"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in SCHEDULER_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} ({column}) WHERE is_deleted = false"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _table, _column in SCHEDULER_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,36 @@
+"""Tabla rate_limit_buckets (backend compartido del rate limiting)
+
+Solo se usa con RATE_LIMIT_BACKEND=database. Es UNLOGGED: su contenido es efímero
+(si se pierde en una caída, los límites simplemente se reinician) y así no genera WAL.
+
+Revision ID: 0010_rate_limit_buckets
+Revises: 0009_scheduler_indexes
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0010_rate_limit_buckets"
+down_revision = "0009_scheduler_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rate_limit_buckets",
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("tokens", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.Float(), nullable=False),
+        sa.Column("allowed", sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+        prefixes=["UNLOGGED"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("rate_limit_buckets")
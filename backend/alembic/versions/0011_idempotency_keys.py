@@ -0,0 +1,39 @@
+"""Tabla idempotency_keys (respuestas guardadas por Idempotency-Key)
+
+Solo se usa con IDEMPOTENCY_BACKEND=database. Las filas caducan a las
+IDEMPOTENCY_TTL_SECONDS y el propio backend borra las expiradas.
+
+Revision ID: 0011_idempotency_keys
+Revises: 0010_rate_limit_buckets
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0011_idempotency_keys"
+down_revision = "0010_rate_limit_buckets"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "idempotency_keys",
+        sa.Column("key", sa.String(length=64), nullable=False),
+        sa.Column("fingerprint", sa.String(length=64), nullable=False),
+        sa.Column("status_code", sa.Integer(), nullable=True),
+        sa.Column("headers", sa.JSON(), nullable=True),
+        sa.Column("body", sa.LargeBinary(), nullable=True),
+        sa.Column("expires_at", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index("ix_idempotency_keys_expires_at", "idempotency_keys", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_idempotency_keys_expires_at", table_name="idempotency_keys")
+    op.drop_table("idempotency_keys")
@@ -0,0 +1,38 @@
+"""Tabla event_deletions (borrado en cascada por lotes de eventos eliminados)
+
+Revision ID: 0012_event_deletions
+Revises: 0011_idempotency_keys
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0012_event_deletions"
+down_revision = "0011_idempotency_keys"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_deletions",
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.Column("total_sessions", sa.Integer(), nullable=False),
+        sa.Column("total_registrations", sa.Integer(), nullable=False),
+        sa.Column("sessions_deleted", sa.Integer(), nullable=False),
+        sa.Column("registrations_deleted", sa.Integer(), nullable=False),
+        sa.Column("locked_until", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("event_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("event_deletions")
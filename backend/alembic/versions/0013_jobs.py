@@ -0,0 +1,61 @@
+"""Tabla jobs (trabajos en segundo plano)
+
+Revision ID: 0013_jobs
+Revises: 0012_event_deletions
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0013_jobs"
+down_revision = "0012_event_deletions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("type", sa.String(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(length=9), nullable=False),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("run_at", sa.DateTime(), nullable=False),
+        sa.Column("locked_until", sa.DateTime(), nullable=True),
+        sa.Column("result", sa.JSON(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_jobs_id", "jobs", ["id"])
+    # Tabla nueva (vacía): no hace falta CONCURRENTLY
+    op.create_index(
+        "ix_jobs_pending",
+        "jobs",
+        ["type", "priority", "run_at"],
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+    op.create_index(
+        "ix_jobs_running",
+        "jobs",
+        ["type", "locked_until"],
+        postgresql_where=sa.text("status = 'RUNNING'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_running", table_name="jobs")
+    op.drop_index("ix_jobs_pending", table_name="jobs")
+    op.drop_index("ix_jobs_id", table_name="jobs")
+    op.drop_table("jobs")
@@ -0,0 +1,43 @@
+"""Índices de búsqueda y filtros del listado de usuarios
+
+- GIN trigram (pg_trgm) sobre lower(email) y lower(full_name): búsqueda contains
+  (lower(col) LIKE '%término%') sin recorrer la tabla.
+- B-tree text_pattern_ops sobre lower(email): búsqueda prefix (LIKE 'término%') con
+  cualquier collation.
+- (role, is_active, id) e (is_active, id): filtros del listado ordenado por id.
+
+Revision ID: 0014_user_search_indexes
+Revises: 0013_jobs
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0014_user_search_indexes"
+down_revision = "0013_jobs"
+branch_labels = None
+depends_on = None
+
+USER_SEARCH_INDEXES = [
+    ("ix_users_email_lower_trgm", "USING gin (lower(email) gin_trgm_ops)"),
+    ("ix_users_full_name_lower_trgm", "USING gin (lower(full_name) gin_trgm_ops)"),
+    ("ix_users_email_lower_prefix", "(lower(email) text_pattern_ops)"),
+    ("ix_users_role_is_active_id", "(role, is_active, id)"),
+    ("ix_users_is_active_id", "(is_active, id)"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        for name, definition in USER_SEARCH_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON users {definition}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _definition in USER_SEARCH_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
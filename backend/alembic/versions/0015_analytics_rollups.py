@@ -0,0 +1,67 @@
+"""Rollups diarios de analítica (registros/cancelaciones por evento y altas de usuarios)
+
+Las tablas se rellenan una vez a partir de los datos existentes; después las mantienen
+las escrituras (crud.analytics). En el histórico, una cancelación es un registro
+eliminado antes que su evento: el borrado en cascada copia el deleted_at del evento.
+Los registros ya purgados por retención no se pueden recuperar.
+
+Revision ID: 0015_analytics_rollups
+Revises: 0014_user_search_indexes
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0015_analytics_rollups"
+down_revision = "0014_user_search_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_event_stats",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("registrations", sa.Integer(), nullable=False),
+        sa.Column("cancellations", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("day", "event_id"),
+    )
+    op.create_index("ix_daily_event_stats_event_id_day", "daily_event_stats", ["event_id", "day"])
+    op.create_table(
+        "daily_signups",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("role", sa.String(length=9), nullable=False),
+        sa.Column("signups", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("day", "role"),
+    )
+
+    op.execute(
+        "INSERT INTO daily_event_stats (day, event_id, registrations, cancellations) "
+        "SELECT day, event_id, sum(registrations), sum(cancellations) FROM ("
+        "  SELECT CAST(registered_at AS date) AS day, event_id,"
+        "         count(*) AS registrations, 0 AS cancellations"
+        "  FROM event_registrations GROUP BY 1, 2"
+        "  UNION ALL"
+        "  SELECT CAST(r.deleted_at AS date), r.event_id, 0, count(*)"
+        "  FROM event_registrations r JOIN events e ON e.id = r.event_id"
+        "  WHERE r.is_deleted = true"
+        "    AND (e.is_deleted = false OR r.deleted_at < e.deleted_at)"
+        "  GROUP BY 1, 2"
+        ") AS activity GROUP BY day, event_id"
+    )
+    op.execute(
+        "INSERT INTO daily_signups (day, role, signups) "
+        "SELECT CAST(created_at AS date), CAST(role AS varchar), count(*) "
+        "FROM users GROUP BY 1, 2"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("daily_signups")
+    op.drop_index("ix_daily_event_stats_event_id_day", table_name="daily_event_stats")
+    op.drop_table("daily_event_stats")
@@ -0,0 +1,88 @@
+"""Registro por sesión: contador seats_taken y tabla session_registrations
+
+Revision ID: 0016_session_registrations
+Revises: 0015_analytics_rollups
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0016_session_registrations"
+down_revision = "0015_analytics_rollups"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "sessions",
+        sa.Column("seats_taken", sa.Integer(), server_default=sa.text("0"), nullable=False),
+    )
+    op.add_column(
+        "event_deletions",
+        sa.Column(
+            "session_registrations_deleted",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+    )
+    op.create_table(
+        "session_registrations",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("session_id", sa.Integer(), nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("registered_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["session_id"], ["sessions.id"]),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_session_registrations_id", "session_registrations", ["id"])
+    op.create_index(
+        "uq_session_registrations_user_id_session_id_live",
+        "session_registrations",
+        ["user_id", "session_id"],
+        unique=True,
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+    op.create_index(
+        "ix_session_registrations_session_id_live",
+        "session_registrations",
+        ["session_id"],
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+    op.create_index(
+        "ix_session_registrations_event_id_user_id_live",
+        "session_registrations",
+        ["event_id", "user_id"],
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+    op.create_index(
+        "ix_session_registrations_purge",
+        "session_registrations",
+        ["id"],
+        postgresql_where=sa.text("is_deleted = true"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_session_registrations_purge", table_name="session_registrations")
+    op.drop_index(
+        "ix_session_registrations_event_id_user_id_live", table_name="session_registrations"
+    )
+    op.drop_index("ix_session_registrations_session_id_live", table_name="session_registrations")
+    op.drop_index(
+        "uq_session_registrations_user_id_session_id_live", table_name="session_registrations"
+    )
+    op.drop_index("ix_session_registrations_id", table_name="session_registrations")
+    op.drop_table("session_registrations")
+    op.drop_column("event_deletions", "session_registrations_deleted")
+    op.drop_column("sessions", "seats_taken")
@@ -0,0 +1,43 @@
+"""Cubos de registros por evento para el ranking de tendencia (/events/trending)
+
+Se rellenan con los registros de las últimas 24 horas (cubos de 5 minutos, los valores
+por defecto de TRENDING_*); después los mantiene crud.analytics.record_registration.
+
+Revision ID: 0017_trending_buckets
+Revises: 0016_session_registrations
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0017_trending_buckets"
+down_revision = "0016_session_registrations"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_registration_buckets",
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("registrations", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("bucket_start", "event_id"),
+    )
+
+    op.execute(
+        "INSERT INTO event_registration_buckets (bucket_start, event_id, registrations) "
+        "SELECT to_timestamp(floor(extract(epoch FROM registered_at) / 300) * 300)"
+        "         AT TIME ZONE 'UTC', event_id, count(*) "
+        "FROM event_registrations "
+        "WHERE registered_at >= (now() AT TIME ZONE 'UTC') - interval '24 hours' "
+        "GROUP BY 1, 2"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("event_registration_buckets")
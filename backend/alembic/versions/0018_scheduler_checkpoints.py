@@ -0,0 +1,31 @@
+"""Marca persistente del planificador (temporizadores ya disparados)
+
+Revision ID: 0018_scheduler_checkpoints
+Revises: 0017_trending_buckets
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0018_scheduler_checkpoints"
+down_revision = "0017_trending_buckets"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scheduler_checkpoints",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("fired_until", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("scheduler_checkpoints")
@@ -1,21 +1,88 @@
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from app.api.v1 import attendees, auth, events, sessions, users
+from app.api.v1 import analytics, attendees, auth, calendar, events, jobs, sessions, users
 from app.config import settings
 from app.core.exceptions import APIException
+from app.core.idempotency import IdempotencyMiddleware
+from app.core.serialization import ORJSONResponse
+
+logger = logging.getLogger("uvicorn.error")
+
+
+def _report_boot_time() -> None:
+    """
+    Reporta el tiempo desde el arranque del contenedor hasta que la app está lista.
+    BOOT_STARTED_AT (ms) lo exporta docker-entrypoint.sh.
+    """
+    boot_started_at = os.getenv("BOOT_STARTED_AT")
+    if not boot_started_at:
+        return
+    elapsed_ms = int(time.time() * 1000) - int(boot_started_at)
+    logger.info("Aplicación lista en %d ms desde el arranque del contenedor", elapsed_ms)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Ciclo de vida de la aplicación (arranque y apagado)"""
+    from app.database import engine
+    from app.services.job_service import run_jobs
+    from app.services.live_service import listen_for_changes
+    from app.services.outbox_service import dispatch_periodically
+    from app.services.retention_service import purge_periodically
+    from app.services.schedule_service import run_scheduler
+    from app.services.trending_service import prune_periodically
+
+    background_tasks = []
+    if settings.PURGE_ENABLED:
+        background_tasks.append(asyncio.create_task(purge_periodically()))
+    if settings.JOBS_ENABLED:
+        background_tasks.append(asyncio.create_task(run_jobs()))
+    if settings.OUTBOX_DISPATCH_ENABLED:
+        background_tasks.append(asyncio.create_task(dispatch_periodically()))
+    if settings.TRENDING_PRUNE_ENABLED:
+        background_tasks.append(asyncio.create_task(prune_periodically()))
+    if settings.SCHEDULER_ENABLED:
+        background_tasks.append(asyncio.create_task(run_scheduler()))
+    if engine.dialect.name == "postgresql":
+        # Actualizaciones en vivo (SSE): cambios de todos los workers vía LISTEN/NOTIFY
+        background_tasks.append(asyncio.create_task(listen_for_changes()))
+
+    _report_boot_time()
+    yield
+
+    for task in background_tasks:
+        task.cancel()
 
 
 def create_app() -> FastAPI:
     """Factory function para crear la aplicación FastAPI"""
     app = FastAPI(
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         title=settings.PROJECT_NAME,
         description="API de Gestión de Eventos - Documentación automática",
         version=settings.VERSION,
         docs_url="/swagger",
         openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     )
+    # Reintentos seguros de los POST de creación e inscripción (cabecera Idempotency-Key)
+    app.add_middleware(
+        IdempotencyMiddleware,
+        routes=[
+            ("POST", rf"{settings.API_V1_PREFIX}/events/?"),
+            ("POST", rf"{settings.API_V1_PREFIX}/sessions/?"),
+            ("POST", rf"{settings.API_V1_PREFIX}/attendees/register/\d+"),
+            ("POST", rf"{settings.API_V1_PREFIX}/attendees/sessions(/\d+)?"),
+        ],
+    )
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.BACKEND_CORS_ORIGINS,
@@ -27,7 +94,9 @@ def create_app() -> FastAPI:
     @app.exception_handler(APIException)
     async def api_exception_handler(request: Request, exc: APIException):
         """Maneja excepciones personalizadas de la API"""
-        return JSONResponse(status_code=exc.status_code, content={"detail": exc.message})
+        return JSONResponse(
+            status_code=exc.status_code, content={"detail": exc.message}, headers=exc.headers
+        )
 
     app.include_router(
         auth.router, prefix=f"{settings.API_V1_PREFIX}/auth", tags=["Authentication"]
@@ -40,6 +109,13 @@ def create_app() -> FastAPI:
         attendees.router, prefix=f"{settings.API_V1_PREFIX}/attendees", tags=["Attendees"]
     )
     app.include_router(users.router, prefix=f"{settings.API_V1_PREFIX}/users", tags=["Users"])
+    app.include_router(
+        calendar.router, prefix=f"{settings.API_V1_PREFIX}/calendar", tags=["Calendar"]
+    )
+    app.include_router(jobs.router, prefix=f"{settings.API_V1_PREFIX}/jobs", tags=["Jobs"])
+    app.include_router(
+        analytics.router, prefix=f"{settings.API_V1_PREFIX}/analytics", tags=["Analytics"]
+    )
 
     @app.get("/")
     def root():
@@ -1,3 +1,3 @@
-from . import attendees, auth, events, sessions, users
+from . import analytics, attendees, auth, calendar, events, jobs, sessions, users
 
-__all__ = ["auth", "events", "sessions", "attendees", "users"]
+__all__ = ["auth", "events", "sessions", "attendees", "users", "calendar", "jobs", "analytics"]
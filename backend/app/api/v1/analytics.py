@@ -0,0 +1,66 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.core.deps import require_roles
+from app.core.serialization import model_response
+from app.core.unit_of_work import UnitOfWorkRoute
+from app.database import get_db
+from app.models.user import User, UserRole
+from app.schemas.analytics import (
+    AnalyticsRangeQueryParams,
+    EventAnalyticsResponse,
+    RegistrationSeriesResponse,
+    SignupSeriesResponse,
+)
+from app.services.analytics_service import AnalyticsService
+
+router = APIRouter(route_class=UnitOfWorkRoute)
+
+
+@router.get(
+    "/registrations",
+    response_model=RegistrationSeriesResponse,
+    summary="Registros y cancelaciones por día",
+    description="Serie diaria de registros y cancelaciones de todos los eventos entre date_from y date_to (por defecto, los últimos 30 días). Se lee de rollups diarios (requiere rol ADMIN)",
+)
+def get_registration_series(
+    params: AnalyticsRangeQueryParams = Depends(),
+    current_user: User = Depends(require_roles(UserRole.ADMIN)),
+    db: Session = Depends(get_db),
+):
+    """Serie diaria de registros y cancelaciones"""
+    series = AnalyticsService.get_registration_series(db, params.date_from, params.date_to)
+    return model_response(RegistrationSeriesResponse, series)
+
+
+@router.get(
+    "/signups",
+    response_model=SignupSeriesResponse,
+    summary="Altas de usuarios por día",
+    description="Serie diaria de altas de usuarios y totales por rol entre date_from y date_to (por defecto, los últimos 30 días). Se lee de rollups diarios (requiere rol ADMIN)",
+)
+def get_signup_series(
+    params: AnalyticsRangeQueryParams = Depends(),
+    current_user: User = Depends(require_roles(UserRole.ADMIN)),
+    db: Session = Depends(get_db),
+):
+    """Serie diaria de altas de usuarios"""
+    series = AnalyticsService.get_signup_series(db, params.date_from, params.date_to)
+    return model_response(SignupSeriesResponse, series)
+
+
+@router.get(
+    "/events/{event_id}",
+    response_model=EventAnalyticsResponse,
+    summary="Ocupación y registros de un evento",
+    description="Ocupación actual (fill_rate) de un evento y su serie diaria de registros y cancelaciones entre date_from y date_to (requiere rol ADMIN)",
+)
+def get_event_analytics(
+    event_id: int,
+    params: AnalyticsRangeQueryParams = Depends(),
+    current_user: User = Depends(require_roles(UserRole.ADMIN)),
+    db: Session = Depends(get_db),
+):
+    """Ocupación y serie diaria de un evento"""
+    analytics = AnalyticsService.get_event_analytics(db, event_id, params.date_from, params.date_to)
+    return model_response(EventAnalyticsResponse, analytics)
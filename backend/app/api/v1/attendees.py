@@ -1,21 +1,35 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.deps import require_roles
+from app.core.deps import rate_limit, require_roles, write_rate_limit
+from app.core.unit_of_work import UnitOfWorkRoute
 from app.database import get_db
 from app.models.user import User, UserRole
-from app.schemas.attendee import EventAttendeesResponse, MyEventsListResponse
+from app.schemas.attendee import (
+    EventAttendeesResponse,
+    MyEventsListResponse,
+    MySessionsResponse,
+    RegistrationCheckResponse,
+    SessionBatchRegistrationRequest,
+    SessionBatchRegistrationResponse,
+    SessionRegistrationStatus,
+)
 from app.schemas.pagination import PaginationQueryParams
+from app.schemas.session import SessionResponse
 from app.services.attendee_service import AttendeeService
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
 
 
 @router.post(
     "/register/{event_id}",
     status_code=status.HTTP_201_CREATED,
     summary="Registrarse a un evento",
-    description="Registra al usuario actual a un evento (requiere rol ATTENDEE)",
+    description="Registra al usuario actual a un evento (requiere rol ATTENDEE). Con Idempotency-Key, los reintentos devuelven la primera respuesta",
+    dependencies=[
+        Depends(write_rate_limit),
+        Depends(rate_limit("event_registration", "RATE_LIMIT_EVENT_REGISTRATION_USER", per="user")),
+    ],
 )
 def register_to_event(
     event_id: int,
@@ -35,6 +49,7 @@ def register_to_event(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Cancelar registro a un evento",
     description="Cancela el registro del usuario actual a un evento",
+    dependencies=[Depends(write_rate_limit)],
 )
 def unregister_from_event(
     event_id: int,
@@ -45,6 +60,87 @@ def unregister_from_event(
     AttendeeService.unregister_from_event(db, event_id, current_user)
 
 
+@router.post(
+    "/sessions/{session_id}",
+    status_code=status.HTTP_201_CREATED,
+    summary="Reservar plaza en una sesión",
+    description="Reserva plaza en una sesión con aforo para el usuario actual, que debe estar registrado en el evento (requiere rol ATTENDEE). Con Idempotency-Key, los reintentos devuelven la primera respuesta",
+    dependencies=[
+        Depends(write_rate_limit),
+        Depends(rate_limit("event_registration", "RATE_LIMIT_EVENT_REGISTRATION_USER", per="user")),
+    ],
+)
+def register_to_session(
+    session_id: int,
+    current_user: User = Depends(require_roles(UserRole.ATTENDEE)),
+    db: Session = Depends(get_db),
+):
+    """Reservar plaza en una sesión"""
+    result = AttendeeService.register_to_session(db, session_id, current_user)
+    return {
+        "message": "Plaza reservada en la sesión",
+        "data": {"session_id": session_id, "seats_taken": result.seats_taken},
+    }
+
+
+@router.post(
+    "/sessions",
+    response_model=SessionBatchRegistrationResponse,
+    summary="Reservar plaza en varias sesiones",
+    description="Reserva plaza en varias sesiones a la vez (máximo 20). Cada sesión se reserva o no por separado y la respuesta indica el resultado de cada una (requiere rol ATTENDEE)",
+    dependencies=[
+        Depends(write_rate_limit),
+        Depends(rate_limit("event_registration", "RATE_LIMIT_EVENT_REGISTRATION_USER", per="user")),
+    ],
+)
+def register_to_sessions(
+    body: SessionBatchRegistrationRequest,
+    current_user: User = Depends(require_roles(UserRole.ATTENDEE)),
+    db: Session = Depends(get_db),
+):
+    """Reservar plaza en varias sesiones"""
+    results = AttendeeService.register_to_sessions(db, body.session_ids, current_user)
+    return SessionBatchRegistrationResponse(
+        registered=sum(result.status == SessionRegistrationStatus.REGISTERED for result in results),
+        results=results,
+    )
+
+
+@router.delete(
+    "/sessions/{session_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Cancelar plaza en una sesión",
+    description="Cancela la plaza del usuario actual en una sesión y la devuelve al aforo",
+    dependencies=[Depends(write_rate_limit)],
+)
+def unregister_from_session(
+    session_id: int,
+    current_user: User = Depends(require_roles(UserRole.ATTENDEE)),
+    db: Session = Depends(get_db),
+):
+    """Cancelar plaza en una sesión"""
+    AttendeeService.unregister_from_session(db, session_id, current_user)
+
+
+@router.get(
+    "/event/{event_id}/my-sessions",
+    response_model=MySessionsResponse,
+    summary="Obtener mis sesiones de un evento",
+    description="Obtiene las sesiones del evento en las que el usuario actual tiene plaza, por hora de inicio (requiere rol ATTENDEE)",
+)
+def get_my_event_sessions(
+    event_id: int,
+    current_user: User = Depends(require_roles(UserRole.ATTENDEE)),
+    db: Session = Depends(get_db),
+):
+    """Obtener las sesiones de un evento en las que tengo plaza"""
+    sessions = AttendeeService.get_user_event_sessions(db, event_id, current_user)
+    return MySessionsResponse(
+        event_id=event_id,
+        sessions=[SessionResponse.model_validate(session) for session in sessions],
+    )
+
+
 @router.get(
     "/my-events",
     response_model=MyEventsListResponse,
@@ -86,6 +182,22 @@ def get_event_attendees(
     return result
 
 
+@router.get(
+    "/check",
+    response_model=RegistrationCheckResponse,
+    summary="Verificar registro en varios eventos",
+    description="Verifica en una sola consulta si el usuario actual está registrado en cada evento indicado (event_ids repetido, máximo 100)",
+)
+def check_registrations(
+    event_ids: list[int] = Query(...),
+    current_user: User = Depends(require_roles(UserRole.ATTENDEE)),
+    db: Session = Depends(get_db),
+):
+    """Verificar si estoy registrado en varios eventos"""
+    registrations = AttendeeService.check_registrations(db, event_ids, current_user)
+    return RegistrationCheckResponse(registrations=registrations)
+
+
 @router.get(
     "/check/{event_id}",
     summary="Verificar registro en evento",
@@ -4,17 +4,22 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.config import settings
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, rate_limit
 from app.core.security import create_access_token
-from app.crud import attendee as crud_attendee
-from app.crud import event as crud_event
+from app.core.unit_of_work import UnitOfWorkRoute
 from app.database import get_db
 from app.models.user import User
-from app.schemas.event import EventResponse
-from app.schemas.user import Token, UserCreate, UserLogin, UserProfileResponse, UserResponse
+from app.schemas.user import (
+    Token,
+    UserCreate,
+    UserLogin,
+    UserProfileQueryParams,
+    UserProfileResponse,
+    UserResponse,
+)
 from app.services.user_service import UserService
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
 
 
 @router.post(
@@ -23,6 +28,7 @@ router = APIRouter()
     status_code=status.HTTP_201_CREATED,
     summary="Registrar nuevo usuario",
     description="Crea un nuevo usuario en el sistema. Los usuarios registrados desde este endpoint siempre se crean con rol 'attendee' (asistente).",
+    dependencies=[Depends(rate_limit("signup", "RATE_LIMIT_SIGNUP_IP"))],
 )
 def register(user_data: UserCreate, db: Session = Depends(get_db)):
     """Registrar nuevo usuario (siempre como asistente/attendee)"""
@@ -35,6 +41,7 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     response_model=Token,
     summary="Login de usuario",
     description="Autentica un usuario y retorna un token JWT",
+    dependencies=[Depends(rate_limit("login", "RATE_LIMIT_LOGIN_IP"))],
 )
 def login(credentials: UserLogin, db: Session = Depends(get_db)):
     """Login de usuario"""
@@ -56,23 +63,14 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
     "/me",
     response_model=UserProfileResponse,
     summary="Obtener perfil del usuario actual",
-    description="Retorna el perfil completo del usuario autenticado con eventos registrados",
+    description="Retorna el perfil del usuario autenticado con contadores de eventos. "
+    "Con include=upcoming_events incluye una vista previa de los próximos eventos registrados; "
+    "las listas completas están en /attendees/my-events y /events/my/events.",
 )
-def read_users_me(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    """Obtener perfil completo del usuario actual"""
-    registered_events = crud_attendee.get_user_registered_events_all(db, user_id=current_user.id)
-    created_events = crud_event.get_user_events_all(db, user_id=current_user.id)
-    created_events_count = len(created_events)
-
-    registered_events_response = [
-        EventResponse.model_validate(event) for event in registered_events
-    ]
-
-    user_base = UserResponse.model_validate(current_user)
-    profile_response = UserProfileResponse(
-        **user_base.model_dump(),
-        registered_events=registered_events_response,
-        created_events_count=created_events_count,
-    )
-
-    return profile_response
+def read_users_me(
+    params: UserProfileQueryParams = Depends(),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Obtener perfil del usuario actual con contadores agregados"""
+    return UserService.get_profile(db, current_user, include=params.include_set)
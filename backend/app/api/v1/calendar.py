@@ -0,0 +1,116 @@
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.core.deps import get_current_user
+from app.core.unit_of_work import UnitOfWorkRoute
+from app.core.versioning import http_date, is_not_modified
+from app.database import get_db
+from app.models.user import User
+from app.schemas.calendar import CalendarFeedResponse
+from app.services.calendar_service import CalendarService, event_feed_key, user_feed_key
+
+router = APIRouter(route_class=UnitOfWorkRoute)
+
+CALENDAR_MEDIA_TYPE = "text/calendar"  # Starlette añade "; charset=utf-8"
+
+
+def _feed_response(
+    db: Session,
+    feed_key: str,
+    token: str,
+    if_none_match: str | None,
+    if_modified_since: str | None,
+) -> Response:
+    """
+    Responde a la consulta de un feed: 304 si el cliente tiene la versión vigente
+    (primero contra la caché, sin consultar la base de datos) o el feed como stream.
+    """
+    CalendarService.verify_feed_token(token, feed_key)
+
+    validators = CalendarService.get_cached_validators(feed_key)
+    if validators is None or not is_not_modified(if_none_match, if_modified_since, *validators):
+        validators = CalendarService.get_feed_validators(db, feed_key)
+
+    etag, last_modified = validators
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+
+    if is_not_modified(if_none_match, if_modified_since, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # El cuerpo se genera tras el commit de UnitOfWorkRoute, con sus propias sesiones
+    return StreamingResponse(
+        CalendarService.stream_feed(db.get_bind(), feed_key),
+        media_type=CALENDAR_MEDIA_TYPE,
+        headers=headers,
+    )
+
+
+# Los feeds .ics se declaran antes que /events/{event_id} para que no los capture
+@router.get(
+    "/users/{user_id}.ics",
+    response_class=StreamingResponse,
+    summary="Feed iCalendar de un usuario",
+    description="Eventos (y sesiones) a los que el usuario está registrado. Autorizado con el token firmado de la URL; admite If-None-Match / If-Modified-Since (304)",
+)
+def get_user_calendar(
+    user_id: int,
+    token: str = Query(...),
+    if_none_match: str | None = Header(None),
+    if_modified_since: str | None = Header(None),
+    db: Session = Depends(get_db),
+):
+    """Feed iCalendar de los eventos registrados de un usuario"""
+    return _feed_response(db, user_feed_key(user_id), token, if_none_match, if_modified_since)
+
+
+@router.get(
+    "/events/{event_id}.ics",
+    response_class=StreamingResponse,
+    summary="Feed iCalendar de un evento",
+    description="Evento y sus sesiones. Autorizado con el token firmado de la URL; admite If-None-Match / If-Modified-Since (304)",
+)
+def get_event_calendar(
+    event_id: int,
+    token: str = Query(...),
+    if_none_match: str | None = Header(None),
+    if_modified_since: str | None = Header(None),
+    db: Session = Depends(get_db),
+):
+    """Feed iCalendar de un evento y sus sesiones"""
+    return _feed_response(db, event_feed_key(event_id), token, if_none_match, if_modified_since)
+
+
+@router.get(
+    "/me",
+    response_model=CalendarFeedResponse,
+    summary="Obtener URL de mi calendario",
+    description="Devuelve la URL firmada del feed iCalendar con los eventos a los que el usuario actual está registrado",
+)
+def get_my_calendar_feed(request: Request, current_user: User = Depends(get_current_user)):
+    """Obtener URL de suscripción a mi calendario"""
+    token = CalendarService.create_user_feed_token(current_user.id)
+    url = request.url_for("get_user_calendar", user_id=current_user.id).include_query_params(
+        token=token
+    )
+    return CalendarFeedResponse(token=token, url=str(url))
+
+
+@router.get(
+    "/events/{event_id}",
+    response_model=CalendarFeedResponse,
+    summary="Obtener URL del calendario de un evento",
+    description="Devuelve la URL firmada del feed iCalendar de un evento y sus sesiones",
+)
+def get_event_calendar_feed(
+    event_id: int,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Obtener URL de suscripción al calendario de un evento"""
+    token = CalendarService.create_event_feed_token(db, event_id)
+    url = request.url_for("get_event_calendar", event_id=event_id).include_query_params(token=token)
+    return CalendarFeedResponse(token=token, url=str(url))
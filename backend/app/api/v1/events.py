@@ -1,48 +1,143 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.core.deps import require_roles
+from app.config import settings
+from app.core.deps import get_current_user_optional, require_roles, write_rate_limit
+from app.core.serialization import model_response
+from app.core.unit_of_work import UnitOfWorkRoute
+from app.core.versioning import etag
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.schemas.event import (
     EventCreate,
     EventDetailResponse,
+    EventFacetsQueryParams,
+    EventFacetsResponse,
     EventListQueryParams,
     EventListResponse,
     EventResponse,
     EventUpdate,
+    TrendingEventsResponse,
 )
-from app.schemas.pagination import PaginationMetadata, PaginationQueryParams
+from app.schemas.job import JobResponse
+from app.schemas.pagination import PaginationQueryParams
+from app.services.attendee_service import AttendeeService
 from app.services.event_service import EventService
+from app.services.live_service import LiveService
+from app.services.trending_service import TrendingService
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
+
+
+def _live_response(db: Session, snapshots: dict) -> StreamingResponse:
+    """
+    Respuesta SSE sin caché ni buffering de proxies
+
+    Cierra antes la sesión de la petición: get_db solo la cierra cuando termina la
+    respuesta, y cada conexión SSE retendría una conexión del pool durante todo el flujo.
+    """
+    db.close()
+    return StreamingResponse(
+        LiveService.stream(snapshots),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get(
     "/",
     response_model=EventListResponse,
     summary="Listar eventos",
-    description="Lista todos los eventos con filtros opcionales y paginación",
+    description="Lista todos los eventos con filtros combinables (búsqueda, estado, rango de fechas, ubicación, organizador, disponibilidad, capacidad mínima), ordenación y paginación. Con token, cada evento incluye is_registered",
 )
-def list_events(params: EventListQueryParams = Depends(), db: Session = Depends(get_db)):
+def list_events(
+    params: EventListQueryParams = Depends(),
+    current_user: User | None = Depends(get_current_user_optional),
+    db: Session = Depends(get_db),
+):
     """Listar todos los eventos con filtros opcionales y paginación"""
-    events, pagination_metadata = EventService.list_events(
-        db, page=params.page, per_page=params.per_page, search=params.search, status=params.status
+    events, pagination_metadata = EventService.list_events(db, **params.model_dump())
+    AttendeeService.annotate_registrations(db, events, current_user)
+
+    return model_response(
+        EventListResponse,
+        {"events": events, "pagination": pagination_metadata},
+        headers={"Vary": "Authorization"},
     )
 
-    return EventListResponse(events=events, pagination=pagination_metadata)
+
+@router.get(
+    "/facets",
+    response_model=EventFacetsResponse,
+    summary="Conteos del listado de eventos",
+    description="Con los mismos filtros que el listado, devuelve el número de eventos por estado computado (ignorando el filtro de estado), las ubicaciones más frecuentes y el número de eventos por mes",
+)
+def get_event_facets(params: EventFacetsQueryParams = Depends(), db: Session = Depends(get_db)):
+    """Conteos por estado, ubicación y mes para las pestañas y filtros del listado"""
+    facets = EventService.get_event_facets(db, **params.model_dump())
+    return model_response(EventFacetsResponse, facets)
+
+
+@router.get(
+    "/trending",
+    response_model=TrendingEventsResponse,
+    summary="Eventos en tendencia",
+    description="Eventos con más registros recientes (cubos de 5 minutos en las últimas 24 horas, con decaimiento exponencial), excluyendo cancelados y terminados. La respuesta se cachea unos segundos y es igual para todos los usuarios",
+)
+def get_trending_events(limit: int = 10, db: Session = Depends(get_db)):
+    """Ranking de eventos por velocidad reciente de registros"""
+    trending = TrendingService.get_trending_events(db, limit=limit)
+    return model_response(
+        TrendingEventsResponse,
+        trending,
+        headers={"Cache-Control": f"public, max-age={settings.TRENDING_CACHE_TTL_SECONDS}"},
+    )
+
+
+@router.get(
+    "/live",
+    response_class=StreamingResponse,
+    summary="Actualizaciones en vivo de varios eventos (SSE)",
+    description="Flujo Server-Sent Events con plazas disponibles, is_full y estado de los eventos indicados (event_ids repetido, máximo 100). Envía el estado actual y después un mensaje update por cambio, como mucho LIVE_UPDATES_MAX_PER_SECOND por evento",
+)
+def stream_events_live(event_ids: list[int] = Query(...), db: Session = Depends(get_db)):
+    """Suscribirse a los cambios de plazas y estado de varios eventos"""
+    snapshots = LiveService.get_snapshots(db, event_ids)
+    return _live_response(db, snapshots)
 
 
 @router.get(
     "/{event_id}",
     response_model=EventDetailResponse,
     summary="Obtener detalle de evento",
-    description="Obtiene el detalle de un evento con sesiones incluidas",
+    description="Obtiene el detalle de un evento con sesiones incluidas. La cabecera ETag contiene la versión del evento. Con token, incluye is_registered",
 )
-def get_event(event_id: int, db: Session = Depends(get_db)):
+def get_event(
+    event_id: int,
+    current_user: User | None = Depends(get_current_user_optional),
+    db: Session = Depends(get_db),
+):
     """Obtener detalle de un evento con sesiones incluidas"""
-    event = EventService.get_event(db, event_id, include_sessions=True)
-    return EventDetailResponse.model_validate(event)
+    event = EventService.get_event_detail(db, event_id)
+    AttendeeService.annotate_registrations(db, [event], current_user)
+    return model_response(
+        EventDetailResponse,
+        event,
+        headers={"ETag": etag(event.version), "Vary": "Authorization"},
+    )
+
+
+@router.get(
+    "/{event_id}/live",
+    response_class=StreamingResponse,
+    summary="Actualizaciones en vivo de un evento (SSE)",
+    description="Flujo Server-Sent Events con plazas disponibles, is_full y estado del evento: el estado actual y después un mensaje update por cambio (deleted si se elimina). Sustituye al polling de la página de detalle",
+)
+def stream_event_live(event_id: int, db: Session = Depends(get_db)):
+    """Suscribirse a los cambios de plazas y estado de un evento"""
+    snapshots = LiveService.get_event_snapshot(db, event_id)
+    return _live_response(db, snapshots)
 
 
 @router.post(
@@ -50,7 +145,8 @@ def get_event(event_id: int, db: Session = Depends(get_db)):
     response_model=EventResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Crear nuevo evento",
-    description="Crea un nuevo evento (requiere rol ORGANIZER)",
+    description="Crea un nuevo evento (requiere rol ORGANIZER). Con Idempotency-Key, los reintentos devuelven la primera respuesta",
+    dependencies=[Depends(write_rate_limit)],
 )
 def create_event(
     event_data: EventCreate,
@@ -59,31 +155,39 @@ def create_event(
 ):
     """Crear nuevo evento"""
     new_event = EventService.create_event(db, event_data, current_user)
-    return EventResponse.model_validate(new_event)
+    return model_response(EventResponse, new_event, status_code=status.HTTP_201_CREATED)
 
 
 @router.put(
     "/{event_id}",
     response_model=EventResponse,
     summary="Actualizar evento",
-    description="Actualiza un evento existente (requiere rol ORGANIZER)",
+    description="Actualiza un evento existente (requiere rol ORGANIZER). Con If-Match (ETag del evento) la edición falla con 412 si el evento cambió; una edición concurrente devuelve 409",
+    dependencies=[Depends(write_rate_limit)],
 )
 def update_event(
     event_id: int,
     event_data: EventUpdate,
+    if_match: str | None = Header(None),
     current_user: User = Depends(require_roles(UserRole.ORGANIZER)),
     db: Session = Depends(get_db),
 ):
     """Actualizar evento"""
-    updated_event = EventService.update_event(db, event_id, event_data, current_user)
-    return EventResponse.model_validate(updated_event)
+    updated_event = EventService.update_event(
+        db, event_id, event_data, current_user, if_match=if_match
+    )
+    return model_response(
+        EventResponse, updated_event, headers={"ETag": etag(updated_event.version)}
+    )
 
 
 @router.delete(
     "/{event_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Eliminar evento",
-    description="Elimina un evento (requiere rol ORGANIZER)",
+    description="Elimina un evento (requiere rol ORGANIZER). Sus sesiones y registros dejan de verse al momento y se eliminan en segundo plano: la respuesta 202 incluye el trabajo, consultable en GET /jobs/{id} (cabecera Location)",
+    dependencies=[Depends(write_rate_limit)],
 )
 def delete_event(
     event_id: int,
@@ -91,7 +195,13 @@ def delete_event(
     db: Session = Depends(get_db),
 ):
     """Eliminar evento"""
-    EventService.delete_event(db, event_id, current_user)
+    job = EventService.delete_event(db, event_id, current_user)
+    return model_response(
+        JobResponse,
+        job,
+        status_code=status.HTTP_202_ACCEPTED,
+        headers={"Location": f"{settings.API_V1_PREFIX}/jobs/{job.id}"},
+    )
 
 
 @router.get(
@@ -110,7 +220,4 @@ def get_my_events(
         db, current_user, page=params.page, per_page=params.per_page
     )
 
-    return EventListResponse(
-        events=[EventResponse.model_validate(event) for event in events],
-        pagination=PaginationMetadata(**pagination_metadata),
-    )
+    return model_response(EventListResponse, {"events": events, "pagination": pagination_metadata})
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.core.deps import get_current_user
+from app.core.serialization import model_response
+from app.core.unit_of_work import UnitOfWorkRoute
+from app.database import get_db
+from app.models.user import User
+from app.schemas.job import JobResponse
+from app.services.job_service import JobService
+
+router = APIRouter(route_class=UnitOfWorkRoute)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    summary="Estado de un trabajo en segundo plano",
+    description="Estado, intentos y resultado de un trabajo lanzado por una operación que respondió 202 (solo quien la lanzó o un ADMIN)",
+)
+def get_job(
+    job_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Consultar un trabajo"""
+    job = JobService.get_job(db, job_id, current_user)
+    return model_response(JobResponse, job)
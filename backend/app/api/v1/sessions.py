@@ -1,14 +1,23 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, status
 from sqlalchemy.orm import Session
 
-from app.core.deps import require_roles
+from app.core.deps import require_roles, write_rate_limit
+from app.core.serialization import model_response
+from app.core.unit_of_work import UnitOfWorkRoute
+from app.core.versioning import etag
 from app.database import get_db
 from app.models.user import User, UserRole
-from app.schemas.pagination import PaginationMetadata, PaginationQueryParams
-from app.schemas.session import SessionCreate, SessionListResponse, SessionResponse, SessionUpdate
+from app.schemas.pagination import PaginationQueryParams
+from app.schemas.session import (
+    AgendaConflictsResponse,
+    SessionCreate,
+    SessionListResponse,
+    SessionResponse,
+    SessionUpdate,
+)
 from app.services.session_service import SessionService
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
 
 
 @router.get(
@@ -24,22 +33,37 @@ def get_event_sessions(
     sessions, pagination_metadata = SessionService.get_event_sessions(
         db, event_id, page=params.page, per_page=params.per_page
     )
-    return SessionListResponse(
-        sessions=[SessionResponse.model_validate(session) for session in sessions],
-        pagination=PaginationMetadata(**pagination_metadata),
+    return model_response(
+        SessionListResponse, {"sessions": sessions, "pagination": pagination_metadata}
     )
 
 
+@router.get(
+    "/event/{event_id}/conflicts",
+    response_model=AgendaConflictsResponse,
+    summary="Validar agenda de un evento",
+    description="Detecta todas las sesiones del evento que se solapan en la misma sala o con el mismo ponente (requiere rol ORGANIZER)",
+)
+def get_agenda_conflicts(
+    event_id: int,
+    current_user: User = Depends(require_roles(UserRole.ORGANIZER)),
+    db: Session = Depends(get_db),
+):
+    """Validar la agenda de un evento (conflictos de sala y ponente)"""
+    conflicts = SessionService.get_agenda_conflicts(db, event_id)
+    return model_response(AgendaConflictsResponse, conflicts)
+
+
 @router.get(
     "/{session_id}",
     response_model=SessionResponse,
     summary="Obtener detalle de sesión",
-    description="Obtiene el detalle de una sesión específica",
+    description="Obtiene el detalle de una sesión específica. La cabecera ETag contiene la versión de la sesión",
 )
 def get_session(session_id: int, db: Session = Depends(get_db)):
     """Obtener detalle de una sesión"""
     session = SessionService.get_session(db, session_id)
-    return SessionResponse.model_validate(session)
+    return model_response(SessionResponse, session, headers={"ETag": etag(session.version)})
 
 
 @router.post(
@@ -47,7 +71,8 @@ def get_session(session_id: int, db: Session = Depends(get_db)):
     response_model=SessionResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Crear nueva sesión",
-    description="Crea una nueva sesión para un evento (requiere rol ORGANIZER)",
+    description="Crea una nueva sesión para un evento (requiere rol ORGANIZER). Con Idempotency-Key, los reintentos devuelven la primera respuesta",
+    dependencies=[Depends(write_rate_limit)],
 )
 def create_session(
     session_data: SessionCreate,
@@ -56,24 +81,28 @@ def create_session(
 ):
     """Crear nueva sesión"""
     new_session = SessionService.create_session(db, session_data, current_user)
-    return SessionResponse.model_validate(new_session)
+    return model_response(SessionResponse, new_session, status_code=status.HTTP_201_CREATED)
 
 
 @router.put(
     "/{session_id}",
     response_model=SessionResponse,
     summary="Actualizar sesión",
-    description="Actualiza una sesión existente (requiere rol ORGANIZER)",
+    description="Actualiza una sesión existente (requiere rol ORGANIZER). Con If-Match (ETag de la sesión) la edición falla con 412 si la sesión cambió; una edición concurrente devuelve 409",
+    dependencies=[Depends(write_rate_limit)],
 )
 def update_session(
     session_id: int,
     session_data: SessionUpdate,
+    if_match: str | None = Header(None),
     current_user: User = Depends(require_roles(UserRole.ORGANIZER)),
     db: Session = Depends(get_db),
 ):
     """Actualizar sesión"""
-    updated_session = SessionService.update_session(db, session_id, session_data)
-    return SessionResponse.model_validate(updated_session)
+    updated_session = SessionService.update_session(db, session_id, session_data, if_match=if_match)
+    return model_response(
+        SessionResponse, updated_session, headers={"ETag": etag(updated_session.version)}
+    )
 
 
 @router.delete(
@@ -81,6 +110,7 @@ def update_session(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Eliminar sesión",
     description="Elimina una sesión (requiere rol ORGANIZER)",
+    dependencies=[Depends(write_rate_limit)],
 )
 def delete_session(
     session_id: int,
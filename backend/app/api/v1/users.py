@@ -2,6 +2,8 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.core.deps import require_roles
+from app.core.serialization import model_response
+from app.core.unit_of_work import UnitOfWorkRoute
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.schemas.user import (
@@ -13,7 +15,7 @@ from app.schemas.user import (
 )
 from app.services.user_service import UserService
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
 
 
 @router.post(
@@ -47,14 +49,14 @@ def create_user(
         role=user_data.role,
         is_active=user_data.is_active,
     )
-    return UserResponse.model_validate(new_user)
+    return model_response(UserResponse, new_user, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
     "/",
     response_model=UserListResponse,
     summary="Listar usuarios",
-    description="Lista todos los usuarios con filtros opcionales y paginación (requiere rol ADMIN)",
+    description="Lista todos los usuarios con filtros opcionales y paginación (requiere rol ADMIN). search_mode=contains busca el término en email o nombre; search_mode=prefix busca emails que empiezan por él (más rápido)",
 )
 def list_users(
     params: UserListQueryParams = Depends(),
@@ -67,11 +69,12 @@ def list_users(
         page=params.page,
         per_page=params.per_page,
         search=params.search,
+        search_mode=params.search_mode,
         role=params.role,
         is_active=params.is_active,
     )
 
-    return UserListResponse(users=users, pagination=pagination_metadata)
+    return model_response(UserListResponse, {"users": users, "pagination": pagination_metadata})
 
 
 @router.get(
@@ -87,7 +90,7 @@ def get_user(
 ):
     """Obtener detalle de un usuario"""
     user = UserService.get_user_by_id(db, user_id)
-    return UserResponse.model_validate(user)
+    return model_response(UserResponse, user)
 
 
 @router.put(
@@ -108,4 +111,4 @@ def update_user(
         user_id,
         user_data,
     )
-    return UserResponse.model_validate(updated_user)
+    return model_response(UserResponse, updated_user)
@@ -26,6 +26,110 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = os.getenv("PROJECT_NAME", "Mis Eventos API")
     VERSION: str = os.getenv("VERSION", "1.0.0")
     API_V1_PREFIX: str = os.getenv("API_V1_PREFIX", "/api/v1")
+    # Servidor (run.py): sin auto-reload por defecto; RELOAD=true solo en desarrollo
+    RELOAD: bool = os.getenv("RELOAD", "false").lower() == "true"
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+    # Perfil (/auth/me): tamaño de la vista previa de próximos eventos registrados
+    PROFILE_PREVIEW_SIZE: int = int(os.getenv("PROFILE_PREVIEW_SIZE", "5"))
+    # Particionado por rango de event_registrations (app.scripts.partition_maintenance)
+    PARTITION_MONTHS_AHEAD: int = int(os.getenv("PARTITION_MONTHS_AHEAD", "3"))
+    PARTITION_RETENTION_MONTHS: int = int(os.getenv("PARTITION_RETENTION_MONTHS", "24"))
+    # Purgado de filas soft-deleted (app.scripts.purge_deleted y tarea en segundo plano)
+    PURGE_ENABLED: bool = os.getenv("PURGE_ENABLED", "false").lower() == "true"
+    PURGE_RETENTION_DAYS: int = int(os.getenv("PURGE_RETENTION_DAYS", "90"))
+    PURGE_MODE: str = os.getenv("PURGE_MODE", "delete")  # delete | archive
+    PURGE_BATCH_SIZE: int = int(os.getenv("PURGE_BATCH_SIZE", "500"))
+    PURGE_BATCH_SLEEP_SECONDS: float = float(os.getenv("PURGE_BATCH_SLEEP_SECONDS", "0.5"))
+    PURGE_INTERVAL_SECONDS: int = int(os.getenv("PURGE_INTERVAL_SECONDS", "3600"))
+    # Trabajos en segundo plano (tabla jobs). JOBS_ENABLED arranca el runner en el backend;
+    # alternativa: app.scripts.run_jobs como proceso aparte
+    JOBS_ENABLED: bool = os.getenv("JOBS_ENABLED", "true").lower() == "true"
+    JOBS_POLL_INTERVAL_SECONDS: float = float(os.getenv("JOBS_POLL_INTERVAL_SECONDS", "2"))
+    # Reserva de un trabajo en curso (el runner la renueva en cada sondeo)
+    JOBS_LEASE_SECONDS: int = int(os.getenv("JOBS_LEASE_SECONDS", "60"))
+    JOBS_MAX_ATTEMPTS: int = int(os.getenv("JOBS_MAX_ATTEMPTS", "5"))
+    JOBS_BACKOFF_BASE_SECONDS: float = float(os.getenv("JOBS_BACKOFF_BASE_SECONDS", "10"))
+    JOBS_BACKOFF_MAX_SECONDS: float = float(os.getenv("JOBS_BACKOFF_MAX_SECONDS", "600"))
+    JOBS_CASCADE_CONCURRENCY: int = int(os.getenv("JOBS_CASCADE_CONCURRENCY", "2"))
+    # Borrado en cascada por lotes de sesiones y registros de eventos eliminados (trabajo
+    # event.cascade o app.scripts.cascade_deletes)
+    CASCADE_BATCH_SIZE: int = int(os.getenv("CASCADE_BATCH_SIZE", "1000"))
+    CASCADE_BATCH_SLEEP_SECONDS: float = float(os.getenv("CASCADE_BATCH_SLEEP_SECONDS", "0.1"))
+    CASCADE_LEASE_SECONDS: int = int(os.getenv("CASCADE_LEASE_SECONDS", "300"))
+    # Facetas del listado de eventos (GET /events/facets): caché por filtro normalizado
+    EVENT_FACETS_CACHE_TTL_SECONDS: int = int(os.getenv("EVENT_FACETS_CACHE_TTL_SECONDS", "30"))
+    EVENT_FACETS_CACHE_MAX_ENTRIES: int = int(os.getenv("EVENT_FACETS_CACHE_MAX_ENTRIES", "1000"))
+    # Outbox de notificaciones (emails y webhooks) y su dispatcher
+    OUTBOX_DISPATCH_ENABLED: bool = os.getenv("OUTBOX_DISPATCH_ENABLED", "false").lower() == "true"
+    OUTBOX_BATCH_SIZE: int = int(os.getenv("OUTBOX_BATCH_SIZE", "100"))
+    OUTBOX_CONCURRENCY: int = int(os.getenv("OUTBOX_CONCURRENCY", "10"))
+    OUTBOX_MAX_ATTEMPTS: int = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "8"))
+    OUTBOX_BACKOFF_BASE_SECONDS: float = float(os.getenv("OUTBOX_BACKOFF_BASE_SECONDS", "30"))
+    OUTBOX_BACKOFF_MAX_SECONDS: float = float(os.getenv("OUTBOX_BACKOFF_MAX_SECONDS", "3600"))
+    OUTBOX_LEASE_SECONDS: int = int(os.getenv("OUTBOX_LEASE_SECONDS", "300"))
+    OUTBOX_POLL_INTERVAL_SECONDS: float = float(os.getenv("OUTBOX_POLL_INTERVAL_SECONDS", "5"))
+    # Los mensajes entregados (SENT) se borran en el purgado de retención pasados N días
+    OUTBOX_RETENTION_DAYS: int = int(os.getenv("OUTBOX_RETENTION_DAYS", "7"))
+    OUTBOX_WEBHOOK_URLS: str | list[str] = os.getenv("OUTBOX_WEBHOOK_URLS", "")
+    OUTBOX_WEBHOOK_TIMEOUT_SECONDS: float = float(os.getenv("OUTBOX_WEBHOOK_TIMEOUT_SECONDS", "10"))
+    # SMTP vacío → buzón local en memoria/log (MailboxEmailAdapter)
+    SMTP_HOST: str = os.getenv("SMTP_HOST", "")
+    SMTP_PORT: int = int(os.getenv("SMTP_PORT", "1025"))
+    SMTP_SENDER: str = os.getenv("SMTP_SENDER", "no-reply@mis-eventos.local")
+    # Planificador de temporizadores (inicio/fin de eventos y recordatorios de sesiones).
+    # Con varios workers solo dispara el que obtiene el lock consultivo (líder)
+    SCHEDULER_ENABLED: bool = os.getenv("SCHEDULER_ENABLED", "false").lower() == "true"
+    SCHEDULER_HORIZON_SECONDS: int = int(os.getenv("SCHEDULER_HORIZON_SECONDS", "21600"))
+    SCHEDULER_RELOAD_SECONDS: int = int(os.getenv("SCHEDULER_RELOAD_SECONDS", "600"))
+    # Retraso máximo con el que se recuperan los avisos vencidos con el proceso parado
+    SCHEDULER_CATCHUP_SECONDS: int = int(os.getenv("SCHEDULER_CATCHUP_SECONDS", "86400"))
+    SESSION_REMINDER_MINUTES: int = int(os.getenv("SESSION_REMINDER_MINUTES", "30"))
+    # Rate limiting (token bucket "<peticiones>/<segundos>") y backoff de login por cuenta.
+    # RATE_LIMIT_BACKEND: memory (por worker) | database (compartido, rate_limit_buckets)
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND", "memory")
+    RATE_LIMIT_MAX_KEYS: int = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+    RATE_LIMIT_LOGIN_IP: str = os.getenv("RATE_LIMIT_LOGIN_IP", "10/60")
+    RATE_LIMIT_SIGNUP_IP: str = os.getenv("RATE_LIMIT_SIGNUP_IP", "5/60")
+    RATE_LIMIT_WRITE_USER: str = os.getenv("RATE_LIMIT_WRITE_USER", "60/60")
+    RATE_LIMIT_EVENT_REGISTRATION_USER: str = os.getenv(
+        "RATE_LIMIT_EVENT_REGISTRATION_USER", "10/60"
+    )
+    LOGIN_FREE_ATTEMPTS: int = int(os.getenv("LOGIN_FREE_ATTEMPTS", "5"))
+    LOGIN_BACKOFF_BASE_SECONDS: float = float(os.getenv("LOGIN_BACKOFF_BASE_SECONDS", "2"))
+    LOGIN_BACKOFF_MAX_SECONDS: float = float(os.getenv("LOGIN_BACKOFF_MAX_SECONDS", "900"))
+    # Cabecera Idempotency-Key en los POST de creación e inscripción.
+    # IDEMPOTENCY_BACKEND: memory (por worker) | database (compartido, idempotency_keys)
+    IDEMPOTENCY_ENABLED: bool = os.getenv("IDEMPOTENCY_ENABLED", "true").lower() == "true"
+    IDEMPOTENCY_BACKEND: str = os.getenv("IDEMPOTENCY_BACKEND", "memory")
+    IDEMPOTENCY_TTL_SECONDS: int = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+    IDEMPOTENCY_MAX_KEYS: int = int(os.getenv("IDEMPOTENCY_MAX_KEYS", "10000"))
+    # Reserva de una petición en curso (si el worker muere, la clave se libera al vencer)
+    IDEMPOTENCY_LOCK_SECONDS: float = float(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "60"))
+    # Espera máxima de un duplicado concurrente antes de responder 409
+    IDEMPOTENCY_WAIT_SECONDS: float = float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", "30"))
+    # Actualizaciones en vivo por SSE (/events/{id}/live): coalescido por evento, latido y
+    # duración máxima de cada conexión (EventSource se reconecta solo)
+    LIVE_UPDATES_MAX_PER_SECOND: float = float(os.getenv("LIVE_UPDATES_MAX_PER_SECOND", "2"))
+    LIVE_HEARTBEAT_SECONDS: float = float(os.getenv("LIVE_HEARTBEAT_SECONDS", "15"))
+    LIVE_STREAM_MAX_SECONDS: float = float(os.getenv("LIVE_STREAM_MAX_SECONDS", "300"))
+    # Analítica del panel de administración (/analytics): rango por defecto y máximo en días
+    ANALYTICS_DEFAULT_DAYS: int = int(os.getenv("ANALYTICS_DEFAULT_DAYS", "30"))
+    ANALYTICS_MAX_DAYS: int = int(os.getenv("ANALYTICS_MAX_DAYS", "1830"))
+    # Eventos en tendencia (/events/trending): registros por cubos de TRENDING_BUCKET_SECONDS
+    # en una ventana de TRENDING_WINDOW_HOURS, con decaimiento exponencial (semivida)
+    TRENDING_BUCKET_SECONDS: int = int(os.getenv("TRENDING_BUCKET_SECONDS", "300"))
+    TRENDING_WINDOW_HOURS: int = int(os.getenv("TRENDING_WINDOW_HOURS", "24"))
+    TRENDING_HALF_LIFE_MINUTES: float = float(os.getenv("TRENDING_HALF_LIFE_MINUTES", "120"))
+    TRENDING_CACHE_TTL_SECONDS: int = int(os.getenv("TRENDING_CACHE_TTL_SECONDS", "60"))
+    TRENDING_MAX_LIMIT: int = int(os.getenv("TRENDING_MAX_LIMIT", "50"))
+    # Borrado periódico de los cubos fuera de la ventana (independiente de PURGE_ENABLED)
+    TRENDING_PRUNE_ENABLED: bool = os.getenv("TRENDING_PRUNE_ENABLED", "true").lower() == "true"
+    TRENDING_PRUNE_INTERVAL_SECONDS: int = int(os.getenv("TRENDING_PRUNE_INTERVAL_SECONDS", "3600"))
+    # Feeds iCalendar (/calendar): validez de los tokens de URL y caché de ETag/Last-Modified
+    CALENDAR_TOKEN_EXPIRE_DAYS: int = int(os.getenv("CALENDAR_TOKEN_EXPIRE_DAYS", "365"))
+    CALENDAR_CACHE_TTL_SECONDS: int = int(os.getenv("CALENDAR_CACHE_TTL_SECONDS", "300"))
+    CALENDAR_CACHE_MAX_ENTRIES: int = int(os.getenv("CALENDAR_CACHE_MAX_ENTRIES", "10000"))
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -33,6 +137,10 @@ class Settings(BaseSettings):
             self.BACKEND_CORS_ORIGINS = [
                 origin.strip() for origin in self.BACKEND_CORS_ORIGINS.split(",") if origin.strip()
             ]
+        if isinstance(self.OUTBOX_WEBHOOK_URLS, str):
+            self.OUTBOX_WEBHOOK_URLS = [
+                url.strip() for url in self.OUTBOX_WEBHOOK_URLS.split(",") if url.strip()
+            ]
 
     class Config:
         env_file = ".env"
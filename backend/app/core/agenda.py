@@ -0,0 +1,81 @@
+"""
+Detección de conflictos de agenda (sala y ponente) entre sesiones
+
+Dos sesiones están en conflicto si comparten sala (``location``) o ponente
+(``speaker_name``) y sus intervalos semiabiertos ``[start_time, end_time)`` se solapan.
+Las claves se comparan sin espacios extremos ni distinción de mayúsculas, igual que
+las restricciones de exclusión ``lower(btrim(...)) WITH =`` de PostgreSQL. ``btrim``
+solo quita espacios (no tabuladores ni saltos de línea), así que aquí tampoco.
+
+``find_conflicts`` usa sort-and-sweep: ordena las sesiones por inicio y recorre la
+lista manteniendo un heap con las sesiones aún abiertas (ordenadas por fin).
+Coste O(n log n + k), siendo k el número de conflictos, en lugar de comparar todos
+los pares (O(n²)).
+"""
+
+import heapq
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+# Tipo de conflicto -> atributo de la sesión que se compara
+CONFLICT_KINDS = {"location": "location", "speaker": "speaker_name"}
+
+# SQLSTATE de PostgreSQL para violaciones de restricciones de exclusión
+EXCLUSION_VIOLATION = "23P01"
+
+
+def normalize_key(value: str | None) -> str | None:
+    """Clave de comparación de sala/ponente (None si está vacía)"""
+    if value is None:
+        return None
+    value = value.strip(" ").lower()
+    return value or None
+
+
+def find_conflicts(sessions: Iterable[Any]) -> list[dict[str, Any]]:
+    """
+    Encuentra todos los conflictos de sala y de ponente de una agenda.
+
+    Args:
+        sessions: Sesiones (objetos ORM o filas) con id, start_time, end_time,
+            location y speaker_name
+
+    Returns:
+        Lista de conflictos (kind, value, session_id, conflicting_session_id,
+        overlap_start, overlap_end) ordenada por inicio del solapamiento.
+        Cada par de sesiones aparece una vez por tipo de conflicto.
+    """
+    groups: dict[tuple[str, str], list[Any]] = defaultdict(list)
+    for session in sessions:
+        for kind, attribute in CONFLICT_KINDS.items():
+            key = normalize_key(getattr(session, attribute))
+            if key is not None:
+                groups[(kind, key)].append(session)
+
+    conflicts = []
+    for (kind, _key), group in groups.items():
+        if len(group) < 2:
+            continue
+        group.sort(key=lambda session: (session.start_time, session.id))
+        active: list[tuple[datetime, int]] = []  # Heap (end_time, id) de sesiones abiertas
+        for session in group:
+            # Las sesiones que terminan antes (o justo cuando) empieza esta ya no solapan
+            while active and active[0][0] <= session.start_time:
+                heapq.heappop(active)
+            for end_time, other_id in active:
+                conflicts.append(
+                    {
+                        "kind": kind,
+                        "value": getattr(session, CONFLICT_KINDS[kind]),
+                        "session_id": other_id,
+                        "conflicting_session_id": session.id,
+                        "overlap_start": session.start_time,
+                        "overlap_end": min(end_time, session.end_time),
+                    }
+                )
+            heapq.heappush(active, (session.end_time, session.id))
+
+    conflicts.sort(key=lambda c: (c["overlap_start"], c["session_id"], c["conflicting_session_id"]))
+    return conflicts
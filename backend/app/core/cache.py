@@ -0,0 +1,64 @@
+"""
+Caché en memoria con expiración (TTL) y tamaño máximo (LRU)
+
+Caché local de cada proceso: con varios workers cada uno tiene la suya, por lo que
+solo debe guardar datos que puedan estar desfasados como mucho ``ttl_seconds``.
+Es segura entre hilos (los endpoints síncronos de FastAPI se ejecutan en un threadpool).
+
+Uso:
+    feeds_cache = TTLCache(ttl_seconds=300, max_entries=10_000)
+    feeds_cache.set("user:1", value)
+    feeds_cache.get("user:1")  # None si no existe o expiró
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    """Caché LRU con expiración por entrada"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Obtiene un valor vigente (y lo marca como usado recientemente)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float | None = None) -> None:
+        """Guarda un valor; descarta el menos usado si se supera max_entries"""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Elimina una entrada (si existe)"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Vacía la caché"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -1,60 +1,100 @@
 """
 Utilidades para manejo de base de datos - Helpers reutilizables
+
+Los helpers escriben con ``flush`` y no hacen commit: la petición es la unidad de trabajo
+y confirma una sola vez al final (ver app.core.unit_of_work). El flush ejecuta el
+``INSERT ... RETURNING`` (id generado) o el UPDATE en la transacción de la petición, así
+que la instancia queda completa sin el SELECT extra de ``db.refresh``.
+
+``advisory_lock`` coordina las tareas periódicas entre workers y procesos: con
+``WEB_CONCURRENCY > 1`` cada worker arranca las mismas tareas y solo una debe trabajar.
+``advisory_xact_lock`` serializa una sección crítica corta dentro de una transacción.
 """
 
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from typing import TypeVar
 
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
 T = TypeVar("T")
 
 
-def save_and_refresh(db: Session, instance: T, refresh: bool = True) -> T:
+def lock_key(name: str) -> int:
+    """Clave numérica estable (pg_advisory_lock) de un lock con nombre"""
+    return zlib.crc32(name.encode())
+
+
+@contextmanager
+def advisory_lock(bind: Engine, name: str) -> Iterator[bool]:
     """
-    Guarda una instancia en la base de datos y la refresca
+    Intenta tomar un lock consultivo de PostgreSQL sin esperar
 
-    Args:
-        db: Sesión de base de datos
-        instance: Instancia del modelo a guardar
-        refresh: Si True, refresca la instancia después del commit
+    El lock es de sesión y se toma en una conexión propia, así que se mantiene aunque
+    el trabajo haga varios commits con otras sesiones. Fuera de PostgreSQL (SQLite en
+    los tests) siempre se obtiene.
 
-    Returns:
-        La instancia guardada (y refrescada si refresh=True)
+    Uso:
+        with advisory_lock(db.get_bind(), "retention_purge") as acquired:
+            if acquired:
+                ...
+
+    Yields:
+        True si el lock se ha obtenido (otro proceso no lo tiene)
     """
-    db.add(instance)
-    db.commit()
-    if refresh:
-        db.refresh(instance)
-    return instance
+    if bind.dialect.name != "postgresql":
+        yield True
+        return
+    with bind.connect() as conn:
+        params = {"key": lock_key(name)}
+        acquired = conn.execute(text("SELECT pg_try_advisory_lock(:key)"), params).scalar()
+        conn.commit()
+        try:
+            yield bool(acquired)
+        finally:
+            if acquired:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), params)
+                conn.commit()
+
+
+def advisory_xact_lock(db: Session, name: str) -> None:
+    """
+    Toma (esperando) un lock consultivo hasta el final de la transacción de ``db``
+
+    Serializa secciones críticas cortas entre workers; se libera con el commit o el
+    rollback. No hace nada fuera de PostgreSQL.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": lock_key(name)})
 
 
-def update_and_refresh(db: Session, instance: T, refresh: bool = True) -> T:
+def save_and_flush(db: Session, instance: T) -> T:
     """
-    Actualiza una instancia existente y la refresca
+    Añade (o actualiza) una instancia y la escribe en la transacción actual, sin commit
 
     Args:
         db: Sesión de base de datos
-        instance: Instancia del modelo a actualizar
-        refresh: Si True, refresca la instancia después del commit
+        instance: Instancia del modelo a guardar
 
     Returns:
-        La instancia actualizada (y refrescada si refresh=True)
+        La instancia con el id y los valores por defecto ya asignados
     """
-    db.commit()
-    if refresh:
-        db.refresh(instance)
+    db.add(instance)
+    db.flush()
     return instance
 
 
-def soft_delete(db: Session, instance: T, refresh: bool = True) -> T:
+def soft_delete(db: Session, instance: T) -> T:
     """
-    Realiza soft delete de una instancia (marca deleted_at e is_deleted)
+    Realiza soft delete de una instancia (marca deleted_at e is_deleted), sin commit
 
     Args:
         db: Sesión de base de datos
         instance: Instancia del modelo a eliminar (soft delete)
-        refresh: Si True, refresca la instancia después del commit
 
     Returns:
         La instancia con deleted_at e is_deleted actualizados
@@ -68,7 +108,5 @@ def soft_delete(db: Session, instance: T, refresh: bool = True) -> T:
     if hasattr(instance, "updated_at"):
         instance.updated_at = now
 
-    db.commit()
-    if refresh:
-        db.refresh(instance)
+    db.flush()
     return instance
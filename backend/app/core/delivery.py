@@ -0,0 +1,157 @@
+"""
+Adaptadores de entrega de notificaciones del outbox (emails y webhooks)
+
+Cada adaptador expone ``async send(message)`` y lanza una excepción si la entrega
+falla; el dispatcher (OutboxService.dispatch_batch) decide si reintentar.
+
+- SMTPEmailAdapter: SMTP real (o un servidor SMTP local de desarrollo, ej: MailHog)
+- MailboxEmailAdapter: sustituto local de SMTP; guarda los últimos emails en memoria
+  (``max_messages``) y los escribe en el log (por defecto si SMTP_HOST no está configurado)
+- WebhookAdapter: POST JSON a la URL del mensaje
+- StubWebhookAdapter: stub HTTP para tests (registra peticiones, puede simular fallos)
+"""
+
+import asyncio
+import json
+import logging
+import smtplib
+import urllib.error
+import urllib.request
+from collections import deque
+from email.message import EmailMessage
+from typing import Any
+
+from app.config import settings
+from app.models.outbox import OutboxChannel
+
+logger = logging.getLogger("uvicorn.error")
+
+# Asunto de los emails por topic (se formatean con el payload del mensaje)
+EMAIL_SUBJECTS = {
+    "registration.created": "Registro confirmado: {event_name}",
+    "registration.cancelled": "Registro cancelado: {event_name}",
+    "event.updated": "Cambios en el evento: {event_name}",
+    "event.cancelled": "Evento cancelado: {event_name}",
+    "session.reminder": "Recordatorio: {session_title} ({event_name})",
+}
+
+
+class DeliveryError(Exception):
+    """Fallo de entrega (se reintenta según la política del dispatcher)"""
+
+
+def render_email(topic: str, payload: dict[str, Any]) -> tuple[str, str]:
+    """Construye asunto y cuerpo de texto de un email a partir de su topic y payload"""
+    subject = EMAIL_SUBJECTS.get(topic, "Notificación: {event_name}").format_map(
+        {
+            "event_name": payload.get("event_name", ""),
+            "session_title": payload.get("session_title", ""),
+        }
+    )
+    lines = [subject, ""]
+    if payload.get("session_start_time"):
+        lines.append(f"Sesión: {payload['session_start_time']}")
+    if payload.get("start_date"):
+        lines.append(f"Inicio: {payload['start_date']}")
+    if payload.get("location"):
+        lines.append(f"Ubicación: {payload['location']}")
+    if payload.get("changes"):
+        lines.append(f"Cambios: {', '.join(payload['changes'])}")
+    return subject, "\n".join(lines)
+
+
+def webhook_body(message: Any) -> bytes:
+    """Cuerpo JSON de un webhook (el id permite a los receptores descartar duplicados)"""
+    return json.dumps(
+        {"id": message.id, "topic": message.topic, "payload": message.payload}
+    ).encode("utf-8")
+
+
+class SMTPEmailAdapter:
+    """Envío de emails por SMTP (smtplib en un hilo para no bloquear el event loop)"""
+
+    def __init__(self, host: str, port: int, sender: str, timeout: float = 10):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.timeout = timeout
+
+    def _send(self, message: Any) -> None:
+        subject, body = render_email(message.topic, message.payload)
+        email = EmailMessage()
+        email["From"] = self.sender
+        email["To"] = message.recipient
+        email["Subject"] = subject
+        email.set_content(body)
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            smtp.send_message(email)
+
+    async def send(self, message: Any) -> None:
+        await asyncio.to_thread(self._send, message)
+
+
+class MailboxEmailAdapter:
+    """Sustituto local de SMTP: buzón en memoria (solo los últimos ``max_messages``) + log"""
+
+    def __init__(self, max_messages: int = 100):
+        self.sent: deque[dict[str, str]] = deque(maxlen=max_messages)
+
+    async def send(self, message: Any) -> None:
+        subject, body = render_email(message.topic, message.payload)
+        self.sent.append({"to": message.recipient, "subject": subject, "body": body})
+        logger.info("Email (buzón local) para %s: %s", message.recipient, subject)
+
+
+class WebhookAdapter:
+    """POST JSON al webhook (urllib en un hilo; cualquier respuesta no 2xx es un fallo)"""
+
+    def __init__(self, timeout: float = 10):
+        self.timeout = timeout
+
+    def _post(self, message: Any) -> None:
+        request = urllib.request.Request(
+            message.recipient,
+            data=webhook_body(message),
+            headers={
+                "Content-Type": "application/json",
+                "X-Outbox-Message-Id": str(message.id),
+            },
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                if not 200 <= response.status < 300:
+                    raise DeliveryError(f"Webhook respondió {response.status}")
+        except urllib.error.HTTPError as exc:
+            raise DeliveryError(f"Webhook respondió {exc.code}") from exc
+
+    async def send(self, message: Any) -> None:
+        await asyncio.to_thread(self._post, message)
+
+
+class StubWebhookAdapter:
+    """Stub HTTP para tests: registra las peticiones y falla las primeras ``fail_times``"""
+
+    def __init__(self, fail_times: int = 0):
+        self.fail_times = fail_times
+        self.requests: list[dict[str, Any]] = []
+
+    async def send(self, message: Any) -> None:
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise DeliveryError("Webhook respondió 503")
+        self.requests.append({"url": message.recipient, "body": json.loads(webhook_body(message))})
+
+
+def default_adapters() -> dict[OutboxChannel, Any]:
+    """Adaptadores según la configuración (SMTP_*, OUTBOX_WEBHOOK_TIMEOUT_SECONDS)"""
+    if settings.SMTP_HOST:
+        email_adapter = SMTPEmailAdapter(
+            settings.SMTP_HOST, settings.SMTP_PORT, settings.SMTP_SENDER
+        )
+    else:
+        email_adapter = MailboxEmailAdapter()
+    return {
+        OutboxChannel.EMAIL: email_adapter,
+        OutboxChannel.WEBHOOK: WebhookAdapter(timeout=settings.OUTBOX_WEBHOOK_TIMEOUT_SECONDS),
+    }
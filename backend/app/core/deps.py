@@ -4,16 +4,19 @@ Dependencies de FastAPI para autenticación y autorización
 
 from collections.abc import Callable
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
+from app.config import settings
+from app.core.rate_limit import RateLimit, rate_limiter
 from app.core.security import decode_access_token
 from app.crud import user as crud_user
 from app.database import get_db
 from app.models.user import User, UserRole
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 
 def get_current_user(
@@ -42,6 +45,26 @@ def get_current_user(
     return user
 
 
+def get_current_user_optional(
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_security),
+    db: Session = Depends(get_db),
+) -> User | None:
+    """
+    Dependency para endpoints públicos que añaden datos del usuario si está autenticado.
+    Sin token (o con un token inválido o de un usuario inactivo) retorna None en lugar de 401.
+    """
+    if credentials is None:
+        return None
+    email = decode_access_token(credentials.credentials)
+    if email is None:
+        return None
+
+    user = crud_user.get_user_by_email(db, email=email)
+    if user is None or not user.is_active:
+        return None
+    return user
+
+
 def require_roles(*allowed_roles: UserRole) -> Callable:
     """
     Factory function que crea un dependency para validar roles.
@@ -69,3 +92,39 @@ def require_roles(*allowed_roles: UserRole) -> Callable:
         return current_user
 
     return role_checker
+
+
+def rate_limit(route: str, limit_setting: str, per: str = "ip") -> Callable:
+    """
+    Factory function que crea un dependency de rate limiting (token bucket).
+
+    Se declara en ``dependencies`` del endpoint para que se evalúe antes que el resto de
+    dependencies: una petición limitada se rechaza (429 + Retry-After) sin consultar la
+    base de datos.
+
+    Args:
+        route: Nombre del bucket (las rutas que lo comparten comparten el límite)
+        limit_setting: Ajuste de settings con el límite ("<peticiones>/<segundos>")
+        per: "ip" o "user" (sub del token, sin consultar la BD; sin token válido, la IP)
+
+    Usage:
+        @router.post("/login", dependencies=[Depends(rate_limit("login", "RATE_LIMIT_LOGIN_IP"))])
+    """
+
+    def limiter(
+        request: Request,
+        credentials: HTTPAuthorizationCredentials | None = Depends(optional_security),
+    ) -> None:
+        client = f"ip:{request.client.host if request.client else 'unknown'}"
+        if per == "user" and credentials is not None:
+            subject = decode_access_token(credentials.credentials)
+            if subject is not None:
+                client = f"user:{subject}"
+        limit = RateLimit.parse(getattr(settings, limit_setting))
+        rate_limiter.hit(f"{route}:{client}", limit)
+
+    return limiter
+
+
+# Límite común de escrituras por usuario (eventos, sesiones y registros a eventos)
+write_rate_limit = rate_limit("write", "RATE_LIMIT_WRITE_USER", per="user")
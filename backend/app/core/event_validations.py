@@ -58,9 +58,7 @@ def validate_field_editable_by_status(event: Event, field_name: str, new_value:
             return
         if field_name == "capacity":
             if new_value is not None:
-                registered_count = len(
-                    [r for r in event.registrations if r.deleted_at is None and not r.is_deleted]
-                )
+                registered_count = event.registered_count
                 if new_value < registered_count:
                     raise ValidationError(
                         f"No se puede establecer la capacidad a {new_value} porque hay {registered_count} usuarios registrados. "
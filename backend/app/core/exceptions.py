@@ -2,13 +2,16 @@
 Excepciones personalizadas para la aplicación
 """
 
+import math
+
 
 class APIException(Exception):
     """Excepción base para errores de la API"""
 
-    def __init__(self, message: str, status_code: int = 400):
+    def __init__(self, message: str, status_code: int = 400, headers: dict | None = None):
         self.message = message
         self.status_code = status_code
+        self.headers = headers
         super().__init__(self.message)
 
 
@@ -38,3 +41,24 @@ class ConflictError(APIException):
 
     def __init__(self, message: str):
         super().__init__(message, status_code=409)
+
+
+class PreconditionFailedError(APIException):
+    """Precondición fallida (ej: If-Match no coincide con la versión actual)"""
+
+    def __init__(self, message: str):
+        super().__init__(message, status_code=412)
+
+
+class TooManyRequestsError(APIException):
+    """Límite de peticiones superado (la cabecera Retry-After indica cuánto esperar)"""
+
+    def __init__(
+        self, retry_after: float, message: str = "Demasiadas peticiones. Inténtalo más tarde"
+    ):
+        self.retry_after = retry_after
+        super().__init__(
+            message,
+            status_code=429,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
@@ -0,0 +1,100 @@
+"""
+Generación de iCalendar (RFC 5545) línea a línea
+
+Las funciones devuelven líneas ya terminadas en CRLF y plegadas a 75 octetos para
+poder emitir el calendario como stream sin construirlo entero en memoria.
+"""
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+
+PRODID = "-//Mis Eventos//Calendario//ES"
+UID_DOMAIN = "mis-eventos"
+
+
+def escape_text(value: str | None) -> str:
+    """Escapa un valor TEXT (barra invertida, punto y coma, coma y saltos de línea)"""
+    if not value:
+        return ""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def format_datetime(value: datetime) -> str:
+    """Fecha en UTC con formato iCalendar (las fechas se guardan en UTC sin zona)"""
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+
+def fold_line(line: str) -> str:
+    """Pliega una línea de contenido a 75 octetos (continuaciones con un espacio)"""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+
+    parts = []
+    current = ""
+    limit = 75
+    for char in line:
+        if len((current + char).encode("utf-8")) > limit:
+            parts.append(current)
+            current = char
+            limit = 74  # El espacio inicial de la continuación cuenta
+        else:
+            current += char
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def component(name: str, properties: Iterable[tuple[str, str | None]]) -> str:
+    """Construye un componente (ej: VEVENT) omitiendo las propiedades vacías"""
+    lines = [fold_line(f"BEGIN:{name}")]
+    for key, value in properties:
+        if value:
+            lines.append(fold_line(f"{key}:{value}"))
+    lines.append(fold_line(f"END:{name}"))
+    return "".join(lines)
+
+
+def vevent(
+    uid: str,
+    start: datetime,
+    end: datetime,
+    summary: str,
+    stamp: datetime,
+    description: str | None = None,
+    location: str | None = None,
+    status: str | None = None,
+    sequence: int | None = None,
+) -> str:
+    """Componente VEVENT"""
+    return component(
+        "VEVENT",
+        [
+            ("UID", f"{uid}@{UID_DOMAIN}"),
+            ("DTSTAMP", format_datetime(stamp)),
+            ("DTSTART", format_datetime(start)),
+            ("DTEND", format_datetime(end)),
+            ("SUMMARY", escape_text(summary)),
+            ("DESCRIPTION", escape_text(description)),
+            ("LOCATION", escape_text(location)),
+            ("STATUS", status),
+            ("SEQUENCE", str(sequence) if sequence is not None else None),
+        ],
+    )
+
+
+def calendar(name: str, components: Iterable[str]) -> Iterator[str]:
+    """Envuelve los componentes en un VCALENDAR, emitiéndolos uno a uno"""
+    yield fold_line("BEGIN:VCALENDAR")
+    yield fold_line("VERSION:2.0")
+    yield fold_line(f"PRODID:{PRODID}")
+    yield fold_line("CALSCALE:GREGORIAN")
+    yield fold_line("METHOD:PUBLISH")
+    yield fold_line(f"X-WR-CALNAME:{escape_text(name)}")
+    yield from components
+    yield fold_line("END:VCALENDAR")
@@ -0,0 +1,323 @@
+"""
+Peticiones idempotentes con la cabecera ``Idempotency-Key``
+
+Los clientes (sobre todo móviles) reintentan los POST cuando vence su timeout sin saber si
+la petición original llegó a ejecutarse. Con ``Idempotency-Key: <uuid>``:
+
+- La primera petición se ejecuta y su respuesta (estado, cabeceras y cuerpo) se guarda
+  durante IDEMPOTENCY_TTL_SECONDS.
+- Un reintento con la misma clave recibe la respuesta guardada (con la cabecera
+  ``Idempotent-Replayed: true``) sin pasar por rate limiting, servicios ni base de datos.
+- Un duplicado concurrente espera a que termine la petición en curso en lugar de
+  ejecutarse otra vez (409 si tarda más de IDEMPOTENCY_WAIT_SECONDS).
+- Reutilizar la clave con otro cuerpo es un error del cliente (422).
+
+Las claves se separan por credenciales (cabecera Authorization), método y ruta. Los 5xx
+y los 429 no se guardan: el reintento vuelve a ejecutarse.
+
+Backends: ``MemoryIdempotencyStore`` (por defecto, estado local de cada worker) y
+``DatabaseIdempotencyStore`` (compartido entre workers, tabla ``idempotency_keys``).
+"""
+
+import asyncio
+import hashlib
+import re
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from fastapi.responses import JSONResponse
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+from app.core.cache import TTLCache
+from app.models.idempotency import IdempotencyKey
+
+IDEMPOTENCY_HEADER = b"idempotency-key"
+REPLAYED_HEADER = b"idempotent-replayed"
+MAX_KEY_LENGTH = 255
+
+# Intervalo de sondeo de un duplicado que espera a la petición en curso
+_POLL_SECONDS = 0.05
+# Intervalo mínimo entre borrados de filas expiradas (backend database)
+_PURGE_INTERVAL_SECONDS = 60
+
+
+@dataclass
+class IdempotencyRecord:
+    """Estado de una clave: en curso (status_code None) o con la respuesta guardada"""
+
+    fingerprint: str
+    status_code: int | None = None
+    headers: list[tuple[str, str]] = field(default_factory=list)
+    body: bytes = b""
+
+
+class MemoryIdempotencyStore:
+    """Respuestas en memoria del proceso (TTLCache acotada, segura entre hilos)"""
+
+    def __init__(self, max_keys: int = 10_000):
+        self._cache = TTLCache(settings.IDEMPOTENCY_TTL_SECONDS, max_entries=max_keys)
+        self._lock = threading.Lock()
+
+    def claim(self, key: str, fingerprint: str) -> IdempotencyRecord | None:
+        """Reserva la clave; retorna None si queda reservada o el registro existente"""
+        with self._lock:
+            record = self._cache.get(key)
+            if record is not None:
+                return record
+            self._cache.set(
+                key, IdempotencyRecord(fingerprint), ttl_seconds=settings.IDEMPOTENCY_LOCK_SECONDS
+            )
+            return None
+
+    def complete(self, key: str, record: IdempotencyRecord) -> None:
+        self._cache.set(key, record, ttl_seconds=settings.IDEMPOTENCY_TTL_SECONDS)
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            record = self._cache.get(key)
+            if record is not None and record.status_code is None:
+                self._cache.delete(key)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+class DatabaseIdempotencyStore:
+    """
+    Respuestas compartidas en la tabla ``idempotency_keys`` (PostgreSQL o SQLite).
+
+    La reserva es un único ``INSERT ... ON CONFLICT DO UPDATE WHERE expires_at <= now``:
+    solo una petición consigue la fila aunque lleguen a la vez a workers distintos.
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self._table = IdempotencyKey.__table__
+        self._insert = postgresql.insert if engine.dialect.name == "postgresql" else sqlite.insert
+        self._next_purge_at = 0.0
+
+    def claim(self, key: str, fingerprint: str) -> IdempotencyRecord | None:
+        table = self._table
+        now = time.time()
+        values = {
+            "fingerprint": fingerprint,
+            "status_code": None,
+            "headers": None,
+            "body": None,
+            "expires_at": now + settings.IDEMPOTENCY_LOCK_SECONDS,
+        }
+        statement = (
+            self._insert(table)
+            .values(key=key, **values)
+            .on_conflict_do_update(
+                index_elements=[table.c.key], set_=values, where=table.c.expires_at <= now
+            )
+            .returning(table.c.key)
+        )
+        with self.engine.begin() as conn:
+            self._purge_expired(conn, now)
+            if conn.execute(statement).first() is not None:
+                return None
+            row = conn.execute(select(table).where(table.c.key == key)).first()
+        if row is None:  # Liberada entre el INSERT y el SELECT: se vuelve a intentar
+            return IdempotencyRecord(fingerprint)
+        return IdempotencyRecord(
+            fingerprint=row.fingerprint,
+            status_code=row.status_code,
+            headers=[tuple(header) for header in row.headers or []],
+            body=row.body or b"",
+        )
+
+    def complete(self, key: str, record: IdempotencyRecord) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(
+                update(self._table)
+                .where(self._table.c.key == key)
+                .values(
+                    status_code=record.status_code,
+                    headers=[list(header) for header in record.headers],
+                    body=record.body,
+                    expires_at=time.time() + settings.IDEMPOTENCY_TTL_SECONDS,
+                )
+            )
+
+    def release(self, key: str) -> None:
+        table = self._table
+        with self.engine.begin() as conn:
+            conn.execute(delete(table).where(table.c.key == key, table.c.status_code.is_(None)))
+
+    def clear(self) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(delete(self._table))
+
+    def _purge_expired(self, conn, now: float) -> None:
+        """Borra las filas expiradas (como mucho una vez por minuto y proceso)"""
+        if now < self._next_purge_at:
+            return
+        self._next_purge_at = now + _PURGE_INTERVAL_SECONDS
+        conn.execute(delete(self._table).where(self._table.c.expires_at <= now))
+
+
+def _storage_key(headers: dict[bytes, bytes], scope: dict, idempotency_key: bytes) -> str:
+    """Clave guardada: no incluye el token en claro"""
+    parts = [
+        headers.get(b"authorization", b""),
+        scope["method"].encode(),
+        scope["path"].encode(),
+        idempotency_key,
+    ]
+    return hashlib.sha256(b"\n".join(parts)).hexdigest()
+
+
+def _is_storable(status_code: int) -> bool:
+    """Las respuestas transitorias (5xx, 429) no se repiten: el reintento se ejecuta"""
+    return status_code < 500 and status_code != 429
+
+
+async def _read_body(receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+class IdempotencyMiddleware:
+    """
+    Middleware ASGI de Idempotency-Key para las rutas indicadas
+
+    Args:
+        routes: Pares ``(método, regex de la ruta completa)``; el resto de peticiones
+            (o las que no llevan la cabecera) pasan sin cambios
+        store: Backend de respuestas (por defecto ``idempotency_store``)
+    """
+
+    def __init__(self, app, routes: Iterable[tuple[str, str]], store=None):
+        self.app = app
+        self.routes = [(method, re.compile(pattern)) for method, pattern in routes]
+        self.store = store or idempotency_store
+
+    def _matches(self, scope: dict) -> bool:
+        return any(
+            scope["method"] == method and pattern.fullmatch(scope["path"])
+            for method, pattern in self.routes
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.IDEMPOTENCY_ENABLED or not self._matches(scope):
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope["headers"])
+        idempotency_key = headers.get(IDEMPOTENCY_HEADER)
+        if idempotency_key is None:
+            await self.app(scope, receive, send)
+            return
+        if not 0 < len(idempotency_key) <= MAX_KEY_LENGTH:
+            response = JSONResponse(
+                status_code=400,
+                content={"detail": f"Idempotency-Key debe tener 1-{MAX_KEY_LENGTH} caracteres"},
+            )
+            await response(scope, receive, send)
+            return
+
+        body = await _read_body(receive)
+        key = _storage_key(headers, scope, idempotency_key)
+        fingerprint = hashlib.sha256(body).hexdigest()
+        record = await self._acquire(key, fingerprint)
+        if isinstance(record, JSONResponse):
+            await record(scope, receive, send)
+        elif record is not None:
+            await self._replay(record, send)
+        else:
+            await self._execute(scope, receive, send, key, fingerprint, body)
+
+    async def _acquire(self, key: str, fingerprint: str):
+        """
+        Reserva la clave o espera a la petición en curso
+
+        Returns:
+            None si esta petición debe ejecutarse, el IdempotencyRecord a repetir o la
+            respuesta de error (422 cuerpo distinto, 409 espera agotada)
+        """
+        deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_SECONDS
+        while True:
+            record = await asyncio.to_thread(self.store.claim, key, fingerprint)
+            if record is None:
+                return None
+            if record.fingerprint != fingerprint:
+                return JSONResponse(
+                    status_code=422,
+                    content={"detail": "Idempotency-Key ya usada con otra petición"},
+                )
+            if record.status_code is not None:
+                return record
+            if time.monotonic() >= deadline:
+                return JSONResponse(
+                    status_code=409,
+                    content={"detail": "Hay una petición en curso con esta Idempotency-Key"},
+                )
+            await asyncio.sleep(_POLL_SECONDS)
+
+    @staticmethod
+    async def _replay(record: IdempotencyRecord, send) -> None:
+        headers = [
+            (name.encode("latin-1"), value.encode("latin-1")) for name, value in record.headers
+        ]
+        headers.append((REPLAYED_HEADER, b"true"))
+        await send(
+            {"type": "http.response.start", "status": record.status_code, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": record.body})
+
+    async def _execute(self, scope, receive, send, key: str, fingerprint: str, body: bytes):
+        """Ejecuta la petición reservada y guarda su respuesta"""
+        body_sent = False
+        record = IdempotencyRecord(fingerprint)
+        chunks = []
+
+        async def receive_body():
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def capture_send(message):
+            if message["type"] == "http.response.start":
+                record.status_code = message["status"]
+                record.headers = [
+                    (name.decode("latin-1"), value.decode("latin-1"))
+                    for name, value in message.get("headers", [])
+                ]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_body, capture_send)
+        except BaseException:
+            self.store.release(key)
+            raise
+        if record.status_code is not None and _is_storable(record.status_code):
+            record.body = b"".join(chunks)
+            await asyncio.to_thread(self.store.complete, key, record)
+        else:
+            await asyncio.to_thread(self.store.release, key)
+
+
+def _create_store():
+    if settings.IDEMPOTENCY_BACKEND == "database":
+        from app.database import engine
+
+        return DatabaseIdempotencyStore(engine)
+    return MemoryIdempotencyStore(settings.IDEMPOTENCY_MAX_KEYS)
+
+
+# Respuestas guardadas del proceso (backend según IDEMPOTENCY_BACKEND)
+idempotency_store = _create_store()
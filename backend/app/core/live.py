@@ -0,0 +1,199 @@
+"""
+Actualizaciones en vivo por Server-Sent Events
+
+- LiveUpdateHub: reparto en proceso de valores por clave (ej: id de evento) a los
+  suscriptores conectados. Los cambios se marcan como "sucios" y un único flusher los
+  coalesce: como mucho un valor por clave cada ``min_interval`` segundos, leído con una
+  sola llamada al loader para todas las claves sucias, y solo si alguien está suscrito.
+  Un suscriptor inactivo cuesta un ``asyncio.Event`` y un dict: miles caben en un worker.
+- listen_pg_notifications: LISTEN de PostgreSQL sin bloquear el event loop (psycopg2 en
+  modo asíncrono con ``loop.add_reader``), para repartir los cambios entre workers.
+- format_sse: serialización de un mensaje SSE.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any
+
+import orjson
+
+logger = logging.getLogger("uvicorn.error")
+
+
+def format_sse(data: Any = None, event: str | None = None, retry_ms: int | None = None) -> str:
+    """Mensaje SSE (``retry:``, ``event:`` y ``data:`` en JSON, terminado en línea en blanco)"""
+    lines = []
+    if retry_ms is not None:
+        lines.append(f"retry: {retry_ms}")
+    if event:
+        lines.append(f"event: {event}")
+    if data is not None:
+        lines.append("data: " + orjson.dumps(data).decode("utf-8"))
+    return "\n".join(lines) + "\n\n"
+
+
+class Subscription:
+    """Suscripción a un conjunto de claves; acumula solo el último valor de cada una"""
+
+    __slots__ = ("keys", "_pending", "_ready")
+
+    def __init__(self, keys: Iterable[Hashable]):
+        self.keys = frozenset(keys)
+        self._pending: dict[Hashable, Any] = {}
+        self._ready = asyncio.Event()
+
+    def push(self, key: Hashable, value: Any) -> None:
+        self._pending[key] = value
+        self._ready.set()
+
+    async def get(self, timeout: float) -> dict[Hashable, Any]:
+        """Espera valores nuevos hasta ``timeout`` segundos (dict vacío si no llegan)"""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+        except TimeoutError:
+            return {}
+        self._ready.clear()
+        pending, self._pending = self._pending, {}
+        return pending
+
+
+class LiveUpdateHub:
+    """
+    Reparto coalescido de actualizaciones a suscriptores de un event loop
+
+    Args:
+        loader: Función síncrona ``claves -> {clave: valor}`` (se ejecuta en un hilo);
+            una clave ausente en el resultado se entrega como None
+        min_interval: Segundos mínimos entre dos entregas (máximo 1/min_interval por clave)
+    """
+
+    def __init__(self, loader: Callable[[set], dict], min_interval: float):
+        self._loader = loader
+        self.min_interval = min_interval
+        self._subscribers: dict[Hashable, set[Subscription]] = {}
+        self._last: dict[Hashable, Any] = {}  # Último valor entregado por clave
+        self._dirty: set[Hashable] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._flusher: asyncio.Task | None = None
+
+    def subscribe(self, keys: Iterable[Hashable], initial: dict | None = None) -> Subscription:
+        """
+        Registra un suscriptor (desde el event loop). ``initial`` son los valores ya
+        enviados al cliente: no se repiten hasta que cambien.
+        """
+        self._bind_loop()
+        subscription = Subscription(keys)
+        for key in subscription.keys:
+            self._subscribers.setdefault(key, set()).add(subscription)
+            if initial and key in initial:
+                self._last.setdefault(key, initial[key])
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        for key in subscription.keys:
+            subscribers = self._subscribers.get(key)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[key]
+                self._last.pop(key, None)
+
+    def subscriber_count(self) -> int:
+        return len({sub for subs in self._subscribers.values() for sub in subs})
+
+    def mark_dirty(self, key: Hashable) -> None:
+        """Marca una clave como cambiada (seguro desde cualquier hilo; sin suscriptores, nada)"""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._mark, key)
+        except RuntimeError:  # Loop cerrado entre la comprobación y la llamada
+            pass
+
+    def _mark(self, key: Hashable) -> None:
+        if key in self._subscribers:
+            self._dirty.add(key)
+            self._wakeup.set()
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is self._loop and self._flusher is not None and not self._flusher.done():
+            return
+        # Primer suscriptor (o loop nuevo): el estado del loop anterior ya no sirve
+        self._loop = loop
+        self._subscribers.clear()
+        self._last.clear()
+        self._dirty.clear()
+        self._wakeup = asyncio.Event()
+        self._flusher = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            keys = self._dirty & self._subscribers.keys()
+            self._dirty.clear()
+            if keys:
+                try:
+                    values = await asyncio.to_thread(self._loader, keys)
+                    self._deliver(keys, values)
+                except Exception:
+                    logger.exception("Error al cargar actualizaciones en vivo")
+            await asyncio.sleep(self.min_interval)
+
+    def _deliver(self, keys: set, values: dict) -> None:
+        for key in keys:
+            value = values.get(key)
+            if key not in self._subscribers or self._last.get(key) == value:
+                continue
+            self._last[key] = value
+            for subscription in self._subscribers[key]:
+                subscription.push(key, value)
+
+
+async def listen_pg_notifications(
+    connect: Callable[[], Any], channel: str, callback: Callable[[str], None]
+) -> None:
+    """
+    Escucha ``NOTIFY channel`` y llama a ``callback(payload)`` por notificación.
+
+    Usa una conexión psycopg2 dedicada en autocommit y espera en el event loop a que su
+    socket tenga datos (sin hilos). Se reconecta con espera creciente si la conexión cae.
+
+    Args:
+        connect: Crea una conexión psycopg2 nueva (fuera del pool)
+    """
+    loop = asyncio.get_running_loop()
+    delay = 1.0
+    while True:
+        conn = None
+        try:
+            conn = await asyncio.to_thread(connect)
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {channel}")
+            ready = asyncio.Event()
+            loop.add_reader(conn.fileno(), ready.set)
+            delay = 1.0
+            try:
+                while True:
+                    await ready.wait()
+                    ready.clear()
+                    conn.poll()
+                    while conn.notifies:
+                        callback(conn.notifies.pop(0).payload)
+            finally:
+                loop.remove_reader(conn.fileno())
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("LISTEN %s interrumpido; reintentando en %.0f s", channel, delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60.0)
+        finally:
+            if conn is not None:
+                conn.close()
@@ -0,0 +1,292 @@
+"""
+Particionado declarativo de event_registrations (solo PostgreSQL)
+
+Estrategias soportadas:
+- ``hash``: por ``event_id`` (MODULUS fijo). Las consultas del CRUD filtran siempre
+  por ``event_id`` cuando lo conocen (registro, cancelación, capacidad, asistentes),
+  así PostgreSQL poda todas las particiones salvo una.
+- ``range``: por mes de ``registered_at``. Permite separar (DETACH) meses antiguos
+  para que vacuum y el mantenimiento de índices trabajen sobre tablas acotadas.
+
+La conversión la ejecuta la migración opcional ``partitioning`` de Alembic y el
+mantenimiento periódico ``python -m app.scripts.partition_maintenance``. Los índices
+se leen de ``pg_indexes`` al migrar (``list_index_definitions``) para no perder los que
+se añadan después; ``_INDEXES`` solo se usa en modo offline (``alembic --sql``).
+"""
+
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+TABLE = "event_registrations"
+STRATEGIES = ("hash", "range")
+
+# Índices conocidos de event_registrations (modo offline, sin acceso a pg_indexes)
+_INDEXES = [
+    ("ix_event_registrations_id", "id", None),
+    ("ix_event_registrations_event_id_live", "event_id", "is_deleted = false"),
+    ("ix_event_registrations_user_id_live", "user_id", "is_deleted = false"),
+    ("ix_event_registrations_purge", "id", "is_deleted = true"),
+]
+
+
+def month_start(value: date) -> date:
+    """Primer día del mes de una fecha"""
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """Suma (o resta) meses a una fecha que es primer día de mes"""
+    month_index = value.year * 12 + (value.month - 1) + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def month_partition_name(value: date) -> str:
+    """Nombre de la partición mensual, ej: event_registrations_p2026_10"""
+    return f"{TABLE}_p{value.year:04d}_{value.month:02d}"
+
+
+def month_partition_sql(parent: str, value: date) -> str:
+    """SQL para crear (si no existe) la partición mensual que contiene la fecha"""
+    start = month_start(value)
+    end = add_months(start, 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {month_partition_name(start)} PARTITION OF {parent} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+def month_partition_bounds(name: str) -> tuple[date, date]:
+    """Rango [inicio, fin) de una partición mensual a partir de su nombre"""
+    year, month = name.removeprefix(f"{TABLE}_p").split("_")
+    start = date(int(year), int(month), 1)
+    return start, add_months(start, 1)
+
+
+def hash_partitions_sql(parent: str, modulus: int) -> list[str]:
+    """SQL para crear las particiones hash por event_id"""
+    return [
+        f"CREATE TABLE {TABLE}_h{remainder:02d} PARTITION OF {parent} "
+        f"FOR VALUES WITH (MODULUS {modulus}, REMAINDER {remainder})"
+        for remainder in range(modulus)
+    ]
+
+
+def _indexes_sql(table: str, indexes: list[str] | None = None) -> list[str]:
+    """
+    SQL de índices sobre la tabla padre (se propagan a cada partición)
+
+    Args:
+        indexes: Definiciones leídas con list_index_definitions (None: _INDEXES)
+    """
+    if indexes is not None:
+        # En una tabla particionada pg_indexes devuelve "ON ONLY", que no crea los
+        # índices de las particiones
+        return [definition.replace(" ON ONLY ", " ON ", 1) for definition in indexes]
+    statements = []
+    for name, columns, where in _INDEXES:
+        statement = f"CREATE INDEX {name} ON {table} ({columns})"
+        if where:
+            statement += f" WHERE {where}"
+        statements.append(statement)
+    return statements
+
+
+def conversion_sql(
+    strategy: str,
+    first_month: date,
+    today: date,
+    modulus: int = 16,
+    months_ahead: int = 3,
+    indexes: list[str] | None = None,
+) -> list[str]:
+    """
+    Genera el SQL para convertir event_registrations en tabla particionada.
+
+    La tabla nueva se crea con LIKE, se copian los datos, la secuencia del id pasa a
+    pertenecer a la tabla nueva y finalmente se intercambian los nombres.
+
+    Args:
+        strategy: "hash" (por event_id) o "range" (por mes de registered_at)
+        first_month: Mes del registro más antiguo (solo range)
+        today: Fecha actual (solo range)
+        modulus: Número de particiones hash
+        months_ahead: Meses futuros a pre-crear (solo range)
+        indexes: Definiciones de índices a recrear (list_index_definitions);
+            None usa los índices conocidos de _INDEXES
+
+    Returns:
+        Lista de sentencias SQL a ejecutar en orden dentro de una transacción
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Estrategia de particionado no soportada: {strategy}")
+
+    new_table = f"{TABLE}_partitioned"
+    if strategy == "hash":
+        partition_by, key = "HASH (event_id)", "event_id"
+        partitions = hash_partitions_sql(new_table, modulus)
+    else:
+        partition_by, key = "RANGE (registered_at)", "registered_at"
+        partitions = []
+        month = month_start(first_month)
+        last_month = add_months(month_start(today), months_ahead)
+        while month <= last_month:
+            partitions.append(month_partition_sql(new_table, month))
+            month = add_months(month, 1)
+        partitions.append(f"CREATE TABLE {TABLE}_default PARTITION OF {new_table} DEFAULT")
+
+    return [
+        f"CREATE TABLE {new_table} (LIKE {TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        f"PARTITION BY {partition_by}",
+        *partitions,
+        f"INSERT INTO {new_table} SELECT * FROM {TABLE}",
+        f"ALTER SEQUENCE {TABLE}_id_seq OWNED BY {new_table}.id",
+        f"DROP TABLE {TABLE}",
+        f"ALTER TABLE {new_table} RENAME TO {TABLE}",
+        # La PK de una tabla particionada debe incluir la clave de partición
+        f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY (id, {key})",
+        f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_user_id_fkey "
+        f"FOREIGN KEY (user_id) REFERENCES users (id)",
+        f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_event_id_fkey "
+        f"FOREIGN KEY (event_id) REFERENCES events (id)",
+        *_indexes_sql(TABLE, indexes),
+    ]
+
+
+def revert_sql(indexes: list[str] | None = None, detached: list[str] | None = None) -> list[str]:
+    """
+    SQL para volver a una tabla event_registrations sin particionar
+
+    Las particiones mensuales separadas por partition_maintenance se vuelven a adjuntar
+    antes de copiar, para que sus filas no se pierdan (falla, y la migración se
+    deshace, si la partición DEFAULT ya tiene filas de esos meses).
+
+    Args:
+        indexes: Definiciones de índices a recrear (list_index_definitions)
+        detached: Particiones separadas (list_detached_partitions)
+    """
+    plain_table = f"{TABLE}_plain"
+    attach = []
+    for name in detached or []:
+        start, end = month_partition_bounds(name)
+        attach.append(
+            f"ALTER TABLE {TABLE} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    return [
+        *attach,
+        f"CREATE TABLE {plain_table} (LIKE {TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+        f"INSERT INTO {plain_table} SELECT * FROM {TABLE}",
+        f"ALTER SEQUENCE {TABLE}_id_seq OWNED BY {plain_table}.id",
+        f"DROP TABLE {TABLE}",
+        f"ALTER TABLE {plain_table} RENAME TO {TABLE}",
+        f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY (id)",
+        f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_user_id_fkey "
+        f"FOREIGN KEY (user_id) REFERENCES users (id)",
+        f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_event_id_fkey "
+        f"FOREIGN KEY (event_id) REFERENCES events (id)",
+        *_indexes_sql(TABLE, indexes),
+    ]
+
+
+def list_index_definitions(conn: Connection) -> list[str]:
+    """
+    Definiciones (CREATE INDEX) de los índices actuales de event_registrations
+
+    Excluye los índices de restricciones (PK), que la conversión crea aparte.
+    """
+    rows = conn.execute(
+        text(
+            "SELECT indexdef FROM pg_indexes "
+            "WHERE schemaname = current_schema() AND tablename = :table "
+            "AND indexname NOT IN ("
+            "SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(:table)"
+            ") ORDER BY indexname"
+        ),
+        {"table": TABLE},
+    )
+    return [row[0] for row in rows]
+
+
+def get_strategy(conn: Connection) -> str | None:
+    """
+    Detecta la estrategia de particionado actual de event_registrations.
+
+    Returns:
+        "hash", "range" o None si la tabla no está particionada
+    """
+    strategy = conn.execute(
+        text(
+            "SELECT pt.partstrat FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = :table"
+        ),
+        {"table": TABLE},
+    ).scalar()
+    return {"h": "hash", "r": "range"}.get(strategy)
+
+
+def list_month_partitions(conn: Connection) -> list[str]:
+    """Nombres de las particiones mensuales adjuntas (excluye la partición DEFAULT)"""
+    rows = conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table AND c.relname LIKE :pattern ORDER BY c.relname"
+        ),
+        {"table": TABLE, "pattern": f"{TABLE}_p%"},
+    )
+    return [row[0] for row in rows]
+
+
+def list_detached_partitions(conn: Connection) -> list[str]:
+    """Particiones mensuales separadas (DETACH) que siguen existiendo como tablas"""
+    rows = conn.execute(
+        text(
+            "SELECT c.relname FROM pg_class c "
+            "WHERE c.relnamespace = current_schema()::regnamespace AND c.relkind = 'r' "
+            "AND NOT c.relispartition AND c.relname ~ :pattern ORDER BY c.relname"
+        ),
+        {"pattern": f"^{TABLE}_p[0-9]{{4}}_[0-9]{{2}}$"},
+    )
+    return [row[0] for row in rows]
+
+
+def create_future_partitions(conn: Connection, today: date, months_ahead: int) -> list[str]:
+    """
+    Crea (si faltan) las particiones mensuales desde el mes actual hasta months_ahead.
+
+    Returns:
+        Nombres de las particiones aseguradas
+    """
+    ensured = []
+    month = month_start(today)
+    for _ in range(months_ahead + 1):
+        conn.execute(text(month_partition_sql(TABLE, month)))
+        ensured.append(month_partition_name(month))
+        month = add_months(month, 1)
+    return ensured
+
+
+def detach_old_partitions(
+    conn: Connection, today: date, retention_months: int, drop: bool = False
+) -> list[str]:
+    """
+    Separa (DETACH) las particiones mensuales más antiguas que la retención.
+
+    Las tablas separadas quedan como tablas normales (archivables) salvo que drop=True.
+
+    Returns:
+        Nombres de las particiones separadas
+    """
+    cutoff = month_partition_name(add_months(month_start(today), -retention_months))
+    detached = []
+    for name in list_month_partitions(conn):
+        if name >= cutoff:
+            continue
+        conn.execute(text(f"ALTER TABLE {TABLE} DETACH PARTITION {name}"))
+        if drop:
+            conn.execute(text(f"DROP TABLE {name}"))
+        detached.append(name)
+    return detached
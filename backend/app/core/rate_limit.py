@@ -0,0 +1,240 @@
+"""
+Rate limiting con token bucket y backoff de login por cuenta
+
+- Cada límite es un token bucket: ``capacity`` peticiones de ráfaga que se reponen a
+  ``capacity / period`` por segundo. Las claves combinan ruta y cliente (IP o usuario),
+  ej: ``login:ip:10.0.0.1`` o ``attendee_register:user:ana@example.com``.
+- Los fallos de login de una cuenta activan un bloqueo creciente (exponencial con tope)
+  a partir de LOGIN_FREE_ATTEMPTS fallos seguidos; un login correcto lo reinicia.
+- Backends: ``MemoryRateLimitBackend`` (por defecto, estado local de cada worker) y
+  ``DatabaseRateLimitBackend`` (compartido entre workers: un UPSERT atómico por
+  comprobación sobre ``rate_limit_buckets``).
+
+Las comprobaciones se hacen antes de tocar la base de datos de la petición o bcrypt
+(ver app.core.deps.rate_limit y UserService.authenticate_user).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+
+from sqlalchemy import case, delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+from app.core.exceptions import TooManyRequestsError
+from app.models.rate_limit import RateLimitBucket
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket: ``capacity`` peticiones cada ``period`` segundos"""
+
+    capacity: int
+    period: float
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.capacity / self.period
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def parse(cls, value: str) -> "RateLimit":
+        """Convierte ``"<peticiones>/<segundos>"`` (ej: ``"10/60"``) en un RateLimit"""
+        capacity, _, period = value.partition("/")
+        return cls(capacity=int(capacity), period=float(period or 1))
+
+
+class MemoryRateLimitBackend:
+    """Estado en memoria del proceso (LRU acotado, seguro entre hilos)"""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._entries: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _put(self, key: str, value: tuple[float, float]) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_keys:
+            self._entries.popitem(last=False)
+
+    def consume(self, key: str, limit: RateLimit, now: float, cost: float = 1.0) -> float:
+        """Consume ``cost`` tokens; retorna 0 si se permite o los segundos de espera"""
+        with self._lock:
+            tokens, updated_at = self._entries.get(key, (float(limit.capacity), now))
+            tokens = min(limit.capacity, tokens + (now - updated_at) * limit.refill_per_second)
+            if tokens >= cost:
+                self._put(key, (tokens - cost, now))
+                return 0.0
+            self._put(key, (tokens, now))
+            return (cost - tokens) / limit.refill_per_second
+
+    def get_failures(self, key: str) -> tuple[int, float]:
+        """Número de fallos registrados y epoch del último (0, 0 si no hay)"""
+        with self._lock:
+            count, last_at = self._entries.get(key, (0, 0.0))
+            return int(count), last_at
+
+    def record_failure(self, key: str, now: float, window: float) -> int:
+        """Suma un fallo (el contador se reinicia tras ``window`` segundos sin fallos)"""
+        with self._lock:
+            count, last_at = self._entries.get(key, (0, 0.0))
+            count = 1 if now - last_at > window else count + 1
+            self._put(key, (count, now))
+            return int(count)
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DatabaseRateLimitBackend:
+    """
+    Estado compartido en la tabla ``rate_limit_buckets`` (PostgreSQL o SQLite).
+
+    Cada operación es una sentencia atómica (``INSERT ... ON CONFLICT DO UPDATE ...
+    RETURNING``) en una conexión propia, independiente de la sesión de la petición.
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self._table = RateLimitBucket.__table__
+        dialect = engine.dialect.name
+        self._insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        self._least = func.least if dialect == "postgresql" else func.min
+
+    def consume(self, key: str, limit: RateLimit, now: float, cost: float = 1.0) -> float:
+        table = self._table
+        refilled = self._least(
+            limit.capacity, table.c.tokens + (now - table.c.updated_at) * limit.refill_per_second
+        )
+        statement = (
+            self._insert(table)
+            .values(key=key, tokens=limit.capacity - cost, updated_at=now, allowed=True)
+            .on_conflict_do_update(
+                index_elements=[table.c.key],
+                set_={
+                    "tokens": case((refilled >= cost, refilled - cost), else_=refilled),
+                    "updated_at": now,
+                    "allowed": refilled >= cost,
+                },
+            )
+            .returning(table.c.tokens, table.c.allowed)
+        )
+        with self.engine.begin() as conn:
+            tokens, allowed = conn.execute(statement).one()
+        return 0.0 if allowed else (cost - tokens) / limit.refill_per_second
+
+    def get_failures(self, key: str) -> tuple[int, float]:
+        table = self._table
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                select(table.c.tokens, table.c.updated_at).where(table.c.key == key)
+            ).first()
+        return (int(row.tokens), row.updated_at) if row else (0, 0.0)
+
+    def record_failure(self, key: str, now: float, window: float) -> int:
+        table = self._table
+        statement = (
+            self._insert(table)
+            .values(key=key, tokens=1, updated_at=now, allowed=True)
+            .on_conflict_do_update(
+                index_elements=[table.c.key],
+                set_={
+                    "tokens": case(
+                        (now - table.c.updated_at > window, 1), else_=table.c.tokens + 1
+                    ),
+                    "updated_at": now,
+                },
+            )
+            .returning(table.c.tokens)
+        )
+        with self.engine.begin() as conn:
+            return int(conn.execute(statement).scalar_one())
+
+    def reset(self, key: str) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(delete(self._table).where(self._table.c.key == key))
+
+    def clear(self) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(delete(self._table))
+
+
+class RateLimiter:
+    """Comprobaciones de límites y backoff de login sobre un backend"""
+
+    def __init__(self, backend, clock=time.time):
+        self.backend = backend
+        self.clock = clock
+
+    def hit(self, key: str, limit: RateLimit) -> None:
+        """
+        Consume una petición del bucket de ``key``
+
+        Raises:
+            TooManyRequestsError: Si el bucket está vacío (con Retry-After)
+        """
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+        retry_after = self.backend.consume(key, limit, self.clock())
+        if retry_after > 0:
+            raise TooManyRequestsError(retry_after)
+
+    @staticmethod
+    def login_backoff(failures: int) -> float:
+        """Segundos de bloqueo tras ``failures`` fallos seguidos (0 si aún son gratis)"""
+        extra = failures - settings.LOGIN_FREE_ATTEMPTS
+        if extra < 0:
+            return 0.0
+        return min(
+            settings.LOGIN_BACKOFF_BASE_SECONDS * 2**extra, settings.LOGIN_BACKOFF_MAX_SECONDS
+        )
+
+    def check_login(self, account: str) -> None:
+        """
+        Rechaza el login si la cuenta está en periodo de bloqueo
+
+        Raises:
+            TooManyRequestsError: Si hay que esperar (con Retry-After)
+        """
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+        failures, last_at = self.backend.get_failures(_login_key(account))
+        retry_after = last_at + self.login_backoff(failures) - self.clock()
+        if failures and retry_after > 0:
+            raise TooManyRequestsError(retry_after)
+
+    def record_login_failure(self, account: str) -> None:
+        if settings.RATE_LIMIT_ENABLED:
+            self.backend.record_failure(
+                _login_key(account), self.clock(), settings.LOGIN_BACKOFF_MAX_SECONDS
+            )
+
+    def reset_login(self, account: str) -> None:
+        if settings.RATE_LIMIT_ENABLED:
+            self.backend.reset(_login_key(account))
+
+
+def _login_key(account: str) -> str:
+    return f"login_failures:{account.strip().lower()}"
+
+
+def _create_backend():
+    if settings.RATE_LIMIT_BACKEND == "database":
+        from app.database import engine
+
+        return DatabaseRateLimitBackend(engine)
+    return MemoryRateLimitBackend(settings.RATE_LIMIT_MAX_KEYS)
+
+
+# Limitador del proceso (backend según RATE_LIMIT_BACKEND)
+rate_limiter = RateLimiter(_create_backend())
@@ -0,0 +1,191 @@
+"""
+Planificador de temporizadores en memoria (min-heap)
+
+Los estados ONGOING y COMPLETED de un evento dependen solo del tiempo y no se guardan,
+así que nada puede reaccionar a ellos con un UPDATE. El planificador mantiene en un
+min-heap los próximos instantes relevantes (inicio/fin de eventos, recordatorios de
+sesiones) y ejecuta el callback de cada uno al vencer, con precisión de segundos.
+
+- Cada temporizador tiene una clave ``(tipo, id)``: volver a programar una clave
+  sustituye su instante anterior y ``cancel`` la anula. Las entradas obsoletas se
+  descartan al salir del heap (borrado perezoso) y el heap se compacta si acumula
+  demasiadas.
+- Los callbacks se registran por tipo con ``on(tipo, handler)`` y se ejecutan en un hilo
+  (pueden usar la base de datos sin bloquear el event loop).
+- ``schedule``/``cancel`` son seguros desde cualquier hilo (endpoints síncronos) y
+  despiertan el bucle si el nuevo instante es anterior al próximo vencimiento.
+- Los temporizadores que salen del heap quedan anotados (``was_fired``) hasta que
+  ``forget_fired`` los descarta: así una recarga que solapa con lo ya disparado no los
+  repite.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+logger = logging.getLogger("uvicorn.error")
+
+# Espera máxima del bucle entre comprobaciones (cubre saltos del reloj del sistema)
+MAX_SLEEP_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class Timer:
+    """Temporizador vencido que se entrega al handler de su tipo"""
+
+    key: tuple[str, Hashable]
+    fire_at: datetime
+    payload: Any = None
+
+    @property
+    def kind(self) -> str:
+        return self.key[0]
+
+
+class TimerScheduler:
+    """Min-heap de temporizadores con claves reemplazables y handlers por tipo"""
+
+    def __init__(self, clock: Callable[[], datetime] = datetime.utcnow):
+        self.clock = clock
+        self._heap: list[tuple[datetime, int, tuple]] = []
+        self._entries: dict[tuple, tuple[int, datetime, Any]] = {}  # clave → entrada vigente
+        self._handlers: dict[str, Callable[[Timer], None]] = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._fired: set[tuple[tuple, datetime]] = set()  # (clave, instante) ya disparados
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        # Instante de la última carga completa desde la fuente externa (lo fija quien carga)
+        self.synced_at: datetime | None = None
+
+    @property
+    def running(self) -> bool:
+        """True mientras el bucle ``run`` está activo"""
+        return self._loop is not None
+
+    def on(self, kind: str, handler: Callable[[Timer], None]) -> None:
+        """Registra el handler (síncrono) de un tipo de temporizador"""
+        self._handlers[kind] = handler
+
+    def schedule(self, key: tuple[str, Hashable], fire_at: datetime, payload: Any = None) -> None:
+        """Programa (o reprograma) la clave para ``fire_at``"""
+        with self._lock:
+            seq = next(self._counter)
+            self._entries[key] = (seq, fire_at, payload)
+            heapq.heappush(self._heap, (fire_at, seq, key))
+            is_next = self._heap[0][1] == seq
+            self._compact_if_needed()
+        if is_next:
+            self._wake()
+
+    def cancel(self, key: tuple[str, Hashable]) -> None:
+        """Anula la clave si estaba programada"""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._compact_if_needed()
+
+    def clear(self) -> None:
+        """Elimina todos los temporizadores"""
+        with self._lock:
+            self._heap.clear()
+            self._entries.clear()
+            self._fired.clear()
+        self.synced_at = None
+
+    def was_fired(self, key: tuple[str, Hashable], fire_at: datetime) -> bool:
+        """True si la clave ya se disparó para ese instante"""
+        with self._lock:
+            return (key, fire_at) in self._fired
+
+    def forget_fired(self, until: datetime) -> None:
+        """Olvida los disparos con instante <= ``until`` (ya no pueden volver a cargarse)"""
+        with self._lock:
+            self._fired = {(key, fire_at) for key, fire_at in self._fired if fire_at > until}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: tuple[str, Hashable]) -> bool:
+        return key in self._entries
+
+    def next_deadline(self) -> datetime | None:
+        """Instante del próximo temporizador vigente (None si no hay)"""
+        with self._lock:
+            self._drop_stale_head()
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> list[Timer]:
+        """Extrae, en orden, los temporizadores vencidos en ``now``"""
+        due = []
+        with self._lock:
+            while self._heap:
+                self._drop_stale_head()
+                if not self._heap or self._heap[0][0] > now:
+                    break
+                fire_at, _, key = heapq.heappop(self._heap)
+                _, _, payload = self._entries.pop(key)
+                self._fired.add((key, fire_at))
+                due.append(Timer(key=key, fire_at=fire_at, payload=payload))
+        return due
+
+    def fire(self, timer: Timer) -> None:
+        """Ejecuta el handler del temporizador; los errores se registran y no se propagan"""
+        handler = self._handlers.get(timer.kind)
+        if handler is None:
+            logger.warning("Planificador: sin handler para %s", timer.kind)
+            return
+        try:
+            handler(timer)
+        except Exception:
+            logger.exception("Planificador: error en el temporizador %s", timer.key)
+
+    async def run(self) -> None:
+        """
+        Bucle principal: duerme hasta el próximo vencimiento (o hasta que se programe
+        uno anterior) y ejecuta en un hilo los handlers de los temporizadores vencidos.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        try:
+            while True:
+                for timer in self.pop_due(self.clock()):
+                    await asyncio.to_thread(self.fire, timer)
+
+                self._wakeup.clear()
+                deadline = self.next_deadline()
+                timeout = MAX_SLEEP_SECONDS
+                if deadline is not None:
+                    timeout = min(max((deadline - self.clock()).total_seconds(), 0), timeout)
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except TimeoutError:
+                    pass
+        finally:
+            self._loop = None
+            self._wakeup = None
+
+    def _wake(self) -> None:
+        loop, wakeup = self._loop, self._wakeup
+        if loop is not None and wakeup is not None:
+            loop.call_soon_threadsafe(wakeup.set)
+
+    def _drop_stale_head(self) -> None:
+        """Descarta entradas obsoletas (reprogramadas o canceladas) de la cima del heap"""
+        while self._heap:
+            _, seq, key = self._heap[0]
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == seq:
+                return
+            heapq.heappop(self._heap)
+
+    def _compact_if_needed(self) -> None:
+        """Reconstruye el heap si más de la mitad de sus entradas son obsoletas"""
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._entries):
+            self._heap = [(fire_at, seq, key) for key, (seq, fire_at, _) in self._entries.items()]
+            heapq.heapify(self._heap)
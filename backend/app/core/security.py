@@ -5,6 +5,8 @@ from jose import JWTError, jwt
 
 from app.config import settings
 
+CALENDAR_TOKEN_SCOPE = "calendar"
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifica si la contraseña coincide con el hash"""
@@ -37,9 +39,36 @@ def decode_access_token(token: str) -> str | None:
     """Decodifica token JWT y retorna el email del usuario"""
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        # Los tokens con scope (ej: calendario) no sirven como tokens de acceso
+        if payload.get("scope") is not None:
+            return None
         email: str = payload.get("sub")
         if email is None:
             return None
         return email
     except JWTError:
         return None
+
+
+def create_calendar_token(subject: str) -> str:
+    """
+    Crea un token firmado de larga duración para una URL de calendario (.ics).
+
+    Args:
+        subject: Feed autorizado ("user:<id>" o "event:<id>")
+    """
+    return create_access_token(
+        {"sub": subject, "scope": CALENDAR_TOKEN_SCOPE},
+        expires_delta=timedelta(days=settings.CALENDAR_TOKEN_EXPIRE_DAYS),
+    )
+
+
+def decode_calendar_token(token: str) -> str | None:
+    """Decodifica un token de calendario y retorna el feed autorizado"""
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        if payload.get("scope") != CALENDAR_TOKEN_SCOPE:
+            return None
+        return payload.get("sub")
+    except JWTError:
+        return None
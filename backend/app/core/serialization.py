@@ -0,0 +1,92 @@
+"""
+Serialización rápida de respuestas JSON
+
+Cuando un endpoint devuelve un modelo Pydantic, FastAPI lo vuelve a validar contra
+``response_model``, lo pasa por ``jsonable_encoder`` y lo serializa con ``json`` de la
+librería estándar. En listados de 100 elementos eso es buena parte del tiempo de CPU.
+
+``model_response`` valida los datos (objetos ORM o dicts) una sola vez con un
+``TypeAdapter`` precompilado y los serializa directamente a bytes con pydantic-core.
+Al devolver una ``Response`` FastAPI omite su propia validación; ``response_model``
+se mantiene en el decorador para la documentación OpenAPI.
+
+Uso:
+    return model_response(EventListResponse, {"events": events, "pagination": metadata})
+"""
+
+from functools import cache
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+from app.schemas.event import EventDetailResponse, EventListResponse, EventResponse
+from app.schemas.session import SessionListResponse, SessionResponse
+from app.schemas.user import UserListResponse, UserResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse serializada con orjson.
+    Si el contenido ya son bytes (JSON serializado), se envía tal cual.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+@cache
+def get_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    """TypeAdapter cacheado por schema (se construye una sola vez por proceso)"""
+    return TypeAdapter(schema)
+
+
+# Adaptadores precompilados de las respuestas más usadas (evita el coste en la 1ª petición)
+for _schema in (
+    EventListResponse,
+    EventDetailResponse,
+    EventResponse,
+    SessionListResponse,
+    SessionResponse,
+    UserListResponse,
+    UserResponse,
+):
+    get_adapter(_schema)
+
+
+def serialize(schema: type[BaseModel], data: Any) -> bytes:
+    """
+    Valida los datos contra el schema (una sola vez) y los serializa a JSON.
+
+    Args:
+        schema: Schema Pydantic de la respuesta
+        data: Instancia del schema, objeto ORM o dict (con objetos ORM anidados)
+
+    Returns:
+        JSON serializado en bytes
+    """
+    adapter = get_adapter(schema)
+    if not isinstance(data, schema):
+        data = adapter.validate_python(data, from_attributes=True)
+    return adapter.dump_json(data)
+
+
+def model_response(
+    schema: type[BaseModel], data: Any, status_code: int = 200, headers: dict | None = None
+) -> ORJSONResponse:
+    """
+    Construye la respuesta HTTP de un schema validando y serializando una sola vez.
+
+    Args:
+        schema: Schema Pydantic de la respuesta (el mismo que response_model)
+        data: Instancia del schema, objeto ORM o dict
+        status_code: Código HTTP de la respuesta
+        headers: Cabeceras adicionales
+
+    Returns:
+        ORJSONResponse con el cuerpo ya serializado
+    """
+    return ORJSONResponse(serialize(schema, data), status_code=status_code, headers=headers)
@@ -0,0 +1,62 @@
+"""
+Filtro global de soft delete
+
+Todas las consultas ORM de tipo SELECT sobre modelos que heredan de
+``SoftDeleteMixin`` excluyen automáticamente las filas eliminadas
+(``is_deleted = false``). Así el filtro coincide con los índices parciales
+``WHERE is_deleted = false`` definidos en los modelos.
+
+Para ver filas eliminadas (administración, restauración) se usa la opción
+de ejecución ``include_deleted``:
+
+    db.query(Event).execution_options(include_deleted=True)
+    # o bien
+    with_deleted(db.query(Event))
+"""
+
+from typing import TypeVar
+
+from sqlalchemy import Boolean, Column, DateTime, event, false
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+INCLUDE_DELETED = "include_deleted"
+
+Q = TypeVar("Q")
+
+
+class SoftDeleteMixin:
+    """Columnas de soft delete compartidas por los modelos soft-deletables"""
+
+    deleted_at = Column(DateTime, nullable=True, default=None)  # Soft delete
+    is_deleted = Column(Boolean, default=False, nullable=False)  # Soft delete (boolean)
+
+
+def with_deleted(query: Q) -> Q:
+    """
+    Desactiva el filtro global de soft delete para una consulta.
+
+    Args:
+        query: Query o statement de SQLAlchemy
+
+    Returns:
+        La misma consulta con la opción include_deleted activada
+    """
+    return query.execution_options(**{INCLUDE_DELETED: True})
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _add_soft_delete_criteria(execute_state: ORMExecuteState) -> None:
+    """Añade el criterio de fila viva a todos los SELECT ORM salvo opt-out explícito"""
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+        and not execute_state.execution_options.get(INCLUDE_DELETED, False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(
+                SoftDeleteMixin,
+                lambda cls: cls.is_deleted == false(),
+                include_aliases=True,
+            )
+        )
@@ -0,0 +1,50 @@
+"""
+Unidad de trabajo por petición - Un único commit antes de enviar la respuesta
+
+Los servicios y el CRUD solo hacen flush; ``get_db`` deja la sesión de la petición en
+``request.state.db`` y ``UnitOfWorkRoute`` la confirma cuando el endpoint termina bien
+(respuesta < 400) o la descarta con rollback si lanza una excepción o responde un error.
+
+El commit se hace en la ruta y no al salir de ``get_db`` porque en FastAPI el código tras
+el ``yield`` de una dependencia se ejecuta después de enviar la respuesta: el cliente
+podría recibir un 201 de algo que aún no está confirmado (o que falla al confirmar).
+
+La sesión usa ``expire_on_commit=False``: tras el commit las instancias conservan sus
+valores y la serialización de la respuesta no vuelve a consultarlas.
+
+Uso:
+    router = APIRouter(route_class=UnitOfWorkRoute)
+"""
+
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.routing import APIRoute
+
+
+class UnitOfWorkRoute(APIRoute):
+    """Ruta que confirma (o descarta) la sesión de la petición antes de responder"""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def unit_of_work_handler(request: Request) -> Response:
+            try:
+                response = await handler(request)
+            except Exception:
+                await _finish(request, commit=False)
+                raise
+            await _finish(request, commit=response.status_code < 400)
+            return response
+
+        return unit_of_work_handler
+
+
+async def _finish(request: Request, commit: bool) -> None:
+    db = getattr(request.state, "db", None)
+    if db is None:
+        return
+    # Sesión síncrona: commit/rollback en el threadpool para no bloquear el event loop
+    await run_in_threadpool(db.commit if commit else db.rollback)
@@ -0,0 +1,87 @@
+"""
+Control de concurrencia optimista con la columna ``version``
+
+Cada actualización de eventos y sesiones es un ``UPDATE ... WHERE id = ? AND version = ?``
+que incrementa la versión. Las respuestas incluyen ``ETag: "<version>"`` y los clientes
+pueden enviar ``If-Match`` con esa ETag para que la edición falle (412) si otro usuario
+modificó el recurso desde que lo leyeron.
+
+Para GET condicionales (If-None-Match / If-Modified-Since) ver ``is_not_modified``.
+"""
+
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from app.core.exceptions import PreconditionFailedError
+
+
+def etag(version: int) -> str:
+    """ETag de un recurso a partir de su versión"""
+    return f'"{version}"'
+
+
+def check_if_match(if_match: str | None, current_version: int) -> None:
+    """
+    Verifica la cabecera If-Match contra la versión actual.
+
+    Acepta una lista de ETags separadas por coma, ETags débiles (W/"3") y ``*``.
+    Sin cabecera no se comprueba nada.
+
+    Args:
+        if_match: Valor de la cabecera If-Match (o None)
+        current_version: Versión actual del recurso
+
+    Raises:
+        PreconditionFailedError: Si ninguna ETag coincide con la versión actual
+    """
+    if if_match is None or if_match.strip() == "*":
+        return
+
+    for tag in if_match.split(","):
+        tag = tag.strip().removeprefix("W/").strip('"')
+        if tag == str(current_version):
+            return
+
+    raise PreconditionFailedError(
+        f"El recurso fue modificado por otra petición (versión actual: {current_version})"
+    )
+
+
+def http_date(value: datetime) -> str:
+    """Fecha HTTP (Last-Modified) de un datetime UTC sin zona"""
+    return format_datetime(value.replace(tzinfo=UTC), usegmt=True)
+
+
+def is_not_modified(
+    if_none_match: str | None,
+    if_modified_since: str | None,
+    current_etag: str,
+    last_modified: datetime | None,
+) -> bool:
+    """
+    Evalúa un GET condicional (RFC 9110): True si se debe responder 304.
+
+    If-None-Match tiene prioridad; If-Modified-Since solo se usa sin él.
+
+    Args:
+        if_none_match: Valor de la cabecera If-None-Match (o None)
+        if_modified_since: Valor de la cabecera If-Modified-Since (o None)
+        current_etag: ETag actual del recurso
+        last_modified: Última modificación del recurso (UTC sin zona, o None)
+    """
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        current = current_etag.removeprefix("W/")
+        return any(tag.strip().removeprefix("W/") == current for tag in if_none_match.split(","))
+
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    # Las fechas HTTP tienen resolución de segundos
+    return last_modified.replace(tzinfo=UTC, microsecond=0) <= since
@@ -1,3 +1,3 @@
-from app.crud import attendee, event, session, user
+from app.crud import attendee, calendar, event, job, outbox, session, user
 
-__all__ = ["user", "event", "session", "attendee"]
+__all__ = ["user", "event", "session", "attendee", "calendar", "outbox", "job"]
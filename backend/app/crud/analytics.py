@@ -0,0 +1,147 @@
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.analytics import DailyEventStats, DailySignups, EventRegistrationBucket
+from app.models.event import Event, EventStatusDB
+from app.models.user import UserRole
+
+EPOCH = datetime(1970, 1, 1)
+
+# Las funciones record_* no hacen commit: el rollup se confirma (o se descarta) con la
+# escritura que lo origina, en la misma transacción.
+
+
+def _increment(db: Session, model, keys: dict[str, Any], counts: dict[str, int]) -> None:
+    """
+    Suma ``counts`` a la fila del rollup identificada por ``keys`` con un único
+    ``INSERT ... ON CONFLICT DO UPDATE`` (PostgreSQL o SQLite)
+    """
+    insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    table = model.__table__
+    statement = insert(table).values(**keys, **counts)
+    db.execute(
+        statement.on_conflict_do_update(
+            index_elements=list(keys),
+            set_={name: table.c[name] + statement.excluded[name] for name in counts},
+        )
+    )
+
+
+def bucket_start(moment: datetime) -> datetime:
+    """Inicio del cubo de TRENDING_BUCKET_SECONDS que contiene ``moment``"""
+    seconds = int((moment - EPOCH).total_seconds())
+    return EPOCH + timedelta(seconds=seconds - seconds % settings.TRENDING_BUCKET_SECONDS)
+
+
+def record_registration(db: Session, event_id: int) -> None:
+    """Cuenta un registro en el rollup diario y en el cubo de tendencia del evento (sin commit)"""
+    now = datetime.utcnow()
+    _increment(
+        db,
+        DailyEventStats,
+        {"day": now.date(), "event_id": event_id},
+        {"registrations": 1, "cancellations": 0},
+    )
+    _increment(
+        db,
+        EventRegistrationBucket,
+        {"bucket_start": bucket_start(now), "event_id": event_id},
+        {"registrations": 1},
+    )
+
+
+def record_cancellation(db: Session, event_id: int) -> None:
+    """Cuenta una cancelación de registro en el rollup diario del evento (sin commit)"""
+    _increment(
+        db,
+        DailyEventStats,
+        {"day": datetime.utcnow().date(), "event_id": event_id},
+        {"registrations": 0, "cancellations": 1},
+    )
+
+
+def record_signup(db: Session, role: UserRole) -> None:
+    """Cuenta un alta de usuario en el rollup diario de su rol (sin commit)"""
+    _increment(db, DailySignups, {"day": datetime.utcnow().date(), "role": role}, {"signups": 1})
+
+
+def get_registration_series(
+    db: Session, date_from: date, date_to: date, event_id: int | None = None
+) -> list[dict[str, Any]]:
+    """
+    Registros y cancelaciones por día en [date_from, date_to], de todos los eventos o de
+    uno (rango sobre la PK o sobre ix_daily_event_stats_event_id_day)
+
+    Returns:
+        Días con actividad: [{day, registrations, cancellations}] ordenados por día
+    """
+    query = (
+        select(
+            DailyEventStats.day,
+            func.sum(DailyEventStats.registrations).label("registrations"),
+            func.sum(DailyEventStats.cancellations).label("cancellations"),
+        )
+        .where(DailyEventStats.day.between(date_from, date_to))
+        .group_by(DailyEventStats.day)
+        .order_by(DailyEventStats.day)
+    )
+    if event_id is not None:
+        query = query.where(DailyEventStats.event_id == event_id)
+    return [dict(row._mapping) for row in db.execute(query)]
+
+
+def get_signup_series(db: Session, date_from: date, date_to: date) -> list[dict[str, Any]]:
+    """
+    Altas de usuarios por día y rol en [date_from, date_to]
+
+    Returns:
+        Filas con actividad: [{day, role, signups}] ordenadas por día
+    """
+    query = (
+        select(DailySignups.day, DailySignups.role, DailySignups.signups)
+        .where(DailySignups.day.between(date_from, date_to))
+        .order_by(DailySignups.day)
+    )
+    return [dict(row._mapping) for row in db.execute(query)]
+
+
+def get_trending_buckets(db: Session, since: datetime) -> list[dict[str, Any]]:
+    """
+    Cubos de registros desde ``since`` de eventos vivos, no cancelados ni terminados
+    (rango sobre la PK de event_registration_buckets)
+
+    Returns:
+        [{event_id, bucket_start, registrations}]
+    """
+    query = (
+        select(
+            EventRegistrationBucket.event_id,
+            EventRegistrationBucket.bucket_start,
+            EventRegistrationBucket.registrations,
+        )
+        .join(Event, Event.id == EventRegistrationBucket.event_id)
+        .where(
+            EventRegistrationBucket.bucket_start >= since,
+            Event.status != EventStatusDB.CANCELLED,
+            Event.end_date > datetime.utcnow(),
+        )
+    )
+    return [dict(row._mapping) for row in db.execute(query)]
+
+
+def delete_buckets_before(db: Session, cutoff: datetime) -> int:
+    """
+    Borra los cubos de tendencia anteriores a ``cutoff`` (sin commit)
+
+    Returns:
+        Número de cubos borrados
+    """
+    result = db.execute(
+        delete(EventRegistrationBucket).where(EventRegistrationBucket.bucket_start < cutoff)
+    )
+    return result.rowcount
@@ -1,35 +1,83 @@
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy import false, or_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, contains_eager
 
-from app.core.db_utils import save_and_refresh
+from app.core.db_utils import save_and_flush, soft_delete
 from app.core.pagination import apply_pagination, get_pagination_metadata
-from app.models.attendee import EventRegistration
-from app.models.event import Event
+from app.crud import analytics as crud_analytics
+from app.models.attendee import EventRegistration, SessionRegistration
+from app.models.event import Event, EventStatusDB
+from app.models.session import Session as EventSession
 
 
-def register_to_event(db: Session, user_id: int, event_id: int) -> EventRegistration:
+def _live_registrations(db: Session, *entities):
     """
-    Registra un usuario a un evento.
+    Query de registros vivos de eventos vivos.
 
-    Nota: Las validaciones (evento existe, capacidad, duplicados)
+    El JOIN aplica el filtro global de soft delete también al evento: los registros de un
+    evento eliminado quedan ocultos mientras el borrado en cascada llega a ellos.
+    """
+    return db.query(*(entities or (EventRegistration,))).join(
+        Event, Event.id == EventRegistration.event_id
+    )
+
+
+def _reserve_seat(db: Session, event_id: int) -> bool:
+    """
+    Incrementa el contador de registros del evento solo si quedan plazas.
+
+    El UPDATE condicional es atómico: dos registros simultáneos no pueden superar la
+    capacidad aunque ambos hayan visto una plaza libre.
+
+    Returns:
+        True si se reservó la plaza, False si el evento está lleno
+    """
+    result = db.execute(
+        update(Event)
+        .where(Event.id == event_id, Event.registered_count < Event.capacity)
+        .values(registered_count=Event.registered_count + 1)
+    )
+    return result.rowcount == 1
+
+
+def _release_seat(db: Session, event_id: int) -> None:
+    """Decrementa el contador de registros del evento (sin bajar de 0)"""
+    db.execute(
+        update(Event)
+        .where(Event.id == event_id, Event.registered_count > 0)
+        .values(registered_count=Event.registered_count - 1)
+    )
+
+
+def register_to_event(db: Session, user_id: int, event_id: int) -> EventRegistration | None:
+    """
+    Registra un usuario a un evento, reserva la plaza en el contador del evento y lo
+    cuenta en el rollup diario (misma transacción).
+
+    Nota: Las validaciones (evento existe, duplicados)
     se hacen en el servicio, no aquí.
+
+    Returns:
+        EventRegistration o None si el evento se llenó
     """
+    if not _reserve_seat(db, event_id):
+        return None
+
+    crud_analytics.record_registration(db, event_id)
     registration = EventRegistration(user_id=user_id, event_id=event_id)
-    return save_and_refresh(db, registration)
+    return save_and_flush(db, registration)
 
 
 def unregister_from_event(db: Session, user_id: int, event_id: int) -> bool:
     """Cancela el registro de un usuario a un evento (soft delete)"""
-    from app.core.db_utils import soft_delete
-
     registration = (
-        db.query(EventRegistration)
+        _live_registrations(db)
         .filter(
             EventRegistration.user_id == user_id,
             EventRegistration.event_id == event_id,
-            EventRegistration.deleted_at.is_(None),
-            EventRegistration.is_deleted.is_(False),
         )
         .first()
     )
@@ -37,20 +85,25 @@ def unregister_from_event(db: Session, user_id: int, event_id: int) -> bool:
     if not registration:
         return False
 
+    _release_seat(db, event_id)
+    release_user_event_sessions(db, registration.user_id, event_id)
+    crud_analytics.record_cancellation(db, event_id)
     soft_delete(db, registration)
     return True
 
 
-def soft_delete_registration(db: Session, registration_id: int) -> bool:
-    """Realiza soft delete de un registro"""
-    from app.core.db_utils import soft_delete
+def soft_delete_registration(db: Session, registration_id: int, event_id: int) -> bool:
+    """
+    Realiza soft delete de un registro.
 
+    Se filtra también por event_id para que PostgreSQL pode particiones cuando
+    event_registrations está particionada por event_id.
+    """
     registration = (
-        db.query(EventRegistration)
+        _live_registrations(db)
         .filter(
             EventRegistration.id == registration_id,
-            EventRegistration.deleted_at.is_(None),
-            EventRegistration.is_deleted.is_(False),
+            EventRegistration.event_id == event_id,
         )
         .first()
     )
@@ -58,21 +111,16 @@ def soft_delete_registration(db: Session, registration_id: int) -> bool:
     if not registration:
         return False
 
+    _release_seat(db, event_id)
+    release_user_event_sessions(db, registration.user_id, event_id)
+    crud_analytics.record_cancellation(db, event_id)
     soft_delete(db, registration)
     return True
 
 
 def get_user_registrations(db: Session, user_id: int) -> list[EventRegistration]:
-    """Obtiene todos los registros de un usuario (excluye eliminados)"""
-    return (
-        db.query(EventRegistration)
-        .filter(
-            EventRegistration.user_id == user_id,
-            EventRegistration.deleted_at.is_(None),
-            EventRegistration.is_deleted.is_(False),
-        )
-        .all()
-    )
+    """Obtiene todos los registros de un usuario (excluye eliminados y de eventos eliminados)"""
+    return _live_registrations(db).filter(EventRegistration.user_id == user_id).all()
 
 
 def _get_user_registered_events_query(db: Session, user_id: int):
@@ -83,13 +131,7 @@ def _get_user_registered_events_query(db: Session, user_id: int):
     return (
         db.query(Event)
         .join(EventRegistration, Event.id == EventRegistration.event_id)
-        .filter(
-            EventRegistration.user_id == user_id,
-            EventRegistration.deleted_at.is_(None),
-            EventRegistration.is_deleted.is_(False),
-            Event.deleted_at.is_(None),
-            Event.is_deleted.is_(False),
-        )
+        .filter(EventRegistration.user_id == user_id)
         .order_by(Event.created_at.desc())
     )
 
@@ -111,41 +153,231 @@ def get_user_registered_events(
     return events, pagination_metadata
 
 
-def get_user_registered_events_all(db: Session, user_id: int) -> list[Event]:
+def get_user_upcoming_registered_events(db: Session, user_id: int, limit: int) -> list[Event]:
     """
-    Obtiene todos los eventos a los que un usuario está registrado (sin paginación).
-    Útil para casos como el perfil del usuario donde se necesitan todos los eventos.
-
-    Returns:
-        List[Event]: Lista completa de eventos registrados
+    Obtiene los próximos eventos (no iniciados ni cancelados) a los que el usuario
+    está registrado, ordenados por fecha de inicio. Pensado para vistas previas pequeñas.
     """
-    query = _get_user_registered_events_query(db, user_id)
-    return query.all()
+    return (
+        db.query(Event)
+        .join(EventRegistration, Event.id == EventRegistration.event_id)
+        .filter(
+            EventRegistration.user_id == user_id,
+            Event.start_date > datetime.utcnow(),
+            Event.status != EventStatusDB.CANCELLED,
+        )
+        .order_by(Event.start_date.asc())
+        .limit(limit)
+        .all()
+    )
 
 
 def get_event_registrations(db: Session, event_id: int) -> list[EventRegistration]:
     """Obtiene todos los registros de un evento (excluye eliminados)"""
+    return db.query(EventRegistration).filter(EventRegistration.event_id == event_id).all()
+
+
+def is_user_registered(db: Session, user_id: int, event_id: int) -> bool:
+    """Verifica si un usuario está registrado en un evento vivo (excluye eliminados)"""
     return (
-        db.query(EventRegistration)
+        _live_registrations(db)
         .filter(
+            EventRegistration.user_id == user_id,
             EventRegistration.event_id == event_id,
-            EventRegistration.deleted_at.is_(None),
-            EventRegistration.is_deleted.is_(False),
+        )
+        .first()
+        is not None
+    )
+
+
+def get_registered_event_ids(db: Session, user_id: int, event_ids: set[int]) -> set[int]:
+    """
+    Obtiene cuáles de los eventos indicados tienen un registro vivo del usuario
+    (una sola query ``event_id IN (...)`` sobre el índice parcial por usuario)
+    """
+    if not event_ids:
+        return set()
+
+    rows = (
+        _live_registrations(db, EventRegistration.event_id)
+        .filter(
+            EventRegistration.user_id == user_id,
+            EventRegistration.event_id.in_(event_ids),
         )
         .all()
     )
+    return {row.event_id for row in rows}
 
 
-def is_user_registered(db: Session, user_id: int, event_id: int) -> bool:
-    """Verifica si un usuario está registrado en un evento (excluye eliminados)"""
+def take_session_seat(db: Session, session_id: int) -> int | None:
+    """
+    Ocupa una plaza de la sesión con un UPDATE condicional atómico
+    (``seats_taken = seats_taken + 1 WHERE seats_taken < capacity RETURNING``).
+
+    La fila de la sesión queda bloqueada hasta el commit: en una avalancha sobre un
+    taller, cada reserva espera solo a las anteriores y ninguna supera la capacidad.
+    Capacidad NULL = sin límite (solo se cuenta la plaza).
+
+    Returns:
+        Plazas ocupadas tras la reserva, o None si la sesión está llena o no existe
+    """
+    return db.execute(
+        update(EventSession)
+        .where(
+            EventSession.id == session_id,
+            EventSession.is_deleted.is_(False),
+            or_(EventSession.capacity.is_(None), EventSession.seats_taken < EventSession.capacity),
+        )
+        .values(seats_taken=EventSession.seats_taken + 1)
+        .returning(EventSession.seats_taken)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+
+
+def release_session_seat(db: Session, session_id: int) -> None:
+    """Libera una plaza de la sesión (sin bajar de 0)"""
+    db.execute(
+        update(EventSession)
+        .where(EventSession.id == session_id, EventSession.seats_taken > 0)
+        .values(seats_taken=EventSession.seats_taken - 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def get_sessions_with_event(db: Session, session_ids: set[int]) -> list[EventSession]:
+    """
+    Obtiene sesiones vivas de eventos vivos con su evento en una sola query
+    (ordenadas por id: orden de bloqueo de las reservas en lote)
+    """
+    if not session_ids:
+        return []
+
     return (
-        db.query(EventRegistration)
+        db.query(EventSession)
+        .join(EventSession.event)
+        .options(contains_eager(EventSession.event))
+        .filter(EventSession.id.in_(session_ids))
+        .order_by(EventSession.id)
+        .all()
+    )
+
+
+def add_session_registration(
+    db: Session, user_id: int, session_id: int, event_id: int
+) -> SessionRegistration | None:
+    """
+    Inserta la plaza del usuario con ``INSERT ... ON CONFLICT DO NOTHING`` sobre el
+    índice único parcial (usuario, sesión), sin commit
+
+    Returns:
+        SessionRegistration creado, o None si el usuario ya tenía plaza (p. ej. una
+        petición simultánea suya ganó la inserción)
+    """
+    insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    table = SessionRegistration.__table__
+    registration_id = db.execute(
+        insert(table)
+        .values(user_id=user_id, session_id=session_id, event_id=event_id)
+        .on_conflict_do_nothing(
+            # Mismo predicado que el índice parcial (is_deleted = false / = 0)
+            index_elements=["user_id", "session_id"],
+            index_where=table.c.is_deleted == false(),
+        )
+        .returning(table.c.id)
+    ).scalar_one_or_none()
+    if registration_id is None:
+        return None
+    return db.get(SessionRegistration, registration_id)
+
+
+def unregister_from_session(db: Session, user_id: int, session_id: int) -> bool:
+    """Cancela la plaza de un usuario en una sesión y la devuelve al contador"""
+    registration = (
+        db.query(SessionRegistration)
         .filter(
-            EventRegistration.user_id == user_id,
-            EventRegistration.event_id == event_id,
-            EventRegistration.deleted_at.is_(None),
-            EventRegistration.is_deleted.is_(False),
+            SessionRegistration.user_id == user_id,
+            SessionRegistration.session_id == session_id,
         )
         .first()
-        is not None
+    )
+    if not registration:
+        return False
+
+    release_session_seat(db, session_id)
+    soft_delete(db, registration)
+    return True
+
+
+def release_user_event_sessions(db: Session, user_id: int, event_id: int) -> int:
+    """
+    Cancela las plazas de sesión de un usuario en un evento (al dejar el evento)
+
+    Returns:
+        Número de plazas liberadas
+    """
+    registrations = (
+        db.query(SessionRegistration)
+        .filter(
+            SessionRegistration.event_id == event_id,
+            SessionRegistration.user_id == user_id,
+        )
+        .all()
+    )
+    for registration in registrations:
+        release_session_seat(db, registration.session_id)
+        soft_delete(db, registration)
+    return len(registrations)
+
+
+def soft_delete_session_registrations(db: Session, session_id: int) -> int:
+    """
+    Marca como eliminadas las plazas vivas de una sesión eliminada con un único UPDATE
+    (el contador de la sesión ya no se usa)
+
+    Returns:
+        Número de plazas marcadas
+    """
+    now = datetime.utcnow()
+    result = db.execute(
+        update(SessionRegistration)
+        .where(
+            SessionRegistration.session_id == session_id,
+            SessionRegistration.is_deleted.is_(False),
+        )
+        .values(deleted_at=now, is_deleted=True)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def get_registered_session_ids(db: Session, user_id: int, session_ids: set[int]) -> set[int]:
+    """Obtiene cuáles de las sesiones indicadas tienen una plaza viva del usuario"""
+    if not session_ids:
+        return set()
+
+    rows = (
+        db.query(SessionRegistration.session_id)
+        .filter(
+            SessionRegistration.user_id == user_id,
+            SessionRegistration.session_id.in_(session_ids),
+        )
+        .all()
+    )
+    return {row.session_id for row in rows}
+
+
+def get_user_event_sessions(db: Session, user_id: int, event_id: int) -> list[EventSession]:
+    """
+    Obtiene las sesiones vivas de un evento en las que el usuario tiene plaza,
+    ordenadas por hora de inicio
+    """
+    return (
+        db.query(EventSession)
+        .join(SessionRegistration, SessionRegistration.session_id == EventSession.id)
+        .filter(
+            SessionRegistration.event_id == event_id,
+            SessionRegistration.user_id == user_id,
+        )
+        .order_by(EventSession.start_time.asc())
+        .all()
     )
@@ -0,0 +1,122 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import and_, distinct, func, or_
+from sqlalchemy.orm import Query, Session
+
+from app.models.attendee import EventRegistration
+from app.models.event import Event
+from app.models.session import Session as EventSession
+
+# Eventos leídos por lote al generar un feed (sin cargar el resultado completo en memoria)
+FEED_BATCH_SIZE = 200
+
+
+def _scope_events(query: Query, user_id: int | None, event_id: int | None) -> Query:
+    """
+    Restringe una query sobre eventos al feed pedido: eventos con registro vivo del
+    usuario o un único evento.
+    """
+    if user_id is not None:
+        query = query.join(EventRegistration, EventRegistration.event_id == Event.id).filter(
+            EventRegistration.user_id == user_id
+        )
+    if event_id is not None:
+        query = query.filter(Event.id == event_id)
+    return query
+
+
+def _scope_feed_query(query: Query, user_id: int | None, event_id: int | None) -> Query:
+    """Restringe una query sobre eventos (LEFT JOIN sesiones) al feed pedido"""
+    query = query.outerjoin(EventSession, EventSession.event_id == Event.id)
+    return _scope_events(query, user_id, event_id)
+
+
+def get_feed_validators(
+    db: Session, user_id: int | None = None, event_id: int | None = None
+) -> dict[str, Any]:
+    """
+    Obtiene en una sola query agregada los datos de los que se derivan ETag y
+    Last-Modified de un feed (filas vivas: el filtro de soft delete aplica al JOIN).
+
+    Los contadores detectan bajas (sesiones eliminadas, registros cancelados) que no
+    cambian ningún ``updated_at``.
+
+    Returns:
+        Dict con events, sessions, events_updated_at, sessions_updated_at y registered_at
+    """
+    columns = [
+        func.count(distinct(Event.id)),
+        func.count(distinct(EventSession.id)),
+        func.max(Event.updated_at),
+        func.max(EventSession.updated_at),
+    ]
+    if user_id is not None:
+        columns.append(func.max(EventRegistration.registered_at))
+
+    row = _scope_feed_query(db.query(*columns).select_from(Event), user_id, event_id).one()
+    return {
+        "events": row[0],
+        "sessions": row[1],
+        "events_updated_at": row[2],
+        "sessions_updated_at": row[3],
+        "registered_at": row[4] if user_id is not None else None,
+    }
+
+
+def get_feed_rows(
+    db: Session,
+    user_id: int | None = None,
+    event_id: int | None = None,
+    after: tuple[datetime, int] | None = None,
+    limit: int = FEED_BATCH_SIZE,
+) -> list[Any]:
+    """
+    Obtiene el siguiente lote del feed: hasta ``limit`` eventos tras ``after``
+    (keyset por start_date, id) con sus sesiones, una fila por sesión (o una fila con
+    columnas de sesión a NULL si el evento no tiene sesiones).
+
+    Cada lote son dos queries cortas e independientes (no mantiene un cursor abierto
+    entre lotes); las filas de un mismo evento llegan consecutivas y sus sesiones
+    ordenadas por hora de inicio.
+    """
+    events = _scope_events(db.query(Event.id).select_from(Event), user_id, event_id)
+    if after is not None:
+        start_date, last_id = after
+        events = events.filter(
+            or_(
+                Event.start_date > start_date,
+                and_(Event.start_date == start_date, Event.id > last_id),
+            )
+        )
+    event_ids = [row.id for row in events.order_by(Event.start_date, Event.id).limit(limit)]
+    if not event_ids:
+        return []
+
+    return (
+        db.query(
+            Event.id.label("event_id"),
+            Event.name,
+            Event.description,
+            Event.location,
+            Event.start_date,
+            Event.end_date,
+            Event.status,
+            Event.version,
+            Event.updated_at,
+            EventSession.id.label("session_id"),
+            EventSession.title.label("session_title"),
+            EventSession.description.label("session_description"),
+            EventSession.speaker_name.label("session_speaker_name"),
+            EventSession.location.label("session_location"),
+            EventSession.start_time.label("session_start_time"),
+            EventSession.end_time.label("session_end_time"),
+            EventSession.version.label("session_version"),
+            EventSession.updated_at.label("session_updated_at"),
+        )
+        .select_from(Event)
+        .outerjoin(EventSession, EventSession.event_id == Event.id)
+        .filter(Event.id.in_(event_ids))
+        .order_by(Event.start_date, Event.id, EventSession.start_time, EventSession.id)
+        .all()
+    )
@@ -2,13 +2,13 @@ import unicodedata
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import func, update
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import ColumnElement, and_, func, or_, update
+from sqlalchemy.orm import Session, joinedload, selectinload
 
-from app.core.db_utils import save_and_refresh, update_and_refresh
+from app.core.db_utils import save_and_flush
 from app.core.pagination import apply_pagination, get_pagination_metadata
 from app.models.event import Event, EventStatus, EventStatusDB
-from app.schemas.event import EventCreate, EventUpdate
+from app.schemas.event import EventCreate, EventSortField, SortOrder
 
 
 def _normalize_text(text: str) -> str:
@@ -70,41 +70,130 @@ def get_event(db: Session, event_id: int, include_sessions: bool = False) -> Eve
     Returns:
         Event o None si no existe o está eliminado
     """
-    query = db.query(Event).filter(
-        Event.id == event_id, Event.deleted_at.is_(None), Event.is_deleted.is_(False)
-    )
+    query = db.query(Event).filter(Event.id == event_id)
     if include_sessions:
         query = query.options(joinedload(Event.sessions))
 
     return query.first()
 
 
-def get_events(
-    db: Session,
-    page: int = 1,
-    per_page: int = 20,
-    search: str | None = None,
-    status: EventStatus | None = None,
-) -> tuple[list[Event], dict[str, Any]]:
+def get_events_by_ids(db: Session, event_ids: list[int] | set[int]) -> list[Event]:
+    """Obtiene varios eventos por ID en una sola query (excluye eliminados)"""
+    return db.query(Event).filter(Event.id.in_(event_ids)).all()
+
+
+def get_event_detail(db: Session, event_id: int) -> Event | None:
     """
-    Lista eventos con filtros opcionales y paginación.
+    Obtiene el detalle de un evento en dos consultas, sin cargar filas de registros:
+    1. El evento (incluye el contador registered_count)
+    2. Sus sesiones vivas ordenadas por hora de inicio (selectinload)
+
+    Args:
+        db: Sesión de base de datos
+        event_id: ID del evento
 
     Returns:
-        Tuple[List[Event], Dict]: (eventos, metadata de paginación)
+        Event (con sessions cargadas) o None si no existe
     """
-    query = db.query(Event).filter(Event.deleted_at.is_(None), Event.is_deleted.is_(False))
+    return (
+        db.query(Event)
+        .options(selectinload(Event.sessions))
+        .filter(Event.id == event_id)
+        # Refresca el evento aunque ya esté en el identity map
+        .populate_existing()
+        .first()
+    )
+
+
+# Columnas por las que se puede ordenar el listado (ver EventSortField)
+SORT_COLUMNS = {
+    EventSortField.START_DATE: Event.start_date,
+    EventSortField.CREATED_AT: Event.created_at,
+    EventSortField.NAME: Event.name,
+}
+
+
+def _build_event_filters(
+    search: str | None = None,
+    status: EventStatus | None = None,
+    start_from: datetime | None = None,
+    start_to: datetime | None = None,
+    location: str | None = None,
+    creator_id: int | None = None,
+    has_availability: bool | None = None,
+    min_capacity: int | None = None,
+) -> list[ColumnElement[bool]]:
+    """
+    Construye la lista de condiciones SQL del listado de eventos.
+
+    Cada filtro es una expresión independiente que se combina con AND, de modo que
+    cualquier combinación se resuelve con los índices parciales de Event:
+    - start_from/start_to: rango sobre start_date (ix_events_start_date_live)
+    - location: lower(location) = :location (ix_events_location_lower_live)
+    - creator_id: ix_events_creator_id_created_at_live
+    - has_availability: registered_count < capacity, comparación de columnas de la misma
+      fila sin contar registros (ix_events_start_date_available)
+    """
+    conditions = []
     if search:
         # Normalizar el término de búsqueda: convertir a minúsculas y remover acentos
         normalized_search = _normalize_text(search)
 
         # Usar unaccent de PostgreSQL para normalizar acentos en el campo name
         # Requiere: CREATE EXTENSION IF NOT EXISTS unaccent;
-        query = query.filter(func.unaccent(func.lower(Event.name)).ilike(f"%{normalized_search}%"))
+        conditions.append(func.unaccent(func.lower(Event.name)).ilike(f"%{normalized_search}%"))
     if status:
         status_filter = _build_computed_status_filter(status)
         if status_filter is not None:
-            query = query.filter(status_filter)
+            conditions.append(status_filter)
+    if start_from is not None:
+        conditions.append(Event.start_date >= start_from)
+    if start_to is not None:
+        conditions.append(Event.start_date <= start_to)
+    if location:
+        conditions.append(func.lower(Event.location) == location.lower())
+    if creator_id is not None:
+        conditions.append(Event.creator_id == creator_id)
+    if has_availability is True:
+        conditions.append(Event.registered_count < Event.capacity)
+    elif has_availability is False:
+        conditions.append(Event.registered_count >= Event.capacity)
+    if min_capacity is not None:
+        conditions.append(Event.capacity >= min_capacity)
+    return conditions
+
+
+def get_events(
+    db: Session,
+    page: int = 1,
+    per_page: int = 20,
+    sort_by: EventSortField = EventSortField.START_DATE,
+    sort_order: SortOrder = SortOrder.ASC,
+    **filters: Any,
+) -> tuple[list[Event], dict[str, Any]]:
+    """
+    Lista eventos con filtros opcionales combinables, ordenación y paginación.
+
+    Args:
+        db: Sesión de base de datos
+        page: Número de página (1-indexed)
+        per_page: Eventos por página
+        sort_by: Columna de ordenación
+        sort_order: Dirección de la ordenación
+        **filters: Filtros de _build_event_filters (search, status, start_from, start_to,
+            location, creator_id, has_availability, min_capacity)
+
+    Returns:
+        Tuple[List[Event], Dict]: (eventos, metadata de paginación)
+    """
+    query = db.query(Event).filter(*_build_event_filters(**filters))
     pagination_metadata = get_pagination_metadata(query, page=page, per_page=per_page)
+
+    sort_column = SORT_COLUMNS[sort_by]
+    if sort_order == SortOrder.DESC:
+        query = query.order_by(sort_column.desc(), Event.id.desc())
+    else:
+        query = query.order_by(sort_column.asc(), Event.id.asc())
     query = apply_pagination(query, page=page, per_page=per_page)
 
     events = query.all()
@@ -112,45 +201,139 @@ def get_events(
     return events, pagination_metadata
 
 
+def _month_bucket(db: Session) -> ColumnElement[str]:
+    """Mes de start_date con formato YYYY-MM (la función depende del dialecto)"""
+    if db.get_bind().dialect.name == "sqlite":
+        return func.strftime("%Y-%m", Event.start_date)
+    return func.to_char(Event.start_date, "YYYY-MM")
+
+
+def get_event_facets(
+    db: Session, status: EventStatus | None = None, top_locations: int = 10, **filters: Any
+) -> dict[str, Any]:
+    """
+    Calcula los conteos por estado computado, ubicación y mes del listado de eventos
+    en una sola query agregada.
+
+    La query agrupa por (lower(location), mes) y cuenta con ``COUNT(*) FILTER (WHERE ...)``
+    cada estado computado y las filas que cumplen el filtro de estado; los grupos se
+    suman después por faceta. El filtro de estado no se aplica en el WHERE para que
+    los conteos por estado muestren todas las pestañas.
+
+    Args:
+        db: Sesión de base de datos
+        status: Estado computado seleccionado (solo afecta a total, locations y months)
+        top_locations: Número máximo de ubicaciones devueltas
+        **filters: Resto de filtros de _build_event_filters
+
+    Returns:
+        Dict con total, status, locations y months (ver EventFacetsResponse)
+    """
+    location_key = func.lower(Event.location)
+    month = _month_bucket(db)
+    status_filter = _build_computed_status_filter(status) if status else None
+    matched = func.count().filter(status_filter) if status_filter is not None else func.count()
+
+    rows = (
+        db.query(
+            location_key,
+            func.min(Event.location),
+            month,
+            matched,
+            *(func.count().filter(_build_computed_status_filter(s)) for s in EventStatus),
+        )
+        .filter(*_build_event_filters(**filters))
+        .group_by(location_key, month)
+        .all()
+    )
+
+    status_counts = dict.fromkeys(EventStatus, 0)
+    locations: dict[str, list] = {}  # lower(location) -> [ubicación mostrada, conteo]
+    months: dict[str, int] = {}
+    total = 0
+    for key, label, month_value, count, *per_status in rows:
+        for event_status, status_count in zip(EventStatus, per_status, strict=True):
+            status_counts[event_status] += status_count
+        if not count:
+            continue
+        total += count
+        months[month_value] = months.get(month_value, 0) + count
+        if key is not None:
+            locations.setdefault(key, [label, 0])[1] += count
+
+    top = sorted(locations.values(), key=lambda item: (-item[1], item[0]))[:top_locations]
+    return {
+        "total": total,
+        "status": status_counts,
+        "locations": [{"value": label, "count": count} for label, count in top],
+        "months": [{"value": value, "count": months[value]} for value in sorted(months)],
+    }
+
+
+def get_event_boundaries(db: Session, start: datetime, end: datetime) -> list:
+    """
+    Eventos programados con inicio o fin en ``(start, end]`` para el planificador
+    (filas ligeras; cada rango usa su índice parcial de start_date/end_date)
+    """
+    return (
+        db.query(Event.id, Event.start_date, Event.end_date)
+        .filter(
+            Event.status == EventStatusDB.SCHEDULED,
+            or_(
+                and_(Event.start_date > start, Event.start_date <= end),
+                and_(Event.end_date > start, Event.end_date <= end),
+            ),
+        )
+        .all()
+    )
+
+
 def create_event(db: Session, event: EventCreate, creator_id: int) -> Event:
     """Crea un nuevo evento"""
     db_event = Event(**event.model_dump(), creator_id=creator_id)
-    return save_and_refresh(db, db_event)
+    return save_and_flush(db, db_event)
 
 
-def update_event(db: Session, event_id: int, event_update: EventUpdate) -> Event | None:
-    """Actualiza un evento"""
-    db_event = get_event(db, event_id)
-    if not db_event:
-        return None
+def update_event(db: Session, event_id: int, values: dict[str, Any], version: int) -> Event | None:
+    """
+    Actualiza un evento con un UPDATE condicional (concurrencia optimista).
 
-    update_data = event_update.model_dump(exclude_unset=True)
+    El UPDATE solo afecta a la fila si la versión sigue siendo la leída; incrementa la
+    versión y devuelve la fila con RETURNING, sin volver a consultarla (sin commit).
 
-    # Convertir EventStatus a EventStatusDB si se está actualizando el status
-    if "status" in update_data:
-        status_value = update_data["status"]
-        if isinstance(status_value, EventStatus):
-            update_data["status"] = EventStatusDB(status_value.value)
-        elif isinstance(status_value, str):
-            try:
-                update_data["status"] = EventStatusDB(status_value)
-            except ValueError:
-                try:
-                    event_status = EventStatus(status_value)
-                    update_data["status"] = EventStatusDB(event_status.value)
-                except ValueError:
-                    pass  # Dejar que SQLAlchemy valide
+    Args:
+        db: Sesión de base de datos
+        event_id: ID del evento
+        values: Columnas a actualizar (ya validadas)
+        version: Versión leída del evento
 
-    for field, value in update_data.items():
-        setattr(db_event, field, value)
+    Returns:
+        Event actualizado o None si no existe, la versión cambió (edición concurrente) o
+        la nueva capacidad ya es menor que los registros vivos
+    """
+    conditions = [Event.id == event_id, Event.version == version, Event.is_deleted.is_(False)]
+    if values.get("capacity") is not None:
+        # Evita reducir la capacidad por debajo de registros hechos tras la validación
+        conditions.append(Event.registered_count <= values["capacity"])
 
-    db_event.updated_at = datetime.utcnow()
-    return update_and_refresh(db, db_event)
+    updated_event = db.execute(
+        update(Event)
+        .where(*conditions)
+        .values(**values, version=Event.version + 1, updated_at=datetime.utcnow())
+        .returning(Event),
+        execution_options={"populate_existing": True},
+    ).scalar_one_or_none()
+    return updated_event
 
 
 def soft_delete_event(db: Session, event_id: int) -> bool:
     """
-    Realiza soft delete de un evento y sus relaciones (cascada) usando bulk updates
+    Realiza soft delete de un evento y encola el borrado de sus sesiones y registros
+    (sin commit)
+
+    Solo se actualiza la fila del evento: las filas hijas se marcan después en lotes
+    (DeletionService), sin mantener bloqueos largos. Mientras tanto quedan ocultas porque
+    las lecturas de sesiones y registros exigen un evento vivo.
 
     Args:
         db: Sesión de base de datos
@@ -159,7 +342,7 @@ def soft_delete_event(db: Session, event_id: int) -> bool:
     Returns:
         True si se eliminó correctamente, False si no existe
     """
-    from app.models.attendee import EventRegistration
+    from app.crud import maintenance as crud_maintenance
     from app.models.session import Session
 
     db_event = get_event(db, event_id)
@@ -167,36 +350,21 @@ def soft_delete_event(db: Session, event_id: int) -> bool:
         return False
 
     now = datetime.utcnow()
-
-    # Bulk soft delete de entidades relacionadas (cascada)
-    db.execute(
-        update(Session)
-        .where(
-            Session.event_id == event_id,
-            Session.deleted_at.is_(None),
-            Session.is_deleted.is_(False),
-        )
-        .values(deleted_at=now, is_deleted=True, updated_at=now)
+    total_sessions = db.query(func.count(Session.id)).filter(Session.event_id == event_id).scalar()
+    crud_maintenance.create_event_deletion(
+        db,
+        event_id=event_id,
+        deleted_at=now,
+        total_sessions=total_sessions,
+        total_registrations=db_event.registered_count,
     )
 
-    db.execute(
-        update(EventRegistration)
-        .where(
-            EventRegistration.event_id == event_id,
-            EventRegistration.deleted_at.is_(None),
-            EventRegistration.is_deleted.is_(False),
-        )
-        .values(deleted_at=now, is_deleted=True)
-    )
-
-    # Soft delete del evento
+    # Soft delete del evento (sus registros ya no cuentan)
     db.execute(
         update(Event)
         .where(Event.id == event_id)
-        .values(deleted_at=now, is_deleted=True, updated_at=now)
+        .values(deleted_at=now, is_deleted=True, updated_at=now, registered_count=0)
     )
-
-    db.commit()
     return True
 
 
@@ -205,13 +373,7 @@ def _get_user_events_query(db: Session, user_id: int):
     Query base para obtener eventos creados por un usuario.
     Retorna la query sin paginación para reutilizar.
     """
-    return (
-        db.query(Event)
-        .filter(
-            Event.creator_id == user_id, Event.deleted_at.is_(None), Event.is_deleted.is_(False)
-        )
-        .order_by(Event.created_at.desc())
-    )
+    return db.query(Event).filter(Event.creator_id == user_id).order_by(Event.created_at.desc())
 
 
 def get_user_events(
@@ -231,15 +393,3 @@ def get_user_events(
     events = paginated_query.all()
 
     return events, pagination_metadata
-
-
-def get_user_events_all(db: Session, user_id: int) -> list[Event]:
-    """
-    Obtiene todos los eventos creados por un usuario (sin paginación).
-    Útil para casos como el perfil del usuario donde se necesitan todos los eventos.
-
-    Returns:
-        List[Event]: Lista completa de eventos creados
-    """
-    query = _get_user_events_query(db, user_id)
-    return query.all()
@@ -0,0 +1,152 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.models.job import Job, JobStatus
+
+
+def create_job(
+    db: Session,
+    job_type: str,
+    payload: dict[str, Any],
+    max_attempts: int,
+    priority: int = 0,
+    run_at: datetime | None = None,
+    user_id: int | None = None,
+) -> Job:
+    """
+    Encola un trabajo en la transacción actual (sin commit): si la petición que lo
+    origina hace rollback, el trabajo se descarta con ella
+    """
+    job = Job(
+        type=job_type,
+        payload=payload,
+        status=JobStatus.PENDING,
+        priority=priority,
+        attempts=0,
+        max_attempts=max_attempts,
+        run_at=run_at or datetime.utcnow(),
+        user_id=user_id,
+    )
+    db.add(job)
+    db.flush()
+    return job
+
+
+def get_job(db: Session, job_id: int) -> Job | None:
+    """Obtiene un trabajo por ID"""
+    return db.get(Job, job_id)
+
+
+def count_running(db: Session, job_type: str) -> int:
+    """Trabajos de un tipo en curso con la reserva vigente (en todos los workers)"""
+    return (
+        db.query(func.count(Job.id))
+        .filter(
+            Job.type == job_type,
+            Job.status == JobStatus.RUNNING,
+            Job.locked_until > datetime.utcnow(),
+        )
+        .scalar()
+    )
+
+
+def claim_jobs(db: Session, job_type: str, limit: int, lease_seconds: int) -> list[Job]:
+    """
+    Reserva hasta ``limit`` trabajos pendientes de un tipo, por prioridad y antigüedad.
+
+    Las filas se bloquean con ``FOR UPDATE SKIP LOCKED`` (varios workers no se pisan),
+    pasan a RUNNING con un intento más y una reserva de ``lease_seconds`` que el worker
+    renueva mientras el trabajo sigue vivo. Hace commit para liberar los bloqueos.
+
+    Returns:
+        Trabajos reservados (separados de la sesión)
+    """
+    now = datetime.utcnow()
+    jobs = (
+        db.query(Job)
+        .filter(Job.type == job_type, Job.status == JobStatus.PENDING, Job.run_at <= now)
+        .order_by(Job.priority.desc(), Job.run_at, Job.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    for job in jobs:
+        job.status = JobStatus.RUNNING
+        job.attempts += 1
+        job.locked_until = now + timedelta(seconds=lease_seconds)
+        job.started_at = now
+    db.commit()
+    for job in jobs:
+        db.expunge(job)
+    return jobs
+
+
+def renew_leases(db: Session, job_ids: list[int], lease_seconds: int) -> None:
+    """Prolonga la reserva de los trabajos en curso de este worker (sin commit)"""
+    if not job_ids:
+        return
+    db.execute(
+        update(Job)
+        .where(Job.id.in_(job_ids), Job.status == JobStatus.RUNNING)
+        .values(locked_until=datetime.utcnow() + timedelta(seconds=lease_seconds))
+    )
+
+
+def requeue_expired(db: Session) -> int:
+    """
+    Devuelve a la cola los trabajos RUNNING cuya reserva venció (su worker cayó), o los
+    marca FAILED si ya agotaron los intentos (sin commit)
+
+    Returns:
+        Número de trabajos recuperados
+    """
+    now = datetime.utcnow()
+    expired = (
+        Job.status == JobStatus.RUNNING,
+        Job.locked_until <= now,
+    )
+    failed = db.execute(
+        update(Job)
+        .where(*expired, Job.attempts >= Job.max_attempts)
+        .values(
+            status=JobStatus.FAILED,
+            locked_until=None,
+            finished_at=now,
+            last_error="Reserva vencida: el worker dejó de responder",
+        )
+    )
+    requeued = db.execute(
+        update(Job).where(*expired).values(status=JobStatus.PENDING, locked_until=None, run_at=now)
+    )
+    return failed.rowcount + requeued.rowcount
+
+
+def mark_succeeded(db: Session, job_id: int, result: dict[str, Any] | None) -> None:
+    """Marca un trabajo como terminado con su resultado (sin commit)"""
+    db.execute(
+        update(Job)
+        .where(Job.id == job_id)
+        .values(
+            status=JobStatus.SUCCEEDED,
+            result=result,
+            last_error=None,
+            locked_until=None,
+            finished_at=datetime.utcnow(),
+        )
+    )
+
+
+def mark_failed_attempt(db: Session, job_id: int, error: str, run_at: datetime | None) -> None:
+    """
+    Registra un intento fallido (sin commit): reprograma el trabajo para ``run_at`` o,
+    si es None, lo marca como FAILED definitivamente
+    """
+    values: dict[str, Any] = {"last_error": error, "locked_until": None}
+    if run_at is None:
+        values.update(status=JobStatus.FAILED, finished_at=datetime.utcnow())
+    else:
+        values.update(status=JobStatus.PENDING, run_at=run_at)
+    db.execute(update(Job).where(Job.id == job_id).values(**values))
@@ -0,0 +1,186 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, exists, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.soft_delete import with_deleted
+from app.models.attendee import EventRegistration, SessionRegistration
+from app.models.event import Event
+from app.models.maintenance import (
+    ArchivedRecord,
+    EventDeletion,
+    PurgeCheckpoint,
+    SchedulerCheckpoint,
+)
+from app.models.outbox import OutboxMessage, OutboxStatus
+from app.models.session import Session as EventSession
+
+
+def get_checkpoint(db: Session, table_name: str) -> PurgeCheckpoint:
+    """Obtiene (o crea sin guardar) el checkpoint de purgado de una tabla"""
+    checkpoint = db.get(PurgeCheckpoint, table_name)
+    if checkpoint is None:
+        checkpoint = PurgeCheckpoint(table_name=table_name, last_id=0, purged_count=0)
+        db.add(checkpoint)
+    return checkpoint
+
+
+def get_scheduler_checkpoint(db: Session, name: str, now: datetime) -> SchedulerCheckpoint:
+    """Obtiene (o crea sin guardar, con la marca en ``now``) la marca del planificador"""
+    checkpoint = db.get(SchedulerCheckpoint, name)
+    if checkpoint is None:
+        checkpoint = SchedulerCheckpoint(name=name, fired_until=now)
+        db.add(checkpoint)
+    return checkpoint
+
+
+def get_purge_batch(db: Session, model, cutoff: datetime, after_id: int, limit: int) -> list:
+    """
+    Obtiene el siguiente lote (keyset por id) de filas soft-deleted antes de cutoff.
+
+    Las sesiones solo se purgan cuando ya no les quedan plazas reservadas, y los eventos
+    cuando ya no les quedan sesiones, registros ni plazas, para no violar las claves
+    foráneas (p. ej. si un borrado en cascada falló a medias). Los mensajes del outbox
+    no son soft-deleted: se purgan los entregados (SENT) antes de cutoff.
+    """
+    if model is OutboxMessage:
+        return (
+            db.query(OutboxMessage)
+            .filter(
+                OutboxMessage.status == OutboxStatus.SENT,
+                OutboxMessage.sent_at < cutoff,
+                OutboxMessage.id > after_id,
+            )
+            .order_by(OutboxMessage.id)
+            .limit(limit)
+            .all()
+        )
+    query = with_deleted(db.query(model)).filter(
+        model.is_deleted.is_(True),
+        model.deleted_at < cutoff,
+        model.id > after_id,
+    )
+    if model is Event:
+        query = query.filter(
+            ~exists().where(EventSession.event_id == Event.id),
+            ~exists().where(EventRegistration.event_id == Event.id),
+            ~exists().where(SessionRegistration.event_id == Event.id),
+        )
+    elif model is EventSession:
+        query = query.filter(~exists().where(SessionRegistration.session_id == EventSession.id))
+    return query.order_by(model.id).limit(limit).all()
+
+
+def _row_payload(instance) -> dict:
+    """Serializa las columnas de una fila a un dict apto para JSON"""
+    payload = {}
+    for column in instance.__table__.columns:
+        value = getattr(instance, column.key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif hasattr(value, "value"):
+            value = value.value  # Enums
+        payload[column.name] = value
+    return payload
+
+
+def archive_rows(db: Session, rows: list) -> None:
+    """Copia las filas a archived_records (misma transacción que el borrado)"""
+    if not rows:
+        return
+    db.execute(
+        insert(ArchivedRecord),
+        [
+            {
+                "table_name": row.__tablename__,
+                "record_id": row.id,
+                "payload": _row_payload(row),
+                "deleted_at": row.deleted_at,
+                "archived_at": datetime.utcnow(),
+            }
+            for row in rows
+        ],
+    )
+
+
+def hard_delete_rows(db: Session, model, ids: list[int]) -> int:
+    """Borra físicamente las filas indicadas"""
+    if not ids:
+        return 0
+    result = db.execute(
+        delete(model).where(model.id.in_(ids)).execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def create_event_deletion(
+    db: Session, event_id: int, deleted_at: datetime, total_sessions: int, total_registrations: int
+) -> EventDeletion:
+    """Encola el borrado en cascada de un evento recién eliminado (sin commit)"""
+    deletion = EventDeletion(
+        event_id=event_id,
+        deleted_at=deleted_at,
+        total_sessions=total_sessions,
+        total_registrations=total_registrations,
+        sessions_deleted=0,
+        registrations_deleted=0,
+    )
+    db.add(deletion)
+    return deletion
+
+
+def claim_event_deletion(
+    db: Session, lease_seconds: int, event_id: int | None = None
+) -> EventDeletion | None:
+    """
+    Reserva el borrado pendiente más antiguo (o el de ``event_id``) que no tenga otro
+    worker (FOR UPDATE SKIP LOCKED en PostgreSQL) durante lease_seconds y confirma la
+    reserva.
+
+    Returns:
+        El borrado reservado o None si no hay pendientes libres
+    """
+    now = datetime.utcnow()
+    query = db.query(EventDeletion).filter(
+        EventDeletion.finished_at.is_(None),
+        or_(EventDeletion.locked_until.is_(None), EventDeletion.locked_until <= now),
+    )
+    if event_id is not None:
+        query = query.filter(EventDeletion.event_id == event_id)
+    deletion = (
+        query.order_by(EventDeletion.created_at).limit(1).with_for_update(skip_locked=True).first()
+    )
+    if deletion is not None:
+        deletion.locked_until = now + timedelta(seconds=lease_seconds)
+    db.commit()
+    return deletion
+
+
+def soft_delete_event_children_batch(
+    db: Session, model, event_id: int, deleted_at: datetime, limit: int
+) -> int:
+    """
+    Marca como eliminadas hasta ``limit`` filas vivas (sesiones o registros) de un evento
+    con un único UPDATE (sin commit).
+
+    El lote se elige sobre el índice parcial de filas vivas por event_id: las filas
+    marcadas salen del índice, así que cada lote lee las siguientes sin OFFSET ni
+    ordenación y, tras una caída, el trabajo restante es exactamente lo que sigue vivo.
+
+    Returns:
+        Número de filas marcadas (0 si no quedan)
+    """
+    batch = (
+        select(model.id).where(model.event_id == event_id, model.is_deleted.is_(False)).limit(limit)
+    )
+    values = {"deleted_at": deleted_at, "is_deleted": True}
+    if hasattr(model, "updated_at"):
+        values["updated_at"] = deleted_at
+    result = db.execute(
+        update(model)
+        # event_id también en el UPDATE: poda de particiones de event_registrations
+        .where(model.event_id == event_id, model.id.in_(batch))
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
@@ -0,0 +1,160 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import JSON, func, insert, literal, select, update
+from sqlalchemy.orm import Session
+
+from app.models.attendee import EventRegistration
+from app.models.outbox import OutboxChannel, OutboxMessage, OutboxStatus
+from app.models.user import User
+
+# Las funciones enqueue_* no hacen commit: los mensajes se confirman (o se descartan)
+# con el commit (o rollback) de la operación de dominio en la misma transacción.
+
+
+def enqueue(
+    db: Session,
+    topic: str,
+    channel: OutboxChannel,
+    recipient: str,
+    payload: dict[str, Any],
+    user_id: int | None = None,
+) -> OutboxMessage:
+    """Añade un mensaje al outbox en la transacción actual (sin commit)"""
+    message = OutboxMessage(
+        topic=topic,
+        channel=channel,
+        recipient=recipient,
+        user_id=user_id,
+        payload=payload,
+        status=OutboxStatus.PENDING,
+        attempts=0,
+        next_attempt_at=datetime.utcnow(),
+    )
+    db.add(message)
+    return message
+
+
+def enqueue_event_attendees(db: Session, event_id: int, topic: str, payload: dict[str, Any]) -> int:
+    """
+    Encola un email por cada asistente con registro vivo del evento con un único
+    ``INSERT ... SELECT`` (sin cargar los registros en Python), en la transacción
+    actual y sin commit.
+
+    Debe ejecutarse antes de eliminar (soft delete) los registros del evento.
+
+    Returns:
+        Número de mensajes encolados
+    """
+    now = datetime.utcnow()
+    attendees = (
+        select(
+            literal(topic),
+            literal(OutboxChannel.EMAIL, type_=OutboxMessage.channel.type),
+            User.email,
+            User.id,
+            literal(payload, type_=JSON),
+            literal(OutboxStatus.PENDING, type_=OutboxMessage.status.type),
+            literal(0),
+            literal(now),
+            literal(now),
+        )
+        .select_from(EventRegistration)
+        .join(User, User.id == EventRegistration.user_id)
+        .where(
+            EventRegistration.event_id == event_id,
+            EventRegistration.is_deleted.is_(False),
+            User.is_active.is_(True),
+        )
+    )
+    result = db.execute(
+        insert(OutboxMessage).from_select(
+            [
+                "topic",
+                "channel",
+                "recipient",
+                "user_id",
+                "payload",
+                "status",
+                "attempts",
+                "next_attempt_at",
+                "created_at",
+            ],
+            attendees,
+        )
+    )
+    return result.rowcount
+
+
+def claim_batch(db: Session, limit: int, lease_seconds: int) -> list[OutboxMessage]:
+    """
+    Reserva el siguiente lote de mensajes pendientes y vencidos.
+
+    Las filas se bloquean con ``FOR UPDATE SKIP LOCKED`` (varios dispatchers no se
+    pisan) y se les aplaza el próximo intento ``lease_seconds``: si el dispatcher muere
+    durante la entrega, los mensajes vuelven a estar disponibles al vencer el plazo.
+    Hace commit para liberar los bloqueos antes de entregar.
+
+    Returns:
+        Mensajes reservados (separados de la sesión)
+    """
+    now = datetime.utcnow()
+    messages = (
+        db.query(OutboxMessage)
+        .filter(
+            OutboxMessage.status == OutboxStatus.PENDING,
+            OutboxMessage.next_attempt_at <= now,
+        )
+        .order_by(OutboxMessage.next_attempt_at, OutboxMessage.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    if messages:
+        db.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_([message.id for message in messages]))
+            .values(next_attempt_at=now + timedelta(seconds=lease_seconds))
+        )
+    for message in messages:
+        db.expunge(message)
+    db.commit()
+    return messages
+
+
+def mark_sent(db: Session, message_ids: list[int]) -> None:
+    """Marca mensajes como entregados (sin commit)"""
+    if not message_ids:
+        return
+    db.execute(
+        update(OutboxMessage)
+        .where(OutboxMessage.id.in_(message_ids))
+        .values(
+            status=OutboxStatus.SENT,
+            attempts=OutboxMessage.attempts + 1,
+            sent_at=datetime.utcnow(),
+        )
+    )
+
+
+def mark_failed_attempt(
+    db: Session, message_id: int, error: str, next_attempt_at: datetime | None
+) -> None:
+    """
+    Registra un intento fallido (sin commit): reprograma el mensaje o, si
+    next_attempt_at es None, lo marca como FAILED definitivamente
+    """
+    values: dict[str, Any] = {"attempts": OutboxMessage.attempts + 1, "last_error": error}
+    if next_attempt_at is None:
+        values["status"] = OutboxStatus.FAILED
+    else:
+        values["next_attempt_at"] = next_attempt_at
+    db.execute(update(OutboxMessage).where(OutboxMessage.id == message_id).values(**values))
+
+
+def count_by_status(db: Session) -> dict[OutboxStatus, int]:
+    """Número de mensajes por estado (monitorización)"""
+    rows = db.query(OutboxMessage.status, func.count()).group_by(OutboxMessage.status).all()
+    counts = dict.fromkeys(OutboxStatus, 0)
+    counts.update(dict(rows))
+    return counts
@@ -1,25 +1,33 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, or_, update
+from sqlalchemy.orm import Session, contains_eager
 
-from app.core.db_utils import save_and_refresh, update_and_refresh
+from app.core.agenda import normalize_key
+from app.core.db_utils import save_and_flush, soft_delete
 from app.core.pagination import apply_pagination, get_pagination_metadata
+from app.models.event import Event, EventStatusDB
 from app.models.session import Session as EventSession
-from app.schemas.session import SessionCreate, SessionUpdate
+from app.schemas.session import SessionCreate
 
 
-def get_session(db: Session, session_id: int) -> EventSession | None:
-    """Obtiene una sesión por ID (excluye eliminadas)"""
-    return (
-        db.query(EventSession)
-        .filter(
-            EventSession.id == session_id,
-            EventSession.deleted_at.is_(None),
-            EventSession.is_deleted.is_(False),
-        )
-        .first()
-    )
+def get_session(db: Session, session_id: int, include_event: bool = False) -> EventSession | None:
+    """
+    Obtiene una sesión por ID (excluye eliminadas y las de eventos eliminados, aunque el
+    borrado en cascada aún no haya llegado a ellas)
+
+    Args:
+        db: Sesión de base de datos
+        session_id: ID de la sesión
+        include_event: Si True, carga el evento en la misma query (eager loading)
+    """
+    # El JOIN aplica el filtro global de soft delete también al evento
+    query = db.query(EventSession).join(EventSession.event).filter(EventSession.id == session_id)
+    if include_event:
+        query = query.options(contains_eager(EventSession.event))
+
+    return query.first()
 
 
 def get_event_sessions(
@@ -33,11 +41,7 @@ def get_event_sessions(
     """
     query = (
         db.query(EventSession)
-        .filter(
-            EventSession.event_id == event_id,
-            EventSession.deleted_at.is_(None),
-            EventSession.is_deleted.is_(False),
-        )
+        .filter(EventSession.event_id == event_id)
         .order_by(EventSession.start_time.asc())
     )
     pagination_metadata = get_pagination_metadata(query, page=page, per_page=per_page)
@@ -47,32 +51,117 @@ def get_event_sessions(
     return sessions, pagination_metadata
 
 
+def _conflict_key(column):
+    """Expresión SQL de la clave de conflicto (misma normalización que app.core.agenda)"""
+    return func.lower(func.trim(column))
+
+
+def find_overlapping_sessions(
+    db: Session,
+    event_id: int,
+    start_time: datetime,
+    end_time: datetime,
+    location: str | None = None,
+    speaker_name: str | None = None,
+    exclude_session_id: int | None = None,
+) -> list[EventSession]:
+    """
+    Obtiene las sesiones vivas del evento que se solapan con [start_time, end_time)
+    en la misma sala o con el mismo ponente.
+
+    Usa el índice (event_id, start_time) de sesiones vivas.
+    """
+    key_filters = []
+    if normalize_key(location) is not None:
+        key_filters.append(_conflict_key(EventSession.location) == normalize_key(location))
+    if normalize_key(speaker_name) is not None:
+        key_filters.append(_conflict_key(EventSession.speaker_name) == normalize_key(speaker_name))
+    if not key_filters:
+        return []
+
+    query = db.query(EventSession).filter(
+        EventSession.event_id == event_id,
+        EventSession.start_time < end_time,
+        EventSession.end_time > start_time,
+        or_(*key_filters),
+    )
+    if exclude_session_id is not None:
+        query = query.filter(EventSession.id != exclude_session_id)
+    return query.order_by(EventSession.start_time).all()
+
+
+def get_agenda_slots(db: Session, event_id: int) -> list:
+    """
+    Obtiene las columnas necesarias para validar la agenda de un evento
+    (filas ligeras, sin instanciar objetos ORM)
+    """
+    return (
+        db.query(
+            EventSession.id,
+            EventSession.start_time,
+            EventSession.end_time,
+            EventSession.location,
+            EventSession.speaker_name,
+        )
+        .filter(EventSession.event_id == event_id)
+        .all()
+    )
+
+
+def get_sessions_starting_between(db: Session, start: datetime, end: datetime) -> list:
+    """
+    Sesiones de eventos programados que empiezan en ``(start, end]`` (recordatorios del
+    planificador; filas ligeras sobre el índice parcial de start_time)
+    """
+    return (
+        db.query(EventSession.id, EventSession.event_id, EventSession.start_time)
+        .join(Event, Event.id == EventSession.event_id)
+        .filter(
+            EventSession.start_time > start,
+            EventSession.start_time <= end,
+            Event.status == EventStatusDB.SCHEDULED,
+        )
+        .all()
+    )
+
+
 def create_session(db: Session, session: SessionCreate) -> EventSession:
     """Crea una nueva sesión"""
     db_session = EventSession(**session.model_dump())
-    return save_and_refresh(db, db_session)
+    return save_and_flush(db, db_session)
 
 
 def update_session(
-    db: Session, session_id: int, session_update: SessionUpdate
+    db: Session, session_id: int, values: dict[str, Any], version: int
 ) -> EventSession | None:
-    """Actualiza una sesión"""
-    db_session = get_session(db, session_id)
-    if not db_session:
-        return None
-
-    update_data = session_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_session, field, value)
-    db_session.updated_at = datetime.utcnow()
+    """
+    Actualiza una sesión con un UPDATE condicional por versión (RETURNING, sin re-SELECT)
 
-    return update_and_refresh(db, db_session)
+    Returns:
+        EventSession actualizada o None si no existe, la versión cambió o la nueva
+        capacidad es menor que las plazas ocupadas
+    """
+    conditions = [
+        EventSession.id == session_id,
+        EventSession.version == version,
+        EventSession.is_deleted.is_(False),
+    ]
+    if values.get("capacity") is not None:
+        # Sin bajar la capacidad por debajo de las plazas ya ocupadas (aunque se ocupen
+        # entre la validación del servicio y este UPDATE)
+        conditions.append(EventSession.seats_taken <= values["capacity"])
+    updated_session = db.execute(
+        update(EventSession)
+        .where(*conditions)
+        .values(**values, version=EventSession.version + 1, updated_at=datetime.utcnow())
+        .returning(EventSession),
+        execution_options={"populate_existing": True},
+    ).scalar_one_or_none()
+    return updated_session
 
 
 def soft_delete_session(db: Session, session_id: int) -> bool:
     """Realiza soft delete de una sesión"""
-    from app.core.db_utils import soft_delete
-
     db_session = get_session(db, session_id)
     if not db_session:
         return False
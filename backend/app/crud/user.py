@@ -1,14 +1,17 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import or_
+from sqlalchemy import func, or_, select
 from sqlalchemy.orm import Session
 
-from app.core.db_utils import save_and_refresh, update_and_refresh
+from app.core.db_utils import save_and_flush
 from app.core.pagination import apply_pagination, get_pagination_metadata
 from app.core.security import get_password_hash, verify_password
+from app.crud import analytics as crud_analytics
+from app.models.attendee import EventRegistration
+from app.models.event import Event, EventStatusDB
 from app.models.user import User, UserRole
-from app.schemas.user import UserAdminUpdate, UserCreate
+from app.schemas.user import UserAdminUpdate, UserCreate, UserSearchMode
 
 
 def get_user(db: Session, user_id: int) -> User | None:
@@ -21,11 +24,40 @@ def get_user_by_email(db: Session, email: str) -> User | None:
     return db.query(User).filter(User.email == email).first()
 
 
+def get_profile_counts(db: Session, user_id: int) -> dict[str, int]:
+    """
+    Obtiene los contadores del perfil de un usuario en una sola consulta agregada
+    (subconsultas escalares, sin cargar filas de eventos ni registros).
+
+    Returns:
+        Dict con registered_events_count, upcoming_events_count y created_events_count
+    """
+    registered = (
+        select(func.count(EventRegistration.id))
+        .join(Event, Event.id == EventRegistration.event_id)
+        .where(EventRegistration.user_id == user_id)
+    )
+    upcoming = registered.where(
+        Event.start_date > datetime.utcnow(), Event.status != EventStatusDB.CANCELLED
+    )
+    created = select(func.count(Event.id)).where(Event.creator_id == user_id)
+
+    row = db.execute(
+        select(
+            registered.scalar_subquery().label("registered_events_count"),
+            upcoming.scalar_subquery().label("upcoming_events_count"),
+            created.scalar_subquery().label("created_events_count"),
+        )
+    ).one()
+    return dict(row._mapping)
+
+
 def create_user(db: Session, user: UserCreate) -> User:
     """Crea un nuevo usuario"""
     hashed_password = get_password_hash(user.password)
     db_user = User(email=user.email, hashed_password=hashed_password, full_name=user.full_name)
-    return save_and_refresh(db, db_user)
+    crud_analytics.record_signup(db, UserRole.ATTENDEE)
+    return save_and_flush(db, db_user)
 
 
 def authenticate_user(db: Session, email: str, password: str) -> User | None:
@@ -38,16 +70,28 @@ def authenticate_user(db: Session, email: str, password: str) -> User | None:
     return user
 
 
+def _escape_like(value: str) -> str:
+    """Escapa los comodines de LIKE (%, _) para buscar el texto literal"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 def get_users(
     db: Session,
     page: int = 1,
     per_page: int = 20,
     search: str | None = None,
+    search_mode: UserSearchMode = UserSearchMode.CONTAINS,
     role: UserRole | None = None,
     is_active: bool | None = None,
 ) -> tuple[list[User], dict[str, Any]]:
     """
-    Lista usuarios con filtros opcionales y paginación.
+    Lista usuarios con filtros opcionales y paginación, ordenados por id.
+
+    Las búsquedas comparan ``lower(columna) LIKE lower(:término)`` para usar los índices
+    de expresión de User:
+    - contains: ``%término%`` en email o nombre (GIN trigram; con menos de 3 caracteres
+      no hay trigramas completos y el índice no filtra)
+    - prefix: ``término%`` solo en email (B-tree text_pattern_ops)
 
     Returns:
         Tuple[List[User], Dict]: (usuarios, metadata de paginación)
@@ -55,9 +99,16 @@ def get_users(
     query = db.query(User)
 
     if search:
-        query = query.filter(
-            or_(User.email.ilike(f"%{search}%"), User.full_name.ilike(f"%{search}%"))
-        )
+        term = _escape_like(search.lower())
+        if search_mode == UserSearchMode.PREFIX:
+            query = query.filter(func.lower(User.email).like(f"{term}%", escape="\\"))
+        else:
+            query = query.filter(
+                or_(
+                    func.lower(User.email).like(f"%{term}%", escape="\\"),
+                    func.lower(User.full_name).like(f"%{term}%", escape="\\"),
+                )
+            )
 
     if role:
         query = query.filter(User.role == role)
@@ -67,7 +118,7 @@ def get_users(
 
     pagination_metadata = get_pagination_metadata(query, page=page, per_page=per_page)
 
-    query = apply_pagination(query, page=page, per_page=per_page)
+    query = apply_pagination(query.order_by(User.id), page=page, per_page=per_page)
 
     users = query.all()
 
@@ -91,7 +142,8 @@ def create_user_with_role(
         role=role,
         is_active=is_active,
     )
-    return save_and_refresh(db, db_user)
+    crud_analytics.record_signup(db, role)
+    return save_and_flush(db, db_user)
 
 
 def update_user(db: Session, user_id: int, user_update: UserAdminUpdate) -> User | None:
@@ -105,4 +157,4 @@ def update_user(db: Session, user_id: int, user_update: UserAdminUpdate) -> User
         setattr(db_user, field, value)
 
     db_user.updated_at = datetime.utcnow()
-    return update_and_refresh(db, db_user)
+    return save_and_flush(db, db_user)
@@ -1,3 +1,4 @@
+from fastapi import Request
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -6,17 +7,22 @@ from app.config import settings
 
 engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True, echo=True)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: tras el commit de la petición las instancias conservan sus valores
+# (la respuesta se serializa sin volver a consultarlas)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 Base = declarative_base()
 
 
-def get_db():
+def get_db(request: Request):
     """
     Dependency para obtener la sesión de BD en FastAPI.
     Usa yield pattern para cerrar automáticamente la sesión al final del request.
+    La sesión queda en request.state.db: UnitOfWorkRoute hace el único commit de la
+    petición antes de enviar la respuesta (ver app.core.unit_of_work).
     """
     db = SessionLocal()
+    request.state.db = db
     try:
         yield db
     finally:
@@ -1,5 +1,16 @@
-from app.models.attendee import EventRegistration
+from app.models.analytics import DailyEventStats, DailySignups, EventRegistrationBucket
+from app.models.attendee import EventRegistration, SessionRegistration
 from app.models.event import Event, EventStatus, EventStatusDB
+from app.models.idempotency import IdempotencyKey
+from app.models.job import Job, JobStatus
+from app.models.maintenance import (
+    ArchivedRecord,
+    EventDeletion,
+    PurgeCheckpoint,
+    SchedulerCheckpoint,
+)
+from app.models.outbox import OutboxChannel, OutboxMessage, OutboxStatus
+from app.models.rate_limit import RateLimitBucket
 from app.models.session import Session
 from app.models.user import User, UserRole
 
@@ -11,4 +22,19 @@ __all__ = [
     "EventStatusDB",
     "Session",
     "EventRegistration",
+    "SessionRegistration",
+    "PurgeCheckpoint",
+    "SchedulerCheckpoint",
+    "ArchivedRecord",
+    "EventDeletion",
+    "OutboxMessage",
+    "OutboxChannel",
+    "OutboxStatus",
+    "RateLimitBucket",
+    "IdempotencyKey",
+    "DailyEventStats",
+    "DailySignups",
+    "EventRegistrationBucket",
+    "Job",
+    "JobStatus",
 ]
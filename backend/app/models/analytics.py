@@ -0,0 +1,51 @@
+from sqlalchemy import Column, Date, DateTime, Index, Integer
+from sqlalchemy import Enum as SQLEnum
+
+from app.database import Base
+from app.models.user import UserRole
+
+
+class DailyEventStats(Base):
+    """
+    Rollup diario por evento: registros y cancelaciones de registro de ese día (UTC).
+
+    Se incrementa en la misma transacción que cada registro o cancelación (crud.analytics);
+    los borrados en cascada de un evento eliminado no cuentan como cancelaciones. Sin FK
+    a events: el histórico se conserva aunque el purgado borre el evento.
+    """
+
+    __tablename__ = "daily_event_stats"
+    __table_args__ = (
+        # Serie de un evento (la PK (day, event_id) sirve los rangos de fechas globales)
+        Index("ix_daily_event_stats_event_id_day", "event_id", "day"),
+    )
+
+    day = Column(Date, primary_key=True)
+    event_id = Column(Integer, primary_key=True)
+    registrations = Column(Integer, default=0, nullable=False)
+    cancellations = Column(Integer, default=0, nullable=False)
+
+
+class DailySignups(Base):
+    """Rollup diario de altas de usuario por rol (UTC), incrementado al crear cada usuario"""
+
+    __tablename__ = "daily_signups"
+
+    day = Column(Date, primary_key=True)
+    role = Column(SQLEnum(UserRole, native_enum=False), primary_key=True)
+    signups = Column(Integer, default=0, nullable=False)
+
+
+class EventRegistrationBucket(Base):
+    """
+    Registros por evento en cubos de TRENDING_BUCKET_SECONDS (UTC), para el ranking de
+    eventos en tendencia. Se incrementa con cada registro, igual que DailyEventStats; el
+    purgado de retención borra los cubos que ya salieron de la ventana.
+    """
+
+    __tablename__ = "event_registration_buckets"
+
+    # PK (bucket_start, event_id): el ranking lee un rango de cubos recientes
+    bucket_start = Column(DateTime, primary_key=True)
+    event_id = Column(Integer, primary_key=True)
+    registrations = Column(Integer, default=0, nullable=False)
@@ -1,21 +1,91 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, text
 from sqlalchemy.orm import relationship
 
+from app.core.soft_delete import SoftDeleteMixin
 from app.database import Base
 
 
-class EventRegistration(Base):
+class EventRegistration(SoftDeleteMixin, Base):
     __tablename__ = "event_registrations"
+    __table_args__ = (
+        # Índices parciales: solo filas vivas (coinciden con el filtro global de soft delete)
+        Index(
+            "ix_event_registrations_event_id_live",
+            "event_id",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        Index(
+            "ix_event_registrations_user_id_live",
+            "user_id",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        # Índice parcial de filas eliminadas: recorrido por id del purgado de retención
+        Index(
+            "ix_event_registrations_purge",
+            "id",
+            postgresql_where=text("is_deleted = true"),
+            sqlite_where=text("is_deleted = 1"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     event_id = Column(Integer, ForeignKey("events.id"), nullable=False)
     registered_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    deleted_at = Column(DateTime, nullable=True, default=None)
-    is_deleted = Column(Boolean, default=False, nullable=False)
 
     # Relaciones
     user = relationship("User", back_populates="registrations")
     event = relationship("Event", back_populates="registrations")
+
+
+class SessionRegistration(SoftDeleteMixin, Base):
+    """Plaza de un asistente en una sesión con aforo (talleres)"""
+
+    __tablename__ = "session_registrations"
+    __table_args__ = (
+        # Único parcial: un registro vivo por usuario y sesión (árbitro del
+        # INSERT ... ON CONFLICT DO NOTHING de las reservas concurrentes)
+        Index(
+            "uq_session_registrations_user_id_session_id_live",
+            "user_id",
+            "session_id",
+            unique=True,
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        Index(
+            "ix_session_registrations_session_id_live",
+            "session_id",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        # Borrado en cascada por evento y plazas de un usuario en un evento
+        Index(
+            "ix_session_registrations_event_id_user_id_live",
+            "event_id",
+            "user_id",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        # Índice parcial de filas eliminadas: recorrido por id del purgado de retención
+        Index(
+            "ix_session_registrations_purge",
+            "id",
+            postgresql_where=text("is_deleted = true"),
+            sqlite_where=text("is_deleted = 1"),
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    session_id = Column(Integer, ForeignKey("sessions.id"), nullable=False)
+    # Copia de sessions.event_id: borrado en cascada del evento sin JOIN
+    event_id = Column(Integer, ForeignKey("events.id"), nullable=False)
+    registered_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relaciones
+    session = relationship("Session")
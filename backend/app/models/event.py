@@ -2,19 +2,22 @@ import enum
 from datetime import datetime
 
 from sqlalchemy import (
-    Boolean,
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    func,
+    text,
 )
 from sqlalchemy import (
     Enum as SQLEnum,
 )
 from sqlalchemy.orm import relationship
 
+from app.core.soft_delete import SoftDeleteMixin
 from app.database import Base
 
 
@@ -34,8 +37,52 @@ class EventStatus(str, enum.Enum):
     CANCELLED = "cancelled"
 
 
-class Event(Base):
+class Event(SoftDeleteMixin, Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # Índice parcial: eventos vivos de un creador ordenados por fecha de creación
+        Index(
+            "ix_events_creator_id_created_at_live",
+            "creator_id",
+            "created_at",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        # Índices parciales de los filtros y ordenaciones del listado (GET /events)
+        Index(
+            "ix_events_start_date_live",
+            "start_date",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        # Planificador: eventos que terminan en la ventana cargada
+        Index(
+            "ix_events_end_date_live",
+            "end_date",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        Index(
+            "ix_events_created_at_live",
+            "created_at",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        # has_availability: eventos con plazas ordenados por fecha (sin contar registros)
+        Index(
+            "ix_events_start_date_available",
+            "start_date",
+            postgresql_where=text("is_deleted = false AND registered_count < capacity"),
+            sqlite_where=text("is_deleted = 0 AND registered_count < capacity"),
+        ),
+        # Índice parcial de filas eliminadas: recorrido por id del purgado de retención
+        Index(
+            "ix_events_purge",
+            "id",
+            postgresql_where=text("is_deleted = true"),
+            sqlite_where=text("is_deleted = 1"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True, nullable=False)
@@ -48,8 +95,15 @@ class Event(Base):
     creator_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    deleted_at = Column(DateTime, nullable=True, default=None)  # Soft delete
-    is_deleted = Column(Boolean, default=False, nullable=False)  # Soft delete (boolean)
+    version = Column(
+        Integer, default=1, server_default=text("1"), nullable=False
+    )  # Concurrencia optimista
+    # Registros vivos (contador desnormalizado, se mantiene al registrar/cancelar)
+    registered_count = Column(Integer, default=0, server_default=text("0"), nullable=False)
+
+    # Atributo no persistido: registro del usuario autenticado en listados y detalle
+    # (lo rellena AttendeeService.annotate_registrations; None si la petición es anónima)
+    is_registered = None
 
     # Relaciones
     creator = relationship("User", back_populates="created_events", foreign_keys=[creator_id])
@@ -58,6 +112,7 @@ class Event(Base):
         back_populates="event",
         cascade="all, delete-orphan",
         primaryjoin="and_(Event.id == foreign(Session.event_id), Session.deleted_at.is_(None), Session.is_deleted == False)",
+        order_by="Session.start_time",
         lazy="select",
     )
     registrations = relationship(
@@ -71,10 +126,7 @@ class Event(Base):
     @property
     def available_capacity(self):
         """Calcula la capacidad disponible (solo registros no eliminados)"""
-        registered = len(
-            [r for r in self.registrations if r.deleted_at is None and not r.is_deleted]
-        )
-        return max(0, self.capacity - registered)
+        return max(0, self.capacity - self.registered_count)
 
     @property
     def is_full(self):
@@ -117,3 +169,12 @@ class Event(Base):
 
         # Fallback: retornar el estado actual convertido
         return EventStatus(self.status.value)
+
+
+# Filtro por ubicación sin distinguir mayúsculas (lower(location) = lower(:location))
+Index(
+    "ix_events_location_lower_live",
+    func.lower(Event.location),
+    postgresql_where=text("is_deleted = false"),
+    sqlite_where=text("is_deleted = 0"),
+)
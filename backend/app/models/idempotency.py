@@ -0,0 +1,23 @@
+from sqlalchemy import JSON, Column, Float, Integer, LargeBinary, String
+
+from app.database import Base
+
+
+class IdempotencyKey(Base):
+    """
+    Respuesta guardada de una petición con cabecera Idempotency-Key
+    (IDEMPOTENCY_BACKEND=database)
+
+    Mientras la petición original está en curso status_code es NULL y expires_at es el
+    fin de su reserva; al terminar se guarda la respuesta y expires_at pasa a ser el
+    final de IDEMPOTENCY_TTL_SECONDS. Una fila expirada se reutiliza con la misma clave.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    key = Column(String(64), primary_key=True)  # sha256 de credenciales, ruta y clave
+    fingerprint = Column(String(64), nullable=False)  # sha256 del cuerpo de la petición
+    status_code = Column(Integer, nullable=True)
+    headers = Column(JSON, nullable=True)  # Lista de [nombre, valor]
+    body = Column(LargeBinary, nullable=True)
+    expires_at = Column(Float, nullable=False, index=True)  # Epoch en segundos
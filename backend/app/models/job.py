@@ -0,0 +1,64 @@
+import enum
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy import Enum as SQLEnum
+
+from app.database import Base
+
+
+class JobStatus(str, enum.Enum):
+    """Estado de un trabajo en segundo plano"""
+
+    PENDING = "pending"  # En cola (o esperando un reintento)
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"  # Agotó los intentos
+
+
+class Job(Base):
+    """
+    Trabajo en segundo plano (operaciones pesadas fuera de la petición).
+
+    Se inserta en la misma transacción que la petición que lo origina y lo ejecuta
+    después el runner de JobService, que reserva los trabajos con FOR UPDATE SKIP LOCKED.
+    """
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Índice parcial: cola de pendientes por prioridad y hora de ejecución
+        Index(
+            "ix_jobs_pending",
+            "type",
+            "priority",
+            "run_at",
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
+        # Trabajos en curso por tipo (límite de concurrencia y reservas vencidas)
+        Index(
+            "ix_jobs_running",
+            "type",
+            "locked_until",
+            postgresql_where=text("status = 'RUNNING'"),
+            sqlite_where=text("status = 'RUNNING'"),
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    type = Column(String, nullable=False)  # Ej: event.cascade (ver JOB_TYPES)
+    payload = Column(JSON, nullable=False)
+    status = Column(
+        SQLEnum(JobStatus, native_enum=False), default=JobStatus.PENDING, nullable=False
+    )
+    priority = Column(Integer, default=0, nullable=False)  # Mayor = antes
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, nullable=False)
+    run_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # No antes de esta hora
+    locked_until = Column(DateTime, nullable=True)  # Reserva del worker (se renueva)
+    result = Column(JSON, nullable=True)
+    last_error = Column(Text, nullable=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)  # Quién lo lanzó
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
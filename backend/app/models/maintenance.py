@@ -0,0 +1,66 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, Integer, String, text
+
+from app.database import Base
+
+
+class PurgeCheckpoint(Base):
+    """Progreso del purgado de retención por tabla (permite reanudar tras un fallo)"""
+
+    __tablename__ = "purge_checkpoints"
+
+    table_name = Column(String, primary_key=True)
+    last_id = Column(Integer, default=0, nullable=False)  # Último id procesado en la pasada
+    purged_count = Column(Integer, default=0, nullable=False)  # Total histórico purgado
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+class SchedulerCheckpoint(Base):
+    """
+    Marca del planificador: todos los temporizadores con instante <= fired_until ya se
+    dispararon. Al arrancar (o recargar) se carga la ventana desde la marca y no desde
+    ahora, así que los avisos vencidos con el proceso parado no se pierden.
+    """
+
+    __tablename__ = "scheduler_checkpoints"
+
+    name = Column(String, primary_key=True)
+    fired_until = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+class ArchivedRecord(Base):
+    """Copia JSON de una fila soft-deleted purgada en modo archivo"""
+
+    __tablename__ = "archived_records"
+
+    id = Column(Integer, primary_key=True, index=True)
+    table_name = Column(String, nullable=False)
+    record_id = Column(Integer, nullable=False)
+    payload = Column(JSON, nullable=False)
+    deleted_at = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class EventDeletion(Base):
+    """
+    Borrado en cascada de un evento eliminado (sesiones y registros), hecho en lotes por
+    el worker de DeletionService. Sirve de progreso y de cola: finished_at NULL = pendiente.
+    """
+
+    __tablename__ = "event_deletions"
+
+    event_id = Column(Integer, primary_key=True)
+    deleted_at = Column(DateTime, nullable=False)  # Se copia a las filas hijas
+    total_sessions = Column(Integer, default=0, nullable=False)  # Vivas al eliminar el evento
+    total_registrations = Column(Integer, default=0, nullable=False)
+    sessions_deleted = Column(Integer, default=0, nullable=False)
+    registrations_deleted = Column(Integer, default=0, nullable=False)
+    session_registrations_deleted = Column(
+        Integer, default=0, server_default=text("0"), nullable=False
+    )
+    locked_until = Column(DateTime, nullable=True)  # Reserva del worker que la procesa
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
@@ -0,0 +1,57 @@
+import enum
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy import Enum as SQLEnum
+
+from app.database import Base
+
+
+class OutboxChannel(str, enum.Enum):
+    """Canal de entrega de una notificación"""
+
+    EMAIL = "email"
+    WEBHOOK = "webhook"
+
+
+class OutboxStatus(str, enum.Enum):
+    """Estado de entrega de un mensaje del outbox"""
+
+    PENDING = "pending"  # Pendiente (o reintentando)
+    SENT = "sent"
+    FAILED = "failed"  # Agotó los reintentos
+
+
+class OutboxMessage(Base):
+    """
+    Notificación pendiente de entregar (patrón transactional outbox).
+
+    Se inserta en la misma transacción que el cambio de dominio que la origina y la
+    entrega después el dispatcher (OutboxService.dispatch_batch), fuera de la petición.
+    """
+
+    __tablename__ = "outbox_messages"
+    __table_args__ = (
+        # Índice parcial: cola de pendientes ordenada por próximo intento
+        Index(
+            "ix_outbox_messages_pending",
+            "next_attempt_at",
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    topic = Column(String, nullable=False)  # Ej: registration.created, event.cancelled
+    channel = Column(SQLEnum(OutboxChannel, native_enum=False), nullable=False)
+    recipient = Column(String, nullable=False)  # Email o URL del webhook
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)  # Destinatario (emails)
+    payload = Column(JSON, nullable=False)
+    status = Column(
+        SQLEnum(OutboxStatus, native_enum=False), default=OutboxStatus.PENDING, nullable=False
+    )
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    sent_at = Column(DateTime, nullable=True)
@@ -0,0 +1,19 @@
+from sqlalchemy import Boolean, Column, Float, String
+
+from app.database import Base
+
+
+class RateLimitBucket(Base):
+    """
+    Estado compartido de rate limiting (RATE_LIMIT_BACKEND=database)
+
+    Una fila por clave: token bucket (tokens disponibles) o contador de fallos de login
+    (tokens = número de fallos). Se actualiza con un único UPSERT atómico por petición.
+    """
+
+    __tablename__ = "rate_limit_buckets"
+
+    key = Column(String, primary_key=True)
+    tokens = Column(Float, nullable=False)
+    updated_at = Column(Float, nullable=False)  # Epoch en segundos de la última actualización
+    allowed = Column(Boolean, nullable=False, default=True)  # Resultado del último consumo
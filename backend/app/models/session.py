@@ -1,13 +1,40 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.orm import relationship
 
+from app.core.soft_delete import SoftDeleteMixin
 from app.database import Base
 
 
-class Session(Base):
+class Session(SoftDeleteMixin, Base):
     __tablename__ = "sessions"
+    # Las restricciones de exclusión de solapes por sala y ponente (GiST sobre tsrange)
+    # solo existen en PostgreSQL: ver la migración 0006_session_agenda_exclusion
+    __table_args__ = (
+        # Índice parcial: sesiones vivas de un evento ordenadas por hora de inicio
+        Index(
+            "ix_sessions_event_id_start_time_live",
+            "event_id",
+            "start_time",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        # Planificador: recordatorios de las sesiones que empiezan en la ventana cargada
+        Index(
+            "ix_sessions_start_time_live",
+            "start_time",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        # Índice parcial de filas eliminadas: recorrido por id del purgado de retención
+        Index(
+            "ix_sessions_purge",
+            "id",
+            postgresql_where=text("is_deleted = true"),
+            sqlite_where=text("is_deleted = 1"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     event_id = Column(Integer, ForeignKey("events.id"), nullable=False)
@@ -19,10 +46,13 @@ class Session(Base):
     end_time = Column(DateTime, nullable=False)
     location = Column(String, nullable=True)
     capacity = Column(Integer, nullable=True)
+    # Plazas ocupadas (contador atómico de crud.attendee.register_to_session)
+    seats_taken = Column(Integer, default=0, server_default=text("0"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    deleted_at = Column(DateTime, nullable=True, default=None)  # Soft delete
-    is_deleted = Column(Boolean, default=False, nullable=False)  # Soft delete (boolean)
+    version = Column(
+        Integer, default=1, server_default=text("1"), nullable=False
+    )  # Concurrencia optimista
 
     # Relaciones
     event = relationship("Event", back_populates="sessions")
@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, func
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import relationship
 
@@ -31,3 +31,27 @@ class User(Base):
         "Event", back_populates="creator", foreign_keys="Event.creator_id"
     )
     registrations = relationship("EventRegistration", back_populates="user")
+
+
+# Búsqueda del listado de usuarios (crud.user.get_users): lower(col) LIKE '%término%' con
+# GIN trigram (pg_trgm) y LIKE 'término%' sobre email con B-tree text_pattern_ops
+Index(
+    "ix_users_email_lower_trgm",
+    func.lower(User.email).label("email_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"email_lower": "gin_trgm_ops"},
+)
+Index(
+    "ix_users_full_name_lower_trgm",
+    func.lower(User.full_name).label("full_name_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"full_name_lower": "gin_trgm_ops"},
+)
+Index(
+    "ix_users_email_lower_prefix",
+    func.lower(User.email).label("email_lower"),
+    postgresql_ops={"email_lower": "text_pattern_ops"},
+)
+# Filtros role/is_active del listado, ordenado por id
+Index("ix_users_role_is_active_id", User.role, User.is_active, User.id)
+Index("ix_users_is_active_id", User.is_active, User.id)
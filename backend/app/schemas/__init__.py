@@ -1,20 +1,38 @@
+from app.schemas.analytics import (
+    AnalyticsRangeQueryParams,
+    EventAnalyticsResponse,
+    RegistrationSeriesResponse,
+    SignupSeriesResponse,
+)
 from app.schemas.attendee import (
     EventAttendeesResponse,
     EventRegistrationCreate,
     EventRegistrationResponse,
     EventRegistrationWithEvent,
     MyEventsListResponse,
+    RegistrationCheckResponse,
 )
+from app.schemas.calendar import CalendarFeedResponse
 from app.schemas.event import (
     EventCreate,
     EventDetailResponse,
+    EventFacetsQueryParams,
+    EventFacetsResponse,
     EventListQueryParams,
     EventListResponse,
     EventResponse,
     EventUpdate,
 )
+from app.schemas.job import JobResponse
 from app.schemas.pagination import PaginatedResponse, PaginationMetadata, PaginationQueryParams
-from app.schemas.session import SessionCreate, SessionListResponse, SessionResponse, SessionUpdate
+from app.schemas.session import (
+    AgendaConflictsResponse,
+    SessionConflict,
+    SessionCreate,
+    SessionListResponse,
+    SessionResponse,
+    SessionUpdate,
+)
 from app.schemas.user import Token, TokenData, UserAdminUpdate, UserCreate, UserLogin, UserResponse
 
 __all__ = [
@@ -29,16 +47,27 @@ __all__ = [
     "EventResponse",
     "EventDetailResponse",
     "EventListQueryParams",
+    "EventFacetsQueryParams",
+    "EventFacetsResponse",
     "EventListResponse",
     "SessionCreate",
     "SessionUpdate",
     "SessionResponse",
     "SessionListResponse",
+    "SessionConflict",
+    "AgendaConflictsResponse",
     "EventRegistrationCreate",
     "EventRegistrationResponse",
     "EventRegistrationWithEvent",
     "EventAttendeesResponse",
     "MyEventsListResponse",
+    "RegistrationCheckResponse",
+    "CalendarFeedResponse",
+    "JobResponse",
+    "AnalyticsRangeQueryParams",
+    "RegistrationSeriesResponse",
+    "SignupSeriesResponse",
+    "EventAnalyticsResponse",
     "PaginationQueryParams",
     "PaginationMetadata",
     "PaginatedResponse",
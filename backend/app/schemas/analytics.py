@@ -0,0 +1,75 @@
+"""
+Schemas para la analítica del panel de administración (leída de los rollups diarios)
+"""
+
+from datetime import date, datetime, timedelta
+
+from pydantic import BaseModel, model_validator
+
+from app.config import settings
+from app.models.user import UserRole
+
+
+class AnalyticsRangeQueryParams(BaseModel):
+    """
+    Rango de días (UTC, ambos incluidos) de las series de analítica
+
+    Por defecto, los últimos ANALYTICS_DEFAULT_DAYS días hasta hoy. El orden y la
+    longitud máxima del rango los valida AnalyticsService (400).
+    """
+
+    date_from: date | None = None
+    date_to: date | None = None
+
+    @model_validator(mode="after")
+    def fill_default_range(self):
+        self.date_to = self.date_to or datetime.utcnow().date()
+        self.date_from = self.date_from or self.date_to - timedelta(
+            days=settings.ANALYTICS_DEFAULT_DAYS - 1
+        )
+        return self
+
+
+class RegistrationDay(BaseModel):
+    """Registros y cancelaciones de registro de un día"""
+
+    day: date
+    registrations: int
+    cancellations: int
+
+
+class RegistrationSeriesResponse(BaseModel):
+    """Serie diaria de registros y cancelaciones (días sin actividad a 0)"""
+
+    date_from: date
+    date_to: date
+    total_registrations: int
+    total_cancellations: int
+    days: list[RegistrationDay]
+
+
+class SignupDay(BaseModel):
+    """Altas de usuarios de un día"""
+
+    day: date
+    signups: int
+
+
+class SignupSeriesResponse(BaseModel):
+    """Serie diaria de altas de usuarios (días sin actividad a 0) y totales por rol"""
+
+    date_from: date
+    date_to: date
+    total_signups: int
+    by_role: dict[UserRole, int]
+    days: list[SignupDay]
+
+
+class EventAnalyticsResponse(RegistrationSeriesResponse):
+    """Ocupación actual de un evento y su serie diaria de registros y cancelaciones"""
+
+    event_id: int
+    name: str
+    capacity: int
+    registered_count: int
+    fill_rate: float  # registered_count / capacity (0-1)
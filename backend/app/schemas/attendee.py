@@ -2,12 +2,14 @@
 Schemas para asistentes y registros a eventos
 """
 
+import enum
 from datetime import datetime
 
 from pydantic import BaseModel
 
 from app.schemas.event import EventResponse
 from app.schemas.pagination import PaginationMetadata
+from app.schemas.session import SessionResponse
 
 
 class EventRegistrationCreate(BaseModel):
@@ -65,3 +67,48 @@ class MyEventsListResponse(BaseModel):
 
     events: list[EventResponse]
     pagination: PaginationMetadata
+
+
+class RegistrationCheckResponse(BaseModel):
+    """Respuesta de verificación de registro en varios eventos"""
+
+    registrations: dict[int, bool]  # event_id -> registrado
+
+
+class SessionBatchRegistrationRequest(BaseModel):
+    """Sesiones elegidas en una sola petición"""
+
+    session_ids: list[int]
+
+
+class SessionRegistrationStatus(str, enum.Enum):
+    """Resultado de la reserva de plaza en una sesión"""
+
+    REGISTERED = "registered"
+    ALREADY_REGISTERED = "already_registered"
+    FULL = "full"
+    CLOSED = "closed"  # La sesión ya empezó o el evento fue cancelado
+    NOT_REGISTERED_TO_EVENT = "not_registered_to_event"
+    NOT_FOUND = "not_found"
+
+
+class SessionRegistrationResult(BaseModel):
+    """Resultado de una sesión dentro de una reserva en lote"""
+
+    session_id: int
+    status: SessionRegistrationStatus
+    seats_taken: int | None = None  # Plazas ocupadas tras la reserva (si se registró)
+
+
+class SessionBatchRegistrationResponse(BaseModel):
+    """Respuesta de la reserva en lote (cada sesión se reserva o no por separado)"""
+
+    registered: int
+    results: list[SessionRegistrationResult]
+
+
+class MySessionsResponse(BaseModel):
+    """Sesiones de un evento en las que el usuario tiene plaza"""
+
+    event_id: int
+    sessions: list[SessionResponse]
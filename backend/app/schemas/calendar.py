@@ -0,0 +1,12 @@
+"""
+Schemas para feeds iCalendar
+"""
+
+from pydantic import BaseModel
+
+
+class CalendarFeedResponse(BaseModel):
+    """Schema para la URL firmada de suscripción a un feed iCalendar"""
+
+    token: str
+    url: str
@@ -1,3 +1,4 @@
+import enum
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -69,12 +70,66 @@ class EventResponse(EventBase):
     created_at: datetime
     available_capacity: int
     is_full: bool
+    version: int  # Versión para concurrencia optimista (ETag / If-Match)
+    is_registered: bool | None = None  # Solo para usuarios autenticados (listado y detalle)
 
     class Config:
         from_attributes = True
 
 
-class EventListQueryParams(BaseModel):
+class EventSortField(str, enum.Enum):
+    """Columnas de ordenación del listado de eventos"""
+
+    START_DATE = "start_date"
+    CREATED_AT = "created_at"
+    NAME = "name"
+
+
+class SortOrder(str, enum.Enum):
+    """Dirección de la ordenación"""
+
+    ASC = "asc"
+    DESC = "desc"
+
+
+class EventFilterParams(BaseModel):
+    """
+    Filtros del listado de eventos compartidos por GET /events y GET /events/facets
+    (ver EventListQueryParams para el detalle de cada parámetro)
+    """
+
+    search: str | None = None
+    status: EventStatus | None = None
+    start_from: datetime | None = None
+    start_to: datetime | None = None
+    location: str | None = None
+    creator_id: int | None = None
+    has_availability: bool | None = None
+    min_capacity: int | None = None
+
+    @field_validator("search", "location")
+    @classmethod
+    def search_must_not_be_empty(cls, v):
+        """Si se proporciona search o location, no debe estar vacío"""
+        return validate_search(v)
+
+    @field_validator("creator_id", "min_capacity")
+    @classmethod
+    def must_be_positive(cls, v):
+        """creator_id y min_capacity deben ser > 0"""
+        if v is not None and v <= 0:
+            raise ValueError("El valor debe ser mayor a 0")
+        return v
+
+    @model_validator(mode="after")
+    def start_range_must_be_valid(self):
+        """start_to no puede ser anterior a start_from"""
+        if self.start_from and self.start_to and self.start_to < self.start_from:
+            raise ValueError("start_to debe ser posterior o igual a start_from")
+        return self
+
+
+class EventListQueryParams(EventFilterParams):
     """
     Schema para validar los parámetros de query del endpoint GET /events
 
@@ -98,12 +153,29 @@ class EventListQueryParams(BaseModel):
             Ejemplo: status=ONGOING → solo eventos en progreso
             Uso: Filtrar eventos según su estado computado (computed_status)
             Nota: El filtro se aplica sobre el estado computado, no el estado manual en BD
+
+        start_from / start_to (datetime, opcional): Rango de fecha de inicio (inclusive)
+            Ejemplo: start_from=2026-11-01T00:00:00&start_to=2026-11-30T23:59:59
+
+        location (str, opcional): Ubicación exacta, sin distinguir mayúsculas
+            Ejemplo: location=madrid
+
+        creator_id (int, opcional): Solo eventos de un organizador
+
+        has_availability (bool, opcional): true → con plazas libres, false → llenos
+
+        min_capacity (int, opcional): Capacidad mínima del evento
+
+        sort_by (EventSortField, opcional): start_date (default), created_at o name
+        sort_order (SortOrder, opcional): asc (default) o desc
+
+    Todos los filtros se combinan con AND.
     """
 
     page: int = 1
     per_page: int = 20
-    search: str | None = None
-    status: EventStatus | None = None
+    sort_by: EventSortField = EventSortField.START_DATE
+    sort_order: SortOrder = SortOrder.ASC
 
     @field_validator("page")
     @classmethod
@@ -117,11 +189,24 @@ class EventListQueryParams(BaseModel):
         """per_page debe ser > 0 y <= 100"""
         return validate_per_page(v)
 
-    @field_validator("search")
+
+class EventFacetsQueryParams(EventFilterParams):
+    """
+    Schema para validar los parámetros de query del endpoint GET /events/facets
+
+    Acepta los mismos filtros que GET /events (sin paginación ni ordenación) y:
+        top_locations (int, opcional): Número de ubicaciones a devolver. Default: 10, Max: 50
+    """
+
+    top_locations: int = 10
+
+    @field_validator("top_locations")
     @classmethod
-    def search_must_not_be_empty(cls, v):
-        """Si se proporciona search, no debe estar vacío"""
-        return validate_search(v)
+    def top_locations_must_be_valid(cls, v):
+        """top_locations debe estar entre 1 y 50"""
+        if v < 1 or v > 50:
+            raise ValueError("top_locations debe estar entre 1 y 50")
+        return v
 
 
 class EventDetailResponse(EventResponse):
@@ -144,6 +229,43 @@ class EventListResponse(BaseModel):
     pagination: PaginationMetadata
 
 
+class FacetCount(BaseModel):
+    """Número de eventos para un valor de una faceta"""
+
+    value: str
+    count: int
+
+
+class EventFacetsResponse(BaseModel):
+    """
+    Conteos del listado de eventos para los filtros actuales (GET /events/facets).
+
+    ``status`` ignora el filtro de estado (conteo de cada pestaña); ``total``,
+    ``locations`` y ``months`` aplican todos los filtros.
+    """
+
+    total: int
+    status: dict[EventStatus, int]
+    locations: list[FacetCount]
+    months: list[FacetCount]  # value con formato YYYY-MM (mes de start_date)
+
+
+class TrendingEvent(BaseModel):
+    """Evento del ranking de tendencia"""
+
+    event: EventResponse
+    score: float  # Registros de la ventana con decaimiento por antigüedad
+    recent_registrations: int  # Registros de la ventana sin decaimiento
+
+
+class TrendingEventsResponse(BaseModel):
+    """Eventos en tendencia (GET /events/trending), de mayor a menor puntuación"""
+
+    generated_at: datetime  # Momento del cálculo (la respuesta se cachea unos segundos)
+    window_hours: int
+    events: list[TrendingEvent]
+
+
 # Resolver forward reference después de que ambos módulos estén cargados
 if not TYPE_CHECKING:
     from app.schemas.session import SessionResponse
@@ -0,0 +1,30 @@
+"""
+Schemas para trabajos en segundo plano
+"""
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+from app.models.job import JobStatus
+
+
+class JobResponse(BaseModel):
+    """Estado de un trabajo en segundo plano (GET /jobs/{id} y respuestas 202)"""
+
+    id: int
+    type: str
+    status: JobStatus
+    priority: int
+    attempts: int
+    max_attempts: int
+    run_at: datetime  # Próximo intento si está pendiente
+    result: dict[str, Any] | None = None
+    last_error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    class Config:
+        from_attributes = True
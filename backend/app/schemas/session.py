@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, model_validator
 
@@ -41,6 +42,8 @@ class SessionResponse(SessionBase):
     id: int
     event_id: int
     created_at: datetime
+    seats_taken: int = 0  # Plazas ocupadas (registro por sesión)
+    version: int  # Versión para concurrencia optimista (ETag / If-Match)
 
     class Config:
         from_attributes = True
@@ -51,3 +54,22 @@ class SessionListResponse(BaseModel):
 
     sessions: list[SessionResponse]
     pagination: PaginationMetadata
+
+
+class SessionConflict(BaseModel):
+    """Par de sesiones que se solapan en la misma sala o con el mismo ponente"""
+
+    kind: Literal["location", "speaker"]
+    value: str  # Sala o ponente compartido
+    session_id: int
+    conflicting_session_id: int
+    overlap_start: datetime
+    overlap_end: datetime
+
+
+class AgendaConflictsResponse(BaseModel):
+    """Resultado de validar la agenda completa de un evento"""
+
+    event_id: int
+    total_sessions: int
+    conflicts: list[SessionConflict]
@@ -1,3 +1,4 @@
+import enum
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -61,22 +62,72 @@ class TokenData(BaseModel):
     email: str | None = None
 
 
-class UserProfileResponse(UserResponse):
-    """Perfil completo del usuario con eventos registrados"""
+PROFILE_INCLUDE_OPTIONS = {"upcoming_events"}
+
 
-    registered_events: list["EventResponse"] = []
+class UserProfileResponse(UserResponse):
+    """
+    Perfil del usuario con contadores agregados.
+    Las listas completas se obtienen con los endpoints paginados
+    (/attendees/my-events, /events/my/events).
+    """
+
+    registered_events_count: int = 0
+    upcoming_events_count: int = 0
     created_events_count: int = 0
+    upcoming_events: list["EventResponse"] | None = None  # Solo con include=upcoming_events
 
     class Config:
         from_attributes = True
 
 
+class UserProfileQueryParams(BaseModel):
+    """
+    Parámetros de query para GET /auth/me
+
+    Parámetros:
+        include (str, opcional): Datos embebidos separados por coma
+            Valores válidos: upcoming_events (próximos eventos registrados, máximo PROFILE_PREVIEW_SIZE)
+            Ejemplo: include=upcoming_events
+    """
+
+    include: str | None = None
+
+    @field_validator("include")
+    @classmethod
+    def include_must_be_valid(cls, v):
+        """Cada valor de include debe ser una opción conocida"""
+        if v is None:
+            return None
+        options = {option.strip() for option in v.split(",") if option.strip()}
+        invalid = options - PROFILE_INCLUDE_OPTIONS
+        if invalid:
+            raise ValueError(
+                f"include no válido: {', '.join(sorted(invalid))}. "
+                f"Opciones: {', '.join(sorted(PROFILE_INCLUDE_OPTIONS))}"
+            )
+        return ",".join(sorted(options))
+
+    @property
+    def include_set(self) -> set[str]:
+        """Opciones de include como conjunto"""
+        return set(self.include.split(",")) if self.include else set()
+
+
+class UserSearchMode(str, enum.Enum):
+    """Modo de búsqueda del listado de usuarios"""
+
+    CONTAINS = "contains"  # Email o nombre contienen el término (índices trigram)
+    PREFIX = "prefix"  # Email empieza por el término (índice text_pattern_ops, más rápido)
+
+
 class UserListQueryParams(BaseModel):
     """Parámetros de query para listar usuarios"""
 
     page: int = 1
     per_page: int = 20
     search: str | None = None  # Búsqueda por email o nombre
+    search_mode: UserSearchMode = UserSearchMode.CONTAINS
     role: UserRole | None = None  # Filtrar por rol
     is_active: bool | None = None  # Filtrar por estado activo
 
@@ -0,0 +1,75 @@
+"""
+Script para completar el borrado en cascada de eventos eliminados
+
+Marca como eliminadas (soft delete) las sesiones y registros de los eventos eliminados
+pendientes, en lotes pequeños con pausas entre lotes. Es lo mismo que hacen los trabajos
+event.cascade (JobService); útil para vaciar la cola a mano sin el runner de trabajos.
+Si se interrumpe, la siguiente ejecución continúa con las filas que siguen vivas.
+
+Uso:
+    python -m app.scripts.cascade_deletes
+    python -m app.scripts.cascade_deletes --batch-size 500 --sleep 0.5
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.config import settings  # noqa: E402
+from app.database import SessionLocal  # noqa: E402
+from app.services.deletion_service import DeletionService  # noqa: E402
+
+
+def cascade(batch_size: int, sleep_seconds: float) -> None:
+    """Procesa los borrados pendientes e imprime el resultado de cada evento"""
+    db = SessionLocal()
+    try:
+        print("🧹 Completando borrados en cascada pendientes...")
+        print("-" * 50)
+        completed = DeletionService.run_pending(
+            db, batch_size=batch_size, sleep_seconds=sleep_seconds
+        )
+        for progress in completed:
+            print(
+                f"✅ Evento {progress['event_id']}: {progress['sessions_deleted']} sesiones, "
+                f"{progress['registrations_deleted']} registros y "
+                f"{progress['session_registrations_deleted']} plazas de sesión eliminados"
+            )
+        if not completed:
+            print("✅ No hay borrados pendientes")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Completar el borrado en cascada de eventos eliminados",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python -m app.scripts.cascade_deletes
+  docker-compose exec backend python -m app.scripts.cascade_deletes --batch-size 500 --sleep 1
+        """,
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.CASCADE_BATCH_SIZE, help="Filas por lote"
+    )
+    parser.add_argument(
+        "--sleep",
+        type=float,
+        default=settings.CASCADE_BATCH_SLEEP_SECONDS,
+        help="Segundos de pausa entre lotes",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        cascade(args.batch_size, args.sleep)
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
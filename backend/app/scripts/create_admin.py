@@ -26,6 +26,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from sqlalchemy.orm import Session  # noqa: E402
 
 from app.core.security import get_password_hash  # noqa: E402
+from app.crud import analytics as crud_analytics  # noqa: E402
 from app.crud import user as crud_user  # noqa: E402
 from app.database import SessionLocal  # noqa: E402
 from app.models.user import User, UserRole  # noqa: E402
@@ -56,6 +57,7 @@ def create_user_with_role(
         is_active=True,
     )
     db.add(new_user)
+    crud_analytics.record_signup(db, role)
     db.commit()
     db.refresh(new_user)
     print(f"✅ Usuario {role.value.upper()} creado: {email}")
@@ -0,0 +1,74 @@
+"""
+Script para entregar las notificaciones pendientes del outbox (emails y webhooks)
+
+Alternativa a la tarea en segundo plano del backend (OUTBOX_DISPATCH_ENABLED) para
+ejecutar el dispatcher como proceso aparte. Se pueden lanzar varios a la vez: cada
+lote se reserva con FOR UPDATE SKIP LOCKED.
+
+Uso:
+    # Bucle continuo
+    python -m app.scripts.dispatch_outbox
+
+    # Vaciar la cola una vez y terminar
+    python -m app.scripts.dispatch_outbox --once
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.config import settings  # noqa: E402
+from app.core.delivery import default_adapters  # noqa: E402
+from app.services.outbox_service import OutboxService, dispatch_periodically  # noqa: E402
+
+
+async def drain(batch_size: int) -> None:
+    """Entrega lotes hasta que no quedan mensajes vencidos e imprime un resumen"""
+    adapters = default_adapters()
+    totals = {"claimed": 0, "sent": 0, "retried": 0, "failed": 0}
+    print("📬 Entregando notificaciones pendientes del outbox...")
+    print("-" * 50)
+    while True:
+        stats = await OutboxService.dispatch_batch(adapters, batch_size=batch_size)
+        for key, value in stats.items():
+            totals[key] += value
+        if stats["claimed"] < batch_size:
+            break
+    print(f"✅ Enviados: {totals['sent']}")
+    print(f"🔁 Reprogramados: {totals['retried']}")
+    print(f"⚠️  Descartados: {totals['failed']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Entregar las notificaciones pendientes del outbox",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python -m app.scripts.dispatch_outbox
+  python -m app.scripts.dispatch_outbox --once --batch-size 500
+  docker-compose exec backend python -m app.scripts.dispatch_outbox --once
+        """,
+    )
+
+    parser.add_argument("--once", action="store_true", help="Vaciar la cola una vez y terminar")
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.OUTBOX_BATCH_SIZE, help="Mensajes por lote"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        if args.once:
+            asyncio.run(drain(args.batch_size))
+        else:
+            print("📬 Dispatcher del outbox en marcha (Ctrl+C para salir)")
+            asyncio.run(dispatch_periodically())
+    except KeyboardInterrupt:
+        print("\n👋 Dispatcher detenido")
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
@@ -0,0 +1,102 @@
+"""
+Mantenimiento de las particiones de event_registrations
+
+Con particionado por rango (mensual) crea las particiones futuras y separa
+(DETACH) las de meses anteriores a la retención, para que vacuum y el
+mantenimiento de índices trabajen sobre tablas acotadas. Con particionado hash
+no hay nada que crear: solo muestra el tamaño de cada partición.
+
+Uso:
+    # Desde cron o Docker (valores de PARTITION_MONTHS_AHEAD / PARTITION_RETENTION_MONTHS)
+    python -m app.scripts.partition_maintenance
+
+    # Con argumentos
+    python -m app.scripts.partition_maintenance --months-ahead 6 --retention-months 12 --drop
+"""
+
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import text  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.core import partitioning  # noqa: E402
+from app.database import engine  # noqa: E402
+
+
+def run_maintenance(months_ahead: int, retention_months: int, drop: bool = False) -> None:
+    """Ejecuta el mantenimiento según la estrategia de particionado detectada"""
+    with engine.begin() as conn:
+        strategy = partitioning.get_strategy(conn)
+        if strategy is None:
+            print("ℹ️  event_registrations no está particionada, nada que hacer")
+            return
+
+        if strategy == "hash":
+            rows = conn.execute(
+                text(
+                    "SELECT c.relname, c.reltuples::bigint FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid "
+                    "JOIN pg_class p ON p.oid = i.inhparent "
+                    "WHERE p.relname = :table ORDER BY c.relname"
+                ),
+                {"table": partitioning.TABLE},
+            )
+            print("🧩 Particionado hash por event_id (número fijo de particiones)")
+            for name, estimated_rows in rows:
+                print(f"   {name}: ~{max(estimated_rows, 0)} filas")
+            return
+
+        today = date.today()
+        ensured = partitioning.create_future_partitions(conn, today, months_ahead)
+        print(f"✅ Particiones aseguradas: {', '.join(ensured)}")
+
+        detached = partitioning.detach_old_partitions(conn, today, retention_months, drop=drop)
+        if detached:
+            action = "eliminadas" if drop else "separadas (DETACH)"
+            print(f"🗄️  Particiones {action}: {', '.join(detached)}")
+        else:
+            print("ℹ️  No hay particiones fuera de la retención")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Mantenimiento de particiones de event_registrations",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python -m app.scripts.partition_maintenance
+  python -m app.scripts.partition_maintenance --months-ahead 6 --retention-months 12
+  docker-compose exec backend python -m app.scripts.partition_maintenance --drop
+        """,
+    )
+
+    parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=settings.PARTITION_MONTHS_AHEAD,
+        help="Meses futuros a pre-crear",
+    )
+    parser.add_argument(
+        "--retention-months",
+        type=int,
+        default=settings.PARTITION_RETENTION_MONTHS,
+        help="Meses a mantener adjuntos",
+    )
+    parser.add_argument(
+        "--drop",
+        action="store_true",
+        help="Eliminar las particiones separadas en vez de conservarlas",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        run_maintenance(args.months_ahead, args.retention_months, drop=args.drop)
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
@@ -0,0 +1,98 @@
+"""
+Script para purgar filas soft-deleted fuera de la política de retención
+
+Borra físicamente (o archiva en archived_records) registros, sesiones y eventos
+eliminados hace más de N días. Trabaja en lotes pequeños ordenados por id con
+pausas entre lotes, por lo que puede ejecutarse en horario laboral sin bloqueos
+largos. Si se interrumpe, continúa desde el último checkpoint.
+
+Uso:
+    # Con los valores de configuración (PURGE_RETENTION_DAYS, PURGE_MODE, ...)
+    python -m app.scripts.purge_deleted
+
+    # Con argumentos
+    python -m app.scripts.purge_deleted --retention-days 30 --mode archive --batch-size 200
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.config import settings  # noqa: E402
+from app.core.db_utils import advisory_lock  # noqa: E402
+from app.database import SessionLocal  # noqa: E402
+from app.services.retention_service import (  # noqa: E402
+    PURGE_LOCK,
+    PURGE_MODES,
+    RetentionService,
+)
+
+
+def purge(retention_days: int, mode: str, batch_size: int, sleep_seconds: float) -> None:
+    """Ejecuta el purgado e imprime un resumen por tabla"""
+    db = SessionLocal()
+    try:
+        with advisory_lock(db.get_bind(), PURGE_LOCK) as acquired:
+            if not acquired:
+                print("ℹ️  Ya hay un purgado en curso en otro proceso, nada que hacer")
+                return
+            print(
+                f"🧹 Purgando filas eliminadas hace más de {retention_days} días (modo {mode})..."
+            )
+            print("-" * 50)
+            purged = RetentionService.purge_deleted(
+                db,
+                retention_days=retention_days,
+                mode=mode,
+                batch_size=batch_size,
+                sleep_seconds=sleep_seconds,
+            )
+            for table_name, count in purged.items():
+                print(f"✅ {table_name}: {count} filas purgadas")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Purgar filas soft-deleted fuera de la retención",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python -m app.scripts.purge_deleted
+  python -m app.scripts.purge_deleted --retention-days 30 --mode archive
+  docker-compose exec backend python -m app.scripts.purge_deleted --batch-size 200 --sleep 1
+        """,
+    )
+
+    parser.add_argument(
+        "--retention-days",
+        type=int,
+        default=settings.PURGE_RETENTION_DAYS,
+        help="Días que se conservan las filas eliminadas",
+    )
+    parser.add_argument(
+        "--mode", choices=PURGE_MODES, default=settings.PURGE_MODE, help="Borrar o archivar"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.PURGE_BATCH_SIZE, help="Filas por lote"
+    )
+    parser.add_argument(
+        "--sleep",
+        type=float,
+        default=settings.PURGE_BATCH_SLEEP_SECONDS,
+        help="Segundos de pausa entre lotes",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        purge(args.retention_days, args.mode, args.batch_size, args.sleep)
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
@@ -0,0 +1,65 @@
+"""
+Script para ejecutar los trabajos en segundo plano (tabla jobs)
+
+Alternativa al runner dentro del backend (JOBS_ENABLED) para ejecutar los trabajos en
+un proceso aparte. Se pueden lanzar varios a la vez: los trabajos se reservan con
+FOR UPDATE SKIP LOCKED y el límite de concurrencia de cada tipo es global (cada
+reserva cuenta los trabajos en curso bajo un lock consultivo por tipo).
+
+Uso:
+    # Bucle continuo
+    python -m app.scripts.run_jobs
+
+    # Ejecutar los trabajos listos una vez y terminar
+    python -m app.scripts.run_jobs --once
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.services.job_service import JobService, run_jobs  # noqa: E402
+
+
+def drain() -> None:
+    """Ejecuta los trabajos listos hasta vaciar la cola e imprime un resumen"""
+    print("⚙️  Ejecutando trabajos pendientes...")
+    print("-" * 50)
+    stats = JobService.run_pending()
+    print(f"✅ Terminados: {stats['succeeded']}")
+    print(f"🔁 Reprogramados: {stats['pending']}")
+    print(f"⚠️  Fallidos: {stats['failed']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Ejecutar los trabajos en segundo plano",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python -m app.scripts.run_jobs
+  python -m app.scripts.run_jobs --once
+  docker-compose exec backend python -m app.scripts.run_jobs --once
+        """,
+    )
+
+    parser.add_argument(
+        "--once", action="store_true", help="Ejecutar los trabajos listos y terminar"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        if args.once:
+            drain()
+        else:
+            print("⚙️  Runner de trabajos en marcha (Ctrl+C para salir)")
+            asyncio.run(run_jobs())
+    except KeyboardInterrupt:
+        print("\n👋 Runner detenido")
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
@@ -1,6 +1,27 @@
+from app.services.analytics_service import AnalyticsService
 from app.services.attendee_service import AttendeeService
+from app.services.calendar_service import CalendarService
+from app.services.deletion_service import DeletionService
 from app.services.event_service import EventService
+from app.services.job_service import JobService
+from app.services.live_service import LiveService
+from app.services.outbox_service import OutboxService
+from app.services.retention_service import RetentionService
+from app.services.schedule_service import ScheduleService
 from app.services.session_service import SessionService
 from app.services.user_service import UserService
 
-__all__ = ["UserService", "EventService", "SessionService", "AttendeeService"]
+__all__ = [
+    "UserService",
+    "EventService",
+    "SessionService",
+    "AttendeeService",
+    "RetentionService",
+    "CalendarService",
+    "OutboxService",
+    "ScheduleService",
+    "LiveService",
+    "DeletionService",
+    "JobService",
+    "AnalyticsService",
+]
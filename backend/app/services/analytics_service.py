@@ -0,0 +1,99 @@
+"""
+Servicio de analítica - Series diarias para el panel de administración
+
+Solo lee los rollups diarios (daily_event_stats, daily_signups), que mantienen las
+escrituras en su misma transacción: el coste de cada consulta depende del número de días
+del rango (y de eventos con actividad en esos días), no del tamaño de
+event_registrations ni de users.
+"""
+
+from datetime import date, timedelta
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.exceptions import ValidationError
+from app.crud import analytics as crud_analytics
+from app.models.user import UserRole
+from app.services.event_service import EventService
+
+
+def _date_range(date_from: date, date_to: date) -> list[date]:
+    """
+    Días de date_from a date_to, ambos incluidos
+
+    Raises:
+        ValidationError: Si date_to es anterior a date_from o el rango supera
+            ANALYTICS_MAX_DAYS días
+    """
+    if date_from > date_to:
+        raise ValidationError("date_to debe ser posterior o igual a date_from")
+    if (date_to - date_from).days >= settings.ANALYTICS_MAX_DAYS:
+        raise ValidationError(f"El rango no puede superar {settings.ANALYTICS_MAX_DAYS} días")
+    return [date_from + timedelta(days=n) for n in range((date_to - date_from).days + 1)]
+
+
+class AnalyticsService:
+    """Servicio para las series de analítica del panel de administración"""
+
+    @staticmethod
+    def get_registration_series(
+        db: Session, date_from: date, date_to: date, event_id: int | None = None
+    ) -> dict[str, Any]:
+        """
+        Registros y cancelaciones por día (todos los eventos o uno), con los días sin
+        actividad a 0 para que la serie sea continua
+        """
+        date_range = _date_range(date_from, date_to)
+        rows = crud_analytics.get_registration_series(db, date_from, date_to, event_id=event_id)
+        by_day = {row["day"]: row for row in rows}
+        days = [
+            by_day.get(day, {"day": day, "registrations": 0, "cancellations": 0})
+            for day in date_range
+        ]
+        return {
+            "date_from": date_from,
+            "date_to": date_to,
+            "total_registrations": sum(row["registrations"] for row in rows),
+            "total_cancellations": sum(row["cancellations"] for row in rows),
+            "days": days,
+        }
+
+    @staticmethod
+    def get_signup_series(db: Session, date_from: date, date_to: date) -> dict[str, Any]:
+        """Altas de usuarios por día (días sin actividad a 0) y totales por rol"""
+        signups = dict.fromkeys(_date_range(date_from, date_to), 0)
+        by_role = dict.fromkeys(UserRole, 0)
+        for row in crud_analytics.get_signup_series(db, date_from, date_to):
+            signups[row["day"]] += row["signups"]
+            by_role[row["role"]] += row["signups"]
+        return {
+            "date_from": date_from,
+            "date_to": date_to,
+            "total_signups": sum(by_role.values()),
+            "by_role": by_role,
+            "days": [{"day": day, "signups": count} for day, count in signups.items()],
+        }
+
+    @staticmethod
+    def get_event_analytics(
+        db: Session, event_id: int, date_from: date, date_to: date
+    ) -> dict[str, Any]:
+        """
+        Ocupación actual de un evento (contador registered_count de la fila del evento) y
+        su serie diaria de registros y cancelaciones
+
+        Raises:
+            NotFoundError: Si el evento no existe
+        """
+        event = EventService.get_event(db, event_id)
+        series = AnalyticsService.get_registration_series(db, date_from, date_to, event_id=event_id)
+        return {
+            **series,
+            "event_id": event.id,
+            "name": event.name,
+            "capacity": event.capacity,
+            "registered_count": event.registered_count,
+            "fill_rate": event.registered_count / event.capacity if event.capacity else 0.0,
+        }
@@ -1,17 +1,53 @@
 """
-Servicio de asistentes - Lógica de negocio para registro a eventos
+Servicio de asistentes - Lógica de negocio para registro a eventos y a sesiones
 """
 
+from collections.abc import Iterable
+from datetime import datetime
 from typing import Any
 
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import ConflictError, NotFoundError, ValidationError
 from app.crud import attendee as crud_attendee
+from app.crud import event as crud_event
 from app.models.attendee import EventRegistration
+from app.models.event import Event, EventStatus, EventStatusDB
+from app.models.session import Session as EventSession
 from app.models.user import User
-from app.schemas.attendee import AttendeeInfo, EventAttendeesResponse
+from app.schemas.attendee import (
+    AttendeeInfo,
+    EventAttendeesResponse,
+    SessionRegistrationResult,
+    SessionRegistrationStatus,
+)
+from app.services.calendar_service import CalendarService, user_feed_key
 from app.services.event_service import EventService
+from app.services.live_service import LiveService
+from app.services.outbox_service import OutboxService
+
+# Máximo de eventos por consulta de registro en lote (una página de listado cabe de sobra)
+MAX_REGISTRATION_CHECK_IDS = 100
+# Máximo de sesiones por reserva en lote
+MAX_SESSION_REGISTRATION_BATCH = 20
+
+# Error de la reserva individual para cada resultado distinto de REGISTERED
+_SESSION_REGISTRATION_ERRORS = {
+    SessionRegistrationStatus.NOT_FOUND: (NotFoundError, "Sesión no encontrada"),
+    SessionRegistrationStatus.CLOSED: (
+        ValidationError,
+        "Las inscripciones a esta sesión están cerradas",
+    ),
+    SessionRegistrationStatus.NOT_REGISTERED_TO_EVENT: (
+        ValidationError,
+        "Debes estar registrado en el evento para reservar plaza en sus sesiones",
+    ),
+    SessionRegistrationStatus.ALREADY_REGISTERED: (
+        ConflictError,
+        "Ya tienes plaza en esta sesión",
+    ),
+    SessionRegistrationStatus.FULL: (ValidationError, "La sesión está llena"),
+}
 
 
 class AttendeeService:
@@ -24,33 +60,172 @@ class AttendeeService:
 
         Raises:
             NotFoundError: Si el evento no existe
-            ValidationError: Si el evento está lleno
+            ValidationError: Si el evento está lleno o ya no admite registros (comenzó,
+                terminó o fue cancelado)
             ConflictError: Si el usuario ya está registrado
         """
         event = EventService.get_event(db, event_id)
+        # Las inscripciones se cierran al empezar el evento (estado calculado por fechas)
+        if event.computed_status != EventStatus.SCHEDULED:
+            raise ValidationError("Las inscripciones a este evento están cerradas")
         if event.is_full:
             raise ValidationError("El evento está lleno")
         is_registered = crud_attendee.is_user_registered(db, user_id=user.id, event_id=event_id)
 
         if is_registered:
             raise ConflictError("Ya estás registrado en este evento")
+
+        # Confirmación por email: se escribe en el outbox en la misma transacción
+        OutboxService.notify_registration(db, "registration.created", event, user)
+        LiveService.notify_event_changed(db, event_id)
+        CalendarService.invalidate_feed(db, user_feed_key(user.id))
         registration = crud_attendee.register_to_event(db, user_id=user.id, event_id=event_id)
+        if registration is None:
+            raise ValidationError("El evento está lleno")
 
         return registration
 
     @staticmethod
     def unregister_from_event(db: Session, event_id: int, user: User) -> None:
         """
-        Cancela el registro de un usuario a un evento
+        Cancela el registro de un usuario a un evento y sus plazas en las sesiones
 
         Raises:
             NotFoundError: Si el usuario no está registrado
         """
+        event = crud_event.get_event(db, event_id)
+        if event is not None:
+            OutboxService.notify_registration(db, "registration.cancelled", event, user)
+            LiveService.notify_event_changed(db, event_id)
+        CalendarService.invalidate_feed(db, user_feed_key(user.id))
         success = crud_attendee.unregister_from_event(db, user_id=user.id, event_id=event_id)
 
         if not success:
+            # La excepción descarta la notificación encolada (rollback de la petición)
             raise NotFoundError("No estás registrado en este evento")
 
+    @staticmethod
+    def _reserve_sessions(
+        db: Session, session_ids: Iterable[int], user: User
+    ) -> list[SessionRegistrationResult]:
+        """
+        Reserva plaza en cada sesión indicada, por separado (sin commit)
+
+        Sesiones, eventos, registros al evento y plazas existentes se leen con una query
+        de cada tipo; después cada plaza se toma con el contador atómico de la sesión.
+        Las sesiones se recorren por id ascendente: todas las peticiones bloquean las
+        filas de sessions en el mismo orden y dos lotes solapados no se interbloquean.
+
+        Returns:
+            Resultado por sesión, ordenado por session_id
+        """
+        ids = sorted(set(session_ids))
+        sessions: dict[int, EventSession] = {
+            session.id: session for session in crud_attendee.get_sessions_with_event(db, set(ids))
+        }
+        registered_event_ids = crud_attendee.get_registered_event_ids(
+            db, user_id=user.id, event_ids={session.event_id for session in sessions.values()}
+        )
+        registered_session_ids = crud_attendee.get_registered_session_ids(
+            db, user_id=user.id, session_ids=set(sessions)
+        )
+        now = datetime.utcnow()
+
+        results = []
+        for session_id in ids:
+            session = sessions.get(session_id)
+            seats_taken = None
+            if session is None:
+                status = SessionRegistrationStatus.NOT_FOUND
+            elif session.event.status == EventStatusDB.CANCELLED or session.start_time <= now:
+                status = SessionRegistrationStatus.CLOSED
+            elif session.event_id not in registered_event_ids:
+                status = SessionRegistrationStatus.NOT_REGISTERED_TO_EVENT
+            elif session_id in registered_session_ids:
+                status = SessionRegistrationStatus.ALREADY_REGISTERED
+            elif (seats_taken := crud_attendee.take_session_seat(db, session_id)) is None:
+                status = SessionRegistrationStatus.FULL
+            elif (
+                crud_attendee.add_session_registration(
+                    db, user_id=user.id, session_id=session_id, event_id=session.event_id
+                )
+                is None
+            ):
+                # Una petición simultánea del mismo usuario ganó la inserción
+                crud_attendee.release_session_seat(db, session_id)
+                status, seats_taken = SessionRegistrationStatus.ALREADY_REGISTERED, None
+            else:
+                status = SessionRegistrationStatus.REGISTERED
+            results.append(
+                SessionRegistrationResult(
+                    session_id=session_id, status=status, seats_taken=seats_taken
+                )
+            )
+        return results
+
+    @staticmethod
+    def register_to_session(db: Session, session_id: int, user: User) -> SessionRegistrationResult:
+        """
+        Reserva plaza en una sesión (requiere registro vivo en su evento)
+
+        Raises:
+            NotFoundError: Si la sesión no existe
+            ValidationError: Si la sesión está llena, ya empezó, su evento fue cancelado
+                o el usuario no está registrado en el evento
+            ConflictError: Si el usuario ya tiene plaza en la sesión
+        """
+        result = AttendeeService._reserve_sessions(db, [session_id], user)[0]
+        if result.status != SessionRegistrationStatus.REGISTERED:
+            error, message = _SESSION_REGISTRATION_ERRORS[result.status]
+            raise error(message)
+        return result
+
+    @staticmethod
+    def register_to_sessions(
+        db: Session, session_ids: list[int], user: User
+    ) -> list[SessionRegistrationResult]:
+        """
+        Reserva plaza en varias sesiones a la vez. Cada sesión se reserva o no por
+        separado: las llenas o cerradas no impiden reservar las demás.
+
+        Raises:
+            ValidationError: Si no se indica ninguna sesión o más de
+                MAX_SESSION_REGISTRATION_BATCH
+
+        Returns:
+            Resultado por sesión, ordenado por session_id
+        """
+        if not session_ids:
+            raise ValidationError("Indica al menos una sesión")
+        if len(set(session_ids)) > MAX_SESSION_REGISTRATION_BATCH:
+            raise ValidationError(
+                f"No se pueden reservar más de {MAX_SESSION_REGISTRATION_BATCH} sesiones a la vez"
+            )
+        return AttendeeService._reserve_sessions(db, session_ids, user)
+
+    @staticmethod
+    def unregister_from_session(db: Session, session_id: int, user: User) -> None:
+        """
+        Cancela la plaza del usuario en una sesión
+
+        Raises:
+            NotFoundError: Si el usuario no tiene plaza en la sesión
+        """
+        success = crud_attendee.unregister_from_session(db, user_id=user.id, session_id=session_id)
+        if not success:
+            raise NotFoundError("No tienes plaza en esta sesión")
+
+    @staticmethod
+    def get_user_event_sessions(db: Session, event_id: int, user: User) -> list[EventSession]:
+        """
+        Obtiene las sesiones del evento en las que el usuario tiene plaza
+
+        Raises:
+            NotFoundError: Si el evento no existe
+        """
+        EventService.verify_event_exists(db, event_id)
+        return crud_attendee.get_user_event_sessions(db, user_id=user.id, event_id=event_id)
+
     @staticmethod
     def get_user_registered_events(
         db: Session, user: User, page: int = 1, per_page: int = 20
@@ -108,3 +283,42 @@ class AttendeeService:
         is_registered = crud_attendee.is_user_registered(db, user_id=user.id, event_id=event_id)
 
         return is_registered
+
+    @staticmethod
+    def check_registrations(db: Session, event_ids: list[int], user: User) -> dict[int, bool]:
+        """
+        Verifica en una sola query si un usuario está registrado en varios eventos
+
+        Raises:
+            ValidationError: Si se piden más de MAX_REGISTRATION_CHECK_IDS eventos
+
+        Returns:
+            Dict[int, bool]: event_id -> registrado (eventos inexistentes: False)
+        """
+        if len(event_ids) > MAX_REGISTRATION_CHECK_IDS:
+            raise ValidationError(
+                f"No se pueden consultar más de {MAX_REGISTRATION_CHECK_IDS} eventos a la vez"
+            )
+
+        registered = crud_attendee.get_registered_event_ids(
+            db, user_id=user.id, event_ids=set(event_ids)
+        )
+        return {event_id: event_id in registered for event_id in event_ids}
+
+    @staticmethod
+    def annotate_registrations(db: Session, events: Iterable[Event], user: User | None) -> None:
+        """
+        Rellena ``is_registered`` en los eventos de una página para el usuario autenticado
+        (una sola query por página). Para peticiones anónimas queda en None.
+
+        Siempre se sobrescribe el atributo: los objetos pueden venir del identity map
+        de la sesión con el valor de una petición anterior.
+        """
+        events = list(events)
+        registered = None
+        if user is not None and events:
+            registered = crud_attendee.get_registered_event_ids(
+                db, user_id=user.id, event_ids={event.id for event in events}
+            )
+        for event in events:
+            event.is_registered = None if registered is None else event.id in registered
@@ -0,0 +1,264 @@
+"""
+Servicio de feeds iCalendar (.ics) de usuarios y eventos
+
+Los clientes de calendario consultan el feed cada pocos minutos. Para no generarlo en
+cada consulta:
+
+- Las validadoras del feed (ETag y Last-Modified) se derivan de una query agregada
+  (máximo ``updated_at`` y contadores) y se guardan en una caché TTL por feed. Una
+  consulta con ``If-None-Match`` que coincide con la validadora cacheada recibe 304
+  sin tocar la base de datos.
+- Si hay que enviar el feed, se genera como stream por lotes de eventos (keyset) con sus
+  sesiones (LEFT JOIN). El stream se envía después del commit de la petición, así que
+  cada lote usa su propia sesión corta y no un cursor de la sesión de la petición.
+
+Las escrituras que cambian un feed (eventos, sesiones, registros, usuarios) descartan
+sus validadoras al confirmarse la transacción. La caché es por proceso: en los demás
+workers un cambio puede tardar hasta ``CALENDAR_CACHE_TTL_SECONDS`` en reflejarse.
+"""
+
+import hashlib
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import event as sa_event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core import icalendar
+from app.core.cache import TTLCache
+from app.core.exceptions import NotFoundError, PermissionError
+from app.core.security import create_calendar_token, decode_calendar_token
+from app.crud import calendar as crud_calendar
+from app.crud import event as crud_event
+from app.crud import user as crud_user
+from app.database import SessionLocal
+from app.models.event import EventStatusDB
+
+# Validadoras (etag, last_modified) por feed ("user:<id>" / "event:<id>")
+feed_validators_cache = TTLCache(
+    ttl_seconds=settings.CALENDAR_CACHE_TTL_SECONDS,
+    max_entries=settings.CALENDAR_CACHE_MAX_ENTRIES,
+)
+
+# Feeds a invalidar al confirmar la transacción (session.info); ALL_FEEDS = todos
+_PENDING_KEY = "calendar_feed_keys"
+ALL_FEEDS = "*"
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    feed_keys = session.info.pop(_PENDING_KEY, ())
+    if ALL_FEEDS in feed_keys:
+        feed_validators_cache.clear()
+        return
+    for feed_key in feed_keys:
+        feed_validators_cache.delete(feed_key)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _verify_event_exists(db: Session, event_id: int) -> None:
+    """
+    Raises:
+        NotFoundError: Si el evento no existe
+    """
+    if crud_event.get_event(db, event_id=event_id) is None:
+        raise NotFoundError("Evento no encontrado")
+
+
+def user_feed_key(user_id: int) -> str:
+    """Clave (y subject del token) del feed de un usuario"""
+    return f"user:{user_id}"
+
+
+def event_feed_key(event_id: int) -> str:
+    """Clave (y subject del token) del feed de un evento"""
+    return f"event:{event_id}"
+
+
+def _feed_name(feed_key: str) -> str:
+    """Nombre del calendario (X-WR-CALNAME)"""
+    kind, _, feed_id = feed_key.partition(":")
+    if kind == "user":
+        return f"{settings.PROJECT_NAME} - Mis eventos"
+    return f"{settings.PROJECT_NAME} - Evento {feed_id}"
+
+
+def _feed_filters(feed_key: str) -> dict[str, int]:
+    """Filtros de las queries de crud.calendar para un feed"""
+    kind, _, feed_id = feed_key.partition(":")
+    return {"user_id": int(feed_id)} if kind == "user" else {"event_id": int(feed_id)}
+
+
+def _event_component(row: Any) -> str:
+    """VEVENT del evento de una fila del feed"""
+    return icalendar.vevent(
+        uid=f"event-{row.event_id}",
+        start=row.start_date,
+        end=row.end_date,
+        summary=row.name,
+        stamp=row.updated_at,
+        description=row.description,
+        location=row.location,
+        status="CANCELLED" if row.status == EventStatusDB.CANCELLED else "CONFIRMED",
+        sequence=row.version,
+    )
+
+
+def _session_component(row: Any) -> str:
+    """VEVENT de la sesión de una fila del feed"""
+    description = row.session_description
+    if row.session_speaker_name:
+        speaker = f"Ponente: {row.session_speaker_name}"
+        description = f"{speaker}\n\n{description}" if description else speaker
+
+    return icalendar.vevent(
+        uid=f"session-{row.session_id}",
+        start=row.session_start_time,
+        end=row.session_end_time,
+        summary=f"{row.name}: {row.session_title}",
+        stamp=row.session_updated_at,
+        description=description,
+        location=row.session_location or row.location,
+        status="CANCELLED" if row.status == EventStatusDB.CANCELLED else "CONFIRMED",
+        sequence=row.session_version,
+    )
+
+
+class CalendarService:
+    """Lógica de negocio de los feeds iCalendar"""
+
+    @staticmethod
+    def create_user_feed_token(user_id: int) -> str:
+        """Token firmado del feed de un usuario"""
+        return create_calendar_token(user_feed_key(user_id))
+
+    @staticmethod
+    def create_event_feed_token(db: Session, event_id: int) -> str:
+        """
+        Token firmado del feed de un evento
+
+        Raises:
+            NotFoundError: Si el evento no existe
+        """
+        _verify_event_exists(db, event_id)
+        return create_calendar_token(event_feed_key(event_id))
+
+    @staticmethod
+    def verify_feed_token(token: str, feed_key: str) -> None:
+        """
+        Verifica que el token autoriza el feed pedido (sin consultar la base de datos)
+
+        Raises:
+            PermissionError: Si el token es inválido, expiró o es de otro feed
+        """
+        if decode_calendar_token(token) != feed_key:
+            raise PermissionError("Token de calendario inválido")
+
+    @staticmethod
+    def get_cached_validators(feed_key: str) -> tuple[str, datetime | None] | None:
+        """Validadoras (etag, last_modified) cacheadas de un feed, o None"""
+        return feed_validators_cache.get(feed_key)
+
+    @staticmethod
+    def get_feed_validators(db: Session, feed_key: str) -> tuple[str, datetime | None]:
+        """
+        Calcula (y cachea) ETag y Last-Modified de un feed con una query agregada.
+
+        Raises:
+            NotFoundError: Si el usuario no existe o está inactivo (feed de usuario)
+        """
+        filters = _feed_filters(feed_key)
+        if "user_id" in filters:
+            user = crud_user.get_user(db, filters["user_id"])
+            if user is None or not user.is_active:
+                raise NotFoundError("Usuario no encontrado")
+        else:
+            _verify_event_exists(db, filters["event_id"])
+
+        data = crud_calendar.get_feed_validators(db, **filters)
+        timestamps = [
+            value
+            for value in (
+                data["events_updated_at"],
+                data["sessions_updated_at"],
+                data["registered_at"],
+            )
+            if value is not None
+        ]
+        last_modified = max(timestamps) if timestamps else None
+
+        fingerprint = "|".join(
+            str(data[key])
+            for key in (
+                "events",
+                "sessions",
+                "events_updated_at",
+                "sessions_updated_at",
+                "registered_at",
+            )
+        )
+        etag = f'"{hashlib.sha1(f"{feed_key}|{fingerprint}".encode()).hexdigest()[:20]}"'
+
+        validators = (etag, last_modified)
+        feed_validators_cache.set(feed_key, validators)
+        return validators
+
+    @staticmethod
+    def invalidate_feed(db: Session, feed_key: str) -> None:
+        """
+        Descarta las validadoras cacheadas de un feed al confirmarse la transacción
+        actual (sin commit; si hay rollback no se descarta nada)
+        """
+        db.info.setdefault(_PENDING_KEY, set()).add(feed_key)
+
+    @staticmethod
+    def invalidate_event(db: Session, event_id: int) -> None:
+        """
+        Descarta los feeds que incluyen un evento al confirmarse la transacción: el del
+        evento y los de sus asistentes. La caché no indexa usuarios por evento, así que
+        se vacía entera (solo cuesta recalcular las validadoras en la siguiente consulta).
+        """
+        db.info.setdefault(_PENDING_KEY, set()).add(ALL_FEEDS)
+
+    @staticmethod
+    def stream_feed(bind: Engine, feed_key: str) -> Iterator[str]:
+        """
+        Genera el feed iCalendar componente a componente por lotes de eventos, sin
+        construir el documento en memoria.
+
+        Cada lote se lee con una sesión propia sobre ``bind`` (el engine de la petición)
+        que se cierra antes de enviarlo: el stream no depende de la sesión de la
+        petición, confirmada antes de enviar el cuerpo, ni retiene una conexión mientras
+        el cliente lee.
+        """
+        filters = _feed_filters(feed_key)
+
+        def components() -> Iterator[str]:
+            after = None
+            while True:
+                db = SessionLocal(bind=bind)
+                try:
+                    rows = crud_calendar.get_feed_rows(
+                        db, after=after, limit=crud_calendar.FEED_BATCH_SIZE, **filters
+                    )
+                finally:
+                    db.close()
+                if not rows:
+                    return
+                current_event_id = None
+                for row in rows:
+                    if row.event_id != current_event_id:
+                        current_event_id = row.event_id
+                        yield _event_component(row)
+                    if row.session_id is not None:
+                        yield _session_component(row)
+                after = (rows[-1].start_date, rows[-1].event_id)
+
+        return icalendar.calendar(_feed_name(feed_key), components())
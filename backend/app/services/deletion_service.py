@@ -0,0 +1,140 @@
+"""
+Servicio de borrado en cascada - Sesiones y registros de eventos eliminados, por lotes
+
+Eliminar un evento solo marca su fila, crea un EventDeletion y encola un trabajo
+``event.cascade`` (JobService). Este servicio marca después las filas hijas en lotes de
+CASCADE_BATCH_SIZE, cada uno en su propia transacción corta (sin bloqueos largos que
+frenen registros concurrentes ni picos de WAL), y guarda el progreso en el EventDeletion
+tras cada lote. Si el proceso cae, la reserva vence a los CASCADE_LEASE_SECONDS y el
+reintento del trabajo continúa con las filas que siguen vivas.
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.crud import maintenance as crud_maintenance
+from app.models.attendee import EventRegistration, SessionRegistration
+from app.models.maintenance import EventDeletion
+from app.models.session import Session as EventSession
+
+# Tablas hijas y columna de progreso de cada una. Las plazas de sesión van primero: si el
+# trabajo falla a medias no quedan plazas vivas de sesiones ya eliminadas
+CASCADE_STEPS = [
+    (SessionRegistration, "session_registrations_deleted"),
+    (EventSession, "sessions_deleted"),
+    (EventRegistration, "registrations_deleted"),
+]
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class DeletionService:
+    """Servicio para completar el borrado en cascada de eventos eliminados"""
+
+    @staticmethod
+    def get_progress(deletion: EventDeletion) -> dict[str, Any]:
+        """Progreso de un borrado (totales estimados al eliminar el evento)"""
+        total = deletion.total_sessions + deletion.total_registrations
+        done = deletion.sessions_deleted + deletion.registrations_deleted
+        return {
+            "event_id": deletion.event_id,
+            "sessions_deleted": deletion.sessions_deleted,
+            "registrations_deleted": deletion.registrations_deleted,
+            "session_registrations_deleted": deletion.session_registrations_deleted,
+            "percent": 100 if deletion.finished_at else min(99, done * 100 // max(total, 1)),
+            "finished_at": deletion.finished_at,
+        }
+
+    @staticmethod
+    def cascade_event(
+        db: Session, deletion: EventDeletion, batch_size: int, sleep_seconds: float
+    ) -> EventDeletion:
+        """
+        Marca en lotes las sesiones y registros vivos del evento de ``deletion``
+
+        Cada lote es una transacción: UPDATE de hasta batch_size filas, progreso y
+        renovación de la reserva. Entre lotes se duerme sleep_seconds.
+
+        Returns:
+            El EventDeletion terminado (finished_at informado)
+        """
+        lease = timedelta(seconds=settings.CASCADE_LEASE_SECONDS)
+        for model, counter in CASCADE_STEPS:
+            while True:
+                marked = crud_maintenance.soft_delete_event_children_batch(
+                    db, model, deletion.event_id, deletion.deleted_at, batch_size
+                )
+                setattr(deletion, counter, getattr(deletion, counter) + marked)
+                deletion.locked_until = datetime.utcnow() + lease
+                db.commit()
+                if marked < batch_size:
+                    break
+                logger.info("Borrado en cascada: %s", DeletionService.get_progress(deletion))
+                if sleep_seconds:
+                    time.sleep(sleep_seconds)
+
+        deletion.finished_at = datetime.utcnow()
+        deletion.locked_until = None
+        db.commit()
+        return deletion
+
+    @staticmethod
+    def cascade_job(db: Session, payload: dict[str, Any]) -> dict[str, Any]:
+        """
+        Trabajo ``event.cascade``: completa el borrado del evento payload["event_id"]
+
+        Raises:
+            RuntimeError: Si otro worker tiene reservado el borrado (se reintenta después)
+
+        Returns:
+            Filas marcadas (resultado del trabajo)
+        """
+        event_id = payload["event_id"]
+        deletion = crud_maintenance.claim_event_deletion(
+            db, settings.CASCADE_LEASE_SECONDS, event_id=event_id
+        )
+        if deletion is None:
+            deletion = db.get(EventDeletion, event_id)
+            if deletion is not None and deletion.finished_at is None:
+                raise RuntimeError(f"El borrado del evento {event_id} está en curso")
+        else:
+            DeletionService.cascade_event(
+                db, deletion, settings.CASCADE_BATCH_SIZE, settings.CASCADE_BATCH_SLEEP_SECONDS
+            )
+        return {
+            "event_id": event_id,
+            "sessions_deleted": deletion.sessions_deleted if deletion else 0,
+            "registrations_deleted": deletion.registrations_deleted if deletion else 0,
+            "session_registrations_deleted": (
+                deletion.session_registrations_deleted if deletion else 0
+            ),
+        }
+
+    @staticmethod
+    def run_pending(
+        db: Session, batch_size: int | None = None, sleep_seconds: float | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Procesa los borrados pendientes libres hasta vaciar la cola
+
+        Los valores no indicados se toman de la configuración (CASCADE_*).
+
+        Returns:
+            Progreso final de cada borrado completado
+        """
+        batch_size = batch_size or settings.CASCADE_BATCH_SIZE
+        if sleep_seconds is None:
+            sleep_seconds = settings.CASCADE_BATCH_SLEEP_SECONDS
+
+        completed = []
+        while (
+            deletion := crud_maintenance.claim_event_deletion(db, settings.CASCADE_LEASE_SECONDS)
+        ) is not None:
+            DeletionService.cascade_event(db, deletion, batch_size, sleep_seconds)
+            completed.append(DeletionService.get_progress(deletion))
+        return completed
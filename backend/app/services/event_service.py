@@ -6,12 +6,43 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from app.config import settings
+from app.core.cache import TTLCache
 from app.core.event_validations import validate_event_update
-from app.core.exceptions import NotFoundError, ValidationError
+from app.core.exceptions import ConflictError, NotFoundError, ValidationError
+from app.core.versioning import check_if_match
 from app.crud import event as crud_event
 from app.models.event import Event, EventStatus, EventStatusDB
+from app.models.job import Job
 from app.models.user import User
-from app.schemas.event import EventCreate, EventUpdate
+from app.schemas.event import EventCreate, EventSortField, EventUpdate, SortOrder
+from app.services.calendar_service import CalendarService
+from app.services.job_service import JobService
+from app.services.live_service import LiveService
+from app.services.outbox_service import OutboxService
+from app.services.schedule_service import ScheduleService
+
+# Facetas del listado por filtro normalizado. El TTL es corto porque el estado computado
+# depende de la hora actual y los conteos no se invalidan al crear o editar eventos.
+facets_cache = TTLCache(
+    ttl_seconds=settings.EVENT_FACETS_CACHE_TTL_SECONDS,
+    max_entries=settings.EVENT_FACETS_CACHE_MAX_ENTRIES,
+)
+
+
+def _facets_cache_key(top_locations: int, filters: dict[str, Any]) -> tuple:
+    """
+    Clave de caché de las facetas: filtros informados, en orden fijo y normalizados
+    igual que los compara la query (search y location sin distinguir mayúsculas).
+    """
+    normalized = []
+    for name, value in sorted(filters.items()):
+        if value is None:
+            continue
+        if name in ("search", "location"):
+            value = value.strip().lower()
+        normalized.append((name, value))
+    return (top_locations, *normalized)
 
 
 class EventService:
@@ -38,21 +69,65 @@ class EventService:
             raise NotFoundError("Evento no encontrado")
         return event
 
+    @staticmethod
+    def get_event_detail(db: Session, event_id: int) -> Event:
+        """
+        Obtiene el detalle de un evento (sesiones ordenadas y número de registros)
+        sin cargar las filas de registros
+
+        Raises:
+            NotFoundError: Si el evento no existe
+
+        Returns:
+            Event con sesiones cargadas
+        """
+        event = crud_event.get_event_detail(db, event_id=event_id)
+        if not event:
+            raise NotFoundError("Evento no encontrado")
+        return event
+
     @staticmethod
     def list_events(
         db: Session,
         page: int = 1,
         per_page: int = 20,
-        search: str | None = None,
-        status: EventStatus | None = None,
+        sort_by: EventSortField = EventSortField.START_DATE,
+        sort_order: SortOrder = SortOrder.ASC,
+        **filters: Any,
     ) -> tuple[list[Event], dict]:
         """
-        Lista eventos con filtros opcionales y paginación.
+        Lista eventos con filtros opcionales combinables, ordenación y paginación.
+
+        Args:
+            **filters: search, status, start_from, start_to, location, creator_id,
+                has_availability, min_capacity (ver EventListQueryParams)
 
         Returns:
             Tuple[List[Event], Dict]: (eventos, metadata de paginación)
         """
-        return crud_event.get_events(db, page=page, per_page=per_page, search=search, status=status)
+        return crud_event.get_events(
+            db, page=page, per_page=per_page, sort_by=sort_by, sort_order=sort_order, **filters
+        )
+
+    @staticmethod
+    def get_event_facets(db: Session, top_locations: int = 10, **filters: Any) -> dict[str, Any]:
+        """
+        Obtiene los conteos por estado computado, ubicación y mes para los filtros del
+        listado (una query agregada, cacheada unos segundos por filtro normalizado).
+
+        Args:
+            top_locations: Número máximo de ubicaciones devueltas
+            **filters: Filtros del listado (ver EventFilterParams)
+
+        Returns:
+            Dict con total, status, locations y months
+        """
+        key = _facets_cache_key(top_locations, filters)
+        facets = facets_cache.get(key)
+        if facets is None:
+            facets = crud_event.get_event_facets(db, top_locations=top_locations, **filters)
+            facets_cache.set(key, facets)
+        return facets
 
     @staticmethod
     def create_event(db: Session, event_data: EventCreate, creator: User) -> Event:
@@ -67,18 +142,36 @@ class EventService:
         Returns:
             Event: Evento creado
         """
-        return crud_event.create_event(db=db, event=event_data, creator_id=creator.id)
+        event = crud_event.create_event(db=db, event=event_data, creator_id=creator.id)
+        ScheduleService.refresh_event(event)
+        return event
 
     @staticmethod
-    def update_event(db: Session, event_id: int, event_update: EventUpdate, user: User) -> Event:
+    def update_event(
+        db: Session,
+        event_id: int,
+        event_update: EventUpdate,
+        user: User,
+        if_match: str | None = None,
+    ) -> Event:
         """
         Actualiza un evento con validaciones de negocio
 
+        Las reglas se validan contra una única lectura del evento (con sesiones y número
+        de registros) y el cambio se aplica con un UPDATE condicional por versión.
+
+        Args:
+            if_match: Cabecera If-Match del cliente (versión que editó), opcional
+
         Raises:
             NotFoundError: Si el evento no existe
             ValidationError: Si las reglas de negocio no se cumplen
+            PreconditionFailedError: Si If-Match no coincide con la versión actual
+            ConflictError: Si otra petición modificó el evento durante la actualización
         """
-        event = EventService.get_event(db, event_id, include_sessions=True)
+        event = EventService.get_event_detail(db, event_id)
+        check_if_match(if_match, event.version)
+
         update_data = event_update.model_dump(exclude_unset=True)
         if "status" in update_data:
             status_value = update_data["status"]
@@ -86,33 +179,56 @@ class EventService:
                 update_data["status"] = EventStatusDB(status_value.value)
         validate_event_update(event, update_data)
 
+        # Aviso a los asistentes en la misma transacción (se descarta si el UPDATE falla)
+        if update_data:
+            cancelled = (
+                update_data.get("status") == EventStatusDB.CANCELLED
+                and event.status != EventStatusDB.CANCELLED
+            )
+            topic = "event.cancelled" if cancelled else "event.updated"
+            OutboxService.notify_event_attendees(db, topic, event, update_data)
+
+        LiveService.notify_event_changed(db, event_id)
+        CalendarService.invalidate_event(db, event_id)
         updated_event = crud_event.update_event(
-            db, event_id=event_id, event_update=EventUpdate(**update_data)
+            db, event_id=event_id, values=update_data, version=event.version
         )
-
         if not updated_event:
-            raise ValidationError("Error al actualizar el evento")
+            raise ConflictError("El evento fue modificado por otra petición. Vuelve a cargarlo")
 
+        ScheduleService.refresh_event(updated_event)
         return updated_event
 
     @staticmethod
-    def delete_event(db: Session, event_id: int, user: User) -> None:
+    def delete_event(db: Session, event_id: int, user: User) -> Job:
         """
-        Realiza soft delete de un evento y sus relaciones (cascada)
+        Realiza soft delete de un evento y encola el de sus relaciones (cascada)
 
         Al eliminar un evento:
         - Se marca como eliminado (deleted_at)
-        - Se eliminan (soft delete) todas sus sesiones
-        - Se eliminan (soft delete) todos sus registros
+        - Se encola un trabajo event.cascade que elimina (soft delete) en lotes sus
+          sesiones y registros, ocultos desde ya
+
+        Returns:
+            Job: Trabajo del borrado en cascada (consultable en GET /jobs/{id})
 
         Raises:
             NotFoundError: Si el evento no existe
         """
-        EventService.get_event(db, event_id)
+        event = EventService.get_event(db, event_id)
+
+        # Eventos pendientes o en curso: aviso de cancelación a todos los asistentes
+        # (un INSERT ... SELECT antes de eliminar los registros, misma transacción)
+        if event.computed_status in (EventStatus.SCHEDULED, EventStatus.ONGOING):
+            OutboxService.notify_event_attendees(db, "event.cancelled", event)
 
+        LiveService.notify_event_changed(db, event_id)
+        CalendarService.invalidate_event(db, event_id)
         success = crud_event.soft_delete_event(db, event_id=event_id)
         if not success:
             raise ValidationError("Error al eliminar el evento")
+        ScheduleService.cancel_event(event_id)
+        return JobService.enqueue(db, "event.cascade", {"event_id": event_id}, user=user)
 
     @staticmethod
     def get_user_events(
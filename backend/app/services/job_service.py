@@ -0,0 +1,231 @@
+"""
+Servicio de trabajos en segundo plano - Cola duradera en la tabla ``jobs``
+
+Las operaciones pesadas (p. ej. el borrado en cascada de un evento) no se ejecutan en
+la petición: el servicio de dominio encola un trabajo en la misma transacción y el
+endpoint responde 202 con su id, consultable en ``GET /jobs/{id}``.
+
+El runner (tarea asyncio en el backend o ``app.scripts.run_jobs`` como proceso aparte)
+reserva trabajos con FOR UPDATE SKIP LOCKED por prioridad, respeta el límite de
+concurrencia de cada tipo (contando los de todos los workers; el recuento y la reserva
+de un tipo se serializan con un lock consultivo de transacción), ejecuta cada trabajo en
+un hilo con su propia sesión y renueva sus reservas mientras siguen en curso. Los fallos
+se reintentan con backoff exponencial hasta max_attempts; si un worker cae, sus trabajos
+vuelven a la cola al vencer la reserva.
+"""
+
+import asyncio
+import logging
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.db_utils import advisory_xact_lock
+from app.core.exceptions import NotFoundError, PermissionError
+from app.crud import job as crud_job
+from app.database import SessionLocal
+from app.models.job import Job, JobStatus
+from app.models.user import User, UserRole
+from app.services.deletion_service import DeletionService
+
+logger = logging.getLogger("uvicorn.error")
+
+# Longitud máxima del error guardado por intento fallido
+MAX_ERROR_LENGTH = 500
+
+# Prefijo del lock consultivo que serializa las reservas de cada tipo ("jobs:<tipo>")
+CLAIM_LOCK_PREFIX = "jobs:"
+
+
+@dataclass(frozen=True)
+class JobType:
+    """Tipo de trabajo: función que lo ejecuta y sus límites"""
+
+    # handler(db, payload) -> resultado (JSON) o None; puede hacer commit por su cuenta
+    handler: Callable[[Session, dict[str, Any]], dict[str, Any] | None]
+    concurrency: int = 1  # Máximo de trabajos de este tipo en curso a la vez
+    priority: int = 0  # Prioridad por defecto (mayor = antes)
+    max_attempts: int = settings.JOBS_MAX_ATTEMPTS
+
+
+JOB_TYPES: dict[str, JobType] = {
+    "event.cascade": JobType(
+        DeletionService.cascade_job, concurrency=settings.JOBS_CASCADE_CONCURRENCY
+    ),
+}
+
+
+def backoff_delay(attempts: int) -> float:
+    """
+    Espera antes del siguiente intento tras ``attempts`` fallos: exponencial con tope
+    (JOBS_BACKOFF_BASE_SECONDS * 2^(n-1), máximo JOBS_BACKOFF_MAX_SECONDS) y jitter.
+    """
+    delay = min(
+        settings.JOBS_BACKOFF_BASE_SECONDS * 2 ** max(attempts - 1, 0),
+        settings.JOBS_BACKOFF_MAX_SECONDS,
+    )
+    return delay * random.uniform(0.5, 1.0)
+
+
+class JobService:
+    """Encolado, consulta y ejecución de trabajos en segundo plano"""
+
+    @staticmethod
+    def enqueue(
+        db: Session,
+        job_type: str,
+        payload: dict[str, Any],
+        user: User | None = None,
+        priority: int | None = None,
+    ) -> Job:
+        """
+        Encola un trabajo en la transacción actual (sin commit)
+
+        Raises:
+            ValueError: Si el tipo de trabajo no está registrado en JOB_TYPES
+        """
+        if job_type not in JOB_TYPES:
+            raise ValueError(f"Tipo de trabajo desconocido: {job_type}")
+        spec = JOB_TYPES[job_type]
+        return crud_job.create_job(
+            db,
+            job_type,
+            payload,
+            max_attempts=spec.max_attempts,
+            priority=spec.priority if priority is None else priority,
+            user_id=user.id if user else None,
+        )
+
+    @staticmethod
+    def get_job(db: Session, job_id: int, user: User) -> Job:
+        """
+        Obtiene un trabajo (solo quien lo lanzó o un ADMIN)
+
+        Raises:
+            NotFoundError: Si el trabajo no existe
+            PermissionError: Si el trabajo es de otro usuario
+        """
+        job = crud_job.get_job(db, job_id)
+        if not job:
+            raise NotFoundError("Trabajo no encontrado")
+        if job.user_id != user.id and user.role != UserRole.ADMIN:
+            raise PermissionError("No tienes permisos para ver este trabajo")
+        return job
+
+    @staticmethod
+    def claim_ready(session_factory: Callable[[], Session] = SessionLocal) -> list[Job]:
+        """
+        Recupera los trabajos de workers caídos y reserva los pendientes de cada tipo
+        hasta su límite de concurrencia
+
+        El recuento de trabajos en curso y la reserva de cada tipo van en la misma
+        transacción bajo un lock consultivo por tipo: dos workers no pueden contar a la
+        vez los mismos huecos libres y superar el límite entre los dos.
+
+        Returns:
+            Trabajos reservados (separados de la sesión)
+        """
+        db = session_factory()
+        try:
+            requeued = crud_job.requeue_expired(db)
+            db.commit()
+            if requeued:
+                logger.warning("Trabajos: %s reservas vencidas recuperadas", requeued)
+
+            claimed = []
+            for job_type, spec in JOB_TYPES.items():
+                # Se libera con el commit de claim_jobs (o el rollback si no hay hueco)
+                advisory_xact_lock(db, CLAIM_LOCK_PREFIX + job_type)
+                free = spec.concurrency - crud_job.count_running(db, job_type)
+                if free > 0:
+                    claimed += crud_job.claim_jobs(db, job_type, free, settings.JOBS_LEASE_SECONDS)
+                else:
+                    db.rollback()
+            return claimed
+        finally:
+            db.close()
+
+    @staticmethod
+    def renew_leases(
+        job_ids: list[int], session_factory: Callable[[], Session] = SessionLocal
+    ) -> None:
+        """Prolonga JOBS_LEASE_SECONDS la reserva de los trabajos en curso de este worker"""
+        db = session_factory()
+        try:
+            crud_job.renew_leases(db, job_ids, settings.JOBS_LEASE_SECONDS)
+            db.commit()
+        finally:
+            db.close()
+
+    @staticmethod
+    def execute(job: Job, session_factory: Callable[[], Session] = SessionLocal) -> JobStatus:
+        """
+        Ejecuta un trabajo reservado y registra el resultado o el fallo
+
+        Returns:
+            Estado final del intento (SUCCEEDED, PENDING si se reintentará o FAILED)
+        """
+        db = session_factory()
+        try:
+            try:
+                result = JOB_TYPES[job.type].handler(db, job.payload)
+            except Exception as exc:
+                db.rollback()
+                logger.exception("Trabajo %s (%s) fallido", job.id, job.type)
+                error = f"{type(exc).__name__}: {exc}"[:MAX_ERROR_LENGTH]
+                if job.attempts >= job.max_attempts:
+                    crud_job.mark_failed_attempt(db, job.id, error, None)
+                    status = JobStatus.FAILED
+                else:
+                    retry_at = datetime.utcnow() + timedelta(seconds=backoff_delay(job.attempts))
+                    crud_job.mark_failed_attempt(db, job.id, error, retry_at)
+                    status = JobStatus.PENDING
+            else:
+                crud_job.mark_succeeded(db, job.id, result)
+                status = JobStatus.SUCCEEDED
+            db.commit()
+            return status
+        finally:
+            db.close()
+
+    @staticmethod
+    def run_pending(session_factory: Callable[[], Session] = SessionLocal) -> dict[str, int]:
+        """
+        Ejecuta uno a uno los trabajos listos hasta vaciar la cola (scripts y tests)
+
+        Returns:
+            Número de intentos por estado final (succeeded, pending, failed)
+        """
+        stats = {
+            status.value: 0 for status in (JobStatus.SUCCEEDED, JobStatus.PENDING, JobStatus.FAILED)
+        }
+        while jobs := JobService.claim_ready(session_factory):
+            for job in jobs:
+                stats[JobService.execute(job, session_factory).value] += 1
+        return stats
+
+
+async def run_jobs(session_factory: Callable[[], Session] = SessionLocal) -> None:
+    """
+    Tarea en segundo plano: cada JOBS_POLL_INTERVAL_SECONDS renueva las reservas de los
+    trabajos en curso y lanza en hilos los que quepan en el límite de cada tipo.
+    """
+    running: dict[int, asyncio.Task] = {}
+    while True:
+        try:
+            if running:
+                await asyncio.to_thread(JobService.renew_leases, list(running), session_factory)
+            for job in await asyncio.to_thread(JobService.claim_ready, session_factory):
+                task = asyncio.create_task(
+                    asyncio.to_thread(JobService.execute, job, session_factory)
+                )
+                running[job.id] = task
+                task.add_done_callback(lambda _task, job_id=job.id: running.pop(job_id, None))
+        except Exception:
+            logger.exception("Error en el runner de trabajos")
+        await asyncio.sleep(settings.JOBS_POLL_INTERVAL_SECONDS)
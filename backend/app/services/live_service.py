@@ -0,0 +1,172 @@
+"""
+Servicio de actualizaciones en vivo - Plazas y estado de eventos por SSE
+
+Los servicios llaman a ``LiveService.notify_event_changed`` en la misma transacción que
+el cambio (registro, cancelación, edición, eliminación, inicio/fin por tiempo):
+
+- PostgreSQL: ``pg_notify`` dentro de la transacción. NOTIFY solo se entrega al hacer
+  commit (y se descarta con el rollback) y llega a todos los workers, que lo escuchan
+  con ``listen_for_changes``.
+- Otros motores (SQLite en tests/desarrollo): el id se guarda en la sesión y se publica
+  en el proceso tras el commit.
+
+Cada worker reparte los cambios a sus conexiones SSE a través de ``live_updates``, que
+coalesce las actualizaciones a LIVE_UPDATES_MAX_PER_SECOND por evento.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from typing import Any
+
+from sqlalchemy import event as sa_event
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.exceptions import NotFoundError, ValidationError
+from app.core.live import LiveUpdateHub, format_sse, listen_pg_notifications
+from app.crud import event as crud_event
+from app.database import SessionLocal, engine
+from app.models.event import Event
+
+logger = logging.getLogger("uvicorn.error")
+
+# Canal de NOTIFY (payload: id del evento)
+LIVE_CHANNEL = "event_live_updates"
+# Máximo de eventos por conexión SSE de varios eventos
+MAX_LIVE_EVENT_IDS = 100
+# Espera sugerida al navegador antes de reconectar (campo retry de SSE)
+RECONNECT_DELAY_MS = 3000
+
+_PENDING_KEY = "live_event_ids"
+
+
+def event_snapshot(event: Event) -> dict[str, Any]:
+    """Datos en vivo de un evento (lo que muestra la página de detalle)"""
+    return {
+        "event_id": event.id,
+        "capacity": event.capacity,
+        "available_capacity": event.available_capacity,
+        "is_full": event.is_full,
+        "status": event.computed_status.value,
+    }
+
+
+def _load_snapshots(event_ids: set[int]) -> dict[int, dict[str, Any]]:
+    """Loader del hub: lee los eventos cambiados en una sola query (sesión propia)"""
+    db = SessionLocal()
+    try:
+        return {
+            event.id: event_snapshot(event) for event in crud_event.get_events_by_ids(db, event_ids)
+        }
+    finally:
+        db.close()
+
+
+# Hub del proceso: conexiones SSE suscritas por id de evento
+live_updates = LiveUpdateHub(_load_snapshots, min_interval=1 / settings.LIVE_UPDATES_MAX_PER_SECOND)
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _publish_after_commit(session: Session) -> None:
+    for event_id in session.info.pop(_PENDING_KEY, ()):
+        live_updates.mark_dirty(event_id)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+class LiveService:
+    """Publicación y streaming de las actualizaciones en vivo de eventos"""
+
+    @staticmethod
+    def notify_event_changed(db: Session, event_id: int) -> None:
+        """
+        Anuncia el cambio de plazas o estado de un evento al confirmarse la transacción
+        actual (sin commit)
+        """
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(select(func.pg_notify(LIVE_CHANNEL, str(event_id))))
+        else:
+            db.info.setdefault(_PENDING_KEY, set()).add(event_id)
+
+    @staticmethod
+    def get_snapshots(db: Session, event_ids: list[int]) -> dict[int, dict[str, Any]]:
+        """
+        Estado inicial de los eventos de una conexión SSE
+
+        Raises:
+            ValidationError: Si se piden más de MAX_LIVE_EVENT_IDS eventos
+        """
+        unique_ids = set(event_ids)
+        if len(unique_ids) > MAX_LIVE_EVENT_IDS:
+            raise ValidationError(f"Máximo {MAX_LIVE_EVENT_IDS} eventos por conexión")
+        return {
+            event.id: event_snapshot(event)
+            for event in crud_event.get_events_by_ids(db, unique_ids)
+        }
+
+    @staticmethod
+    def get_event_snapshot(db: Session, event_id: int) -> dict[int, dict[str, Any]]:
+        """
+        Estado inicial de la conexión SSE de un evento
+
+        Raises:
+            NotFoundError: Si el evento no existe
+        """
+        snapshots = LiveService.get_snapshots(db, [event_id])
+        if not snapshots:
+            raise NotFoundError("Evento no encontrado")
+        return snapshots
+
+    @staticmethod
+    async def stream(initial: dict[int, dict[str, Any]]) -> AsyncIterator[str]:
+        """
+        Flujo SSE de los eventos de ``initial``: primero su estado actual y después un
+        mensaje ``update`` por cambio (``deleted`` si el evento se elimina), con un
+        comentario de latido cada LIVE_HEARTBEAT_SECONDS. La conexión se cierra tras
+        LIVE_STREAM_MAX_SECONDS y el navegador reconecta solo.
+        """
+        yield format_sse(retry_ms=RECONNECT_DELAY_MS)
+        for snapshot in initial.values():
+            yield format_sse(snapshot, event="update")
+        if not initial:
+            return
+
+        loop_time = asyncio.get_running_loop().time
+        deadline = loop_time() + settings.LIVE_STREAM_MAX_SECONDS
+        subscription = live_updates.subscribe(initial.keys(), initial)
+        try:
+            while (remaining := deadline - loop_time()) > 0:
+                updates = await subscription.get(min(settings.LIVE_HEARTBEAT_SECONDS, remaining))
+                if not updates:
+                    yield ": keepalive\n\n"
+                for event_id, snapshot in updates.items():
+                    if snapshot is None:
+                        yield format_sse({"event_id": event_id}, event="deleted")
+                    else:
+                        yield format_sse(snapshot, event="update")
+        finally:
+            live_updates.unsubscribe(subscription)
+
+
+def _on_notification(payload: str) -> None:
+    try:
+        live_updates.mark_dirty(int(payload))
+    except ValueError:
+        logger.warning("Notificación en vivo inválida: %r", payload)
+
+
+def _connect_listener():
+    """Conexión psycopg2 dedicada al LISTEN (separada del pool)"""
+    connection = engine.raw_connection()
+    connection.detach()
+    return connection.dbapi_connection
+
+
+async def listen_for_changes() -> None:
+    """Tarea en segundo plano (solo PostgreSQL): reparte los NOTIFY de otros workers"""
+    await listen_pg_notifications(_connect_listener, LIVE_CHANNEL, _on_notification)
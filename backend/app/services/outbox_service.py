@@ -0,0 +1,228 @@
+"""
+Servicio de outbox - Notificaciones por email y webhook fuera de la petición
+
+Patrón transactional outbox: los servicios de dominio encolan los mensajes en la tabla
+``outbox_messages`` dentro de la misma transacción que el cambio que los origina
+(registro, cancelación de registro, edición o cancelación de un evento). Si la
+transacción hace rollback, los mensajes se descartan con ella; si hace commit, la
+entrega queda garantizada aunque el proceso caiga justo después.
+
+El dispatcher (tarea asyncio en el backend o ``app.scripts.dispatch_outbox`` como
+proceso aparte) reserva lotes de mensajes, los entrega con concurrencia limitada y
+reintenta los fallos con backoff exponencial hasta OUTBOX_MAX_ATTEMPTS.
+"""
+
+import asyncio
+import logging
+import random
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.delivery import default_adapters
+from app.crud import outbox as crud_outbox
+from app.database import SessionLocal
+from app.models.event import Event
+from app.models.outbox import OutboxChannel
+from app.models.user import User
+
+logger = logging.getLogger("uvicorn.error")
+
+# Longitud máxima del error guardado por intento fallido
+MAX_ERROR_LENGTH = 500
+
+
+def _event_payload(event: Event, values: dict[str, Any] | None = None) -> dict[str, Any]:
+    """
+    Datos del evento incluidos en las notificaciones
+
+    Args:
+        event: Evento (estado leído antes del cambio)
+        values: Columnas modificadas; se aplican sobre el evento y se listan en changes
+    """
+    values = values or {}
+    start_date = values.get("start_date") or event.start_date
+    end_date = values.get("end_date") or event.end_date
+    payload = {
+        "event_id": event.id,
+        "event_name": values.get("name") or event.name,
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "location": values.get("location", event.location),
+    }
+    if values:
+        payload["changes"] = sorted(values)
+    return payload
+
+
+def backoff_delay(attempts: int) -> float:
+    """
+    Espera antes del siguiente intento tras ``attempts`` fallos: exponencial con tope
+    (OUTBOX_BACKOFF_BASE_SECONDS * 2^(n-1), máximo OUTBOX_BACKOFF_MAX_SECONDS) y jitter
+    para que los reintentos de un mismo lote no lleguen todos a la vez.
+    """
+    delay = min(
+        settings.OUTBOX_BACKOFF_BASE_SECONDS * 2 ** max(attempts - 1, 0),
+        settings.OUTBOX_BACKOFF_MAX_SECONDS,
+    )
+    return delay * random.uniform(0.5, 1.0)
+
+
+class OutboxService:
+    """Encolado y entrega de notificaciones"""
+
+    @staticmethod
+    def enqueue_webhooks(db: Session, topic: str, payload: dict[str, Any]) -> None:
+        """Encola el cambio para cada webhook configurado (OUTBOX_WEBHOOK_URLS), sin commit"""
+        for url in settings.OUTBOX_WEBHOOK_URLS:
+            crud_outbox.enqueue(db, topic, OutboxChannel.WEBHOOK, url, payload)
+
+    @staticmethod
+    def notify_registration(db: Session, topic: str, event: Event, user: User) -> None:
+        """
+        Encola el email al asistente y los webhooks de un registro o de su cancelación
+        (sin commit: se confirma con el cambio de dominio)
+        """
+        payload = {**_event_payload(event), "user_id": user.id}
+        crud_outbox.enqueue(db, topic, OutboxChannel.EMAIL, user.email, payload, user_id=user.id)
+        OutboxService.enqueue_webhooks(db, topic, payload)
+
+    @staticmethod
+    def notify_event_attendees(
+        db: Session, topic: str, event: Event, values: dict[str, Any] | None = None
+    ) -> int:
+        """
+        Encola un email para cada asistente del evento (un único INSERT ... SELECT) y los
+        webhooks del cambio, sin commit. Debe llamarse antes de eliminar los registros.
+
+        Args:
+            values: Columnas modificadas en una edición (None en una cancelación)
+
+        Returns:
+            Número de emails encolados
+        """
+        payload = _event_payload(event, values)
+        queued = crud_outbox.enqueue_event_attendees(db, event.id, topic, payload)
+        OutboxService.enqueue_webhooks(db, topic, payload)
+        return queued
+
+    @staticmethod
+    def notify_event_transition(db: Session, topic: str, event: Event) -> None:
+        """Encola los webhooks de un cambio de estado por tiempo (inicio/fin), sin commit"""
+        OutboxService.enqueue_webhooks(db, topic, _event_payload(event))
+
+    @staticmethod
+    def notify_session_reminder(db: Session, session: Any, event: Event) -> int:
+        """
+        Encola el recordatorio de una sesión para cada asistente del evento (un único
+        INSERT ... SELECT), sin commit
+
+        Returns:
+            Número de emails encolados
+        """
+        payload = {
+            **_event_payload(event),
+            "session_id": session.id,
+            "session_title": session.title,
+            "session_start_time": session.start_time.isoformat(),
+        }
+        return crud_outbox.enqueue_event_attendees(db, event.id, "session.reminder", payload)
+
+    @staticmethod
+    async def dispatch_batch(
+        adapters: dict[OutboxChannel, Any] | None = None,
+        batch_size: int | None = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ) -> dict[str, int]:
+        """
+        Reserva y entrega un lote de mensajes pendientes.
+
+        Las operaciones de base de datos (bloqueantes) se ejecutan en hilos; las entregas
+        se hacen en paralelo con un máximo de OUTBOX_CONCURRENCY simultáneas.
+
+        Args:
+            adapters: Adaptador por canal (por defecto, default_adapters())
+            batch_size: Tamaño del lote (por defecto, OUTBOX_BATCH_SIZE)
+            session_factory: Fábrica de sesiones de base de datos
+
+        Returns:
+            Dict con claimed, sent, retried y failed
+        """
+        adapters = adapters or default_adapters()
+        batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+
+        def claim() -> list:
+            db = session_factory()
+            try:
+                return crud_outbox.claim_batch(db, batch_size, settings.OUTBOX_LEASE_SECONDS)
+            finally:
+                db.close()
+
+        messages = await asyncio.to_thread(claim)
+        if not messages:
+            return {"claimed": 0, "sent": 0, "retried": 0, "failed": 0}
+
+        semaphore = asyncio.Semaphore(settings.OUTBOX_CONCURRENCY)
+
+        async def deliver(message) -> str | None:
+            """Entrega un mensaje; retorna None si se entregó o el error"""
+            adapter = adapters.get(message.channel)
+            if adapter is None:
+                return f"Sin adaptador para el canal {message.channel}"
+            async with semaphore:
+                try:
+                    await adapter.send(message)
+                    return None
+                except Exception as exc:
+                    return f"{type(exc).__name__}: {exc}"[:MAX_ERROR_LENGTH]
+
+        errors = await asyncio.gather(*(deliver(message) for message in messages))
+
+        def record() -> dict[str, int]:
+            stats = {"claimed": len(messages), "sent": 0, "retried": 0, "failed": 0}
+            now = datetime.utcnow()
+            db = session_factory()
+            try:
+                sent_ids = []
+                for message, error in zip(messages, errors, strict=True):
+                    if error is None:
+                        sent_ids.append(message.id)
+                        continue
+                    attempts = message.attempts + 1
+                    if attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+                        crud_outbox.mark_failed_attempt(db, message.id, error, None)
+                        stats["failed"] += 1
+                        logger.error("Outbox: mensaje %s descartado: %s", message.id, error)
+                    else:
+                        retry_at = now + timedelta(seconds=backoff_delay(attempts))
+                        crud_outbox.mark_failed_attempt(db, message.id, error, retry_at)
+                        stats["retried"] += 1
+                crud_outbox.mark_sent(db, sent_ids)
+                stats["sent"] = len(sent_ids)
+                db.commit()
+                return stats
+            finally:
+                db.close()
+
+        return await asyncio.to_thread(record)
+
+
+async def dispatch_periodically() -> None:
+    """
+    Tarea en segundo plano: vacía el outbox por lotes. Si el lote sale completo sigue
+    sin esperar; si no, duerme OUTBOX_POLL_INTERVAL_SECONDS.
+    """
+    adapters = default_adapters()
+    while True:
+        try:
+            stats = await OutboxService.dispatch_batch(adapters)
+            if stats["claimed"]:
+                logger.info("Outbox: %s", stats)
+            if stats["claimed"] >= settings.OUTBOX_BATCH_SIZE:
+                continue
+        except Exception:
+            logger.exception("Error en el dispatcher del outbox")
+        await asyncio.sleep(settings.OUTBOX_POLL_INTERVAL_SECONDS)
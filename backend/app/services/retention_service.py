@@ -0,0 +1,170 @@
+"""
+Servicio de retención - Purgado por lotes de filas soft-deleted
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.db_utils import advisory_lock
+from app.core.exceptions import ValidationError
+from app.crud import maintenance as crud_maintenance
+from app.database import SessionLocal
+from app.models.attendee import EventRegistration, SessionRegistration
+from app.models.event import Event
+from app.models.outbox import OutboxMessage
+from app.models.session import Session as EventSession
+
+# Orden de purgado: primero las tablas hijas para respetar las claves foráneas
+PURGE_ORDER = [SessionRegistration, EventRegistration, EventSession, Event]
+PURGE_MODES = ("delete", "archive")
+# Lock consultivo: una sola purga a la vez entre workers y el script purge_deleted
+PURGE_LOCK = "retention_purge"
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class RetentionService:
+    """Servicio para purgar (o archivar) filas soft-deleted fuera de la retención"""
+
+    @staticmethod
+    def purge_table(
+        db: Session,
+        model,
+        cutoff: datetime,
+        mode: str = "delete",
+        batch_size: int = 500,
+        sleep_seconds: float = 0.5,
+    ) -> int:
+        """
+        Purga una tabla en lotes pequeños ordenados por id (keyset).
+
+        Cada lote es una transacción corta: se archiva (modo archive), se borra y se
+        guarda el checkpoint. Entre lotes se duerme sleep_seconds para no saturar la
+        base de datos ni la replicación. Si el proceso se interrumpe, la siguiente
+        ejecución continúa desde el último id del checkpoint.
+
+        Returns:
+            int: Número de filas purgadas
+        """
+        table_name = model.__tablename__
+        checkpoint = crud_maintenance.get_checkpoint(db, table_name)
+        after_id = checkpoint.last_id
+        purged = 0
+
+        while True:
+            rows = crud_maintenance.get_purge_batch(db, model, cutoff, after_id, batch_size)
+            if not rows:
+                # Pasada completa: la próxima ejecución empieza desde el principio
+                checkpoint.last_id = 0
+                db.commit()
+                break
+
+            if mode == "archive":
+                crud_maintenance.archive_rows(db, rows)
+            ids = [row.id for row in rows]
+            deleted = crud_maintenance.hard_delete_rows(db, model, ids)
+
+            after_id = ids[-1]
+            checkpoint.last_id = after_id
+            checkpoint.purged_count += deleted
+            db.commit()
+            db.expunge_all()
+            checkpoint = crud_maintenance.get_checkpoint(db, table_name)
+
+            purged += deleted
+            if sleep_seconds:
+                time.sleep(sleep_seconds)
+
+        return purged
+
+    @staticmethod
+    def purge_deleted(
+        db: Session,
+        retention_days: int | None = None,
+        mode: str | None = None,
+        batch_size: int | None = None,
+        sleep_seconds: float | None = None,
+    ) -> dict[str, int]:
+        """
+        Purga todas las tablas soft-deletables con la política de retención, y los
+        mensajes del outbox entregados hace más de OUTBOX_RETENTION_DAYS (sin archivar).
+
+        Los valores no indicados se toman de la configuración (PURGE_*).
+
+        Raises:
+            ValidationError: Si el modo o la retención no son válidos
+
+        Returns:
+            Dict[str, int]: Filas purgadas por tabla
+        """
+        retention_days = settings.PURGE_RETENTION_DAYS if retention_days is None else retention_days
+        mode = mode or settings.PURGE_MODE
+        if mode not in PURGE_MODES:
+            raise ValidationError(f"Modo de purgado no soportado: {mode}")
+        if retention_days < 0:
+            raise ValidationError("La retención debe ser mayor o igual a 0 días")
+
+        now = datetime.utcnow()
+        batch_size = batch_size or settings.PURGE_BATCH_SIZE
+        if sleep_seconds is None:
+            sleep_seconds = settings.PURGE_BATCH_SLEEP_SECONDS
+        purged = {
+            model.__tablename__: RetentionService.purge_table(
+                db,
+                model,
+                now - timedelta(days=retention_days),
+                mode=mode,
+                batch_size=batch_size,
+                sleep_seconds=sleep_seconds,
+            )
+            for model in PURGE_ORDER
+        }
+        # Notificaciones ya entregadas: no hay nada que restaurar, no se archivan
+        purged[OutboxMessage.__tablename__] = RetentionService.purge_table(
+            db,
+            OutboxMessage,
+            now - timedelta(days=settings.OUTBOX_RETENTION_DAYS),
+            batch_size=batch_size,
+            sleep_seconds=sleep_seconds,
+        )
+        return purged
+
+
+def _purge_once() -> dict[str, int] | None:
+    """
+    Ejecuta una pasada de purgado con su propia sesión de base de datos
+
+    Returns:
+        Filas purgadas por tabla, o None si otro worker o proceso ya está purgando
+    """
+    db = SessionLocal()
+    try:
+        with advisory_lock(db.get_bind(), PURGE_LOCK) as acquired:
+            if not acquired:
+                return None
+            return RetentionService.purge_deleted(db)
+    finally:
+        db.close()
+
+
+async def purge_periodically() -> None:
+    """
+    Tarea en segundo plano: purga cada PURGE_INTERVAL_SECONDS.
+    El trabajo bloqueante se ejecuta en un hilo para no bloquear el event loop. Cada
+    worker la arranca, pero solo purga el que obtiene el lock (PURGE_LOCK).
+    """
+    while True:
+        try:
+            purged = await asyncio.to_thread(_purge_once)
+            if purged is None:
+                logger.info("Purgado de retención en curso en otro proceso")
+            else:
+                logger.info("Purgado de retención completado: %s", purged)
+        except Exception:
+            logger.exception("Error en el purgado de retención")
+        await asyncio.sleep(settings.PURGE_INTERVAL_SECONDS)
@@ -0,0 +1,261 @@
+"""
+Servicio de planificación - Transiciones por tiempo y recordatorios
+
+ONGOING y COMPLETED se calculan a partir de las fechas y no se guardan, así que ningún
+cambio en la base de datos marca el inicio o el fin de un evento. El planificador
+(app.core.scheduler) carga en memoria los instantes de las próximas
+SCHEDULER_HORIZON_SECONDS y al vencer cada uno:
+
+- event.started / event.completed: encola los webhooks de la transición
+- session.reminder: encola un email por asistente SESSION_REMINDER_MINUTES antes de
+  que empiece la sesión
+
+La ventana se recarga con consultas indexadas al arrancar y cada
+SCHEDULER_RELOAD_SECONDS, y las escrituras de este proceso la actualizan al momento
+(refresh_*/cancel_*). Cada recarga empieza en la marca persistente
+(scheduler_checkpoints) y no en ahora: los instantes vencidos con el proceso parado o
+creados por otro worker desde la última recarga se disparan con retraso en vez de
+perderse (como mucho SCHEDULER_CATCHUP_SECONDS hacia atrás). Tras un reinicio, lo
+disparado después de la última marca puede repetirse (al menos una vez).
+
+Con varios workers solo ejecuta el planificador el que obtiene el lock consultivo
+SCHEDULER_LOCK; el resto lo reintenta en cada recarga y toma el relevo si el líder cae.
+Cada handler vuelve a leer la fila al dispararse y descarta el temporizador si el
+instante ya no coincide (evento editado, cancelado o eliminado).
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.db_utils import advisory_lock
+from app.core.scheduler import Timer, TimerScheduler
+from app.crud import event as crud_event
+from app.crud import maintenance as crud_maintenance
+from app.crud import session as crud_session
+from app.database import SessionLocal, engine
+from app.models.event import Event, EventStatusDB
+from app.models.session import Session as EventSession
+from app.services.live_service import LiveService
+from app.services.outbox_service import OutboxService
+
+logger = logging.getLogger("uvicorn.error")
+
+EVENT_STARTED = "event.started"
+EVENT_COMPLETED = "event.completed"
+SESSION_REMINDER = "session.reminder"
+
+# Lock consultivo del líder y nombre de su marca en scheduler_checkpoints
+SCHEDULER_LOCK = "scheduler"
+
+# Planificador del proceso (lo arranca run_scheduler si SCHEDULER_ENABLED)
+scheduler = TimerScheduler()
+
+
+def _reminder_offset() -> timedelta:
+    return timedelta(minutes=settings.SESSION_REMINDER_MINUTES)
+
+
+def _in_window(fire_at: datetime, since: datetime, now: datetime) -> bool:
+    return since < fire_at <= now + timedelta(seconds=settings.SCHEDULER_HORIZON_SECONDS)
+
+
+class ScheduleService:
+    """Carga de la ventana de temporizadores, actualización tras escrituras y handlers"""
+
+    @staticmethod
+    def schedule_timer(key: tuple, fire_at: datetime, since: datetime | None = None) -> None:
+        """
+        Programa la clave si su instante cae en la ventana (since, ahora + horizonte] y
+        no se ha disparado ya; si no, la anula (since por defecto: ahora)
+        """
+        now = scheduler.clock()
+        since = now if since is None else since
+        if _in_window(fire_at, since, now) and not scheduler.was_fired(key, fire_at):
+            scheduler.schedule(key, fire_at)
+        else:
+            scheduler.cancel(key)
+
+    @staticmethod
+    def schedule_event(
+        event_id: int, start_date: datetime, end_date: datetime, since: datetime | None = None
+    ) -> None:
+        """Programa el inicio y el fin del evento que caigan dentro de la ventana"""
+        for kind, fire_at in ((EVENT_STARTED, start_date), (EVENT_COMPLETED, end_date)):
+            ScheduleService.schedule_timer((kind, event_id), fire_at, since)
+
+    @staticmethod
+    def schedule_session(
+        session_id: int, start_time: datetime, since: datetime | None = None
+    ) -> None:
+        """Programa el recordatorio de la sesión si cae dentro de la ventana"""
+        fire_at = start_time - _reminder_offset()
+        ScheduleService.schedule_timer((SESSION_REMINDER, session_id), fire_at, since)
+
+    @staticmethod
+    def refresh_event(event: Event) -> None:
+        """Actualiza los temporizadores de un evento tras crearlo o editarlo"""
+        if not scheduler.running:
+            return
+        if event.status == EventStatusDB.SCHEDULED:
+            ScheduleService.schedule_event(event.id, event.start_date, event.end_date)
+        else:
+            ScheduleService.cancel_event(event.id)
+
+    @staticmethod
+    def cancel_event(event_id: int) -> None:
+        """
+        Anula los temporizadores de un evento (los recordatorios de sus sesiones se
+        descartan al dispararse)
+        """
+        scheduler.cancel((EVENT_STARTED, event_id))
+        scheduler.cancel((EVENT_COMPLETED, event_id))
+
+    @staticmethod
+    def refresh_session(session: EventSession) -> None:
+        """Actualiza el recordatorio de una sesión tras crearla o editarla"""
+        if scheduler.running:
+            ScheduleService.schedule_session(session.id, session.start_time)
+
+    @staticmethod
+    def cancel_session(session_id: int) -> None:
+        """Anula el recordatorio de una sesión eliminada"""
+        scheduler.cancel((SESSION_REMINDER, session_id))
+
+    @staticmethod
+    def advance_checkpoint(db: Session, now: datetime) -> datetime:
+        """
+        Avanza la marca persistente hasta donde todo está disparado (sin commit)
+
+        Tras la carga anterior (synced_at) el heap tenía todos los instantes hasta
+        synced_at, y sale en orden: lo anterior a su próximo vencimiento ya se disparó.
+        La primera carga del proceso no avanza la marca (no sabe qué se disparó).
+
+        Returns:
+            Inicio de la ventana a cargar: la marca, como mucho SCHEDULER_CATCHUP_SECONDS
+            hacia atrás
+        """
+        checkpoint = crud_maintenance.get_scheduler_checkpoint(db, SCHEDULER_LOCK, now)
+        if scheduler.synced_at is not None:
+            mark = scheduler.synced_at
+            deadline = scheduler.next_deadline()
+            if deadline is not None:
+                mark = min(mark, deadline - timedelta(microseconds=1))
+            checkpoint.fired_until = max(checkpoint.fired_until, mark)
+        return max(
+            checkpoint.fired_until, now - timedelta(seconds=settings.SCHEDULER_CATCHUP_SECONDS)
+        )
+
+    @staticmethod
+    def load_window(db: Session) -> int:
+        """
+        Programa los instantes de la ventana (marca, ahora + SCHEDULER_HORIZON_SECONDS]
+        con dos consultas indexadas (eventos por start_date/end_date, sesiones por
+        start_time) y guarda la marca. Los ya vencidos se disparan enseguida; reprogramar
+        una clave ya cargada no la duplica y lo ya disparado no se repite.
+
+        Returns:
+            Número de temporizadores programados en la ventana
+        """
+        now = scheduler.clock()
+        since = ScheduleService.advance_checkpoint(db, now)
+        scheduler.forget_fired(since)
+        until = now + timedelta(seconds=settings.SCHEDULER_HORIZON_SECONDS)
+        offset = _reminder_offset()
+
+        for row in crud_event.get_event_boundaries(db, since, until):
+            ScheduleService.schedule_event(row.id, row.start_date, row.end_date, since)
+        for row in crud_session.get_sessions_starting_between(db, since + offset, until + offset):
+            ScheduleService.schedule_session(row.id, row.start_time, since)
+        db.commit()
+        scheduler.synced_at = now
+        return len(scheduler)
+
+    @staticmethod
+    def handle(timer: Timer, session_factory: Callable[[], Session] = SessionLocal) -> int:
+        """
+        Ejecuta un temporizador vencido: relee la fila, comprueba que el instante sigue
+        vigente y encola las notificaciones en el outbox (una transacción)
+
+        Returns:
+            Número de notificaciones encoladas para asistentes (0 si se descartó)
+        """
+        db = session_factory()
+        try:
+            queued = 0
+            if timer.kind in (EVENT_STARTED, EVENT_COMPLETED):
+                event = crud_event.get_event(db, timer.key[1])
+                if event is None or event.status != EventStatusDB.SCHEDULED:
+                    return 0
+                boundary = event.start_date if timer.kind == EVENT_STARTED else event.end_date
+                if boundary != timer.fire_at:
+                    return 0
+                OutboxService.notify_event_transition(db, timer.kind, event)
+                LiveService.notify_event_changed(db, event.id)
+            elif timer.kind == SESSION_REMINDER:
+                session = crud_session.get_session(db, timer.key[1], include_event=True)
+                if session is None or session.event is None:
+                    return 0
+                if session.event.status != EventStatusDB.SCHEDULED:
+                    return 0
+                if session.start_time - _reminder_offset() != timer.fire_at:
+                    return 0
+                if session.start_time <= scheduler.clock():
+                    return 0  # Recuperado tarde: la sesión ya empezó
+                queued = OutboxService.notify_session_reminder(db, session, session.event)
+            db.commit()
+            logger.info("Planificador: %s %s (%d avisos)", timer.kind, timer.key[1], queued)
+            return queued
+        finally:
+            db.close()
+
+
+for _kind in (EVENT_STARTED, EVENT_COMPLETED, SESSION_REMINDER):
+    scheduler.on(_kind, ScheduleService.handle)
+
+
+def _reload_window() -> int:
+    db = SessionLocal()
+    try:
+        return ScheduleService.load_window(db)
+    finally:
+        db.close()
+
+
+async def _lead() -> None:
+    """Ejecuta el planificador y recarga la ventana cada SCHEDULER_RELOAD_SECONDS"""
+    runner = asyncio.create_task(scheduler.run())
+    try:
+        while True:
+            try:
+                loaded = await asyncio.to_thread(_reload_window)
+                logger.info("Planificador: %d temporizadores en la ventana", loaded)
+            except Exception:
+                logger.exception("Error al cargar la ventana del planificador")
+            await asyncio.sleep(settings.SCHEDULER_RELOAD_SECONDS)
+    finally:
+        runner.cancel()
+        scheduler.clear()
+
+
+async def run_scheduler() -> None:
+    """
+    Tarea en segundo plano: el worker que obtiene el lock consultivo SCHEDULER_LOCK
+    ejecuta el planificador (la primera carga al arrancar); el resto lo reintenta cada
+    SCHEDULER_RELOAD_SECONDS
+    """
+    while True:
+        try:
+            with ExitStack() as stack:
+                lock = advisory_lock(engine, SCHEDULER_LOCK)
+                if await asyncio.to_thread(stack.enter_context, lock):
+                    logger.info("Planificador: este worker es el líder")
+                    await _lead()
+        except Exception:
+            logger.exception("Error en el planificador")
+        await asyncio.sleep(settings.SCHEDULER_RELOAD_SECONDS)
@@ -5,15 +5,21 @@ Servicio de sesiones - Lógica de negocio para gestión de sesiones de eventos
 from datetime import datetime
 from typing import Any
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.core.exceptions import NotFoundError, ValidationError
+from app.core.agenda import EXCLUSION_VIOLATION, find_conflicts, normalize_key
+from app.core.exceptions import ConflictError, NotFoundError, ValidationError
+from app.core.versioning import check_if_match
+from app.crud import attendee as crud_attendee
 from app.crud import session as crud_session
 from app.models.event import Event
 from app.models.session import Session as EventSession
 from app.models.user import User
 from app.schemas.session import SessionCreate, SessionUpdate
+from app.services.calendar_service import CalendarService
 from app.services.event_service import EventService
+from app.services.schedule_service import ScheduleService
 
 
 def _validate_session_within_event_range(
@@ -52,6 +58,61 @@ def _validate_session_capacity(session_capacity: int | None, event: Event) -> No
         )
 
 
+def _validate_no_agenda_conflicts(
+    db: Session,
+    event_id: int,
+    start_time: datetime,
+    end_time: datetime,
+    location: str | None,
+    speaker_name: str | None,
+    exclude_session_id: int | None = None,
+) -> None:
+    """
+    Valida que la sesión no se solape con otra de la misma sala o del mismo ponente.
+
+    Raises:
+        ConflictError: Si hay una sesión solapada en la misma sala o con el mismo ponente
+    """
+    overlapping = crud_session.find_overlapping_sessions(
+        db,
+        event_id=event_id,
+        start_time=start_time,
+        end_time=end_time,
+        location=location,
+        speaker_name=speaker_name,
+        exclude_session_id=exclude_session_id,
+    )
+    if not overlapping:
+        return
+
+    other = overlapping[0]
+    location_key = normalize_key(location)
+    if location_key is not None and normalize_key(other.location) == location_key:
+        raise ConflictError(
+            f"La sala '{other.location}' ya está ocupada por la sesión '{other.title}' "
+            f"({other.start_time.isoformat()} - {other.end_time.isoformat()})"
+        )
+    raise ConflictError(
+        f"El ponente '{other.speaker_name}' ya participa en la sesión '{other.title}' "
+        f"({other.start_time.isoformat()} - {other.end_time.isoformat()})"
+    )
+
+
+def _raise_if_agenda_conflict(db: Session, exc: IntegrityError) -> None:
+    """
+    Traduce la violación de la restricción de exclusión de PostgreSQL (carrera entre dos
+    peticiones que pasaron la validación a la vez) a ConflictError.
+
+    Raises:
+        ConflictError: Si el error es una violación de exclusión
+    """
+    if getattr(exc.orig, "pgcode", None) == EXCLUSION_VIOLATION:
+        db.rollback()
+        raise ConflictError(
+            "La sesión se solapa con otra de la misma sala o del mismo ponente"
+        ) from exc
+
+
 class SessionService:
     """Servicio para operaciones relacionadas con sesiones"""
 
@@ -92,28 +153,61 @@ class SessionService:
         Raises:
             NotFoundError: Si el evento no existe
             ValidationError: Si hay errores de validación
+            ConflictError: Si se solapa con otra sesión de la misma sala o ponente
         """
         event = EventService.verify_event_exists(db, session_data.event_id)
         _validate_session_within_event_range(session_data.start_time, session_data.end_time, event)
         _validate_session_capacity(session_data.capacity, event)
+        _validate_no_agenda_conflicts(
+            db,
+            event_id=event.id,
+            start_time=session_data.start_time,
+            end_time=session_data.end_time,
+            location=session_data.location,
+            speaker_name=session_data.speaker_name,
+        )
 
-        return crud_session.create_session(db=db, session=session_data)
+        try:
+            db_session = crud_session.create_session(db=db, session=session_data)
+        except IntegrityError as exc:
+            _raise_if_agenda_conflict(db, exc)
+            raise
+        ScheduleService.refresh_session(db_session)
+        CalendarService.invalidate_event(db, db_session.event_id)
+        return db_session
 
     @staticmethod
     def update_session(
         db: Session,
         session_id: int,
         session_update: SessionUpdate,
+        if_match: str | None = None,
     ) -> EventSession:
         """
         Actualiza una sesión
 
+        La sesión y su evento se leen en una sola consulta y el cambio se aplica con un
+        UPDATE condicional por versión.
+
+        Args:
+            if_match: Cabecera If-Match del cliente (versión que editó), opcional
+
         Raises:
             NotFoundError: Si la sesión no existe
-            ValidationError: Si la sesión no está dentro del rango del evento
+            ValidationError: Si la sesión no está dentro del rango del evento o la
+                capacidad es menor que las plazas ocupadas
+            PreconditionFailedError: Si If-Match no coincide con la versión actual
+            ConflictError: Si se solapa con otra sesión de la misma sala o ponente, o si
+                otra petición modificó la sesión durante la actualización
         """
-        db_session = SessionService.get_session(db, session_id)
-        event = EventService.verify_event_exists(db, db_session.event_id)
+        db_session = crud_session.get_session(db, session_id=session_id, include_event=True)
+        if not db_session:
+            raise NotFoundError("Sesión no encontrada")
+        event = db_session.event
+        if not event:
+            raise NotFoundError("Evento no encontrado")
+        check_if_match(if_match, db_session.version)
+
         if session_update.start_time or session_update.end_time:
             start_time = session_update.start_time or db_session.start_time
             end_time = session_update.end_time or db_session.end_time
@@ -121,26 +215,72 @@ class SessionService:
             _validate_session_within_event_range(start_time, end_time, event)
         if session_update.capacity:
             _validate_session_capacity(session_update.capacity, event)
+        capacity = session_update.capacity
+        if capacity is not None and capacity < db_session.seats_taken:
+            raise ValidationError(
+                f"La capacidad de la sesión ({capacity}) no puede ser menor "
+                f"que las plazas ya ocupadas ({db_session.seats_taken})"
+            )
 
-        updated_session = crud_session.update_session(
-            db, session_id=session_id, session_update=session_update
-        )
+        values = session_update.model_dump(exclude_unset=True)
+        if values.keys() & {"start_time", "end_time", "location", "speaker_name"}:
+            _validate_no_agenda_conflicts(
+                db,
+                event_id=event.id,
+                start_time=values.get("start_time") or db_session.start_time,
+                end_time=values.get("end_time") or db_session.end_time,
+                location=values.get("location", db_session.location),
+                speaker_name=values.get("speaker_name", db_session.speaker_name),
+                exclude_session_id=session_id,
+            )
 
+        try:
+            updated_session = crud_session.update_session(
+                db, session_id=session_id, values=values, version=db_session.version
+            )
+        except IntegrityError as exc:
+            _raise_if_agenda_conflict(db, exc)
+            raise
         if not updated_session:
-            raise ValidationError("Error al actualizar la sesión")
+            raise ConflictError("La sesión fue modificada por otra petición. Vuelve a cargarla")
 
+        ScheduleService.refresh_session(updated_session)
+        CalendarService.invalidate_event(db, updated_session.event_id)
         return updated_session
 
+    @staticmethod
+    def get_agenda_conflicts(db: Session, event_id: int) -> dict[str, Any]:
+        """
+        Valida la agenda completa de un evento y devuelve todos los conflictos de sala y
+        de ponente (sort-and-sweep en O(n log n), ver app.core.agenda)
+
+        Raises:
+            NotFoundError: Si el evento no existe
+
+        Returns:
+            Dict con event_id, total_sessions y conflicts
+        """
+        EventService.verify_event_exists(db, event_id)
+        slots = crud_session.get_agenda_slots(db, event_id=event_id)
+        return {
+            "event_id": event_id,
+            "total_sessions": len(slots),
+            "conflicts": find_conflicts(slots),
+        }
+
     @staticmethod
     def delete_session(db: Session, session_id: int) -> None:
         """
-        Realiza soft delete de una sesión
+        Realiza soft delete de una sesión y de sus plazas reservadas
 
         Raises:
             NotFoundError: Si la sesión no existe
         """
-        SessionService.get_session(db, session_id)
+        db_session = SessionService.get_session(db, session_id)
 
         success = crud_session.soft_delete_session(db, session_id=session_id)
         if not success:
             raise ValidationError("Error al eliminar la sesión")
+        crud_attendee.soft_delete_session_registrations(db, session_id=session_id)
+        ScheduleService.cancel_session(session_id)
+        CalendarService.invalidate_event(db, db_session.event_id)
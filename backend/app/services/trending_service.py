@@ -0,0 +1,165 @@
+"""
+Servicio de tendencias - Ranking de eventos por velocidad reciente de registros
+
+Cada registro suma 1 en el cubo de TRENDING_BUCKET_SECONDS de su evento
+(event_registration_buckets, misma transacción que el registro). La puntuación de un
+evento es la suma de sus cubos de la ventana (TRENDING_WINDOW_HOURS) con decaimiento
+exponencial por antigüedad: un registro de hace TRENDING_HALF_LIFE_MINUTES vale la mitad
+que uno de ahora. El ranking se calcula con un heap sobre los cubos de la ventana (no
+sobre event_registrations) y se cachea TRENDING_CACHE_TTL_SECONDS por proceso.
+Los cubos que salen de la ventana se borran cada TRENDING_PRUNE_INTERVAL_SECONDS
+(``prune_periodically``, activo por defecto).
+"""
+
+import asyncio
+import heapq
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.cache import TTLCache
+from app.core.db_utils import advisory_lock
+from app.core.exceptions import ValidationError
+from app.crud import analytics as crud_analytics
+from app.crud import event as crud_event
+from app.database import SessionLocal
+from app.schemas.event import EventResponse, TrendingEvent, TrendingEventsResponse
+
+# Lock consultivo: un solo worker borra cubos a la vez
+PRUNE_LOCK = "trending_prune"
+
+logger = logging.getLogger("uvicorn.error")
+
+# Respuesta ya serializable por límite: las peticiones dentro del TTL no tocan la base
+trending_cache = TTLCache(ttl_seconds=settings.TRENDING_CACHE_TTL_SECONDS, max_entries=64)
+
+
+def decayed_scores(buckets: list[dict[str, Any]], now: datetime) -> dict[int, dict[str, Any]]:
+    """
+    Puntuación con decaimiento y registros de la ventana por evento
+
+    La antigüedad de cada cubo se mide desde su punto medio.
+
+    Returns:
+        event_id -> {score, recent_registrations}
+    """
+    half_life = settings.TRENDING_HALF_LIFE_MINUTES * 60
+    half_bucket = timedelta(seconds=settings.TRENDING_BUCKET_SECONDS / 2)
+    scores: dict[int, dict[str, Any]] = defaultdict(
+        lambda: {"score": 0.0, "recent_registrations": 0}
+    )
+    for bucket in buckets:
+        age = max((now - (bucket["bucket_start"] + half_bucket)).total_seconds(), 0)
+        entry = scores[bucket["event_id"]]
+        entry["score"] += bucket["registrations"] * 0.5 ** (age / half_life)
+        entry["recent_registrations"] += bucket["registrations"]
+    return scores
+
+
+class TrendingService:
+    """Servicio para el ranking de eventos en tendencia"""
+
+    @staticmethod
+    def get_trending_events(db: Session, limit: int = 10) -> TrendingEventsResponse:
+        """
+        Obtiene los eventos con más registros recientes (puntuación con decaimiento),
+        excluyendo eventos eliminados, cancelados o terminados
+
+        Raises:
+            ValidationError: Si limit no está entre 1 y TRENDING_MAX_LIMIT
+
+        Returns:
+            TrendingEventsResponse (cacheada TRENDING_CACHE_TTL_SECONDS)
+        """
+        if not 1 <= limit <= settings.TRENDING_MAX_LIMIT:
+            raise ValidationError(f"limit debe estar entre 1 y {settings.TRENDING_MAX_LIMIT}")
+        trending = trending_cache.get(limit)
+        if trending is None:
+            trending = TrendingService.compute_trending(db, limit)
+            trending_cache.set(limit, trending)
+        return trending
+
+    @staticmethod
+    def compute_trending(db: Session, limit: int) -> TrendingEventsResponse:
+        """
+        Calcula el ranking sin caché: una query de cubos de la ventana, top ``limit``
+        con heapq y una query de los eventos elegidos
+        """
+        now = datetime.utcnow()
+        window_start = crud_analytics.bucket_start(
+            now - timedelta(hours=settings.TRENDING_WINDOW_HOURS)
+        )
+        scores = decayed_scores(crud_analytics.get_trending_buckets(db, window_start), now)
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1]["score"], -item[0]))
+        events = {
+            event.id: event
+            for event in crud_event.get_events_by_ids(db, [event_id for event_id, _ in top])
+        }
+
+        return TrendingEventsResponse(
+            generated_at=now,
+            window_hours=settings.TRENDING_WINDOW_HOURS,
+            events=[
+                TrendingEvent(
+                    # Respuesta compartida entre usuarios: sin is_registered
+                    event=EventResponse.model_validate(events[event_id]).model_copy(
+                        update={"is_registered": None}
+                    ),
+                    score=round(entry["score"], 3),
+                    recent_registrations=entry["recent_registrations"],
+                )
+                for event_id, entry in top
+                if event_id in events
+            ],
+        )
+
+    @staticmethod
+    def prune_buckets(db: Session) -> int:
+        """
+        Borra los cubos que ya salieron de la ventana (sin commit)
+
+        Returns:
+            Número de cubos borrados
+        """
+        cutoff = crud_analytics.bucket_start(
+            datetime.utcnow() - timedelta(hours=settings.TRENDING_WINDOW_HOURS)
+        )
+        return crud_analytics.delete_buckets_before(db, cutoff)
+
+
+def _prune_once() -> int | None:
+    """
+    Borra los cubos fuera de la ventana con su propia sesión de base de datos
+
+    Returns:
+        Cubos borrados, o None si otro worker ya los está borrando
+    """
+    db = SessionLocal()
+    try:
+        with advisory_lock(db.get_bind(), PRUNE_LOCK) as acquired:
+            if not acquired:
+                return None
+            pruned = TrendingService.prune_buckets(db)
+            db.commit()
+            return pruned
+    finally:
+        db.close()
+
+
+async def prune_periodically() -> None:
+    """
+    Tarea en segundo plano: borra los cubos fuera de la ventana cada
+    TRENDING_PRUNE_INTERVAL_SECONDS (el trabajo bloqueante se ejecuta en un hilo)
+    """
+    while True:
+        try:
+            pruned = await asyncio.to_thread(_prune_once)
+            if pruned:
+                logger.info("Tendencias: %s cubos fuera de la ventana borrados", pruned)
+        except Exception:
+            logger.exception("Error al borrar los cubos de tendencias")
+        await asyncio.sleep(settings.TRENDING_PRUNE_INTERVAL_SECONDS)
@@ -6,10 +6,21 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.core.exceptions import NotFoundError, ValidationError
+from app.core.rate_limit import rate_limiter
+from app.crud import attendee as crud_attendee
 from app.crud import user as crud_user
 from app.models.user import User, UserRole
-from app.schemas.user import UserAdminUpdate, UserCreate
+from app.schemas.event import EventResponse
+from app.schemas.user import (
+    UserAdminUpdate,
+    UserCreate,
+    UserProfileResponse,
+    UserResponse,
+    UserSearchMode,
+)
+from app.services.calendar_service import CalendarService, user_feed_key
 
 
 class UserService:
@@ -47,20 +58,58 @@ class UserService:
         """
         Autentica un usuario
 
+        El backoff por cuenta se comprueba antes de consultar la base de datos o bcrypt.
+
         Raises:
+            TooManyRequestsError: Si la cuenta está bloqueada por fallos recientes
             ValidationError: Si las credenciales son incorrectas
         """
+        rate_limiter.check_login(email)
         user = crud_user.authenticate_user(db, email, password)
         if not user:
+            rate_limiter.record_login_failure(email)
             raise ValidationError("Email o contraseña incorrectos")
+        rate_limiter.reset_login(email)
         return user
 
+    @staticmethod
+    def get_profile(
+        db: Session, user: User, include: set[str] | None = None
+    ) -> UserProfileResponse:
+        """
+        Obtiene el perfil del usuario con contadores agregados (una sola consulta).
+
+        Args:
+            db: Sesión de base de datos
+            user: Usuario autenticado
+            include: Datos embebidos opcionales ("upcoming_events")
+
+        Returns:
+            UserProfileResponse: Perfil con contadores y, opcionalmente, vista previa
+        """
+        include = include or set()
+        counts = crud_user.get_profile_counts(db, user_id=user.id)
+
+        upcoming_events = None
+        if "upcoming_events" in include:
+            events = crud_attendee.get_user_upcoming_registered_events(
+                db, user_id=user.id, limit=settings.PROFILE_PREVIEW_SIZE
+            )
+            upcoming_events = [EventResponse.model_validate(event) for event in events]
+
+        return UserProfileResponse(
+            **UserResponse.model_validate(user).model_dump(),
+            **counts,
+            upcoming_events=upcoming_events,
+        )
+
     @staticmethod
     def list_users(
         db: Session,
         page: int = 1,
         per_page: int = 20,
         search: str | None = None,
+        search_mode: UserSearchMode = UserSearchMode.CONTAINS,
         role: UserRole | None = None,
         is_active: bool | None = None,
     ) -> tuple[list[User], dict[str, Any]]:
@@ -72,7 +121,13 @@ class UserService:
             Tuple[List[User], Dict]: (usuarios, metadata de paginación)
         """
         return crud_user.get_users(
-            db, page=page, per_page=per_page, search=search, role=role, is_active=is_active
+            db,
+            page=page,
+            per_page=per_page,
+            search=search,
+            search_mode=search_mode,
+            role=role,
+            is_active=is_active,
         )
 
     @staticmethod
@@ -91,6 +146,8 @@ class UserService:
         UserService.get_user_by_id(db, user_id)
 
         updated_user = crud_user.update_user(db, user_id=user_id, user_update=user_update)
+        # Un usuario desactivado deja de tener feed (404)
+        CalendarService.invalidate_feed(db, user_feed_key(user_id))
 
         if not updated_user:
             raise ValidationError("Error al actualizar el usuario")
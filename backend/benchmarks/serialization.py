@@ -0,0 +1,103 @@
+"""
+Microbenchmark: serialización de respuestas JSON
+
+Compara, para una página de EventListResponse (100 eventos por defecto):
+- camino clásico: model_validate en el handler + validación de response_model en
+  FastAPI + jsonable_encoder + json de la librería estándar
+- camino rápido: app.core.serialization.serialize (TypeAdapter + una sola validación)
+
+Uso:
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --items 100 --rounds 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+
+from app.core.serialization import serialize  # noqa: E402
+from app.models.event import EventStatus  # noqa: E402
+from app.schemas.event import EventListResponse, EventResponse  # noqa: E402
+
+
+def build_page(items: int) -> tuple[list[SimpleNamespace], dict]:
+    """Construye objetos con los atributos de Event (como los devuelve el ORM)"""
+    now = datetime(2026, 1, 1, 10, 0, 0)
+    events = [
+        SimpleNamespace(
+            id=i,
+            name=f"Evento {i}",
+            description="Descripción del evento " * 5,
+            location="Auditorio principal",
+            start_date=now + timedelta(days=i),
+            end_date=now + timedelta(days=i, hours=8),
+            capacity=200,
+            computed_status=EventStatus.SCHEDULED,
+            creator_id=1,
+            created_at=now,
+            available_capacity=150,
+            is_full=False,
+        )
+        for i in range(1, items + 1)
+    ]
+    pagination = {
+        "page": 1,
+        "per_page": items,
+        "total_count": items * 10,
+        "total_pages": 10,
+        "has_next": True,
+        "has_prev": False,
+    }
+    return events, pagination
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de serialización de respuestas")
+    parser.add_argument("--items", type=int, default=100, help="Eventos por página")
+    parser.add_argument("--rounds", type=int, default=200, help="Repeticiones por camino")
+    args = parser.parse_args()
+
+    events, pagination = build_page(args.items)
+    field = create_response_field(name="response", type_=EventListResponse)
+    loop = asyncio.new_event_loop()
+
+    def classic() -> bytes:
+        content = EventListResponse(
+            events=[EventResponse.model_validate(event) for event in events],
+            pagination=pagination,
+        )
+        data = loop.run_until_complete(serialize_response(field=field, response_content=content))
+        return json.dumps(jsonable_encoder(data), ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+    def fast() -> bytes:
+        return serialize(EventListResponse, {"events": events, "pagination": pagination})
+
+    assert json.loads(classic()) == json.loads(
+        fast()
+    ), "Los dos caminos deben producir el mismo JSON"
+
+    print(f"📊 EventListResponse con {args.items} eventos, {args.rounds} repeticiones")
+    results = {}
+    for name, func in (("clásico", classic), ("rápido", fast)):
+        seconds = min(timeit.repeat(func, number=args.rounds, repeat=5)) / args.rounds
+        results[name] = seconds
+        print(f"   {name:8s} {seconds * 1000:8.3f} ms/respuesta")
+    print(f"✅ Mejora: {results['clásico'] / results['rápido']:.1f}x")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
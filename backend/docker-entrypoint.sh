@@ -1,45 +1,63 @@
 #!/bin/bash
 set -e
 
+# Marca de tiempo del arranque (ms) para medir el tiempo hasta que la app está lista
+export BOOT_STARTED_AT=$(date +%s%3N)
+
+elapsed() {
+  echo "$(( $(date +%s%3N) - BOOT_STARTED_AT )) ms"
+}
+
 echo "🚀 Iniciando backend..."
 
+DB_USER=${POSTGRES_USER:-postgres}
+DB_NAME=${POSTGRES_DB:-mis_eventos}
+export PGPASSWORD=${POSTGRES_PASSWORD:-postgres}
+
 # Esperar a que PostgreSQL esté listo
 echo "⏳ Esperando a que PostgreSQL esté disponible..."
-until pg_isready -h db -p 5432 -U ${POSTGRES_USER:-postgres} > /dev/null 2>&1; do
-  echo "PostgreSQL no está listo aún, esperando..."
-  sleep 2
+until pg_isready -h db -p 5432 -U "$DB_USER" > /dev/null 2>&1; do
+  sleep 0.5
 done
 
-echo "✅ PostgreSQL está disponible"
+echo "✅ PostgreSQL está disponible ($(elapsed))"
 
-# Crear extensión unaccent para búsquedas sin acentos
-echo "🔧 Creando extensión unaccent..."
-PGPASSWORD=${POSTGRES_PASSWORD:-postgres} psql -h db -U ${POSTGRES_USER:-postgres} -d ${POSTGRES_DB:-mis_eventos} -c "CREATE EXTENSION IF NOT EXISTS unaccent;" || echo "⚠️  Advertencia: Error al crear extensión unaccent (puede ser normal si ya existe)"
-
-# Verificar si hay migraciones existentes
-MIGRATIONS_DIR="alembic/versions"
-MIGRATION_COUNT=$(find "$MIGRATIONS_DIR" -name "*.py" -not -name "__init__.py" 2>/dev/null | wc -l || echo "0")
+# Ejecutar migraciones versionadas (alembic/versions). Nunca se autogeneran al arrancar:
+# los cambios de esquema se crean con `alembic revision --autogenerate` y se versionan.
+echo "📦 Ejecutando migraciones de base de datos..."
+alembic upgrade main@head || {
+    echo "⚠️  Error al ejecutar migraciones"
+    exit 1
+}
 
-# Si no hay migraciones, generar la inicial automáticamente desde los modelos
-if [ "$MIGRATION_COUNT" -eq "0" ]; then
-    echo "📝 No se encontraron migraciones. Generando migración inicial desde los modelos..."
-    alembic revision --autogenerate -m "Initial migration - create all tables" || {
-        echo "⚠️  Error al generar migración automática. Verifica que los modelos estén correctos."
+# Rama opcional: particionar event_registrations (PARTITION_EVENT_REGISTRATIONS=hash|range)
+if [ -n "$PARTITION_EVENT_REGISTRATIONS" ]; then
+    echo "🧩 Aplicando particionado de event_registrations ($PARTITION_EVENT_REGISTRATIONS)..."
+    alembic -x strategy="$PARTITION_EVENT_REGISTRATIONS" upgrade partitioning@head || {
+        echo "⚠️  Error al particionar event_registrations"
         exit 1
     }
-    echo "✅ Migración inicial generada automáticamente"
 fi
+echo "✅ Migraciones aplicadas ($(elapsed))"
 
-# Ejecutar migraciones
-echo "📦 Ejecutando migraciones de base de datos..."
-alembic upgrade head || {
-    echo "⚠️  Error al ejecutar migraciones"
-    exit 1
-}
+# Crear usuarios iniciales (admin y organizador) solo si faltan.
+# La consulta evita arrancar Python y calcular hashes bcrypt en cada reinicio.
+ADMIN_EMAIL=${ADMIN_EMAIL:-admin@mis-eventos.com}
+ORGANIZER_EMAIL=${ORGANIZER_EMAIL:-organizer@mis-eventos.com}
+SEED_COUNT=$(psql -h db -U "$DB_USER" -d "$DB_NAME" -tA \
+  -v admin="$ADMIN_EMAIL" -v organizer="$ORGANIZER_EMAIL" <<'SQL' 2>/dev/null || echo "0"
+SELECT count(*) FROM users
+WHERE (email = :'admin' AND role = 'ADMIN') OR (email = :'organizer' AND role = 'ORGANIZER');
+SQL
+)
 
-# Crear usuarios iniciales (admin y organizador)
-echo "👥 Creando usuarios iniciales..."
-python -m app.scripts.create_admin || echo "⚠️  Advertencia: Error al crear usuarios iniciales (puede ser normal si ya existen)"
+if [ "$SEED_COUNT" = "2" ]; then
+    echo "👥 Usuarios iniciales ya existen, se omite su creación"
+else
+    echo "👥 Creando usuarios iniciales..."
+    python -m app.scripts.create_admin || echo "⚠️  Advertencia: Error al crear usuarios iniciales (puede ser normal si ya existen)"
+fi
+echo "✅ Preparación completada ($(elapsed))"
 
 # Ejecutar el comando pasado como argumento
 echo "🎯 Iniciando aplicación..."
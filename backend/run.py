@@ -1,10 +1,14 @@
 """
 Entry point para ejecutar la aplicación FastAPI
+
+Por defecto arranca en modo producción (sin auto-reload). Para desarrollo:
+    RELOAD=true python run.py
 """
 
 import uvicorn
 
 from app import create_app
+from app.config import settings
 
 app = create_app()
 
@@ -13,6 +17,7 @@ if __name__ == "__main__":
         "run:app",
         host="0.0.0.0",
         port=5000,
-        reload=True,  # Auto-reload en desarrollo
+        reload=settings.RELOAD,
+        workers=None if settings.RELOAD else settings.WEB_CONCURRENCY,
         log_level="info",
     )
@@ -2,11 +2,14 @@ import os
 from datetime import timedelta
 
 import pytest
+from fastapi import Request
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from app import create_app
+from app.core.idempotency import idempotency_store
+from app.core.rate_limit import rate_limiter
 from app.core.security import create_access_token, get_password_hash
 from app.database import Base, get_db
 from app.models.user import User, UserRole
@@ -17,7 +20,19 @@ test_engine = create_engine(
     TEST_DATABASE_URL,
     connect_args={"check_same_thread": False} if "sqlite" in TEST_DATABASE_URL else {},
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=test_engine
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limits():
+    """Each test starts with empty rate limit buckets and idempotency keys."""
+    rate_limiter.backend.clear()
+    idempotency_store.clear()
+    yield
+    rate_limiter.backend.clear()
+    idempotency_store.clear()
 
 
 @pytest.fixture(scope="function")
@@ -38,11 +53,10 @@ def client(db):
     """Create a test client for the app."""
     app = create_app()
 
-    def override_get_db():
-        try:
-            yield db
-        finally:
-            pass
+    def override_get_db(request: Request):
+        # Misma sesión en todo el test; UnitOfWorkRoute la confirma al final de cada petición
+        request.state.db = db
+        yield db
 
     app.dependency_overrides[get_db] = override_get_db
     yield TestClient(app)
@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from app.core.agenda import find_conflicts
+
+BASE = datetime(2030, 1, 1, 9, 0)
+
+
+def _slot(session_id, start_hours, end_hours, location=None, speaker_name=None):
+    return SimpleNamespace(
+        id=session_id,
+        start_time=BASE + timedelta(hours=start_hours),
+        end_time=BASE + timedelta(hours=end_hours),
+        location=location,
+        speaker_name=speaker_name,
+    )
+
+
+def test_find_conflicts_sweep():
+    """Test overlaps per room and speaker; back-to-back sessions do not conflict."""
+    conflicts = find_conflicts(
+        [
+            _slot(1, 0, 2, location="Sala A", speaker_name="Ana"),
+            _slot(2, 1, 3, location="sala a "),  # Misma sala normalizada, solapa con 1
+            _slot(3, 2, 4, location="Sala A", speaker_name="ana"),  # Empieza cuando acaba 1
+            _slot(4, 5, 6, location="Sala B", speaker_name="Luis"),
+        ]
+    )
+    pairs = {(c["kind"], c["session_id"], c["conflicting_session_id"]) for c in conflicts}
+    assert pairs == {("location", 1, 2), ("location", 2, 3)}
+    first = conflicts[0]
+    assert first["overlap_start"] == BASE + timedelta(hours=1)
+    assert first["overlap_end"] == BASE + timedelta(hours=2)
+
+
+def test_find_conflicts_many_sessions_same_room():
+    """Test that the sweep reports every overlapping pair in a crowded room."""
+    slots = [_slot(i, i * 0.5, i * 0.5 + 2, location="Auditorio") for i in range(10)]
+    conflicts = find_conflicts(slots)
+    # Cada sesión solapa con las 3 siguientes (empiezan 0.5h, 1h y 1.5h después)
+    assert len(conflicts) == 7 * 3 + 2 + 1
+
+
+def test_find_conflicts_trims_only_spaces():
+    """Test keys are normalized like SQL btrim: a trailing tab is a different room."""
+    conflicts = find_conflicts(
+        [
+            _slot(1, 0, 2, location="Sala 1"),
+            _slot(2, 1, 3, location="Sala 1\t"),
+            _slot(3, 1, 3, location=" sala 1 "),
+        ]
+    )
+    pairs = {(c["session_id"], c["conflicting_session_id"]) for c in conflicts}
+    assert pairs == {(1, 3)}
+
+
+def _session_payload(event, title, start_hours, end_hours, **extra):
+    return {
+        "event_id": event.id,
+        "title": title,
+        "start_time": (event.start_date + timedelta(hours=start_hours)).isoformat(),
+        "end_time": (event.start_date + timedelta(hours=end_hours)).isoformat(),
+        **extra,
+    }
+
+
+def test_create_session_room_conflict(
+    client, db, test_user_organizer, auth_headers_organizer, test_event_data
+):
+    """Test that double-booking a room or a speaker is rejected with 409."""
+    from app.crud import event as crud_event
+    from app.schemas.event import EventCreate
+
+    event = crud_event.create_event(db, EventCreate(**test_event_data), test_user_organizer.id)
+    first = client.post(
+        "/api/v1/sessions/",
+        json=_session_payload(event, "Keynote", 1, 3, location="Sala A", speaker_name="Ana"),
+        headers=auth_headers_organizer,
+    )
+    assert first.status_code == 201
+
+    room = client.post(
+        "/api/v1/sessions/",
+        json=_session_payload(event, "Taller", 2, 4, location="sala a"),
+        headers=auth_headers_organizer,
+    )
+    assert room.status_code == 409
+    speaker = client.post(
+        "/api/v1/sessions/",
+        json=_session_payload(event, "Panel", 2, 4, location="Sala B", speaker_name="Ana"),
+        headers=auth_headers_organizer,
+    )
+    assert speaker.status_code == 409
+    back_to_back = client.post(
+        "/api/v1/sessions/",
+        json=_session_payload(event, "Cierre", 3, 4, location="Sala A", speaker_name="Ana"),
+        headers=auth_headers_organizer,
+    )
+    assert back_to_back.status_code == 201
+
+
+def test_agenda_conflicts_endpoint(
+    client, db, test_user_organizer, auth_headers_organizer, test_event_data
+):
+    """Test the bulk agenda validation endpoint."""
+    from app.crud import event as crud_event
+    from app.models.session import Session as EventSession
+    from app.schemas.event import EventCreate
+
+    event = crud_event.create_event(db, EventCreate(**test_event_data), test_user_organizer.id)
+    # Sesiones cargadas directamente (p. ej. importadas) sin pasar por la validación
+    for title, start, end in (("A", 1, 3), ("B", 2, 4), ("C", 5, 6)):
+        db.add(
+            EventSession(
+                event_id=event.id,
+                title=title,
+                location="Sala A",
+                start_time=event.start_date + timedelta(hours=start),
+                end_time=event.start_date + timedelta(hours=end),
+            )
+        )
+    db.commit()
+
+    response = client.get(
+        f"/api/v1/sessions/event/{event.id}/conflicts", headers=auth_headers_organizer
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_sessions"] == 3
+    assert len(data["conflicts"]) == 1
+    assert data["conflicts"][0]["kind"] == "location"
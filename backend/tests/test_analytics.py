@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import event as sa_event
+
+from app.models.analytics import DailyEventStats
+
+
+def _create_event(client, headers, test_event_data):
+    return client.post("/api/v1/events/", json=test_event_data, headers=headers).json()["id"]
+
+
+def test_rollups_follow_registrations_and_signups(
+    client,
+    db,
+    test_user_admin,
+    auth_headers_admin,
+    auth_headers_organizer,
+    auth_headers_attendee,
+    test_event_data,
+):
+    """Test registrations, cancellations and signups are counted in the daily rollups."""
+    event_id = _create_event(client, auth_headers_organizer, test_event_data)
+    client.post(f"/api/v1/attendees/register/{event_id}", headers=auth_headers_attendee)
+    client.delete(f"/api/v1/attendees/unregister/{event_id}", headers=auth_headers_attendee)
+    client.post(f"/api/v1/attendees/register/{event_id}", headers=auth_headers_attendee)
+    client.post(
+        "/api/v1/auth/register",
+        json={"email": "new@test.com", "password": "password123", "full_name": "New"},
+    )
+    today = datetime.utcnow().date().isoformat()
+
+    response = client.get("/api/v1/analytics/registrations", headers=auth_headers_admin)
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["days"]) == 30 and data["date_to"] == today
+    assert data["days"][-1] == {"day": today, "registrations": 2, "cancellations": 1}
+    assert (data["total_registrations"], data["total_cancellations"]) == (2, 1)
+
+    signups = client.get("/api/v1/analytics/signups", headers=auth_headers_admin).json()
+    assert signups["days"][-1] == {"day": today, "signups": 1}
+    assert signups["by_role"] == {"admin": 0, "organizer": 0, "attendee": 1}
+
+    event = client.get(f"/api/v1/analytics/events/{event_id}", headers=auth_headers_admin).json()
+    assert event["registered_count"] == 1
+    assert event["fill_rate"] == 1 / test_event_data["capacity"]
+    assert event["total_registrations"] == 2
+
+
+def test_dashboard_reads_only_rollups(
+    client, db, test_user_attendee, auth_headers_admin, auth_headers_attendee
+):
+    """Test the dashboard series never query the raw registrations or users tables."""
+    day = datetime.utcnow().date() - timedelta(days=400)
+    db.add(DailyEventStats(day=day, event_id=1, registrations=5, cancellations=2))
+    db.commit()
+    statements = []
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    sa_event.listen(db.bind, "before_cursor_execute", listener)
+    try:
+        response = client.get(
+            "/api/v1/analytics/registrations",
+            params={"date_from": (day - timedelta(days=1)).isoformat()},
+            headers=auth_headers_admin,
+        )
+    finally:
+        sa_event.remove(db.bind, "before_cursor_execute", listener)
+
+    assert response.status_code == 200
+    assert response.json()["total_registrations"] == 5
+    reads = [s for s in statements if "daily_event_stats" in s or "event_registrations" in s]
+    assert reads and all("event_registrations" not in s for s in reads)
+
+    forbidden = client.get("/api/v1/analytics/registrations", headers=auth_headers_attendee)
+    assert forbidden.status_code == 403
+    invalid = client.get(
+        "/api/v1/analytics/signups",
+        params={"date_from": "2030-01-02", "date_to": "2030-01-01"},
+        headers=auth_headers_admin,
+    )
+    assert invalid.status_code == 400
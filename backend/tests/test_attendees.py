@@ -79,3 +79,73 @@ def test_check_registration_true(client, test_event_for_attendee, auth_headers_a
     assert response.status_code == 200
     data = response.json()
     assert data["is_registered"] is True
+
+
+def test_registration_counter_and_capacity(
+    client, db, test_event_for_attendee, auth_headers_attendee
+):
+    """Test that registered_count tracks registrations and blocks full events."""
+    event_id = test_event_for_attendee.id
+    client.post(f"/api/v1/attendees/register/{event_id}", headers=auth_headers_attendee)
+    db.refresh(test_event_for_attendee)
+    assert test_event_for_attendee.registered_count == 1
+
+    client.delete(f"/api/v1/attendees/unregister/{event_id}", headers=auth_headers_attendee)
+    db.refresh(test_event_for_attendee)
+    assert test_event_for_attendee.registered_count == 0
+
+    # Con la capacidad ya ocupada el UPDATE condicional rechaza el registro
+    test_event_for_attendee.registered_count = test_event_for_attendee.capacity
+    db.commit()
+    response = client.post(f"/api/v1/attendees/register/{event_id}", headers=auth_headers_attendee)
+    assert response.status_code == 400
+
+
+def test_batch_check_and_is_registered_flag(
+    client, db, test_event_for_attendee, test_user_organizer, auth_headers_attendee, test_event_data
+):
+    """Test the batch registration check and is_registered on list and detail."""
+    from app.crud import event as crud_event
+    from app.schemas.event import EventCreate
+
+    other = crud_event.create_event(db, EventCreate(**test_event_data), test_user_organizer.id)
+    registered_id = test_event_for_attendee.id
+    client.post(f"/api/v1/attendees/register/{registered_id}", headers=auth_headers_attendee)
+
+    response = client.get(
+        f"/api/v1/attendees/check?event_ids={registered_id}&event_ids={other.id}&event_ids=999",
+        headers=auth_headers_attendee,
+    )
+    assert response.status_code == 200
+    assert response.json()["registrations"] == {
+        str(registered_id): True,
+        str(other.id): False,
+        "999": False,
+    }
+
+    events = client.get("/api/v1/events/", headers=auth_headers_attendee).json()["events"]
+    assert {e["id"]: e["is_registered"] for e in events} == {registered_id: True, other.id: False}
+    anonymous = client.get("/api/v1/events/").json()["events"]
+    assert all(e["is_registered"] is None for e in anonymous)
+    # Un token inválido en un endpoint público se trata como petición anónima
+    invalid = client.get("/api/v1/events/", headers={"Authorization": "Bearer invalid"})
+    assert invalid.status_code == 200
+
+    detail = client.get(f"/api/v1/events/{registered_id}", headers=auth_headers_attendee)
+    assert detail.json()["is_registered"] is True
+
+
+def test_register_closed_once_event_started(
+    client, db, test_event_for_attendee, auth_headers_attendee
+):
+    """Test that registration closes when the event starts."""
+    from datetime import datetime, timedelta
+
+    test_event_for_attendee.start_date = datetime.utcnow() - timedelta(minutes=1)
+    db.commit()
+
+    response = client.post(
+        f"/api/v1/attendees/register/{test_event_for_attendee.id}", headers=auth_headers_attendee
+    )
+    assert response.status_code == 400
+    assert "cerradas" in response.json()["detail"]
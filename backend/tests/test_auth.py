@@ -55,3 +55,34 @@ def test_get_current_user_no_token(client):
     """Test getting current user without token."""
     response = client.get("/api/v1/auth/me")
     assert response.status_code in [401, 403]
+
+
+def test_get_current_user_profile_counts(
+    client,
+    test_user_organizer,
+    auth_headers_organizer,
+    auth_headers_attendee,
+    test_event_data,
+):
+    """Test profile returns aggregate counts and the optional upcoming preview."""
+    event_id = client.post(
+        "/api/v1/events/", json=test_event_data, headers=auth_headers_organizer
+    ).json()["id"]
+    client.post(f"/api/v1/attendees/register/{event_id}", headers=auth_headers_attendee)
+
+    response = client.get("/api/v1/auth/me", headers=auth_headers_attendee)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["registered_events_count"] == 1
+    assert data["upcoming_events_count"] == 1
+    assert data["upcoming_events"] is None
+
+    response = client.get("/api/v1/auth/me?include=upcoming_events", headers=auth_headers_attendee)
+    assert [event["id"] for event in response.json()["upcoming_events"]] == [event_id]
+
+    organizer_data = client.get("/api/v1/auth/me", headers=auth_headers_organizer).json()
+    assert organizer_data["created_events_count"] == 1
+
+    client.delete(f"/api/v1/attendees/unregister/{event_id}", headers=auth_headers_attendee)
+    data = client.get("/api/v1/auth/me", headers=auth_headers_attendee).json()
+    assert data["registered_events_count"] == 0
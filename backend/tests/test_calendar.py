@@ -0,0 +1,219 @@
+from datetime import timedelta
+
+import pytest
+
+from app.core import unit_of_work
+from app.core.icalendar import escape_text, fold_line
+from app.core.security import decode_access_token
+from app.crud import calendar as crud_calendar
+from app.crud import event as crud_event
+from app.models.session import Session as EventSession
+from app.schemas.event import EventCreate
+from app.services.calendar_service import feed_validators_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_feed_cache():
+    """La caché de validadoras es global al proceso; cada test parte de cero."""
+    feed_validators_cache.clear()
+    yield
+    feed_validators_cache.clear()
+
+
+def _create_event_with_session(client, db, organizer, headers, event_data):
+    event = crud_event.create_event(db, EventCreate(**event_data), organizer.id)
+    response = client.post(
+        "/api/v1/sessions/",
+        json={
+            "event_id": event.id,
+            "title": "Keynote, apertura",
+            "speaker_name": "Ana",
+            "start_time": (event.start_date + timedelta(hours=1)).isoformat(),
+            "end_time": (event.start_date + timedelta(hours=2)).isoformat(),
+        },
+        headers=headers,
+    )
+    assert response.status_code == 201
+    return event
+
+
+def test_icalendar_escaping_and_folding():
+    """Test TEXT escaping and 75-octet line folding."""
+    assert escape_text("a,b;c\\d\ne") == "a\\,b\\;c\\\\d\\ne"
+    folded = fold_line("DESCRIPTION:" + "á" * 100)
+    lines = folded.rstrip("\r\n").split("\r\n")
+    assert all(len(line.encode("utf-8")) <= 75 for line in lines)
+    assert all(line.startswith(" ") for line in lines[1:])
+
+
+def test_user_feed_streams_events_and_sessions(
+    client,
+    db,
+    test_user_organizer,
+    auth_headers_organizer,
+    auth_headers_attendee,
+    test_event_data,
+):
+    """Test the signed user feed with one VEVENT per event and per session."""
+    event = _create_event_with_session(
+        client, db, test_user_organizer, auth_headers_organizer, test_event_data
+    )
+    client.post(f"/api/v1/attendees/register/{event.id}", headers=auth_headers_attendee)
+
+    feed = client.get("/api/v1/calendar/me", headers=auth_headers_attendee).json()
+    # El token del feed no sirve como token de acceso a la API
+    assert decode_access_token(feed["token"]) is None
+
+    response = client.get(feed["url"])
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/calendar; charset=utf-8"
+    assert "ETag" in response.headers and "Last-Modified" in response.headers
+    body = response.text
+    assert body.startswith("BEGIN:VCALENDAR\r\n") and body.endswith("END:VCALENDAR\r\n")
+    assert body.count("BEGIN:VEVENT") == 2
+    assert f"UID:event-{event.id}@" in body
+    assert "SUMMARY:Test Event: Keynote\\, apertura" in body
+
+
+def test_feed_not_modified_and_invalid_token(
+    client, db, test_user_organizer, auth_headers_organizer, test_event_data
+):
+    """Test 304 answers from cached validators and tokens bound to one feed."""
+    event = _create_event_with_session(
+        client, db, test_user_organizer, auth_headers_organizer, test_event_data
+    )
+    url = client.get(f"/api/v1/calendar/events/{event.id}", headers=auth_headers_organizer).json()[
+        "url"
+    ]
+    first = client.get(url)
+    assert first.status_code == 200
+
+    # Con la validadora cacheada el 304 se responde sin consultar la base de datos
+    db.close()
+    not_modified = client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    since = client.get(url, headers={"If-Modified-Since": first.headers["Last-Modified"]})
+    assert since.status_code == 304
+
+    token = url.split("token=")[1]
+    other = client.get(f"/api/v1/calendar/events/{event.id + 1}.ics?token={token}")
+    assert other.status_code == 403
+    bad = client.get(f"/api/v1/calendar/events/{event.id}.ics?token=invalid")
+    assert bad.status_code == 403
+
+
+def test_user_feed_etag_changes_after_unregister(
+    client,
+    db,
+    test_user_organizer,
+    auth_headers_organizer,
+    auth_headers_attendee,
+    test_event_data,
+):
+    """Test that cancelling a registration invalidates the cached feed validators."""
+    event = _create_event_with_session(
+        client, db, test_user_organizer, auth_headers_organizer, test_event_data
+    )
+    client.post(f"/api/v1/attendees/register/{event.id}", headers=auth_headers_attendee)
+    url = client.get("/api/v1/calendar/me", headers=auth_headers_attendee).json()["url"]
+    etag = client.get(url).headers["ETag"]
+
+    client.delete(f"/api/v1/attendees/unregister/{event.id}", headers=auth_headers_attendee)
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert "BEGIN:VEVENT" not in response.text
+
+
+def test_event_writes_invalidate_cached_feeds(
+    client,
+    db,
+    test_user_organizer,
+    auth_headers_organizer,
+    auth_headers_attendee,
+    test_event_data,
+):
+    """Test event edits and deletion drop the cached validators of affected feeds."""
+    event = _create_event_with_session(
+        client, db, test_user_organizer, auth_headers_organizer, test_event_data
+    )
+    client.post(f"/api/v1/attendees/register/{event.id}", headers=auth_headers_attendee)
+    event_url = client.get(
+        f"/api/v1/calendar/events/{event.id}", headers=auth_headers_organizer
+    ).json()["url"]
+    user_url = client.get("/api/v1/calendar/me", headers=auth_headers_attendee).json()["url"]
+    event_etag = client.get(event_url).headers["ETag"]
+    user_etag = client.get(user_url).headers["ETag"]
+
+    client.put(
+        f"/api/v1/events/{event.id}", json={"name": "Renombrado"}, headers=auth_headers_organizer
+    )
+    response = client.get(event_url, headers={"If-None-Match": event_etag})
+    assert response.status_code == 200 and "SUMMARY:Renombrado" in response.text
+    assert client.get(user_url, headers={"If-None-Match": user_etag}).status_code == 200
+
+    # Evento eliminado: 404 en lugar del 304 de la validadora cacheada
+    event_etag = client.get(event_url).headers["ETag"]
+    client.delete(f"/api/v1/events/{event.id}", headers=auth_headers_organizer)
+    assert client.get(event_url, headers={"If-None-Match": event_etag}).status_code == 404
+
+
+def test_feed_streams_in_batches_after_the_request_commit(
+    client, db, monkeypatch, test_user_organizer, auth_headers_attendee, test_event_data
+):
+    """Test the real route streams every batch with its own sessions once the request ends."""
+    monkeypatch.setattr(crud_calendar, "FEED_BATCH_SIZE", 2)
+    finish = unit_of_work._finish
+    get_feed_rows = crud_calendar.get_feed_rows
+    request_finished = []
+    batches = []
+
+    async def finish_and_close(request, commit):
+        await finish(request, commit)
+        # Como el cursor de servidor de PostgreSQL: nada de la petición sobrevive al commit
+        request.state.db.close()
+        request_finished.append(True)
+
+    def recording_get_feed_rows(batch_db, **kwargs):
+        batches.append((batch_db is db, bool(request_finished)))
+        return get_feed_rows(batch_db, **kwargs)
+
+    monkeypatch.setattr(unit_of_work, "_finish", finish_and_close)
+    monkeypatch.setattr(crud_calendar, "get_feed_rows", recording_get_feed_rows)
+
+    # Mismo start_date en todos: el keyset desempata por id entre lotes
+    events = [
+        crud_event.create_event(
+            db, EventCreate(**{**test_event_data, "name": f"Lote {i}"}), test_user_organizer.id
+        )
+        for i in range(5)
+    ]
+    for event in events[1:4:2]:
+        for hours in (1, 2):
+            db.add(
+                EventSession(
+                    event_id=event.id,
+                    title=f"Sesión {hours}",
+                    start_time=event.start_date + timedelta(hours=hours),
+                    end_time=event.start_date + timedelta(hours=hours, minutes=30),
+                )
+            )
+    db.commit()
+    for event in events:
+        client.post(f"/api/v1/attendees/register/{event.id}", headers=auth_headers_attendee)
+
+    feed = client.get("/api/v1/calendar/me", headers=auth_headers_attendee).json()
+    request_finished.clear()
+    response = client.get(feed["url"])
+
+    assert response.status_code == 200
+    # 3 lotes de eventos y uno vacío, leídos con sesiones propias tras el commit
+    assert batches == [(False, True)] * 4
+    body = response.text
+    assert body.endswith("END:VCALENDAR\r\n")
+    assert body.count("BEGIN:VEVENT") == 5 + 4
+    uids = [line.split("@")[0] for line in body.split("\r\n") if line.startswith("UID:event-")]
+    assert uids == [f"UID:event-{event.id}" for event in events]
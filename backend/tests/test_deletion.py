@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.soft_delete import with_deleted
+from app.models.attendee import EventRegistration
+from app.models.event import Event
+from app.models.maintenance import EventDeletion
+from app.models.session import Session as EventSession
+from app.services import deletion_service
+from app.services.deletion_service import DeletionService
+
+
+def _create_event_with_children(db, organizer, attendee, sessions=3):
+    now = datetime.utcnow()
+    event = Event(
+        name="Cascade Event",
+        start_date=now + timedelta(days=1),
+        end_date=now + timedelta(days=2),
+        capacity=10,
+        registered_count=1,
+        creator_id=organizer.id,
+    )
+    db.add(event)
+    db.flush()
+    for index in range(sessions):
+        db.add(
+            EventSession(
+                title=f"Session {index}",
+                start_time=event.start_date + timedelta(hours=index),
+                end_time=event.start_date + timedelta(hours=index, minutes=30),
+                event_id=event.id,
+            )
+        )
+    db.add(EventRegistration(user_id=attendee.id, event_id=event.id))
+    db.commit()
+    return event
+
+
+def _live_children(db, event_id):
+    sessions = db.query(EventSession).filter(EventSession.event_id == event_id).count()
+    registrations = (
+        db.query(EventRegistration).filter(EventRegistration.event_id == event_id).count()
+    )
+    return sessions, registrations
+
+
+def test_delete_event_hides_children_before_cascade(
+    client,
+    db,
+    test_user_organizer,
+    test_user_attendee,
+    auth_headers_organizer,
+    auth_headers_attendee,
+):
+    """Test the event is deleted at once and its children are hidden until the cascade."""
+    event = _create_event_with_children(db, test_user_organizer, test_user_attendee)
+    session_id = db.query(EventSession.id).filter(EventSession.event_id == event.id).first()[0]
+
+    response = client.delete(f"/api/v1/events/{event.id}", headers=auth_headers_organizer)
+    assert response.status_code == 202
+
+    # Las filas hijas siguen vivas hasta el worker, pero ya no son visibles
+    assert _live_children(db, event.id) == (3, 1)
+    assert client.get(f"/api/v1/sessions/{session_id}").status_code == 404
+    check = client.get(f"/api/v1/attendees/check/{event.id}", headers=auth_headers_attendee)
+    assert check.json() == {"is_registered": False}
+
+    deletion = db.get(EventDeletion, event.id)
+    assert (deletion.total_sessions, deletion.total_registrations) == (3, 1)
+    assert deletion.finished_at is None
+
+
+def test_cascade_marks_children_in_batches(client, db, test_user_organizer, test_user_attendee):
+    """Test the cascade soft-deletes every child in small batches and records progress."""
+    from app.crud import event as crud_event
+
+    event = _create_event_with_children(db, test_user_organizer, test_user_attendee)
+    crud_event.soft_delete_event(db, event.id)
+    db.commit()
+
+    completed = DeletionService.run_pending(db, batch_size=2, sleep_seconds=0)
+
+    assert len(completed) == 1
+    assert completed[0]["sessions_deleted"] == 3
+    assert completed[0]["registrations_deleted"] == 1
+    assert completed[0]["percent"] == 100
+    assert _live_children(db, event.id) == (0, 0)
+    deleted = with_deleted(db.query(EventSession)).filter(EventSession.event_id == event.id)
+    assert all(session.deleted_at == event.deleted_at for session in deleted)
+    assert DeletionService.run_pending(db, batch_size=2, sleep_seconds=0) == []
+
+
+def test_cascade_resumes_after_crash(
+    client, db, monkeypatch, test_user_organizer, test_user_attendee
+):
+    """Test a crashed cascade keeps its progress and another run finishes it."""
+    from app.crud import event as crud_event
+
+    event = _create_event_with_children(db, test_user_organizer, test_user_attendee)
+    crud_event.soft_delete_event(db, event.id)
+    db.commit()
+
+    def crash(_seconds):
+        raise RuntimeError("worker caído")
+
+    monkeypatch.setattr(deletion_service.time, "sleep", crash)
+    with pytest.raises(RuntimeError):
+        DeletionService.run_pending(db, batch_size=1, sleep_seconds=1)
+
+    assert _live_children(db, event.id) == (2, 1)
+    deletion = db.get(EventDeletion, event.id)
+    assert deletion.sessions_deleted == 1
+    # Reservada por el worker caído: nadie la toma hasta que vence la reserva
+    assert DeletionService.run_pending(db, batch_size=1, sleep_seconds=0) == []
+
+    deletion.locked_until = datetime.utcnow() - timedelta(seconds=1)
+    db.commit()
+    completed = DeletionService.run_pending(db, batch_size=1, sleep_seconds=0)
+
+    assert completed[0]["sessions_deleted"] == 3
+    assert completed[0]["registrations_deleted"] == 1
+    assert _live_children(db, event.id) == (0, 0)
@@ -49,7 +49,10 @@ def test_delete_event(client, test_user_organizer, auth_headers_organizer, test_
     )
     event_id = create_response.json()["id"]
     response = client.delete(f"/api/v1/events/{event_id}", headers=auth_headers_organizer)
-    assert response.status_code == 204
+    assert response.status_code == 202
+    job = response.json()
+    assert job["type"] == "event.cascade" and job["status"] == "pending"
+    assert response.headers["location"] == f"/api/v1/jobs/{job['id']}"
     get_response = client.get(f"/api/v1/events/{event_id}")
     assert get_response.status_code == 404
 
@@ -62,3 +65,194 @@ def test_get_my_events(client, test_user_organizer, auth_headers_organizer, test
     data = response.json()
     assert "events" in data
     assert len(data["events"]) > 0
+
+
+def test_deleted_event_hidden_from_listings(
+    client, test_user_organizer, auth_headers_organizer, test_event_data
+):
+    """Test that soft-deleted events are excluded from every listing."""
+    create_response = client.post(
+        "/api/v1/events/", json=test_event_data, headers=auth_headers_organizer
+    )
+    event_id = create_response.json()["id"]
+    client.delete(f"/api/v1/events/{event_id}", headers=auth_headers_organizer)
+
+    list_response = client.get("/api/v1/events/")
+    assert list_response.json()["pagination"]["total_count"] == 0
+    my_response = client.get("/api/v1/events/my/events", headers=auth_headers_organizer)
+    assert my_response.json()["events"] == []
+
+
+def test_event_detail_loads_count_without_registrations(
+    client, db, test_user_organizer, auth_headers_organizer, auth_headers_attendee, test_event_data
+):
+    """Test that the detail loader counts registrations in SQL and orders sessions."""
+    from datetime import datetime, timedelta
+
+    from sqlalchemy import event as sa_event
+
+    from app.crud import event as crud_event
+
+    event_id = client.post(
+        "/api/v1/events/", json=test_event_data, headers=auth_headers_organizer
+    ).json()["id"]
+    client.post(f"/api/v1/attendees/register/{event_id}", headers=auth_headers_attendee)
+    base = datetime.fromisoformat(test_event_data["start_date"])
+    for hours in (3, 1):
+        client.post(
+            "/api/v1/sessions/",
+            json={
+                "event_id": event_id,
+                "title": f"Session {hours}",
+                "start_time": (base + timedelta(hours=hours)).isoformat(),
+                "end_time": (base + timedelta(hours=hours, minutes=30)).isoformat(),
+            },
+            headers=auth_headers_organizer,
+        )
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    sa_event.listen(db.bind, "before_cursor_execute", listener)
+    try:
+        event = crud_event.get_event_detail(db, event_id)
+    finally:
+        sa_event.remove(db.bind, "before_cursor_execute", listener)
+    assert len(statements) == 2
+    assert "registrations" not in event.__dict__
+    assert event.registered_count == 1
+
+    data = client.get(f"/api/v1/events/{event_id}").json()
+    assert data["available_capacity"] == test_event_data["capacity"] - 1
+    assert [s["title"] for s in data["sessions"]] == ["Session 1", "Session 3"]
+
+
+def test_update_event_optimistic_concurrency(
+    client, db, test_user_organizer, auth_headers_organizer, test_event_data
+):
+    """Test ETag/If-Match handling and version bumps on event updates."""
+    from app.crud import event as crud_event
+
+    create_response = client.post(
+        "/api/v1/events/", json=test_event_data, headers=auth_headers_organizer
+    )
+    event_id = create_response.json()["id"]
+    assert create_response.json()["version"] == 1
+    etag = client.get(f"/api/v1/events/{event_id}").headers["etag"]
+    assert etag == '"1"'
+
+    response = client.put(
+        f"/api/v1/events/{event_id}",
+        json={"name": "First edit"},
+        headers={**auth_headers_organizer, "If-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.json()["version"] == 2
+    assert response.headers["etag"] == '"2"'
+
+    # Un cliente con la versión antigua recibe 412
+    stale_response = client.put(
+        f"/api/v1/events/{event_id}",
+        json={"name": "Stale edit"},
+        headers={**auth_headers_organizer, "If-Match": etag},
+    )
+    assert stale_response.status_code == 412
+
+    # El UPDATE condicional no afecta filas si la versión ya cambió
+    assert crud_event.update_event(db, event_id, {"name": "Lost update"}, version=1) is None
+    assert client.get(f"/api/v1/events/{event_id}").json()["name"] == "First edit"
+
+
+def test_list_events_combined_filters(client, db, test_user_organizer, test_user_admin):
+    """Test composable filters and sorting on GET /events."""
+    from datetime import datetime, timedelta
+
+    from app.models.event import Event
+
+    base = datetime.utcnow() + timedelta(days=10)
+    rows = [
+        ("Beta", base, "Madrid", 100, 0, test_user_organizer.id),
+        ("Alpha", base + timedelta(days=5), "madrid", 50, 50, test_user_organizer.id),
+        ("Gamma", base + timedelta(days=20), "Lima", 300, 10, test_user_admin.id),
+    ]
+    for name, start, location, capacity, registered, creator_id in rows:
+        db.add(
+            Event(
+                name=name,
+                start_date=start,
+                end_date=start + timedelta(hours=4),
+                location=location,
+                capacity=capacity,
+                registered_count=registered,
+                creator_id=creator_id,
+            )
+        )
+    db.commit()
+
+    def names(query):
+        response = client.get(f"/api/v1/events/?{query}")
+        assert response.status_code == 200
+        return [event["name"] for event in response.json()["events"]]
+
+    assert names("") == ["Beta", "Alpha", "Gamma"]  # start_date asc por defecto
+    assert names("location=MADRID&sort_by=name") == ["Alpha", "Beta"]
+    assert names("location=madrid&has_availability=true") == ["Beta"]
+    assert names("has_availability=false") == ["Alpha"]
+    assert names(f"creator_id={test_user_admin.id}") == ["Gamma"]
+    assert names("min_capacity=100&sort_by=start_date&sort_order=desc") == ["Gamma", "Beta"]
+    start_to = (base + timedelta(days=6)).isoformat()
+    assert names(f"start_from={base.isoformat()}&start_to={start_to}") == ["Beta", "Alpha"]
+
+
+def test_event_facets(client, db, test_user_organizer):
+    """Test status/location/month facet counts from one aggregate query, with caching."""
+    from datetime import datetime, timedelta
+
+    from app.models.event import Event, EventStatusDB
+    from app.services.event_service import facets_cache
+
+    facets_cache.clear()
+    now = datetime.utcnow()
+    rows = [
+        ("Pasado", datetime(2020, 1, 10), "Madrid", EventStatusDB.SCHEDULED),
+        ("En curso", now - timedelta(hours=1), "madrid", EventStatusDB.SCHEDULED),
+        ("Futuro", datetime(2099, 3, 1), "Madrid", EventStatusDB.SCHEDULED),
+        ("Cancelado", datetime(2099, 3, 5), "Lima", EventStatusDB.CANCELLED),
+        ("Sin sitio", datetime(2099, 4, 1), None, EventStatusDB.SCHEDULED),
+    ]
+    for name, start, location, event_status in rows:
+        db.add(
+            Event(
+                name=name,
+                start_date=start,
+                end_date=start + timedelta(hours=4),
+                location=location,
+                capacity=10,
+                status=event_status,
+                creator_id=test_user_organizer.id,
+            )
+        )
+    db.commit()
+
+    data = client.get("/api/v1/events/facets").json()
+    assert data["total"] == 5
+    assert data["status"] == {"scheduled": 2, "ongoing": 1, "completed": 1, "cancelled": 1}
+    assert data["locations"] == [
+        {"value": "Madrid", "count": 3},
+        {"value": "Lima", "count": 1},
+    ]
+    assert {"value": "2099-03", "count": 2} in data["months"]
+
+    # El filtro de estado no cambia los conteos por estado, sí el resto de facetas
+    scheduled = client.get("/api/v1/events/facets?status=scheduled&top_locations=1").json()
+    assert scheduled["status"] == data["status"]
+    assert scheduled["total"] == 2
+    assert scheduled["locations"] == [{"value": "Madrid", "count": 1}]
+    assert scheduled["months"] == [
+        {"value": "2099-03", "count": 1},
+        {"value": "2099-04", "count": 1},
+    ]
+
+    # Filtros equivalentes tras normalizar comparten entrada de caché
+    client.get("/api/v1/events/facets?location=MADRID")
+    client.get("/api/v1/events/facets?location=madrid")
+    assert len(facets_cache) == 3
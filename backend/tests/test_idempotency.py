@@ -0,0 +1,92 @@
+import threading
+import time
+
+from app.config import settings
+from app.core.idempotency import DatabaseIdempotencyStore, IdempotencyRecord
+from app.models.event import Event
+from app.services import attendee_service
+from tests.conftest import test_engine
+
+
+def test_create_event_replay(client, db, auth_headers_organizer, test_event_data):
+    """Test that a retried POST returns the stored response without creating a duplicate."""
+    headers = {**auth_headers_organizer, "Idempotency-Key": "retry-1"}
+
+    first = client.post("/api/v1/events/", json=test_event_data, headers=headers)
+    retry = client.post("/api/v1/events/", json=test_event_data, headers=headers)
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+    assert db.query(Event).count() == 1
+
+    other_body = client.post(
+        "/api/v1/events/", json={**test_event_data, "capacity": 5}, headers=headers
+    )
+    assert other_body.status_code == 422
+    without_key = client.post(
+        "/api/v1/events/", json=test_event_data, headers=auth_headers_organizer
+    )
+    assert without_key.status_code == 201
+    assert db.query(Event).count() == 2
+
+
+def test_concurrent_duplicate_waits_for_first(
+    client, monkeypatch, auth_headers_attendee, auth_headers_organizer, test_event_data
+):
+    """Test that a concurrent duplicate waits and replays instead of re-executing."""
+    event = client.post(
+        "/api/v1/events/", json=test_event_data, headers=auth_headers_organizer
+    ).json()
+    calls = []
+    register = attendee_service.AttendeeService.register_to_event
+
+    def slow_register(*args):
+        calls.append(1)
+        time.sleep(0.3)
+        return register(*args)
+
+    monkeypatch.setattr(attendee_service.AttendeeService, "register_to_event", slow_register)
+    headers = {**auth_headers_attendee, "Idempotency-Key": "tap-twice"}
+    responses = []
+
+    def post():
+        responses.append(client.post(f"/api/v1/attendees/register/{event['id']}", headers=headers))
+
+    threads = [threading.Thread(target=post) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.05)
+    for thread in threads:
+        thread.join()
+
+    assert [response.status_code for response in responses] == [201, 201]
+    assert responses[0].json() == responses[1].json()
+    assert len(calls) == 1
+
+
+def test_database_store(db, monkeypatch):
+    """Test the shared store: single claim, replay record, release and expired takeover."""
+    store = DatabaseIdempotencyStore(test_engine)
+
+    assert store.claim("k", "fp") is None
+    in_flight = store.claim("k", "fp")
+    assert in_flight.status_code is None
+    store.complete("k", IdempotencyRecord("fp", 201, [("content-type", "application/json")], b"{}"))
+    stored = store.claim("k", "fp")
+    assert (stored.status_code, stored.headers, stored.body) == (
+        201,
+        [("content-type", "application/json")],
+        b"{}",
+    )
+
+    assert store.claim("failed", "fp") is None
+    store.release("failed")
+    assert store.claim("failed", "fp") is None
+    store.release("k")  # Una respuesta guardada no se libera
+    assert store.claim("k", "fp").status_code == 201
+
+    monkeypatch.setattr(settings, "IDEMPOTENCY_LOCK_SECONDS", -1)  # Reserva ya vencida
+    assert store.claim("crashed", "fp") is None
+    assert store.claim("crashed", "fp") is None
@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta
+
+from app.models.job import Job, JobStatus
+from app.services import job_service
+from app.services.job_service import JobService, JobType
+from tests.conftest import TestingSessionLocal
+
+
+def test_delete_event_runs_cascade_as_job(
+    client, db, test_user_organizer, auth_headers_organizer, auth_headers_attendee, test_event_data
+):
+    """Test event deletion returns a job that the runner completes."""
+    event_id = client.post(
+        "/api/v1/events/", json=test_event_data, headers=auth_headers_organizer
+    ).json()["id"]
+    response = client.delete(f"/api/v1/events/{event_id}", headers=auth_headers_organizer)
+    job_id = response.json()["id"]
+
+    assert client.get(f"/api/v1/jobs/{job_id}", headers=auth_headers_attendee).status_code == 403
+
+    stats = JobService.run_pending(TestingSessionLocal)
+
+    assert stats == {"succeeded": 1, "pending": 0, "failed": 0}
+    response = client.get(f"/api/v1/jobs/{job_id}", headers=auth_headers_organizer)
+    assert response.status_code == 200
+    job = response.json()
+    assert job["status"] == "succeeded" and job["attempts"] == 1
+    assert job["result"] == {
+        "event_id": event_id,
+        "sessions_deleted": 0,
+        "registrations_deleted": 0,
+        "session_registrations_deleted": 0,
+    }
+    assert client.get("/api/v1/jobs/999999", headers=auth_headers_organizer).status_code == 404
+
+
+def test_failed_job_retries_with_backoff_then_fails(db, monkeypatch):
+    """Test a failing job is rescheduled until it runs out of attempts."""
+    calls = []
+
+    def handler(_db, payload):
+        calls.append(payload)
+        raise RuntimeError("servicio caído")
+
+    monkeypatch.setitem(job_service.JOB_TYPES, "test.fail", JobType(handler, max_attempts=2))
+    job = JobService.enqueue(db, "test.fail", {"n": 1})
+    db.commit()
+
+    stats = JobService.run_pending(TestingSessionLocal)
+    assert stats == {"succeeded": 0, "pending": 1, "failed": 0}
+    db.refresh(job)
+    assert job.status == JobStatus.PENDING
+    assert job.run_at > datetime.utcnow()
+    assert job.last_error == "RuntimeError: servicio caído"
+
+    job.run_at = datetime.utcnow()
+    db.commit()
+    stats = JobService.run_pending(TestingSessionLocal)
+    assert stats == {"succeeded": 0, "pending": 0, "failed": 1}
+    db.refresh(job)
+    assert job.status == JobStatus.FAILED and job.attempts == 2
+    assert len(calls) == 2
+
+
+def test_claim_respects_priority_concurrency_and_expired_leases(db, monkeypatch):
+    """Test claims honour the per-type limit, pick by priority and recover dead workers."""
+    monkeypatch.setattr(job_service, "JOB_TYPES", {"test.slow": JobType(lambda *_: None)})
+    for priority in (0, 5, 1):
+        JobService.enqueue(db, "test.slow", {"priority": priority}, priority=priority)
+    db.commit()
+
+    claimed = JobService.claim_ready(TestingSessionLocal)
+    assert [job.payload["priority"] for job in claimed] == [5]
+    # Límite de concurrencia 1: mientras siga en curso no se reserva otro
+    assert JobService.claim_ready(TestingSessionLocal) == []
+
+    # El worker cae: al vencer la reserva el trabajo vuelve a la cola y se retoma
+    db.query(Job).filter(Job.id == claimed[0].id).update(
+        {"locked_until": datetime.utcnow() - timedelta(seconds=1)}
+    )
+    db.commit()
+    reclaimed = JobService.claim_ready(TestingSessionLocal)
+    assert [job.id for job in reclaimed] == [claimed[0].id]
+    assert reclaimed[0].attempts == 2
+
+
+def test_claim_counts_and_reserves_each_type_under_its_lock(db, monkeypatch):
+    """Test the running count and the claim of a type happen inside its advisory lock."""
+    monkeypatch.setattr(
+        job_service,
+        "JOB_TYPES",
+        {"test.busy": JobType(lambda *_: None), "test.idle": JobType(lambda *_: None)},
+    )
+    JobService.enqueue(db, "test.busy", {})
+    db.commit()
+    assert len(JobService.claim_ready(TestingSessionLocal)) == 1
+    JobService.enqueue(db, "test.busy", {})
+    JobService.enqueue(db, "test.idle", {})
+    db.commit()
+
+    steps = []
+    count_running = job_service.crud_job.count_running
+    claim_jobs = job_service.crud_job.claim_jobs
+
+    def recording_lock(lock_db, name):
+        assert not lock_db.in_transaction()  # el lock de cada tipo abre su transacción
+        steps.append(("lock", name))
+
+    def recording_count(count_db, job_type):
+        steps.append(("count", job_type))
+        return count_running(count_db, job_type)
+
+    def recording_claim(claim_db, job_type, *args):
+        steps.append(("claim", job_type))
+        return claim_jobs(claim_db, job_type, *args)
+
+    monkeypatch.setattr(job_service, "advisory_xact_lock", recording_lock)
+    monkeypatch.setattr(job_service.crud_job, "count_running", recording_count)
+    monkeypatch.setattr(job_service.crud_job, "claim_jobs", recording_claim)
+
+    claimed = JobService.claim_ready(TestingSessionLocal)
+    assert [job.type for job in claimed] == ["test.idle"]
+    # test.busy está lleno: se cuenta bajo su lock y no se reserva nada
+    assert steps == [
+        ("lock", "jobs:test.busy"),
+        ("count", "test.busy"),
+        ("lock", "jobs:test.idle"),
+        ("count", "test.idle"),
+        ("claim", "test.idle"),
+    ]
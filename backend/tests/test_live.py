@@ -0,0 +1,112 @@
+import asyncio
+
+from app.config import settings
+from app.core import unit_of_work
+from app.core.live import LiveUpdateHub
+from app.crud import event as crud_event
+from app.schemas.event import EventCreate
+from app.services import live_service
+from app.services.live_service import LiveService, live_updates
+from tests.conftest import TestingSessionLocal, test_engine
+
+
+def test_hub_coalesces_updates():
+    """Test that a burst of changes is coalesced into one load and one delivery."""
+    loads = []
+    state = {"seats": 10}
+
+    def loader(keys):
+        loads.append(set(keys))
+        return {key: {"seats": state["seats"]} for key in keys}
+
+    hub = LiveUpdateHub(loader, min_interval=0.2)
+
+    async def scenario():
+        subscription = hub.subscribe([1], initial={1: {"seats": 10}})
+        for seats in range(9, -1, -1):  # 10 registros seguidos
+            state["seats"] = seats
+            hub.mark_dirty(1)
+            hub.mark_dirty(2)  # Sin suscriptores: se ignora
+        first = await subscription.get(timeout=1)
+        hub.mark_dirty(1)  # Mismo valor: no se reenvía
+        second = await subscription.get(timeout=0.5)
+        hub.unsubscribe(subscription)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first == {1: {"seats": 0}}
+    assert second == {}
+    assert loads == [{1}, {1}]
+    assert hub.subscriber_count() == 0
+
+
+def test_event_live_stream(client, db, monkeypatch, test_user_organizer, test_event_data):
+    """Test the SSE response: reconnect hint, initial snapshot, 404 and id limit."""
+    monkeypatch.setattr(settings, "LIVE_STREAM_MAX_SECONDS", 0.3)
+    monkeypatch.setattr(settings, "LIVE_HEARTBEAT_SECONDS", 0.1)
+    event = crud_event.create_event(db, EventCreate(**test_event_data), test_user_organizer.id)
+
+    response = client.get(f"/api/v1/events/{event.id}/live")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text.startswith("retry: 3000\n\n")
+    assert "event: update\ndata: " in response.text
+    assert '"available_capacity":100' in response.text
+    assert ": keepalive" in response.text
+
+    assert client.get(f"/api/v1/events/{event.id + 1}/live").status_code == 404
+    too_many = "&".join(f"event_ids={i}" for i in range(1, 102))
+    assert client.get(f"/api/v1/events/live?{too_many}").status_code == 400
+
+
+def test_live_stream_releases_db_connection(
+    client, db, monkeypatch, test_user_organizer, test_event_data
+):
+    """Test an open SSE stream does not hold a pooled database connection."""
+    event = crud_event.create_event(db, EventCreate(**test_event_data), test_user_organizer.id)
+    db.commit()
+    checked_out = []
+
+    async def stream(initial):
+        checked_out.append(test_engine.pool.checkedout())
+        yield "retry: 3000\n\n"
+
+    async def keep_transaction(request, commit):
+        return None
+
+    monkeypatch.setattr(LiveService, "stream", staticmethod(stream))
+    # Sin el commit de UnitOfWorkRoute: la conexión la tiene que soltar el propio endpoint
+    monkeypatch.setattr(unit_of_work, "_finish", keep_transaction)
+
+    assert client.get(f"/api/v1/events/{event.id}/live").status_code == 200
+    assert client.get(f"/api/v1/events/live?event_ids={event.id}").status_code == 200
+    assert checked_out == [0, 0]
+
+
+def test_registration_commit_publishes_update(
+    client, db, monkeypatch, test_user_organizer, auth_headers_attendee, test_event_data
+):
+    """Test that a committed registration reaches subscribers and a failed one does not."""
+    monkeypatch.setattr(live_service, "SessionLocal", TestingSessionLocal)
+    event = crud_event.create_event(db, EventCreate(**test_event_data), test_user_organizer.id)
+    initial = LiveService.get_event_snapshot(db, event.id)
+    db.commit()
+
+    def register():
+        return client.post(f"/api/v1/attendees/register/{event.id}", headers=auth_headers_attendee)
+
+    async def scenario():
+        subscription = live_updates.subscribe(initial.keys(), initial)
+        try:
+            assert (await asyncio.to_thread(register)).status_code == 201
+            first = await subscription.get(timeout=2)
+            assert (await asyncio.to_thread(register)).status_code == 409
+            second = await subscription.get(timeout=1)
+            return first, second
+        finally:
+            live_updates.unsubscribe(subscription)
+
+    first, second = asyncio.run(scenario())
+    assert first[event.id]["available_capacity"] == 99
+    assert first[event.id]["is_full"] is False
+    assert second == {}
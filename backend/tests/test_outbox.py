@@ -0,0 +1,130 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy import event as sa_event
+
+from app.config import settings
+from app.core.delivery import MailboxEmailAdapter, StubWebhookAdapter
+from app.core.security import get_password_hash
+from app.crud import event as crud_event
+from app.models.attendee import EventRegistration
+from app.models.outbox import OutboxChannel, OutboxMessage, OutboxStatus
+from app.models.user import User, UserRole
+from app.schemas.event import EventCreate
+from app.services.outbox_service import OutboxService
+from tests.conftest import TestingSessionLocal
+
+WEBHOOK_URL = "http://hooks.test/events"
+
+
+def _messages(db, **filters):
+    db.expire_all()
+    return db.query(OutboxMessage).filter_by(**filters).order_by(OutboxMessage.id).all()
+
+
+def test_registration_enqueues_in_same_transaction(
+    client, db, monkeypatch, test_user_organizer, auth_headers_attendee, test_event_data
+):
+    """Test that a registration writes its email and webhook; failures write nothing."""
+    monkeypatch.setattr(settings, "OUTBOX_WEBHOOK_URLS", [WEBHOOK_URL])
+    event = crud_event.create_event(db, EventCreate(**test_event_data), test_user_organizer.id)
+
+    response = client.post(f"/api/v1/attendees/register/{event.id}", headers=auth_headers_attendee)
+    assert response.status_code == 201
+    messages = _messages(db, topic="registration.created")
+    assert {(m.channel, m.recipient) for m in messages} == {
+        (OutboxChannel.EMAIL, "attendee@test.com"),
+        (OutboxChannel.WEBHOOK, WEBHOOK_URL),
+    }
+    assert messages[0].payload["event_name"] == test_event_data["name"]
+
+    # Registro duplicado (409) o cancelación inexistente (404): no quedan mensajes
+    client.post(f"/api/v1/attendees/register/{event.id}", headers=auth_headers_attendee)
+    client.delete(f"/api/v1/attendees/unregister/{event.id + 1}", headers=auth_headers_attendee)
+    assert len(_messages(db)) == 2
+
+
+def test_event_cancellation_fanout_is_one_insert(
+    client, db, test_user_organizer, auth_headers_organizer, test_event_data
+):
+    """Test that deleting an event enqueues one email per attendee in one INSERT ... SELECT."""
+    event = crud_event.create_event(db, EventCreate(**test_event_data), test_user_organizer.id)
+    for i in range(25):
+        user = User(
+            email=f"fan{i}@test.com",
+            hashed_password=get_password_hash("x"),
+            role=UserRole.ATTENDEE,
+        )
+        db.add(user)
+        db.flush()
+        db.add(EventRegistration(user_id=user.id, event_id=event.id))
+    db.commit()
+
+    inserts = []
+
+    def listener(conn, cursor, statement, *args):
+        if statement.startswith("INSERT INTO outbox_messages"):
+            inserts.append(statement)
+
+    sa_event.listen(db.bind, "before_cursor_execute", listener)
+    try:
+        response = client.delete(f"/api/v1/events/{event.id}", headers=auth_headers_organizer)
+    finally:
+        sa_event.remove(db.bind, "before_cursor_execute", listener)
+    assert response.status_code == 202
+
+    assert len(inserts) == 1
+    messages = _messages(db, topic="event.cancelled")
+    assert len(messages) == 25
+    assert all(m.channel == OutboxChannel.EMAIL and m.user_id for m in messages)
+
+
+def test_dispatcher_retries_with_backoff(
+    client, db, monkeypatch, test_user_organizer, auth_headers_attendee, test_event_data
+):
+    """Test delivery through the stand-in adapters, retries, backoff and final failure."""
+    monkeypatch.setattr(settings, "OUTBOX_WEBHOOK_URLS", [WEBHOOK_URL])
+    event = crud_event.create_event(db, EventCreate(**test_event_data), test_user_organizer.id)
+    client.post(f"/api/v1/attendees/register/{event.id}", headers=auth_headers_attendee)
+    db.commit()
+
+    mailbox = MailboxEmailAdapter()
+    webhook = StubWebhookAdapter(fail_times=1)
+    adapters = {OutboxChannel.EMAIL: mailbox, OutboxChannel.WEBHOOK: webhook}
+
+    def dispatch():
+        return asyncio.run(
+            OutboxService.dispatch_batch(adapters, session_factory=TestingSessionLocal)
+        )
+
+    assert dispatch() == {"claimed": 2, "sent": 1, "retried": 1, "failed": 0}
+    assert mailbox.sent[0]["subject"] == f"Registro confirmado: {test_event_data['name']}"
+    pending = _messages(db, status=OutboxStatus.PENDING)[0]
+    assert pending.attempts == 1 and "503" in pending.last_error
+    assert pending.next_attempt_at > datetime.utcnow()
+    assert dispatch()["claimed"] == 0  # Aún no vence el backoff
+
+    pending.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+    db.commit()
+    assert dispatch()["sent"] == 1
+    assert webhook.requests[0]["body"]["topic"] == "registration.created"
+
+    # Al agotar los intentos el mensaje queda FAILED
+    monkeypatch.setattr(settings, "OUTBOX_MAX_ATTEMPTS", 1)
+    client.delete(f"/api/v1/attendees/unregister/{event.id}", headers=auth_headers_attendee)
+    db.commit()
+    failing = {OutboxChannel.EMAIL: mailbox, OutboxChannel.WEBHOOK: StubWebhookAdapter(9)}
+    stats = asyncio.run(OutboxService.dispatch_batch(failing, session_factory=TestingSessionLocal))
+    assert stats == {"claimed": 2, "sent": 1, "retried": 0, "failed": 1}
+    assert len(_messages(db, status=OutboxStatus.FAILED)) == 1
+
+
+def test_mailbox_keeps_only_recent_messages():
+    """Test the local mailbox stand-in does not grow without bound."""
+    mailbox = MailboxEmailAdapter(max_messages=2)
+    for index in range(3):
+        message = OutboxMessage(
+            id=index, topic="event.cancelled", recipient=f"a{index}@test.com", payload={}
+        )
+        asyncio.run(mailbox.send(message))
+    assert [email["to"] for email in mailbox.sent] == ["a1@test.com", "a2@test.com"]
@@ -0,0 +1,71 @@
+from datetime import date
+
+import pytest
+
+from app.core import partitioning
+
+
+def test_month_helpers_wrap_years():
+    """Test month arithmetic and partition naming across year boundaries."""
+    assert partitioning.add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert partitioning.add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert partitioning.month_partition_name(date(2026, 3, 15)) == "event_registrations_p2026_03"
+
+
+def test_range_conversion_covers_history_and_future_months():
+    """Test range conversion creates monthly partitions from the oldest row to months ahead."""
+    statements = partitioning.conversion_sql(
+        "range", first_month=date(2026, 8, 20), today=date(2026, 10, 18), months_ahead=2
+    )
+    created = [s for s in statements if "PARTITION OF" in s and "FOR VALUES FROM" in s]
+    assert len(created) == 5  # agosto a diciembre
+    assert any("DEFAULT" in s for s in statements)
+    assert any("PRIMARY KEY (id, registered_at)" in s for s in statements)
+
+
+def test_hash_conversion_uses_event_id_key():
+    """Test hash conversion partitions by event_id with the requested modulus."""
+    statements = partitioning.conversion_sql(
+        "hash", first_month=date(2026, 1, 1), today=date(2026, 1, 1), modulus=4
+    )
+    assert "PARTITION BY HASH (event_id)" in statements[0]
+    assert sum("MODULUS 4" in s for s in statements) == 4
+    assert any("PRIMARY KEY (id, event_id)" in s for s in statements)
+
+
+def test_conversion_rejects_unknown_strategy():
+    """Test unsupported strategies are rejected."""
+    with pytest.raises(ValueError):
+        partitioning.conversion_sql("list", first_month=date.today(), today=date.today())
+
+
+def test_conversion_recreates_live_indexes():
+    """Test conversion recreates the indexes read from pg_indexes, not a fixed list."""
+    definitions = [
+        "CREATE INDEX ix_custom ON public.event_registrations USING btree (registered_at)",
+        "CREATE INDEX ix_parent ON ONLY public.event_registrations USING btree (user_id)",
+    ]
+    statements = partitioning.conversion_sql(
+        "hash", first_month=date(2026, 1, 1), today=date(2026, 1, 1), indexes=definitions
+    )
+    assert statements[-2:] == [
+        definitions[0],
+        "CREATE INDEX ix_parent ON public.event_registrations USING btree (user_id)",
+    ]
+    assert not any("ix_event_registrations_purge" in s for s in statements)
+
+
+def test_revert_reattaches_detached_partitions_before_copying():
+    """Test downgrade attaches detached months first so their rows are copied back."""
+    statements = partitioning.revert_sql(
+        indexes=[], detached=["event_registrations_p2025_12", "event_registrations_p2026_01"]
+    )
+    assert statements[:2] == [
+        "ALTER TABLE event_registrations ATTACH PARTITION event_registrations_p2025_12 "
+        "FOR VALUES FROM ('2025-12-01') TO ('2026-01-01')",
+        "ALTER TABLE event_registrations ATTACH PARTITION event_registrations_p2026_01 "
+        "FOR VALUES FROM ('2026-01-01') TO ('2026-02-01')",
+    ]
+    assert statements[3] == (
+        "INSERT INTO event_registrations_plain SELECT * FROM event_registrations"
+    )
@@ -0,0 +1,88 @@
+from app.config import settings
+from app.core.rate_limit import DatabaseRateLimitBackend, RateLimit, rate_limiter
+from app.crud import user as crud_user
+from app.models.rate_limit import RateLimitBucket
+from tests.conftest import test_engine
+
+
+def test_login_ip_limit_returns_429_before_password_check(client, monkeypatch, test_user_attendee):
+    """Test that the per-IP login bucket rejects with Retry-After before running bcrypt."""
+    monkeypatch.setattr(settings, "RATE_LIMIT_LOGIN_IP", "3/60")
+    monkeypatch.setattr(rate_limiter, "clock", lambda: 1000.0)
+    checks = []
+    verify = crud_user.verify_password
+    monkeypatch.setattr(
+        crud_user, "verify_password", lambda *args: checks.append(1) or verify(*args)
+    )
+    credentials = {"email": "attendee@test.com", "password": "testpass123"}
+
+    for _ in range(3):
+        assert client.post("/api/v1/auth/login", json=credentials).status_code == 200
+    response = client.post("/api/v1/auth/login", json=credentials)
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) == 20
+    assert len(checks) == 3
+
+
+def test_login_backoff_per_account(client, monkeypatch, test_user_attendee):
+    """Test that repeated failures lock the account with growing waits until a success."""
+    monkeypatch.setattr(settings, "LOGIN_FREE_ATTEMPTS", 2)
+    monkeypatch.setattr(settings, "LOGIN_BACKOFF_BASE_SECONDS", 10)
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter, "clock", lambda: now[0])
+
+    def login(password):
+        return client.post(
+            "/api/v1/auth/login", json={"email": "attendee@test.com", "password": password}
+        )
+
+    assert login("wrong").status_code == 400
+    assert login("wrong").status_code == 400
+    locked = login("testpass123")
+    assert locked.status_code == 429
+    assert locked.headers["Retry-After"] == "10"
+
+    now[0] += 11
+    assert login("wrong").status_code == 400
+    assert login("testpass123").headers["Retry-After"] == "20"
+
+    now[0] += 21
+    assert login("testpass123").status_code == 200
+    assert login("wrong").status_code == 400  # El contador se reinició
+
+
+def test_registration_limit_per_user(
+    client, db, monkeypatch, auth_headers_attendee, auth_headers_organizer, test_event_data
+):
+    """Test that the per-user registration bucket applies before loading the event."""
+    monkeypatch.setattr(settings, "RATE_LIMIT_EVENT_REGISTRATION_USER", "1/60")
+    event = client.post(
+        "/api/v1/events/", json=test_event_data, headers=auth_headers_organizer
+    ).json()
+
+    first = client.post(f"/api/v1/attendees/register/{event['id']}", headers=auth_headers_attendee)
+    assert first.status_code == 201
+    response = client.post("/api/v1/attendees/register/999999", headers=auth_headers_attendee)
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "60"
+
+
+def test_database_backend(db):
+    """Test the shared UPSERT backend: bucket refill and failure counters."""
+    backend = DatabaseRateLimitBackend(test_engine)
+    limit = RateLimit.parse("2/10")
+
+    assert backend.consume("k", limit, now=0) == 0
+    assert backend.consume("k", limit, now=0) == 0
+    assert backend.consume("k", limit, now=1) == 4.0
+    assert backend.consume("k", limit, now=5) == 0
+
+    assert backend.record_failure("f", now=0, window=60) == 1
+    assert backend.record_failure("f", now=10, window=60) == 2
+    assert backend.get_failures("f") == (2, 10)
+    assert backend.record_failure("f", now=100, window=60) == 1
+    backend.reset("f")
+    assert backend.get_failures("f") == (0, 0.0)
+    backend.clear()
+    assert db.query(RateLimitBucket).count() == 0
@@ -0,0 +1,158 @@
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from app.core.soft_delete import with_deleted
+from app.models.attendee import EventRegistration, SessionRegistration
+from app.models.event import Event
+from app.models.maintenance import ArchivedRecord
+from app.models.outbox import OutboxChannel, OutboxMessage, OutboxStatus
+from app.models.session import Session as EventSession
+from app.services import retention_service
+from app.services.retention_service import RetentionService
+from tests.conftest import TestingSessionLocal
+
+
+def _create_event(db, creator_id, deleted_at=None):
+    now = datetime.utcnow()
+    event = Event(
+        name="Retention Event",
+        start_date=now + timedelta(days=1),
+        end_date=now + timedelta(days=2),
+        capacity=10,
+        creator_id=creator_id,
+        deleted_at=deleted_at,
+        is_deleted=deleted_at is not None,
+    )
+    db.add(event)
+    db.commit()
+    return event
+
+
+def test_purge_removes_only_rows_past_retention(db, test_user_organizer, test_user_attendee):
+    """Test purge hard-deletes old soft-deleted rows and keeps recent or live ones."""
+    old = datetime.utcnow() - timedelta(days=120)
+    old_event = _create_event(db, test_user_organizer.id, deleted_at=old)
+    live_event = _create_event(db, test_user_organizer.id)
+    db.add_all(
+        [
+            EventRegistration(
+                user_id=test_user_attendee.id,
+                event_id=old_event.id,
+                deleted_at=old,
+                is_deleted=True,
+            ),
+            EventRegistration(
+                user_id=test_user_attendee.id,
+                event_id=live_event.id,
+                deleted_at=datetime.utcnow(),
+                is_deleted=True,
+            ),
+        ]
+    )
+    db.commit()
+
+    purged = RetentionService.purge_deleted(db, retention_days=90, batch_size=1, sleep_seconds=0)
+
+    assert purged == {
+        "session_registrations": 0,
+        "event_registrations": 1,
+        "sessions": 0,
+        "events": 1,
+        "outbox_messages": 0,
+    }
+    assert with_deleted(db.query(Event)).count() == 1
+    assert with_deleted(db.query(EventRegistration)).count() == 1
+
+
+def test_purge_archive_mode_keeps_json_copy(db, test_user_organizer):
+    """Test archive mode stores the purged row before deleting it."""
+    event = _create_event(
+        db, test_user_organizer.id, deleted_at=datetime.utcnow() - timedelta(days=10)
+    )
+    event_id = event.id
+
+    RetentionService.purge_deleted(db, retention_days=1, mode="archive", sleep_seconds=0)
+
+    archived = db.query(ArchivedRecord).one()
+    assert archived.table_name == "events"
+    assert archived.record_id == event_id
+    assert archived.payload["name"] == "Retention Event"
+
+
+def test_purge_keeps_sessions_with_live_seat_reservations(
+    db, test_user_organizer, test_user_attendee
+):
+    """Test purge skips deleted sessions (and their event) that still have seat rows."""
+    old = datetime.utcnow() - timedelta(days=120)
+    event = _create_event(db, test_user_organizer.id, deleted_at=old)
+    session = EventSession(
+        event_id=event.id,
+        title="Taller",
+        start_time=event.start_date,
+        end_time=event.end_date,
+        deleted_at=old,
+        is_deleted=True,
+    )
+    db.add(session)
+    db.commit()
+    # Plaza que quedó viva: el borrado en cascada falló antes de llegar a ella
+    db.add(
+        SessionRegistration(user_id=test_user_attendee.id, session_id=session.id, event_id=event.id)
+    )
+    db.commit()
+
+    purged = RetentionService.purge_deleted(db, retention_days=90, sleep_seconds=0)
+
+    assert purged == {
+        "session_registrations": 0,
+        "event_registrations": 0,
+        "sessions": 0,
+        "events": 0,
+        "outbox_messages": 0,
+    }
+    assert with_deleted(db.query(EventSession)).count() == 1
+    assert with_deleted(db.query(Event)).count() == 1
+
+
+def test_purge_deletes_old_sent_outbox_messages(db):
+    """Test delivered outbox messages past OUTBOX_RETENTION_DAYS are deleted, the rest kept."""
+    old = datetime.utcnow() - timedelta(days=30)
+    messages = [
+        OutboxMessage(status=OutboxStatus.SENT, sent_at=old),
+        OutboxMessage(status=OutboxStatus.SENT, sent_at=datetime.utcnow()),
+        OutboxMessage(status=OutboxStatus.PENDING),
+        OutboxMessage(status=OutboxStatus.FAILED),
+    ]
+    for message in messages:
+        message.topic = "registration.created"
+        message.channel = OutboxChannel.EMAIL
+        message.recipient = "asistente@test.com"
+        message.payload = {}
+    db.add_all(messages)
+    db.commit()
+
+    purged = RetentionService.purge_deleted(db, mode="archive", sleep_seconds=0)
+
+    assert purged["outbox_messages"] == 1
+    assert db.query(OutboxMessage).count() == 3
+    assert db.query(ArchivedRecord).count() == 0
+
+
+def test_purge_runs_only_in_the_worker_holding_the_lock(monkeypatch):
+    """Test a worker that cannot take the purge lock skips the run."""
+    taken = []
+
+    @contextmanager
+    def busy_lock(bind, name):
+        taken.append(name)
+        yield False
+
+    def fail(*args, **kwargs):
+        raise AssertionError("no debe purgar sin el lock")
+
+    monkeypatch.setattr(retention_service, "advisory_lock", busy_lock)
+    monkeypatch.setattr(retention_service, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr(RetentionService, "purge_deleted", fail)
+
+    assert retention_service._purge_once() is None
+    assert taken == [retention_service.PURGE_LOCK]
@@ -0,0 +1,196 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from app.config import settings
+from app.core.scheduler import Timer, TimerScheduler
+from app.models.attendee import EventRegistration
+from app.models.event import Event, EventStatusDB
+from app.models.outbox import OutboxChannel, OutboxMessage
+from app.models.session import Session as EventSession
+from app.services import schedule_service
+from app.services.schedule_service import (
+    EVENT_COMPLETED,
+    EVENT_STARTED,
+    SESSION_REMINDER,
+    ScheduleService,
+)
+from tests.conftest import TestingSessionLocal
+
+
+def test_timer_heap_reschedule_and_cancel():
+    """Test ordering, key replacement and cancellation of timers."""
+    base = datetime(2030, 1, 1)
+    scheduler = TimerScheduler(clock=lambda: base)
+    scheduler.schedule(("a", 1), base + timedelta(seconds=30))
+    scheduler.schedule(("b", 2), base + timedelta(seconds=10))
+    scheduler.schedule(("c", 3), base + timedelta(seconds=20))
+    scheduler.schedule(("a", 1), base + timedelta(seconds=5))  # Reprogramada
+    scheduler.cancel(("c", 3))
+
+    assert len(scheduler) == 2
+    assert scheduler.next_deadline() == base + timedelta(seconds=5)
+    assert scheduler.pop_due(base) == []
+
+    due = scheduler.pop_due(base + timedelta(seconds=60))
+    assert [timer.key for timer in due] == [("a", 1), ("b", 2)]
+    assert len(scheduler) == 0 and scheduler.next_deadline() is None
+
+
+def test_run_fires_at_deadline():
+    """Test that the run loop fires timers on time, including ones added while sleeping."""
+    scheduler = TimerScheduler()
+    fired = []
+    scheduler.on("tick", lambda timer: fired.append((timer.key[1], time.monotonic())))
+
+    async def scenario():
+        runner = asyncio.create_task(scheduler.run())
+        started = time.monotonic()
+        scheduler.schedule(("tick", "late"), datetime.utcnow() + timedelta(seconds=0.6))
+        await asyncio.sleep(0.05)
+        # Programado mientras el bucle duerme hasta "late": debe despertarlo
+        scheduler.schedule(("tick", "early"), datetime.utcnow() + timedelta(seconds=0.2))
+        await asyncio.sleep(0.9)
+        runner.cancel()
+        return started
+
+    started = asyncio.run(scenario())
+    assert [key for key, _ in fired] == ["early", "late"]
+    assert abs(fired[0][1] - started - 0.25) < 0.2
+    assert abs(fired[1][1] - started - 0.6) < 0.2
+    assert not scheduler.running
+
+
+def test_load_window_and_handlers(db, test_user_organizer, test_user_attendee, monkeypatch):
+    """Test the indexed window load and the revalidation done by each handler."""
+    monkeypatch.setattr(settings, "SESSION_REMINDER_MINUTES", 30)
+    monkeypatch.setattr(settings, "SCHEDULER_HORIZON_SECONDS", 6 * 3600)
+    scheduler = TimerScheduler()
+    monkeypatch.setattr(schedule_service, "scheduler", scheduler)
+
+    now = datetime.utcnow()
+    soon = Event(
+        name="Soon",
+        start_date=now + timedelta(hours=1),
+        end_date=now + timedelta(hours=3),
+        capacity=10,
+        creator_id=test_user_organizer.id,
+    )
+    later = Event(
+        name="Later",
+        start_date=now + timedelta(days=2),
+        end_date=now + timedelta(days=3),
+        capacity=10,
+        creator_id=test_user_organizer.id,
+    )
+    db.add_all([soon, later])
+    db.flush()
+    talk = EventSession(
+        event_id=soon.id,
+        title="Keynote",
+        start_time=soon.start_date + timedelta(minutes=15),
+        end_time=soon.start_date + timedelta(minutes=45),
+    )
+    db.add_all([talk, EventRegistration(user_id=test_user_attendee.id, event_id=soon.id)])
+    db.commit()
+
+    ScheduleService.load_window(db)
+    assert (EVENT_STARTED, soon.id) in scheduler
+    assert (EVENT_COMPLETED, soon.id) in scheduler
+    assert (SESSION_REMINDER, talk.id) in scheduler
+    assert (EVENT_STARTED, later.id) not in scheduler
+
+    reminder = Timer(
+        key=(SESSION_REMINDER, talk.id), fire_at=talk.start_time - timedelta(minutes=30)
+    )
+    assert ScheduleService.handle(reminder, session_factory=TestingSessionLocal) == 1
+    db.expire_all()
+    message = db.query(OutboxMessage).filter_by(topic="session.reminder").one()
+    assert message.channel == OutboxChannel.EMAIL
+    assert message.payload["session_title"] == "Keynote"
+
+    # La sesión se movió después de programar el recordatorio: se descarta
+    talk.start_time += timedelta(minutes=5)
+    db.commit()
+    assert ScheduleService.handle(reminder, session_factory=TestingSessionLocal) == 0
+
+    # Inicio del evento: webhook de la transición; cancelado después, ya no encola nada
+    monkeypatch.setattr(settings, "OUTBOX_WEBHOOK_URLS", ["http://hooks.test/events"])
+    started = Timer(key=(EVENT_STARTED, soon.id), fire_at=soon.start_date)
+    ScheduleService.handle(started, session_factory=TestingSessionLocal)
+    soon.status = EventStatusDB.CANCELLED
+    db.commit()
+    ScheduleService.handle(started, session_factory=TestingSessionLocal)
+    db.expire_all()
+    assert db.query(OutboxMessage).filter_by(topic=EVENT_STARTED).count() == 1
+
+
+def test_reload_catches_up_from_checkpoint(db, test_user_organizer, monkeypatch):
+    """Test timers that came due while down, or were added elsewhere, fire late but once."""
+    monkeypatch.setattr(settings, "SCHEDULER_HORIZON_SECONDS", 6 * 3600)
+    base = datetime.utcnow().replace(microsecond=0)
+    clock = {"now": base}
+    scheduler = TimerScheduler(clock=lambda: clock["now"])
+    monkeypatch.setattr(schedule_service, "scheduler", scheduler)
+
+    def add_event(name, start):
+        event = Event(
+            name=name,
+            start_date=start,
+            end_date=start + timedelta(days=1),
+            capacity=10,
+            creator_id=test_user_organizer.id,
+        )
+        db.add(event)
+        db.commit()
+        return event
+
+    missed = add_event("Durante la caída", base + timedelta(hours=1))
+    ScheduleService.load_window(db)
+
+    # Reinicio: el proceso estuvo parado mientras vencía el inicio del evento
+    scheduler = TimerScheduler(clock=lambda: clock["now"])
+    monkeypatch.setattr(schedule_service, "scheduler", scheduler)
+    clock["now"] = base + timedelta(hours=2)
+    ScheduleService.load_window(db)
+    assert [t.key for t in scheduler.pop_due(clock["now"])] == [(EVENT_STARTED, missed.id)]
+
+    # Creado por otro worker (sin refresh en este proceso) y vencido antes de la recarga
+    elsewhere = add_event("Otro worker", clock["now"] + timedelta(minutes=5))
+    clock["now"] += timedelta(minutes=10)
+    ScheduleService.load_window(db)
+    assert [t.key for t in scheduler.pop_due(clock["now"])] == [(EVENT_STARTED, elsewhere.id)]
+
+    # Lo ya disparado no se repite en la siguiente recarga
+    clock["now"] += timedelta(minutes=10)
+    ScheduleService.load_window(db)
+    assert scheduler.pop_due(clock["now"]) == []
+
+
+def test_only_the_lock_holder_runs_the_scheduler(monkeypatch):
+    """Test a worker that cannot take the scheduler lock never loads or fires timers."""
+    scheduler = TimerScheduler()
+    monkeypatch.setattr(schedule_service, "scheduler", scheduler)
+    monkeypatch.setattr(settings, "SCHEDULER_RELOAD_SECONDS", 0.01)
+    attempts = []
+
+    @contextmanager
+    def busy_lock(bind, name):
+        attempts.append(name)
+        yield False
+
+    def fail():
+        raise AssertionError("solo el líder carga la ventana")
+
+    monkeypatch.setattr(schedule_service, "advisory_lock", busy_lock)
+    monkeypatch.setattr(schedule_service, "_reload_window", fail)
+
+    async def scenario():
+        task = asyncio.create_task(schedule_service.run_scheduler())
+        await asyncio.sleep(0.1)
+        assert not scheduler.running
+        task.cancel()
+
+    asyncio.run(scenario())
+    assert len(attempts) > 1 and set(attempts) == {schedule_service.SCHEDULER_LOCK}
@@ -0,0 +1,38 @@
+import json
+
+from app.core.serialization import ORJSONResponse, serialize
+from app.models.event import Event
+from app.schemas.event import EventDetailResponse, EventListResponse
+
+
+def test_orjson_response_passes_bytes_through():
+    """Test that pre-serialized bodies are sent unchanged and objects use orjson."""
+    assert ORJSONResponse(b'{"a":1}').body == b'{"a":1}'
+    assert json.loads(ORJSONResponse({"a": 1}).body) == {"a": 1}
+
+
+def test_serialize_matches_pydantic_output(
+    client, db, test_user_organizer, auth_headers_organizer, test_event_data
+):
+    """Test that the fast path produces the same JSON as model_validate + model_dump."""
+    event_id = client.post(
+        "/api/v1/events/", json=test_event_data, headers=auth_headers_organizer
+    ).json()["id"]
+    event = db.get(Event, event_id)
+
+    fast = json.loads(serialize(EventDetailResponse, event))
+    classic = EventDetailResponse.model_validate(event).model_dump(mode="json")
+    assert fast == classic
+
+
+def test_list_endpoint_returns_serialized_page(
+    client, test_user_organizer, auth_headers_organizer, test_event_data
+):
+    """Test that list endpoints keep the EventListResponse shape."""
+    client.post("/api/v1/events/", json=test_event_data, headers=auth_headers_organizer)
+    response = client.get("/api/v1/events/")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    data = EventListResponse.model_validate(response.json())
+    assert data.pagination.total_count == 1
+    assert data.events[0].name == test_event_data["name"]
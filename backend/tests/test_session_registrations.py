@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.crud import attendee as crud_attendee
+from app.models.attendee import SessionRegistration
+from app.models.session import Session as EventSession
+
+
+@pytest.fixture
+def workshop_sessions(client, auth_headers_organizer, test_event_data):
+    """Create an event with three one-hour sessions (capacities 2, 1 and unlimited)."""
+    event_id = client.post(
+        "/api/v1/events/", json=test_event_data, headers=auth_headers_organizer
+    ).json()["id"]
+    event_start = datetime.fromisoformat(test_event_data["start_date"])
+    session_ids = []
+    for index, capacity in enumerate((2, 1, None)):
+        start = event_start + timedelta(hours=index + 1)
+        response = client.post(
+            "/api/v1/sessions/",
+            json={
+                "event_id": event_id,
+                "title": f"Taller {index}",
+                "start_time": start.isoformat(),
+                "end_time": (start + timedelta(hours=1)).isoformat(),
+                "location": f"Sala {index}",
+                "capacity": capacity,
+            },
+            headers=auth_headers_organizer,
+        )
+        session_ids.append(response.json()["id"])
+    return event_id, session_ids
+
+
+def test_register_to_session_takes_seats_atomically(
+    client, db, auth_headers_attendee, auth_headers_organizer, workshop_sessions
+):
+    """Test session seats need an event registration and never exceed capacity."""
+    event_id, (session_id, _, _) = workshop_sessions
+    url = f"/api/v1/attendees/sessions/{session_id}"
+
+    assert client.post(url, headers=auth_headers_attendee).status_code == 400
+    client.post(f"/api/v1/attendees/register/{event_id}", headers=auth_headers_attendee)
+
+    response = client.post(url, headers=auth_headers_attendee)
+    assert response.status_code == 201
+    assert response.json()["data"] == {"session_id": session_id, "seats_taken": 1}
+    assert client.post(url, headers=auth_headers_attendee).status_code == 409
+    missing = client.post("/api/v1/attendees/sessions/999999", headers=auth_headers_attendee)
+    assert missing.status_code == 404
+
+    # La capacidad no puede bajar de las plazas ocupadas
+    response = client.put(
+        f"/api/v1/sessions/{session_id}", json={"capacity": 0}, headers=auth_headers_organizer
+    )
+    assert response.status_code == 400
+
+    # Contador condicional: la última plaza se ocupa una vez y después no hay más
+    assert crud_attendee.take_session_seat(db, session_id) == 2
+    assert crud_attendee.take_session_seat(db, session_id) is None
+    db.rollback()
+
+    assert client.delete(url, headers=auth_headers_attendee).status_code == 204
+    assert client.delete(url, headers=auth_headers_attendee).status_code == 404
+    assert client.get(f"/api/v1/sessions/{session_id}").json()["seats_taken"] == 0
+
+
+def test_batch_session_registration_reports_each_session(
+    client, db, auth_headers_attendee, workshop_sessions
+):
+    """Test the batch endpoint reserves what it can and reports the rest."""
+    event_id, (first_id, full_id, open_id) = workshop_sessions
+    client.post(f"/api/v1/attendees/register/{event_id}", headers=auth_headers_attendee)
+    db.query(EventSession).filter(EventSession.id == full_id).update({"seats_taken": 1})
+    db.commit()
+
+    response = client.post(
+        "/api/v1/attendees/sessions",
+        json={"session_ids": [open_id, 999999, full_id, first_id, open_id]},
+        headers=auth_headers_attendee,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["registered"] == 2
+    assert [(r["session_id"], r["status"], r["seats_taken"]) for r in data["results"]] == [
+        (first_id, "registered", 1),
+        (full_id, "full", None),
+        (open_id, "registered", 1),
+        (999999, "not_found", None),
+    ]
+    response = client.get(
+        f"/api/v1/attendees/event/{event_id}/my-sessions", headers=auth_headers_attendee
+    )
+    assert [session["id"] for session in response.json()["sessions"]] == [first_id, open_id]
+
+    # Dejar el evento libera sus plazas de sesión
+    client.delete(f"/api/v1/attendees/unregister/{event_id}", headers=auth_headers_attendee)
+    assert db.query(SessionRegistration).count() == 0
+    seats = dict(db.query(EventSession.id, EventSession.seats_taken).all())
+    assert seats == {first_id: 0, full_id: 1, open_id: 0}
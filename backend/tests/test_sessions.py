@@ -111,3 +111,33 @@ def test_delete_session(client, test_event_for_session, auth_headers_organizer,
 
     get_response = client.get(f"/api/v1/sessions/{session_id}")
     assert get_response.status_code == 404
+
+
+def test_update_session_if_match(
+    client, test_event_for_session, auth_headers_organizer, test_session_data
+):
+    """Test that session updates bump the version and honour If-Match."""
+    session_data = test_session_data.copy()
+    session_data["event_id"] = test_event_for_session.id
+    event_start = test_event_for_session.start_date
+    session_data["start_time"] = (event_start + timedelta(hours=1)).isoformat()
+    session_data["end_time"] = (event_start + timedelta(hours=3)).isoformat()
+    session_id = client.post(
+        "/api/v1/sessions/", json=session_data, headers=auth_headers_organizer
+    ).json()["id"]
+
+    response = client.put(
+        f"/api/v1/sessions/{session_id}",
+        json={"title": "Edited"},
+        headers={**auth_headers_organizer, "If-Match": '"1"'},
+    )
+    assert response.status_code == 200
+    assert response.json()["version"] == 2
+    assert client.get(f"/api/v1/sessions/{session_id}").headers["etag"] == '"2"'
+
+    stale_response = client.put(
+        f"/api/v1/sessions/{session_id}",
+        json={"title": "Stale"},
+        headers={**auth_headers_organizer, "If-Match": '"1"'},
+    )
+    assert stale_response.status_code == 412
@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta
+
+from app.crud import analytics as crud_analytics
+from app.models.analytics import EventRegistrationBucket
+from app.models.event import Event
+from app.services import trending_service
+from app.services.trending_service import TrendingService
+from tests.conftest import TestingSessionLocal
+
+
+def test_trending_ranks_recent_registrations(
+    client, db, auth_headers_organizer, auth_headers_attendee, test_event_data
+):
+    """Test trending favours recent registration velocity and is cached."""
+    trending_service.trending_cache.clear()
+    event_ids = [
+        client.post(
+            "/api/v1/events/",
+            json={**test_event_data, "name": name},
+            headers=auth_headers_organizer,
+        ).json()["id"]
+        for name in ("Antiguo", "Reciente", "Sin registros")
+    ]
+    old, recent, _ = event_ids
+    # Más registros en total, pero de hace 20 horas: pierden frente a uno de ahora
+    db.add(
+        EventRegistrationBucket(
+            bucket_start=crud_analytics.bucket_start(datetime.utcnow() - timedelta(hours=20)),
+            event_id=old,
+            registrations=5,
+        )
+    )
+    db.commit()
+    client.post(f"/api/v1/attendees/register/{recent}", headers=auth_headers_attendee)
+
+    response = client.get("/api/v1/events/trending?limit=5")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [(e["event"]["id"], e["recent_registrations"]) for e in data["events"]] == [
+        (recent, 1),
+        (old, 5),
+    ]
+    assert data["events"][0]["score"] > data["events"][1]["score"]
+    assert data["events"][0]["event"]["is_registered"] is None
+    assert client.get("/api/v1/events/trending?limit=0").status_code == 400
+
+    # Cacheado: eliminar el evento no cambia la respuesta hasta que vence el TTL
+    client.delete(f"/api/v1/events/{recent}", headers=auth_headers_organizer)
+    assert client.get("/api/v1/events/trending?limit=5").json() == data
+    trending_service.trending_cache.clear()
+    assert [e["event"]["id"] for e in client.get("/api/v1/events/trending").json()["events"]] == [
+        old
+    ]
+
+    # Los cubos fuera de la ventana se purgan
+    db.add(
+        EventRegistrationBucket(
+            bucket_start=datetime.utcnow() - timedelta(days=2), event_id=old, registrations=1
+        )
+    )
+    db.commit()
+    assert TrendingService.prune_buckets(db) == 1
+
+
+def test_prune_once_runs_without_retention_purge(db, monkeypatch, test_user_organizer):
+    """Test the default-on prune task deletes stale buckets with its own session."""
+    monkeypatch.setattr(trending_service, "SessionLocal", TestingSessionLocal)
+    now = datetime.utcnow()
+    test_event = Event(
+        name="Tendencia",
+        start_date=now + timedelta(days=1),
+        end_date=now + timedelta(days=2),
+        capacity=10,
+        creator_id=test_user_organizer.id,
+    )
+    db.add(test_event)
+    db.commit()
+    db.add_all(
+        [
+            EventRegistrationBucket(
+                bucket_start=crud_analytics.bucket_start(now - timedelta(days=2)),
+                event_id=test_event.id,
+                registrations=3,
+            ),
+            EventRegistrationBucket(
+                bucket_start=crud_analytics.bucket_start(now),
+                event_id=test_event.id,
+                registrations=1,
+            ),
+        ]
+    )
+    db.commit()
+
+    assert trending_service._prune_once() == 1
+    assert db.query(EventRegistrationBucket.registrations).all() == [(1,)]
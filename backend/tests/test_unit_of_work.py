@@ -0,0 +1,59 @@
+from contextlib import contextmanager
+
+from sqlalchemy import event as sa_event
+
+from app.crud import event as crud_event
+from app.models.outbox import OutboxMessage
+from app.schemas.event import EventCreate
+from tests.conftest import test_engine
+
+
+@contextmanager
+def record_transaction(db):
+    """Cuenta los commits de la sesión y guarda el verbo de cada sentencia SQL"""
+    recorded = {"commits": 0, "statements": []}
+
+    def on_commit(session):
+        recorded["commits"] += 1
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        recorded["statements"].append(statement.split()[0].upper())
+
+    sa_event.listen(db, "after_commit", on_commit)
+    sa_event.listen(test_engine, "before_cursor_execute", on_execute)
+    try:
+        yield recorded
+    finally:
+        sa_event.remove(test_engine, "before_cursor_execute", on_execute)
+        sa_event.remove(db, "after_commit", on_commit)
+
+
+def test_create_commits_once_without_refresh(client, db, auth_headers_organizer, test_event_data):
+    """Test that a create request commits once and does not re-read the inserted row."""
+    with record_transaction(db) as recorded:
+        response = client.post(
+            "/api/v1/events/", json=test_event_data, headers=auth_headers_organizer
+        )
+
+    assert response.status_code == 201
+    assert response.json()["available_capacity"] == test_event_data["capacity"]
+    assert recorded["commits"] == 1
+    statements = recorded["statements"]
+    assert "SELECT" not in statements[statements.index("INSERT") :]
+
+
+def test_failed_request_rolls_back(
+    client, db, test_user_organizer, auth_headers_attendee, test_event_data
+):
+    """Test that an error response discards the writes queued by the service."""
+    event = crud_event.create_event(db, EventCreate(**test_event_data), test_user_organizer.id)
+    db.commit()
+
+    with record_transaction(db) as recorded:
+        response = client.delete(
+            f"/api/v1/attendees/unregister/{event.id}", headers=auth_headers_attendee
+        )
+
+    assert response.status_code == 404
+    assert recorded["commits"] == 0
+    assert db.query(OutboxMessage).count() == 0
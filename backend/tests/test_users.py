@@ -25,6 +25,27 @@ def test_list_users_as_admin(client, auth_headers_admin, test_user_attendee, tes
     assert len(data["users"]) > 0
 
 
+def test_list_users_search_modes(
+    client, db, auth_headers_admin, test_user_attendee, test_user_organizer
+):
+    """Test contains search on email or name, email-only prefix search and literal wildcards."""
+    from app.models.user import User
+
+    db.add(User(email="ann_smith@test.com", hashed_password="x", full_name="Ann Organizer"))
+    db.commit()
+
+    def emails(**params):
+        response = client.get("/api/v1/users/", params=params, headers=auth_headers_admin)
+        assert response.status_code == 200
+        return [user["email"] for user in response.json()["users"]]
+
+    assert emails(search="ORGANIZER") == ["organizer@test.com", "ann_smith@test.com"]
+    assert emails(search="organizer", search_mode="prefix") == ["organizer@test.com"]
+    assert emails(search="Ann", search_mode="prefix") == ["ann_smith@test.com"]
+    assert emails(search="n_s") == ["ann_smith@test.com"]
+    assert emails(search="organizer", role="attendee") == ["ann_smith@test.com"]
+
+
 def test_get_user_as_admin(client, auth_headers_admin, test_user_attendee):
     """Test getting a user by ID as admin."""
     response = client.get(f"/api/v1/users/{test_user_attendee.id}", headers=auth_headers_admin)
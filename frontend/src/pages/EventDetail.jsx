@@ -35,9 +35,32 @@ const EventDetail = () => {
     fetchEvent();
   }, [id]);
 
+  // Plazas y estado en vivo (SSE) en lugar de recargar el detalle
+  useEffect(() => {
+    if (typeof EventSource === 'undefined') return undefined;
+
+    return eventService.subscribeLive(parseInt(id), (update) => {
+      setEvent((current) =>
+        current && current.id === update.event_id
+          ? {
+              ...current,
+              available_capacity: update.available_capacity,
+              is_full: update.is_full,
+              status: update.status,
+            }
+          : current
+      );
+    });
+  }, [id]);
+
   useEffect(() => {
     if (user && user.role === 'attendee' && event) {
-      checkRegistration();
+      // El detalle ya trae is_registered si la petición llevaba token
+      if (event.is_registered !== null && event.is_registered !== undefined) {
+        setIsRegistered(event.is_registered);
+      } else {
+        checkRegistration();
+      }
     }
   }, [user, event]);
 
@@ -65,4 +65,17 @@ export const attendeeService = {
     const response = await api.get(`/attendees/check/${eventId}`);
     return response.data;
   },
+
+  /**
+   * Verificar en una sola petición si el usuario actual está registrado en varios eventos
+   * Requiere rol ATTENDEE. Nota: listado y detalle de eventos ya incluyen is_registered con token
+   * @param {number[]} eventIds - IDs de los eventos (máximo 100)
+   * @returns {Promise<{registrations: Object<string, boolean>}>}
+   */
+  checkRegistrations: async eventIds => {
+    const queryParams = new URLSearchParams();
+    eventIds.forEach(eventId => queryParams.append('event_ids', eventId.toString()));
+    const response = await api.get(`/attendees/check?${queryParams.toString()}`);
+    return response.data;
+  },
 };
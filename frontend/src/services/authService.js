@@ -51,12 +51,15 @@ export const authService = {
    *   role: string,
    *   is_active: boolean,
    *   created_at: string,
-   *   registered_events: Array,
-   *   created_events_count: number
+   *   registered_events_count: number,
+   *   upcoming_events_count: number,
+   *   created_events_count: number,
+   *   upcoming_events?: Array
    * }>}
+   * @param {string} [include] - Datos embebidos opcionales (ej: 'upcoming_events')
    */
-  getCurrentUser: async () => {
-    const response = await api.get('/auth/me');
+  getCurrentUser: async include => {
+    const response = await api.get('/auth/me', { params: include ? { include } : {} });
     return response.data;
   },
 };
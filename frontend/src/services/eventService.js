@@ -1,5 +1,23 @@
 import api from './api';
 
+/**
+ * Añade a la query los filtros del listado de eventos (compartidos por getAll y getFacets)
+ * @param {URLSearchParams} queryParams
+ * @param {Object} params
+ */
+const appendEventFilters = (queryParams, params) => {
+  if (params.search) queryParams.append('search', params.search);
+  if (params.status) queryParams.append('status', params.status);
+  if (params.start_from) queryParams.append('start_from', params.start_from);
+  if (params.start_to) queryParams.append('start_to', params.start_to);
+  if (params.location) queryParams.append('location', params.location);
+  if (params.creator_id) queryParams.append('creator_id', params.creator_id.toString());
+  if (params.has_availability !== undefined && params.has_availability !== null) {
+    queryParams.append('has_availability', params.has_availability.toString());
+  }
+  if (params.min_capacity) queryParams.append('min_capacity', params.min_capacity.toString());
+};
+
 /**
  * Servicio de eventos
  * Maneja todas las operaciones relacionadas con eventos
@@ -12,6 +30,14 @@ export const eventService = {
    * @param {number} [params.per_page=20] - Resultados por página
    * @param {string} [params.search] - Búsqueda por nombre
    * @param {string} [params.status] - Filtrar por estado (scheduled, ongoing, completed, cancelled)
+   * @param {string} [params.start_from] - Fecha de inicio mínima (ISO 8601)
+   * @param {string} [params.start_to] - Fecha de inicio máxima (ISO 8601)
+   * @param {string} [params.location] - Ubicación exacta (sin distinguir mayúsculas)
+   * @param {number} [params.creator_id] - Solo eventos de un organizador
+   * @param {boolean} [params.has_availability] - true: con plazas libres, false: llenos
+   * @param {number} [params.min_capacity] - Capacidad mínima
+   * @param {string} [params.sort_by] - Ordenar por start_date (default), created_at o name
+   * @param {string} [params.sort_order] - asc (default) o desc
    * @returns {Promise<{events: Array, pagination: {page: number, per_page: number, total: number, total_pages: number}}>}
    */
   getAll: async (params = {}) => {
@@ -19,8 +45,9 @@ export const eventService = {
 
     if (params.page) queryParams.append('page', params.page.toString());
     if (params.per_page) queryParams.append('per_page', params.per_page.toString());
-    if (params.search) queryParams.append('search', params.search);
-    if (params.status) queryParams.append('status', params.status);
+    appendEventFilters(queryParams, params);
+    if (params.sort_by) queryParams.append('sort_by', params.sort_by);
+    if (params.sort_order) queryParams.append('sort_order', params.sort_order);
 
     const queryString = queryParams.toString();
     const url = `/events${queryString ? `?${queryString}` : ''}`;
@@ -29,6 +56,41 @@ export const eventService = {
     return response.data;
   },
 
+  /**
+   * Obtener conteos del listado (pestañas de estado, ubicaciones y meses) para los filtros actuales
+   * @param {Object} [params] - Mismos filtros que getAll (sin paginación ni orden)
+   * @param {number} [params.top_locations=10] - Número de ubicaciones a devolver
+   * @returns {Promise<{
+   *   total: number,
+   *   status: {scheduled: number, ongoing: number, completed: number, cancelled: number},
+   *   locations: Array<{value: string, count: number}>,
+   *   months: Array<{value: string, count: number}>
+   * }>}
+   */
+  getFacets: async (params = {}) => {
+    const queryParams = new URLSearchParams();
+
+    appendEventFilters(queryParams, params);
+    if (params.top_locations) queryParams.append('top_locations', params.top_locations.toString());
+
+    const queryString = queryParams.toString();
+    const response = await api.get(`/events/facets${queryString ? `?${queryString}` : ''}`);
+    return response.data;
+  },
+
+  /**
+   * Suscribirse a las plazas y el estado de un evento en vivo (Server-Sent Events).
+   * El navegador reconecta solo si la conexión se corta.
+   * @param {number} id - ID del evento
+   * @param {Function} onUpdate - Recibe {event_id, capacity, available_capacity, is_full, status}
+   * @returns {Function} Cierra la conexión
+   */
+  subscribeLive: (id, onUpdate) => {
+    const source = new EventSource(`${api.defaults.baseURL}/events/${id}/live`);
+    source.addEventListener('update', (message) => onUpdate(JSON.parse(message.data)));
+    return () => source.close();
+  },
+
   /**
    * Obtener detalle de un evento por ID
    * @param {number} id - ID del evento